@@ -0,0 +1,25 @@
+"""
+Use append-only log files as the database for an Agent.
+Writes append a single line, so they stay fast as sessions grow.
+
+Run `pip install ddgs openai` to install dependencies."""
+
+from agno.agent import Agent
+from agno.db.log import LogDb
+from agno.models.openai import OpenAIChat
+from agno.tools.duckduckgo import DuckDuckGoTools
+
+# Setup the log database. fsync after every write with sync_mode="always".
+db = LogDb(db_path="tmp/log_db", sync_mode="interval")
+
+agent = Agent(
+    model=OpenAIChat(id="gpt-4o-mini"),
+    db=db,
+    session_id="session_storage",
+    tools=[DuckDuckGoTools()],
+    add_history_to_context=True,
+    num_history_runs=3,
+)
+agent.print_response("How many people live in France?")
+agent.print_response("What is their national anthem called?")
+agent.print_response("What have we been talking about?")
@@ -0,0 +1,73 @@
+"""Micro-benchmark: chunks/sec of the character-based chunking strategies and of token-budgeted chunking,
+and MB/sec of the whitespace normalization they run before splitting.
+
+TokenChunking measures chunks with the tokenizer of the embedder. Install `tiktoken` to benchmark it with
+the tokenizer of the OpenAI embedders, otherwise the dependency-free RegexTokenizer is used.
+
+Run `pip install agno` to install dependencies.
+"""
+
+import time
+
+from agno.eval.performance import PerformanceEval
+from agno.knowledge.chunking.document import DocumentChunking
+from agno.knowledge.chunking.fixed import FixedSizeChunking
+from agno.knowledge.chunking.normalization import NormalizationProfile, normalize_text
+from agno.knowledge.chunking.recursive import RecursiveChunking
+from agno.knowledge.chunking.strategy import ChunkingStrategy
+from agno.knowledge.chunking.tokens import RegexTokenizer, TiktokenTokenizer, Tokenizer, TokenChunking
+from agno.knowledge.document.base import Document
+
+paragraph = (
+    "Agno is a framework for building multi-agent systems with memory, knowledge and reasoning. "
+    "Knowledge bases split documents into chunks before embedding them into a vector database. "
+)
+# About 1.8 MB of text, in paragraphs
+document = Document(name="benchmark", content="\n\n".join(paragraph * 5 for _ in range(2_000)))
+
+try:
+    tokenizer: Tokenizer = TiktokenTokenizer()
+except ImportError:
+    tokenizer = RegexTokenizer()
+
+# Chunks of about 1000 characters, or 250 tokens
+strategies = {
+    "FixedSizeChunking": FixedSizeChunking(chunk_size=1000),
+    "RecursiveChunking": RecursiveChunking(chunk_size=1000),
+    "DocumentChunking": DocumentChunking(chunk_size=1000),
+    f"TokenChunking ({type(tokenizer).__name__})": TokenChunking(
+        chunk_size=250, tokenizer=tokenizer, fast_path_threshold=len(document.content) + 1
+    ),
+    f"TokenChunking ({type(tokenizer).__name__}, fast path)": TokenChunking(chunk_size=250, tokenizer=tokenizer),
+}
+
+
+def chunks_per_second(strategy: ChunkingStrategy) -> float:
+    start = time.perf_counter()
+    chunks = strategy.chunk(document)
+    return len(chunks) / (time.perf_counter() - start)
+
+
+def normalized_mb_per_second(profile: NormalizationProfile, track_offsets: bool = False) -> float:
+    start = time.perf_counter()
+    normalize_text(document.content, profile, track_offsets=track_offsets)
+    return len(document.content) / 1e6 / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    for profile in (NormalizationProfile.PLAIN, NormalizationProfile.MARKDOWN):
+        print(f"normalize_text ({profile.value}): {normalized_mb_per_second(profile):,.1f} MB/sec")
+        print(
+            f"normalize_text ({profile.value}, with offsets): "
+            f"{normalized_mb_per_second(profile, track_offsets=True):,.1f} MB/sec"
+        )
+    for name, strategy in strategies.items():
+        print(f"{name}: {chunks_per_second(strategy):,.0f} chunks/sec")
+
+    token_chunking = TokenChunking(chunk_size=250, tokenizer=tokenizer)
+    PerformanceEval(
+        name="Token-budgeted chunking of a 1.8 MB document",
+        func=lambda: token_chunking.chunk(document),
+        measure_memory=False,
+        num_iterations=5,
+    ).run(print_summary=True)
@@ -0,0 +1,69 @@
+"""Micro-benchmark: events/sec per core for serializing streamed run events to SSE frames.
+
+Install `orjson` to use the faster JSON backend, and set `STREAM_FLUSH_INTERVAL` on AgentOS
+to also merge consecutive content deltas into fewer frames.
+
+Run `pip install agno fastapi` to install dependencies.
+"""
+
+import asyncio
+import time
+
+from agno.eval.performance import PerformanceEval
+from agno.os.router import format_sse_event
+from agno.os.utils import coalesce_content_events
+from agno.run.agent import RunContentEvent
+from agno.utils.serialize import orjson
+
+NUM_EVENTS = 10_000
+
+events = [
+    RunContentEvent(
+        run_id="run-1",
+        session_id="session-1",
+        agent_id="agent-1",
+        agent_name="Agent",
+        content=f"token {i} ",
+        model_provider_data={"id": "resp-1"},
+    )
+    for i in range(NUM_EVENTS)
+]
+
+
+def serialize_events():
+    for event in events:
+        format_sse_event(event)
+
+
+def serialize_coalesced_events():
+    async def stream():
+        for event in events:
+            yield event
+            # Give the event loop a chance to run, like a real token stream does
+            if len(event.content) % 4 == 0:
+                await asyncio.sleep(0)
+
+    async def run():
+        async for event in coalesce_content_events(stream(), flush_interval=0.05):
+            format_sse_event(event)
+
+    asyncio.run(run())
+
+
+def events_per_second(func) -> float:
+    start = time.perf_counter()
+    func()
+    return NUM_EVENTS / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    print(f"JSON backend: {'orjson' if orjson is not None else 'json'}")
+    print(f"SSE serialization: {events_per_second(serialize_events):,.0f} events/sec")
+    print(f"SSE serialization with coalescing: {events_per_second(serialize_coalesced_events):,.0f} events/sec")
+
+    PerformanceEval(
+        name=f"Serialize {NUM_EVENTS} content events to SSE",
+        func=serialize_events,
+        measure_memory=False,
+        num_iterations=10,
+    ).run(print_summary=True)
@@ -0,0 +1,47 @@
+"""Micro-benchmark: session and memory lookups on InMemoryDb stay constant-time as the database grows.
+
+Run `pip install agno` to install dependencies.
+"""
+
+from agno.db.base import SessionType
+from agno.db.in_memory import InMemoryDb
+from agno.db.schemas.memory import UserMemory
+from agno.eval.performance import PerformanceEval
+from agno.session import AgentSession
+
+
+def build_db(num_sessions: int) -> InMemoryDb:
+    db = InMemoryDb()
+    for i in range(num_sessions):
+        db.upsert_session(
+            AgentSession(
+                session_id=f"session-{i}",
+                agent_id=f"agent-{i % 10}",
+                user_id=f"user-{i % 100}",
+                session_data={"session_name": f"Session {i}"},
+            )
+        )
+        db.upsert_user_memory(UserMemory(memory_id=f"memory-{i}", memory=f"Memory {i}", user_id=f"user-{i % 100}"))
+    return db
+
+
+def lookups(db: InMemoryDb, num_sessions: int):
+    def run():
+        target = num_sessions // 2
+        db.get_session(session_id=f"session-{target}", session_type=SessionType.AGENT)
+        db.get_user_memory(memory_id=f"memory-{target}")
+        db.upsert_user_memory(UserMemory(memory_id=f"memory-{target}", memory="Updated", user_id="user-1"))
+        db.get_sessions(session_type=SessionType.AGENT, user_id="user-1", limit=5)
+
+    return run
+
+
+if __name__ == "__main__":
+    for num_sessions in (100, 10_000):
+        db = build_db(num_sessions)
+        PerformanceEval(
+            name=f"InMemoryDb lookups with {num_sessions} sessions",
+            func=lookups(db, num_sessions),
+            measure_memory=False,
+            num_iterations=500,
+        ).run(print_summary=True)
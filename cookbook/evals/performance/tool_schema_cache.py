@@ -0,0 +1,74 @@
+"""Micro-benchmark: per-run tool preparation of an agent with 100 tools, with and without the compiled tool-schema cache.
+
+Agents prepare their tools for the model on every run. The JSON schema, description and argument validation of
+each tool are compiled once per process and reused by later runs, which only make a cheap copy of each Function.
+
+Run `pip install openai agno` to install dependencies.
+"""
+
+import time
+from typing import Callable
+
+from agno.agent import Agent
+from agno.eval.performance import PerformanceEval
+from agno.models.openai import OpenAIChat
+from agno.run import RunContext
+from agno.run.agent import RunOutput
+from agno.session import AgentSession
+from agno.tools.function import clear_tool_schema_cache, get_tool_schema_cache_stats
+from agno.tools.toolkit import Toolkit
+
+
+def make_tool(index: int) -> Callable:
+    def search(query: str, limit: int = 10, include_metadata: bool = False) -> str:
+        return f"{limit} results for {query} from source {index}"
+
+    search.__name__ = f"search_source_{index}"
+    search.__doc__ = f"""Search source {index}.
+
+    Args:
+        query: The search query.
+        limit: Maximum number of results.
+        include_metadata: Include the metadata of the results.
+    """
+    return search
+
+
+toolkit = Toolkit(name="sources", tools=[make_tool(index) for index in range(100)])
+agent = Agent(model=OpenAIChat(id="gpt-4o", api_key="not-used"), tools=[toolkit])
+run_context = RunContext(run_id="benchmark", session_id="benchmark")
+session = AgentSession(session_id="benchmark")
+
+
+def prepare_tools():
+    return agent._determine_tools_for_model(
+        model=agent.model,  # type: ignore[arg-type]
+        processed_tools=[toolkit],
+        run_response=RunOutput(run_id="benchmark"),
+        run_context=run_context,
+        session=session,
+    )
+
+
+def milliseconds_per_run(cached: bool, runs: int = 50) -> float:
+    clear_tool_schema_cache()
+    prepare_tools()
+    start = time.perf_counter()
+    for _ in range(runs):
+        if not cached:
+            clear_tool_schema_cache()
+        prepare_tools()
+    return (time.perf_counter() - start) * 1000 / runs
+
+
+if __name__ == "__main__":
+    print(f"Without the cache: {milliseconds_per_run(cached=False):.2f} ms per run")
+    print(f"With the cache: {milliseconds_per_run(cached=True):.2f} ms per run")
+    print(f"Cache: {get_tool_schema_cache_stats().to_dict()}")
+
+    PerformanceEval(
+        name="Tool preparation of an agent with 100 tools",
+        func=prepare_tools,
+        measure_memory=False,
+        num_iterations=50,
+    ).run(print_summary=True)
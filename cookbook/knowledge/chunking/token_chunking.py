@@ -0,0 +1,27 @@
+from agno.agent import Agent
+from agno.knowledge.chunking.tokens import TiktokenTokenizer, TokenChunking
+from agno.knowledge.knowledge import Knowledge
+from agno.knowledge.reader.pdf_reader import PDFReader
+from agno.vectordb.pgvector import PgVector
+
+db_url = "postgresql+psycopg://ai:ai@localhost:5532/ai"
+
+knowledge = Knowledge(
+    vector_db=PgVector(table_name="recipes_token_chunking", db_url=db_url),
+)
+
+knowledge.add_content(
+    url="https://agno-public.s3.amazonaws.com/recipes/ThaiRecipes.pdf",
+    reader=PDFReader(
+        name="Token Chunking Reader",
+        # Chunks of at most 512 tokens of the OpenAI embedders
+        chunking_strategy=TokenChunking(chunk_size=512, overlap=32, tokenizer=TiktokenTokenizer("cl100k_base")),
+    ),
+)
+
+agent = Agent(
+    knowledge=knowledge,
+    search_knowledge=True,
+)
+
+agent.print_response("How to make Thai curry?", markdown=True)
@@ -0,0 +1,31 @@
+import asyncio
+
+from agno.agent import Agent
+from agno.knowledge.knowledge import Knowledge
+from agno.vectordb.local import LocalDb
+
+# Create Knowledge Instance with an in-process, memory-mapped vector store
+knowledge = Knowledge(
+    name="Basic SDK Knowledge Base",
+    description="Agno 2.0 Knowledge Implementation with LocalDb",
+    vector_db=LocalDb(collection="vectors", path="tmp/localdb"),
+)
+
+asyncio.run(
+    knowledge.add_content_async(
+        name="Recipes",
+        url="https://agno-public.s3.amazonaws.com/recipes/ThaiRecipes.pdf",
+        metadata={"doc_type": "recipe_book"},
+    )
+)
+
+# Create and use the agent
+agent = Agent(knowledge=knowledge)
+
+agent.print_response("List down the ingredients to make Massaman Gai", markdown=True)
+
+# Delete operations examples
+vector_db = knowledge.vector_db
+vector_db.delete_by_name("Recipes")
+# or
+vector_db.delete_by_metadata({"user_tag": "Recipes from website"})
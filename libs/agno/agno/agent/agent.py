@@ -252,6 +252,9 @@ class Agent:
 
     # Maximum number of tool calls allowed.
     tool_call_limit: Optional[int] = None
+    # Maximum number of tool calls of one model response executed in parallel in sync runs.
+    # None or 1 executes them one after another. Async runs always execute them concurrently.
+    max_parallel_tool_calls: Optional[int] = None
     # Controls which (if any) tool is called by the model.
     # "none" means the model will not call a tool and instead generates a message.
     # "auto" means the model can pick between generating a message or calling a tool.
@@ -459,6 +462,7 @@ class Agent:
         metadata: Optional[Dict[str, Any]] = None,
         tools: Optional[Sequence[Union[Toolkit, Callable, Function, Dict]]] = None,
         tool_call_limit: Optional[int] = None,
+        max_parallel_tool_calls: Optional[int] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_hooks: Optional[List[Callable]] = None,
         pre_hooks: Optional[List[Union[Callable[..., Any], BaseGuardrail]]] = None,
@@ -574,6 +578,7 @@ class Agent:
 
         self.tools = list(tools) if tools else []
         self.tool_call_limit = tool_call_limit
+        self.max_parallel_tool_calls = max_parallel_tool_calls
         self.tool_choice = tool_choice
         self.tool_hooks = tool_hooks
 
@@ -1046,6 +1051,7 @@ class Agent:
                 tools=_tools,
                 tool_choice=self.tool_choice,
                 tool_call_limit=self.tool_call_limit,
+                max_parallel_tool_calls=self.max_parallel_tool_calls,
                 response_format=response_format,
                 run_response=run_response,
                 send_media_to_model=self.send_media_to_model,
@@ -3008,6 +3014,7 @@ class Agent:
                 tools=tools,
                 tool_choice=self.tool_choice,
                 tool_call_limit=self.tool_call_limit,
+                max_parallel_tool_calls=self.max_parallel_tool_calls,
             )
 
             # Check for cancellation after model processing
@@ -4782,6 +4789,7 @@ class Agent:
             tools=tools,
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
+            max_parallel_tool_calls=self.max_parallel_tool_calls,
             stream_model_response=stream_model_response,
             run_response=run_response,
             send_media_to_model=self.send_media_to_model,
@@ -5578,7 +5586,7 @@ class Agent:
                         if name in _function_names:
                             continue
                         _function_names.append(name)
-                        _func = _func.model_copy(deep=True)
+                        _func = _func.model_copy()
                         _func._agent = self
                         _func.process_entrypoint(strict=strict)
                         if strict and _func.strict is None:
@@ -5598,7 +5606,7 @@ class Agent:
                     _function_names.append(tool.name)
 
                     tool.process_entrypoint(strict=strict)
-                    tool = tool.model_copy(deep=True)
+                    tool = tool.model_copy()
 
                     tool._agent = self
                     if strict and tool.strict is None:
@@ -5621,7 +5629,6 @@ class Agent:
                         _function_names.append(function_name)
 
                         _func = Function.from_callable(tool, strict=strict)
-                        _func = _func.model_copy(deep=True)
                         _func._agent = self
                         if strict:
                             _func.strict = True
@@ -5638,7 +5645,7 @@ class Agent:
 
             # Check if any functions need media before collecting
             needs_media = any(
-                any(param in signature(func.entrypoint).parameters for param in ["images", "videos", "audios", "files"])
+                not {"images", "videos", "audios", "files"}.isdisjoint(signature(func.entrypoint).parameters)
                 for func in _functions
                 if isinstance(func, Function) and func.entrypoint is not None
             )
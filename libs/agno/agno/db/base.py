@@ -80,6 +80,14 @@ class BaseDb(ABC):
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         raise NotImplementedError
 
+    def get_session_updated_at(self, session_id: str, session_type: SessionType) -> Optional[int]:
+        """Get the updated_at of a stored session, or None if it doesn't exist.
+
+        Used to check cached sessions. Databases should override it to read only that column.
+        """
+        session = self.get_session(session_id=session_id, session_type=session_type, deserialize=False)
+        return (session.get("updated_at") or 0) if isinstance(session, dict) else None
+
     @abstractmethod
     def get_sessions(
         self,
@@ -396,6 +404,14 @@ class AsyncBaseDb(ABC):
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         raise NotImplementedError
 
+    async def get_session_updated_at(self, session_id: str, session_type: SessionType) -> Optional[int]:
+        """Get the updated_at of a stored session, or None if it doesn't exist.
+
+        Used to check cached sessions. Databases should override it to read only that column.
+        """
+        session = await self.get_session(session_id=session_id, session_type=session_type, deserialize=False)
+        return (session.get("updated_at") or 0) if isinstance(session, dict) else None
+
     @abstractmethod
     async def get_sessions(
         self,
@@ -0,0 +1,3 @@
+from agno.db.cached.cached_db import AsyncCachedDb, CachedDb, SessionCacheStats
+
+__all__ = ["AsyncCachedDb", "CachedDb", "SessionCacheStats"]
@@ -0,0 +1,919 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
+
+from agno.db.base import AsyncBaseDb, BaseDb, SessionType
+from agno.db.schemas import UserMemory
+from agno.db.schemas.culture import CulturalKnowledge
+from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
+from agno.db.schemas.knowledge import KnowledgeRow
+from agno.session import AgentSession, Session, TeamSession
+from agno.utils.log import log_debug
+
+
+@dataclass
+class SessionCacheStats:
+    """Counters of a session cache"""
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hit_rate": self.hit_rate,
+        }
+
+
+def _get_session_type(session: Session) -> SessionType:
+    if isinstance(session, AgentSession):
+        return SessionType.AGENT
+    if isinstance(session, TeamSession):
+        return SessionType.TEAM
+    return SessionType.WORKFLOW
+
+
+def _set_kwargs(**kwargs: Any) -> Dict[str, Any]:
+    """The keyword arguments that are set. Not every database accepts the user_id of the memory methods."""
+    return {key: value for key, value in kwargs.items() if value is not None}
+
+
+class _CachedSession:
+    __slots__ = ("session", "updated_at", "cached_at")
+
+    def __init__(self, session: Session):
+        self.session = session
+        self.updated_at = session.updated_at or 0
+        self.cached_at = time.monotonic()
+
+
+class _SessionLRU:
+    """Deserialized sessions, keyed by session type and id, evicting the least recently used"""
+
+    def __init__(self, max_sessions: int, ttl: Optional[float], stats: SessionCacheStats):
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self.stats = stats
+
+        self._entries: "OrderedDict[Tuple[SessionType, str], _CachedSession]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_entry(
+        self, session_type: SessionType, session_id: str, user_id: Optional[str] = None
+    ) -> Optional[_CachedSession]:
+        key = (SessionType(session_type), session_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self.ttl is not None and time.monotonic() - entry.cached_at > self.ttl:
+                del self._entries[key]
+                self.stats.invalidations += 1
+                return None
+            # Sessions of other users are left to the database to filter out
+            if user_id is not None and entry.session.user_id != user_id:
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, session: Session, written: bool = False) -> None:
+        """Cache a session. Sessions read from the database don't replace a more recent cached version."""
+        if self.max_sessions <= 0:
+            return
+        key = (_get_session_type(session), session.session_id)
+        entry = _CachedSession(session)
+        with self._lock:
+            current = self._entries.get(key)
+            if not written and current is not None and current.updated_at > entry.updated_at:
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_sessions:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def invalidate(self, session_id: str, session_type: Optional[SessionType] = None) -> None:
+        session_types = [SessionType(session_type)] if session_type is not None else list(SessionType)
+        with self._lock:
+            for key in [(session_type, session_id) for session_type in session_types]:
+                if self._entries.pop(key, None) is not None:
+                    self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def record(self, hits: int = 0, misses: int = 0, writes: int = 0) -> None:
+        with self._lock:
+            self.stats.hits += hits
+            self.stats.misses += misses
+            self.stats.writes += writes
+
+
+class _SessionLocks:
+    """Reentrant per-session locks, kept only while they are held or waited on"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._locks: Dict[str, List[Any]] = {}
+
+    @contextmanager
+    def hold(self, session_id: str) -> Iterator[None]:
+        with self._lock:
+            entry = self._locks.setdefault(session_id, [threading.RLock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._locks[session_id]
+
+
+class _AsyncSessionLock:
+    __slots__ = ("lock", "owner", "depth", "users")
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.owner: Optional[asyncio.Task] = None
+        self.depth = 0
+        self.users = 0
+
+
+class _AsyncSessionLocks:
+    """Per-session locks for asyncio tasks, reentrant within a task, kept only while held or waited on"""
+
+    def __init__(self):
+        self._locks: Dict[str, _AsyncSessionLock] = {}
+
+    @asynccontextmanager
+    async def hold(self, session_id: str) -> AsyncIterator[None]:
+        entry = self._locks.get(session_id)
+        if entry is None:
+            entry = self._locks[session_id] = _AsyncSessionLock()
+        task = asyncio.current_task()
+        entry.users += 1
+        try:
+            if entry.owner is not task:
+                await entry.lock.acquire()
+                entry.owner = task
+            entry.depth += 1
+            try:
+                yield
+            finally:
+                entry.depth -= 1
+                if entry.depth == 0:
+                    entry.owner = None
+                    entry.lock.release()
+        finally:
+            entry.users -= 1
+            if entry.users == 0:
+                del self._locks[session_id]
+
+
+class CachedDb(BaseDb):
+    def __init__(
+        self, db: BaseDb, max_sessions: int = 1024, ttl: Optional[float] = None, check_updated_at: bool = True
+    ):
+        """
+        Read-through, write-through cache of sessions in front of a database.
+
+        Agents, teams and workflows read their session at the start of every run and write it back at the end.
+        With this cache, the read of the next turn is served from memory instead of querying and deserializing
+        the session again. Writes always go to the database, and the session it returns replaces the cached one.
+        Every other method is delegated to the database.
+
+        On a hit, the updated_at of the stored session is read (a single column) and the session is read again
+        if another process wrote it since it was cached, so workers sharing the database don't serve a stale
+        session and overwrite the runs of the others. updated_at has a resolution of one second, so a write in
+        the same second as the cached one is not seen: route the turns of a session to one worker when they can
+        follow each other that quickly.
+
+        Cached sessions are shared, not copied, like with `Agent(cache_session=True)`. Concurrent turns on the
+        same session can be serialized with `session_lock`.
+
+        Args:
+            db (BaseDb): The database to cache sessions of.
+            max_sessions (int): Maximum number of sessions kept, evicting the least recently used.
+            ttl (Optional[float]): Seconds after which a cached session is read again from the database.
+                None keeps sessions until evicted.
+            check_updated_at (bool): Check the updated_at of the stored session on every hit. Only disable it
+                when no other process writes the same sessions.
+
+        Example:
+            >>> db = CachedDb(PostgresDb(db_url=db_url), max_sessions=10_000)
+            >>> agent = Agent(db=db, add_history_to_context=True)
+            >>> with db.session_lock(session_id):
+            ...     agent.run("Hello", session_id=session_id)
+        """
+        self.db = db
+        self.id = db.id
+        self.check_updated_at = check_updated_at
+        self.stats = SessionCacheStats()
+
+        self._sessions = _SessionLRU(max_sessions=max_sessions, ttl=ttl, stats=self.stats)
+        self._locks = _SessionLocks()
+
+    def __getattr__(self, name: str) -> Any:
+        # Table names, engines and other attributes of the wrapped database
+        if name == "db":
+            raise AttributeError(name)
+        return getattr(self.db, name)
+
+    @contextmanager
+    def session_lock(self, session_id: str) -> Iterator[None]:
+        """Hold the lock of a session, e.g. around a run, to serialize concurrent turns on the same session.
+
+        The lock is reentrant, and also serializes the reads and writes of the session through this cache.
+        """
+        with self._locks.hold(session_id):
+            yield
+
+    def invalidate(self, session_id: str, session_type: Optional[SessionType] = None) -> None:
+        """Drop a session from the cache, e.g. after another process updated it."""
+        self._sessions.invalidate(session_id, session_type)
+
+    def clear_cache(self) -> None:
+        self._sessions.clear()
+
+    def _get_current_entry(
+        self, session_type: SessionType, session_id: str, user_id: Optional[str] = None
+    ) -> Optional[_CachedSession]:
+        """Get a cached session, if it is still the stored one."""
+        entry = self._sessions.get_entry(session_type, session_id, user_id)
+        if entry is None or not self.check_updated_at:
+            return entry
+        updated_at = self.db.get_session_updated_at(session_id=session_id, session_type=session_type)
+        # The stored session was deleted or written since it was cached
+        if updated_at is None or updated_at > entry.updated_at:
+            self._sessions.invalidate(session_id, session_type)
+            return None
+        return entry
+
+    # --- Sessions ---
+    def get_session(
+        self,
+        session_id: str,
+        session_type: SessionType,
+        user_id: Optional[str] = None,
+        deserialize: Optional[bool] = True,
+    ) -> Optional[Union[Session, Dict[str, Any]]]:
+        if not deserialize:
+            return self.db.get_session(
+                session_id=session_id, session_type=session_type, user_id=user_id, deserialize=False
+            )
+
+        entry = self._get_current_entry(session_type, session_id, user_id)
+        if entry is None:
+            with self._locks.hold(session_id):
+                # Another thread may have read the session while this one waited
+                entry = self._get_current_entry(session_type, session_id, user_id)
+                if entry is None:
+                    self._sessions.record(misses=1)
+                    result = self.db.get_session(session_id=session_id, session_type=session_type, user_id=user_id)
+                    if result is not None:
+                        self._sessions.put(result)  # type: ignore[arg-type]
+                    return result
+        self._sessions.record(hits=1)
+        log_debug(f"Session {session_id} served from cache")
+        return entry.session
+
+    def upsert_session(
+        self, session: Session, deserialize: Optional[bool] = True
+    ) -> Optional[Union[Session, Dict[str, Any]]]:
+        with self._locks.hold(session.session_id):
+            result = self.db.upsert_session(session=session, deserialize=deserialize)
+            self._sessions.record(writes=1)
+            if deserialize and result is not None:
+                self._sessions.put(result, written=True)  # type: ignore[arg-type]
+            else:
+                self._sessions.invalidate(session.session_id, _get_session_type(session))
+            return result
+
+    def upsert_sessions(
+        self,
+        sessions: List[Session],
+        deserialize: Optional[bool] = True,
+        preserve_updated_at: bool = False,
+    ) -> List[Union[Session, Dict[str, Any]]]:
+        for session in sessions:
+            self._sessions.invalidate(session.session_id, _get_session_type(session))
+        results = self.db.upsert_sessions(
+            sessions=sessions, deserialize=deserialize, preserve_updated_at=preserve_updated_at
+        )
+        self._sessions.record(writes=len(sessions))
+        if deserialize:
+            for result in results:
+                self._sessions.put(result, written=True)  # type: ignore[arg-type]
+        return results
+
+    def rename_session(
+        self,
+        session_id: str,
+        session_type: SessionType,
+        session_name: str,
+        deserialize: Optional[bool] = True,
+    ) -> Optional[Union[Session, Dict[str, Any]]]:
+        with self._locks.hold(session_id):
+            result = self.db.rename_session(
+                session_id=session_id, session_type=session_type, session_name=session_name, deserialize=deserialize
+            )
+            if deserialize and result is not None:
+                self._sessions.put(result, written=True)  # type: ignore[arg-type]
+            else:
+                self._sessions.invalidate(session_id, session_type)
+            return result
+
+    def delete_session(self, session_id: str) -> bool:
+        with self._locks.hold(session_id):
+            self._sessions.invalidate(session_id)
+            return self.db.delete_session(session_id=session_id)
+
+    def delete_sessions(self, session_ids: List[str]) -> None:
+        for session_id in session_ids:
+            self._sessions.invalidate(session_id)
+        self.db.delete_sessions(session_ids=session_ids)
+
+    # --- Delegated to the database ---
+    def table_exists(self, table_name: str) -> bool:
+        return self.db.table_exists(table_name=table_name)
+
+    def _create_all_tables(self) -> None:
+        return self.db._create_all_tables()
+
+    # --- Schema Version ---
+    def get_latest_schema_version(self, table_name: str):
+        return self.db.get_latest_schema_version(table_name=table_name)
+
+    def upsert_schema_version(self, table_name: str, version: str):
+        return self.db.upsert_schema_version(table_name=table_name, version=version)
+
+    def get_session_updated_at(self, session_id: str, session_type: SessionType) -> Optional[int]:
+        return self.db.get_session_updated_at(session_id=session_id, session_type=session_type)
+
+    def get_sessions(
+        self,
+        session_type: SessionType,
+        user_id: Optional[str] = None,
+        component_id: Optional[str] = None,
+        session_name: Optional[str] = None,
+        start_timestamp: Optional[int] = None,
+        end_timestamp: Optional[int] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        deserialize: Optional[bool] = True,
+    ) -> Union[List[Session], Tuple[List[Dict[str, Any]], int]]:
+        return self.db.get_sessions(
+            session_type=session_type,
+            user_id=user_id,
+            component_id=component_id,
+            session_name=session_name,
+            start_timestamp=start_timestamp,
+            end_timestamp=end_timestamp,
+            limit=limit,
+            page=page,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            deserialize=deserialize,
+        )
+
+    # --- Memory ---
+    def clear_memories(self) -> None:
+        return self.db.clear_memories()
+
+    def delete_user_memory(self, memory_id: str, user_id: Optional[str] = None) -> None:
+        return self.db.delete_user_memory(memory_id=memory_id, **_set_kwargs(user_id=user_id))
+
+    def delete_user_memories(self, memory_ids: List[str], user_id: Optional[str] = None) -> None:
+        return self.db.delete_user_memories(memory_ids=memory_ids, **_set_kwargs(user_id=user_id))
+
+    def get_all_memory_topics(self, user_id: Optional[str] = None) -> List[str]:
+        return self.db.get_all_memory_topics(**_set_kwargs(user_id=user_id))
+
+    def get_user_memory(
+        self,
+        memory_id: str,
+        deserialize: Optional[bool] = True,
+        user_id: Optional[str] = None,
+    ) -> Optional[Union[UserMemory, Dict[str, Any]]]:
+        return self.db.get_user_memory(memory_id=memory_id, deserialize=deserialize, **_set_kwargs(user_id=user_id))
+
+    def get_user_memories(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        team_id: Optional[str] = None,
+        topics: Optional[List[str]] = None,
+        search_content: Optional[str] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        deserialize: Optional[bool] = True,
+    ) -> Union[List[UserMemory], Tuple[List[Dict[str, Any]], int]]:
+        return self.db.get_user_memories(
+            user_id=user_id,
+            agent_id=agent_id,
+            team_id=team_id,
+            topics=topics,
+            search_content=search_content,
+            limit=limit,
+            page=page,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            deserialize=deserialize,
+        )
+
+    def get_user_memory_stats(
+        self,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        user_id: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        return self.db.get_user_memory_stats(limit=limit, page=page, **_set_kwargs(user_id=user_id))
+
+    def upsert_user_memory(
+        self, memory: UserMemory, deserialize: Optional[bool] = True
+    ) -> Optional[Union[UserMemory, Dict[str, Any]]]:
+        return self.db.upsert_user_memory(memory=memory, deserialize=deserialize)
+
+    def upsert_memories(
+        self,
+        memories: List[UserMemory],
+        deserialize: Optional[bool] = True,
+        preserve_updated_at: bool = False,
+    ) -> List[Union[UserMemory, Dict[str, Any]]]:
+        return self.db.upsert_memories(
+            memories=memories, deserialize=deserialize, preserve_updated_at=preserve_updated_at
+        )
+
+    # --- Metrics ---
+    def get_metrics(
+        self,
+        starting_date: Optional[date] = None,
+        ending_date: Optional[date] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        return self.db.get_metrics(starting_date=starting_date, ending_date=ending_date)
+
+    def calculate_metrics(self) -> Optional[Any]:
+        return self.db.calculate_metrics()
+
+    # --- Knowledge ---
+    def delete_knowledge_content(self, id: str):
+        return self.db.delete_knowledge_content(id=id)
+
+    def get_knowledge_content(self, id: str) -> Optional[KnowledgeRow]:
+        return self.db.get_knowledge_content(id=id)
+
+    def get_knowledge_contents(
+        self,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+    ) -> Tuple[List[KnowledgeRow], int]:
+        return self.db.get_knowledge_contents(limit=limit, page=page, sort_by=sort_by, sort_order=sort_order)
+
+    def upsert_knowledge_content(self, knowledge_row: KnowledgeRow):
+        return self.db.upsert_knowledge_content(knowledge_row=knowledge_row)
+
+    # --- Evals ---
+    def create_eval_run(self, eval_run: EvalRunRecord) -> Optional[EvalRunRecord]:
+        return self.db.create_eval_run(eval_run=eval_run)
+
+    def delete_eval_runs(self, eval_run_ids: List[str]) -> None:
+        return self.db.delete_eval_runs(eval_run_ids=eval_run_ids)
+
+    def get_eval_run(
+        self, eval_run_id: str, deserialize: Optional[bool] = True
+    ) -> Optional[Union[EvalRunRecord, Dict[str, Any]]]:
+        return self.db.get_eval_run(eval_run_id=eval_run_id, deserialize=deserialize)
+
+    def get_eval_runs(
+        self,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        team_id: Optional[str] = None,
+        workflow_id: Optional[str] = None,
+        model_id: Optional[str] = None,
+        filter_type: Optional[EvalFilterType] = None,
+        eval_type: Optional[List[EvalType]] = None,
+        deserialize: Optional[bool] = True,
+    ) -> Union[List[EvalRunRecord], Tuple[List[Dict[str, Any]], int]]:
+        return self.db.get_eval_runs(
+            limit=limit,
+            page=page,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            agent_id=agent_id,
+            team_id=team_id,
+            workflow_id=workflow_id,
+            model_id=model_id,
+            filter_type=filter_type,
+            eval_type=eval_type,
+            deserialize=deserialize,
+        )
+
+    def rename_eval_run(
+        self, eval_run_id: str, name: str, deserialize: Optional[bool] = True
+    ) -> Optional[Union[EvalRunRecord, Dict[str, Any]]]:
+        return self.db.rename_eval_run(eval_run_id=eval_run_id, name=name, deserialize=deserialize)
+
+    # --- Cultural Knowledge ---
+    def clear_cultural_knowledge(self) -> None:
+        return self.db.clear_cultural_knowledge()
+
+    def delete_cultural_knowledge(self, id: str) -> None:
+        return self.db.delete_cultural_knowledge(id=id)
+
+    def get_cultural_knowledge(self, id: str) -> Optional[CulturalKnowledge]:
+        return self.db.get_cultural_knowledge(id=id)
+
+    def get_all_cultural_knowledge(
+        self,
+        name: Optional[str] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        team_id: Optional[str] = None,
+    ) -> Optional[List[CulturalKnowledge]]:
+        return self.db.get_all_cultural_knowledge(
+            name=name,
+            limit=limit,
+            page=page,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            agent_id=agent_id,
+            team_id=team_id,
+        )
+
+    def upsert_cultural_knowledge(self, cultural_knowledge: CulturalKnowledge) -> Optional[CulturalKnowledge]:
+        return self.db.upsert_cultural_knowledge(cultural_knowledge=cultural_knowledge)
+
+
+class AsyncCachedDb(AsyncBaseDb):
+    def __init__(
+        self, db: AsyncBaseDb, max_sessions: int = 1024, ttl: Optional[float] = None, check_updated_at: bool = True
+    ):
+        """
+        Read-through, write-through cache of sessions in front of an async database.
+
+        See `CachedDb`. On a hit, the session is read again if another process wrote it since it was cached.
+        Concurrent turns on the same session can be serialized with `session_lock`.
+
+        Args:
+            db (AsyncBaseDb): The database to cache sessions of.
+            max_sessions (int): Maximum number of sessions kept, evicting the least recently used.
+            ttl (Optional[float]): Seconds after which a cached session is read again from the database.
+                None keeps sessions until evicted.
+            check_updated_at (bool): Check the updated_at of the stored session on every hit. Only disable it
+                when no other process writes the same sessions.
+        """
+        self.db = db
+        self.id = db.id
+        self.check_updated_at = check_updated_at
+        self.stats = SessionCacheStats()
+
+        self._sessions = _SessionLRU(max_sessions=max_sessions, ttl=ttl, stats=self.stats)
+        self._locks = _AsyncSessionLocks()
+
+    def __getattr__(self, name: str) -> Any:
+        # Table names, engines and other attributes of the wrapped database
+        if name == "db":
+            raise AttributeError(name)
+        return getattr(self.db, name)
+
+    @asynccontextmanager
+    async def session_lock(self, session_id: str) -> AsyncIterator[None]:
+        """Hold the lock of a session, e.g. around a run, to serialize concurrent turns on the same session.
+
+        The lock is reentrant within a task, and also serializes the reads and writes of the session through
+        this cache.
+        """
+        async with self._locks.hold(session_id):
+            yield
+
+    def invalidate(self, session_id: str, session_type: Optional[SessionType] = None) -> None:
+        """Drop a session from the cache, e.g. after another process updated it."""
+        self._sessions.invalidate(session_id, session_type)
+
+    def clear_cache(self) -> None:
+        self._sessions.clear()
+
+    async def _get_current_entry(
+        self, session_type: SessionType, session_id: str, user_id: Optional[str] = None
+    ) -> Optional[_CachedSession]:
+        """Get a cached session, if it is still the stored one."""
+        entry = self._sessions.get_entry(session_type, session_id, user_id)
+        if entry is None or not self.check_updated_at:
+            return entry
+        updated_at = await self.db.get_session_updated_at(session_id=session_id, session_type=session_type)
+        # The stored session was deleted or written since it was cached
+        if updated_at is None or updated_at > entry.updated_at:
+            self._sessions.invalidate(session_id, session_type)
+            return None
+        return entry
+
+    # --- Sessions ---
+    async def get_session(
+        self,
+        session_id: str,
+        session_type: SessionType,
+        user_id: Optional[str] = None,
+        deserialize: Optional[bool] = True,
+    ) -> Optional[Union[Session, Dict[str, Any]]]:
+        if not deserialize:
+            return await self.db.get_session(
+                session_id=session_id, session_type=session_type, user_id=user_id, deserialize=False
+            )
+
+        entry = await self._get_current_entry(session_type, session_id, user_id)
+        if entry is None:
+            async with self._locks.hold(session_id):
+                # Another task may have read the session while this one waited
+                entry = await self._get_current_entry(session_type, session_id, user_id)
+                if entry is None:
+                    self._sessions.record(misses=1)
+                    result = await self.db.get_session(
+                        session_id=session_id, session_type=session_type, user_id=user_id
+                    )
+                    if result is not None:
+                        self._sessions.put(result)  # type: ignore[arg-type]
+                    return result
+        self._sessions.record(hits=1)
+        log_debug(f"Session {session_id} served from cache")
+        return entry.session
+
+    async def upsert_session(
+        self, session: Session, deserialize: Optional[bool] = True
+    ) -> Optional[Union[Session, Dict[str, Any]]]:
+        async with self._locks.hold(session.session_id):
+            result = await self.db.upsert_session(session=session, deserialize=deserialize)
+            self._sessions.record(writes=1)
+            if deserialize and result is not None:
+                self._sessions.put(result, written=True)  # type: ignore[arg-type]
+            else:
+                self._sessions.invalidate(session.session_id, _get_session_type(session))
+            return result
+
+    async def rename_session(
+        self,
+        session_id: str,
+        session_type: SessionType,
+        session_name: str,
+        deserialize: Optional[bool] = True,
+    ) -> Optional[Union[Session, Dict[str, Any]]]:
+        async with self._locks.hold(session_id):
+            result = await self.db.rename_session(
+                session_id=session_id, session_type=session_type, session_name=session_name, deserialize=deserialize
+            )
+            if deserialize and result is not None:
+                self._sessions.put(result, written=True)  # type: ignore[arg-type]
+            else:
+                self._sessions.invalidate(session_id, session_type)
+            return result
+
+    async def delete_session(self, session_id: str) -> bool:
+        async with self._locks.hold(session_id):
+            self._sessions.invalidate(session_id)
+            return await self.db.delete_session(session_id=session_id)
+
+    async def delete_sessions(self, session_ids: List[str]) -> None:
+        for session_id in session_ids:
+            self._sessions.invalidate(session_id)
+        await self.db.delete_sessions(session_ids=session_ids)
+
+    # --- Delegated to the database ---
+    async def table_exists(self, table_name: str) -> bool:
+        return await self.db.table_exists(table_name=table_name)
+
+    async def get_latest_schema_version(self, table_name: str) -> str:
+        return await self.db.get_latest_schema_version(table_name=table_name)
+
+    async def upsert_schema_version(self, table_name: str, version: str):
+        return await self.db.upsert_schema_version(table_name=table_name, version=version)
+
+    async def get_session_updated_at(self, session_id: str, session_type: SessionType) -> Optional[int]:
+        return await self.db.get_session_updated_at(session_id=session_id, session_type=session_type)
+
+    async def get_sessions(
+        self,
+        session_type: SessionType,
+        user_id: Optional[str] = None,
+        component_id: Optional[str] = None,
+        session_name: Optional[str] = None,
+        start_timestamp: Optional[int] = None,
+        end_timestamp: Optional[int] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        deserialize: Optional[bool] = True,
+    ) -> Union[List[Session], Tuple[List[Dict[str, Any]], int]]:
+        return await self.db.get_sessions(
+            session_type=session_type,
+            user_id=user_id,
+            component_id=component_id,
+            session_name=session_name,
+            start_timestamp=start_timestamp,
+            end_timestamp=end_timestamp,
+            limit=limit,
+            page=page,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            deserialize=deserialize,
+        )
+
+    # --- Memory ---
+    async def clear_memories(self) -> None:
+        return await self.db.clear_memories()
+
+    async def delete_user_memory(self, memory_id: str, user_id: Optional[str] = None) -> None:
+        return await self.db.delete_user_memory(memory_id=memory_id, **_set_kwargs(user_id=user_id))
+
+    async def delete_user_memories(self, memory_ids: List[str], user_id: Optional[str] = None) -> None:
+        return await self.db.delete_user_memories(memory_ids=memory_ids, **_set_kwargs(user_id=user_id))
+
+    async def get_all_memory_topics(self, user_id: Optional[str] = None) -> List[str]:
+        return await self.db.get_all_memory_topics(**_set_kwargs(user_id=user_id))
+
+    async def get_user_memory(
+        self,
+        memory_id: str,
+        deserialize: Optional[bool] = True,
+        user_id: Optional[str] = None,
+    ) -> Optional[Union[UserMemory, Dict[str, Any]]]:
+        return await self.db.get_user_memory(
+            memory_id=memory_id, deserialize=deserialize, **_set_kwargs(user_id=user_id)
+        )
+
+    async def get_user_memories(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        team_id: Optional[str] = None,
+        topics: Optional[List[str]] = None,
+        search_content: Optional[str] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        deserialize: Optional[bool] = True,
+    ) -> Union[List[UserMemory], Tuple[List[Dict[str, Any]], int]]:
+        return await self.db.get_user_memories(
+            user_id=user_id,
+            agent_id=agent_id,
+            team_id=team_id,
+            topics=topics,
+            search_content=search_content,
+            limit=limit,
+            page=page,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            deserialize=deserialize,
+        )
+
+    async def get_user_memory_stats(
+        self,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        user_id: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        return await self.db.get_user_memory_stats(limit=limit, page=page, **_set_kwargs(user_id=user_id))
+
+    async def upsert_user_memory(
+        self, memory: UserMemory, deserialize: Optional[bool] = True
+    ) -> Optional[Union[UserMemory, Dict[str, Any]]]:
+        return await self.db.upsert_user_memory(memory=memory, deserialize=deserialize)
+
+    # --- Metrics ---
+    async def get_metrics(
+        self, starting_date: Optional[date] = None, ending_date: Optional[date] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        return await self.db.get_metrics(starting_date=starting_date, ending_date=ending_date)
+
+    async def calculate_metrics(self) -> Optional[Any]:
+        return await self.db.calculate_metrics()
+
+    # --- Knowledge ---
+    async def delete_knowledge_content(self, id: str):
+        return await self.db.delete_knowledge_content(id=id)
+
+    async def get_knowledge_content(self, id: str) -> Optional[KnowledgeRow]:
+        return await self.db.get_knowledge_content(id=id)
+
+    async def get_knowledge_contents(
+        self,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+    ) -> Tuple[List[KnowledgeRow], int]:
+        return await self.db.get_knowledge_contents(limit=limit, page=page, sort_by=sort_by, sort_order=sort_order)
+
+    async def upsert_knowledge_content(self, knowledge_row: KnowledgeRow):
+        return await self.db.upsert_knowledge_content(knowledge_row=knowledge_row)
+
+    # --- Evals ---
+    async def create_eval_run(self, eval_run: EvalRunRecord) -> Optional[EvalRunRecord]:
+        return await self.db.create_eval_run(eval_run=eval_run)
+
+    async def delete_eval_runs(self, eval_run_ids: List[str]) -> None:
+        return await self.db.delete_eval_runs(eval_run_ids=eval_run_ids)
+
+    async def get_eval_run(
+        self, eval_run_id: str, deserialize: Optional[bool] = True
+    ) -> Optional[Union[EvalRunRecord, Dict[str, Any]]]:
+        return await self.db.get_eval_run(eval_run_id=eval_run_id, deserialize=deserialize)
+
+    async def get_eval_runs(
+        self,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        team_id: Optional[str] = None,
+        workflow_id: Optional[str] = None,
+        model_id: Optional[str] = None,
+        filter_type: Optional[EvalFilterType] = None,
+        eval_type: Optional[List[EvalType]] = None,
+        deserialize: Optional[bool] = True,
+    ) -> Union[List[EvalRunRecord], Tuple[List[Dict[str, Any]], int]]:
+        return await self.db.get_eval_runs(
+            limit=limit,
+            page=page,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            agent_id=agent_id,
+            team_id=team_id,
+            workflow_id=workflow_id,
+            model_id=model_id,
+            filter_type=filter_type,
+            eval_type=eval_type,
+            deserialize=deserialize,
+        )
+
+    async def rename_eval_run(
+        self, eval_run_id: str, name: str, deserialize: Optional[bool] = True
+    ) -> Optional[Union[EvalRunRecord, Dict[str, Any]]]:
+        return await self.db.rename_eval_run(eval_run_id=eval_run_id, name=name, deserialize=deserialize)
+
+    # --- Cultural Knowledge ---
+    async def clear_cultural_knowledge(self) -> None:
+        return await self.db.clear_cultural_knowledge()
+
+    async def delete_cultural_knowledge(self, id: str) -> None:
+        return await self.db.delete_cultural_knowledge(id=id)
+
+    async def get_cultural_knowledge(self, id: str) -> Optional[CulturalKnowledge]:
+        return await self.db.get_cultural_knowledge(id=id)
+
+    async def get_all_cultural_knowledge(
+        self,
+        name: Optional[str] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        team_id: Optional[str] = None,
+    ) -> Optional[List[CulturalKnowledge]]:
+        return await self.db.get_all_cultural_knowledge(
+            name=name,
+            limit=limit,
+            page=page,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            agent_id=agent_id,
+            team_id=team_id,
+        )
+
+    async def upsert_cultural_knowledge(self, cultural_knowledge: CulturalKnowledge) -> Optional[CulturalKnowledge]:
+        return await self.db.upsert_cultural_knowledge(cultural_knowledge=cultural_knowledge)
@@ -1,7 +1,7 @@
 import time
-from copy import deepcopy
+from copy import copy, deepcopy
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 from uuid import uuid4
 
 from agno.db.base import BaseDb, SessionType
@@ -20,19 +20,108 @@ from agno.db.schemas.memory import UserMemory
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 
+# (session_id, session_type, id of the agent, team or workflow owning the session)
+SessionKey = Tuple[str, str, Optional[str]]
+
+COMPONENT_ID_FIELDS = {
+    SessionType.AGENT.value: "agent_id",
+    SessionType.TEAM.value: "team_id",
+    SessionType.WORKFLOW.value: "workflow_id",
+}
+
+
+def _copy_run(run: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a stored run with the containers RunOutput.from_dict writes to: the run, message and event dicts."""
+    run = dict(run)
+    for key in ("messages", "additional_input", "reasoning_messages"):
+        if run.get(key):
+            run[key] = [dict(message) for message in run[key]]
+    # Events and member runs are deserialized like runs
+    for key in ("events", "member_responses"):
+        if run.get(key):
+            run[key] = [_copy_run(item) for item in run[key]]
+    return run
+
+
+def _copy_session(session: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a stored session, sharing the values that neither from_dict nor callers of the session modify.
+
+    The session state and metadata are copied whole, as callers modify them in place. Workflow runs nest the
+    outputs of their steps, and are copied whole too.
+    """
+    session = dict(session)
+    for key in ("session_data", "agent_data", "team_data", "workflow_data", "metadata", "summary"):
+        if session.get(key) is not None:
+            session[key] = deepcopy(session[key])
+    if session.get("runs"):
+        if session.get("session_type") == SessionType.WORKFLOW.value:
+            session["runs"] = deepcopy(session["runs"])
+        else:
+            session["runs"] = [_copy_run(run) for run in session["runs"]]
+    return session
+
+
+def _copy_memory(memory: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a stored memory along with its topics and other containers."""
+    return {key: copy(value) if isinstance(value, (dict, list)) else value for key, value in memory.items()}
+
+
+def _discard_from_index(index: Dict[Any, Dict[Any, None]], index_key: Any, key: Any) -> None:
+    """Remove a key from a secondary index, dropping the index entry once it is empty."""
+    keys = index.get(index_key)
+    if keys is not None:
+        keys.pop(key, None)
+        if not keys:
+            del index[index_key]
+
 
 class InMemoryDb(BaseDb):
-    def __init__(self):
-        """Interface for in-memory storage."""
-        super().__init__()
-
-        # Initialize in-memory storage dictionaries
-        self._sessions: List[Dict[str, Any]] = []
-        self._memories: List[Dict[str, Any]] = []
-        self._metrics: List[Dict[str, Any]] = []
-        self._eval_runs: List[Dict[str, Any]] = []
-        self._knowledge: List[Dict[str, Any]] = []
-        self._cultural_knowledge: List[Dict[str, Any]] = []
+    def __init__(
+        self,
+        id: Optional[str] = None,
+        session_table: Optional[str] = None,
+        culture_table: Optional[str] = None,
+        memory_table: Optional[str] = None,
+        metrics_table: Optional[str] = None,
+        eval_table: Optional[str] = None,
+        knowledge_table: Optional[str] = None,
+    ):
+        """
+        Interface for in-memory storage.
+
+        Args:
+            id (Optional[str]): ID of the database.
+            session_table (Optional[str]): Name of the session table.
+            culture_table (Optional[str]): Name of the cultural knowledge table.
+            memory_table (Optional[str]): Name of the memory table.
+            metrics_table (Optional[str]): Name of the metrics table.
+            eval_table (Optional[str]): Name of the eval runs table.
+            knowledge_table (Optional[str]): Name of the knowledge table.
+        """
+        super().__init__(
+            id=id,
+            session_table=session_table,
+            culture_table=culture_table,
+            memory_table=memory_table,
+            metrics_table=metrics_table,
+            eval_table=eval_table,
+            knowledge_table=knowledge_table,
+        )
+
+        # Sessions, memories and knowledge are keyed by their ids, with secondary indexes for the common lookups.
+        # Index values are dicts used as insertion-ordered sets.
+        # Stored records are never modified in place: writes swap in a new record, reads copy the records returned.
+        self._sessions: Dict[SessionKey, Dict[str, Any]] = {}
+        self._session_keys_by_id: Dict[str, Dict[SessionKey, None]] = {}
+        self._session_keys_by_user: Dict[Optional[str], Dict[SessionKey, None]] = {}
+        self._session_keys_by_component: Dict[Tuple[str, Optional[str]], Dict[SessionKey, None]] = {}
+        self._memories: Dict[str, Dict[str, Any]] = {}
+        self._memory_ids_by_user: Dict[Optional[str], Dict[str, None]] = {}
+        self._knowledge: Dict[str, Dict[str, Any]] = {}
+        self._eval_runs: Dict[str, Dict[str, Any]] = {}
+        self._cultural_knowledge: Dict[str, Dict[str, Any]] = {}
+        # Keyed by (date, aggregation_period)
+        self._metrics: Dict[Tuple[str, str], Dict[str, Any]] = {}
 
     def table_exists(self, table_name: str) -> bool:
         """In-memory implementation, always returns True."""
@@ -46,7 +135,42 @@ class InMemoryDb(BaseDb):
         """Upsert the schema version into the database."""
         pass
 
+    def _put_record(self, table: str, key: Any, record: Dict[str, Any]) -> None:
+        """Store a record in one of the tables without secondary indexes (knowledge, eval_runs, metrics, cultural_knowledge)."""
+        getattr(self, f"_{table}")[key] = record
+
+    def _delete_record(self, table: str, key: Any) -> bool:
+        """Delete a record from one of the tables without secondary indexes. Returns True if it existed."""
+        return getattr(self, f"_{table}").pop(key, None) is not None
+
     # -- Session methods --
+    def _session_key(self, session_dict: Dict[str, Any]) -> SessionKey:
+        """Primary key of a stored session: its id, type and the id of the agent, team or workflow owning it."""
+        session_type = session_dict.get("session_type")
+        component_field = COMPONENT_ID_FIELDS.get(session_type)  # type: ignore[arg-type]
+        component_id = session_dict.get(component_field) if component_field else None
+        return session_dict.get("session_id"), session_type, component_id  # type: ignore[return-value]
+
+    def _store_session(self, key: SessionKey, session_dict: Dict[str, Any]) -> None:
+        """Store a session snapshot, replacing the previous snapshot for the same key and updating the indexes."""
+        previous = self._sessions.get(key)
+        if previous is not None and previous.get("user_id") != session_dict.get("user_id"):
+            _discard_from_index(self._session_keys_by_user, previous.get("user_id"), key)
+
+        self._sessions[key] = session_dict
+        self._session_keys_by_id.setdefault(key[0], {})[key] = None
+        self._session_keys_by_user.setdefault(session_dict.get("user_id"), {})[key] = None
+        self._session_keys_by_component.setdefault((key[1], key[2]), {})[key] = None
+
+    def _remove_session(self, key: SessionKey) -> None:
+        """Remove a stored session and its index entries."""
+        session_dict = self._sessions.pop(key, None)
+        if session_dict is None:
+            return
+        _discard_from_index(self._session_keys_by_id, key[0], key)
+        _discard_from_index(self._session_keys_by_user, session_dict.get("user_id"), key)
+        _discard_from_index(self._session_keys_by_component, (key[1], key[2]), key)
+
     def delete_session(self, session_id: str) -> bool:
         """Delete a session from in-memory storage.
 
@@ -60,10 +184,11 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            original_count = len(self._sessions)
-            self._sessions = [s for s in self._sessions if s.get("session_id") != session_id]
+            keys = list(self._session_keys_by_id.get(session_id, {}))
+            for key in keys:
+                self._remove_session(key)
 
-            if len(self._sessions) < original_count:
+            if keys:
                 log_debug(f"Successfully deleted session with session_id: {session_id}")
                 return True
             else:
@@ -84,7 +209,9 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            self._sessions = [s for s in self._sessions if s.get("session_id") not in session_ids]
+            for session_id in session_ids:
+                for key in list(self._session_keys_by_id.get(session_id, {})):
+                    self._remove_session(key)
             log_debug(f"Successfully deleted sessions with ids: {session_ids}")
 
         except Exception as e:
@@ -115,22 +242,23 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs while reading the session.
         """
         try:
-            for session_data in self._sessions:
-                if session_data.get("session_id") == session_id:
-                    if user_id is not None and session_data.get("user_id") != user_id:
-                        continue
+            for key in self._session_keys_by_id.get(session_id, {}):
+                session_data = self._sessions[key]
+                if user_id is not None and session_data.get("user_id") != user_id:
+                    continue
 
-                    session_data_copy = deepcopy(session_data)
+                # The returned session must not alias the containers of the stored one that get modified
+                session_data_copy = _copy_session(session_data)
 
-                    if not deserialize:
-                        return session_data_copy
+                if not deserialize:
+                    return session_data_copy
 
-                    if session_type == SessionType.AGENT:
-                        return AgentSession.from_dict(session_data_copy)
-                    elif session_type == SessionType.TEAM:
-                        return TeamSession.from_dict(session_data_copy)
-                    else:
-                        return WorkflowSession.from_dict(session_data_copy)
+                if session_type == SessionType.AGENT:
+                    return AgentSession.from_dict(session_data_copy)
+                elif session_type == SessionType.TEAM:
+                    return TeamSession.from_dict(session_data_copy)
+                else:
+                    return WorkflowSession.from_dict(session_data_copy)
 
             return None
 
@@ -141,6 +269,12 @@ class InMemoryDb(BaseDb):
             log_error(f"Exception reading session: {e}")
             raise e
 
+    def get_session_updated_at(self, session_id: str, session_type: SessionType) -> Optional[int]:
+        """Get the updated_at of a stored session, or None if it doesn't exist. Doesn't copy the session."""
+        for key in self._session_keys_by_id.get(session_id, {}):
+            return self._sessions[key].get("updated_at") or 0
+        return None
+
     def get_sessions(
         self,
         session_type: SessionType,
@@ -179,18 +313,23 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs while reading the sessions.
         """
         try:
+            session_type_value = session_type.value if isinstance(session_type, SessionType) else session_type
+
+            # Start from the narrowest index available
+            candidate_keys: Iterable[SessionKey]
+            if component_id is not None:
+                candidate_keys = self._session_keys_by_component.get((session_type_value, component_id), {})
+            elif user_id is not None:
+                candidate_keys = self._session_keys_by_user.get(user_id, {})
+            else:
+                candidate_keys = self._sessions.keys()
+
             # Apply filters
             filtered_sessions = []
-            for session_data in self._sessions:
+            for key in candidate_keys:
+                session_data = self._sessions[key]
                 if user_id is not None and session_data.get("user_id") != user_id:
                     continue
-                if component_id is not None:
-                    if session_type == SessionType.AGENT and session_data.get("agent_id") != component_id:
-                        continue
-                    elif session_type == SessionType.TEAM and session_data.get("team_id") != component_id:
-                        continue
-                    elif session_type == SessionType.WORKFLOW and session_data.get("workflow_id") != component_id:
-                        continue
                 if start_timestamp is not None and session_data.get("created_at", 0) < start_timestamp:
                     continue
                 if end_timestamp is not None and session_data.get("created_at", 0) > end_timestamp:
@@ -199,11 +338,10 @@ class InMemoryDb(BaseDb):
                     stored_name = session_data.get("session_data", {}).get("session_name", "")
                     if session_name.lower() not in stored_name.lower():
                         continue
-                session_type_value = session_type.value if isinstance(session_type, SessionType) else session_type
                 if session_data.get("session_type") != session_type_value:
                     continue
 
-                filtered_sessions.append(deepcopy(session_data))
+                filtered_sessions.append(session_data)
 
             total_count = len(filtered_sessions)
 
@@ -217,6 +355,9 @@ class InMemoryDb(BaseDb):
                     start_idx = (page - 1) * limit
                 filtered_sessions = filtered_sessions[start_idx : start_idx + limit]
 
+            # Only copy the sessions being returned
+            filtered_sessions = [_copy_session(session_data) for session_data in filtered_sessions]
+
             if not deserialize:
                 return filtered_sessions, total_count
 
@@ -237,27 +378,30 @@ class InMemoryDb(BaseDb):
         self, session_id: str, session_type: SessionType, session_name: str, deserialize: Optional[bool] = True
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         try:
-            for i, session in enumerate(self._sessions):
-                if session.get("session_id") == session_id and session.get("session_type") == session_type.value:
-                    # Update session name in session_data
-                    if "session_data" not in session:
-                        session["session_data"] = {}
-                    session["session_data"]["session_name"] = session_name
+            for key in list(self._session_keys_by_id.get(session_id, {})):
+                session = self._sessions[key]
+                if session.get("session_type") != session_type.value:
+                    continue
 
-                    self._sessions[i] = session
+                # Stored sessions are never modified in place: build the renamed snapshot and swap it in
+                renamed_session = {
+                    **session,
+                    "session_data": {**(session.get("session_data") or {}), "session_name": session_name},
+                }
+                self._store_session(key, renamed_session)
 
-                    log_debug(f"Renamed session with id '{session_id}' to '{session_name}'")
+                log_debug(f"Renamed session with id '{session_id}' to '{session_name}'")
 
-                    session_copy = deepcopy(session)
-                    if not deserialize:
-                        return session_copy
+                session_copy = deepcopy(renamed_session)
+                if not deserialize:
+                    return session_copy
 
-                    if session_type == SessionType.AGENT:
-                        return AgentSession.from_dict(session_copy)
-                    elif session_type == SessionType.TEAM:
-                        return TeamSession.from_dict(session_copy)
-                    else:
-                        return WorkflowSession.from_dict(session_copy)
+                if session_type == SessionType.AGENT:
+                    return AgentSession.from_dict(session_copy)
+                elif session_type == SessionType.TEAM:
+                    return TeamSession.from_dict(session_copy)
+                else:
+                    return WorkflowSession.from_dict(session_copy)
 
             return None
 
@@ -279,47 +423,30 @@ class InMemoryDb(BaseDb):
             elif isinstance(session, WorkflowSession):
                 session_dict["session_type"] = SessionType.WORKFLOW.value
 
-            # Find existing session to update
-            session_updated = False
-            for i, existing_session in enumerate(self._sessions):
-                if existing_session.get("session_id") == session_dict.get("session_id") and self._matches_session_key(
-                    existing_session, session
-                ):
-                    session_dict["updated_at"] = int(time.time())
-                    self._sessions[i] = deepcopy(session_dict)
-                    session_updated = True
-                    break
-
-            if not session_updated:
+            key = self._session_key(session_dict)
+            if key in self._sessions:
+                session_dict["updated_at"] = int(time.time())
+            else:
                 session_dict["created_at"] = session_dict.get("created_at", int(time.time()))
                 session_dict["updated_at"] = session_dict.get("created_at")
-                self._sessions.append(deepcopy(session_dict))
 
-            session_dict_copy = deepcopy(session_dict)
+            # The stored snapshot is a private copy, the returned session is built from the serialized input
+            self._store_session(key, deepcopy(session_dict))
+
             if not deserialize:
-                return session_dict_copy
+                return session_dict
 
-            if session_dict_copy["session_type"] == SessionType.AGENT:
-                return AgentSession.from_dict(session_dict_copy)
-            elif session_dict_copy["session_type"] == SessionType.TEAM:
-                return TeamSession.from_dict(session_dict_copy)
+            if session_dict["session_type"] == SessionType.AGENT:
+                return AgentSession.from_dict(session_dict)
+            elif session_dict["session_type"] == SessionType.TEAM:
+                return TeamSession.from_dict(session_dict)
             else:
-                return WorkflowSession.from_dict(session_dict_copy)
+                return WorkflowSession.from_dict(session_dict)
 
         except Exception as e:
             log_error(f"Exception upserting session: {e}")
             raise e
 
-    def _matches_session_key(self, existing_session: Dict[str, Any], session: Session) -> bool:
-        """Check if existing session matches the key for the session type."""
-        if isinstance(session, AgentSession):
-            return existing_session.get("agent_id") == session.agent_id
-        elif isinstance(session, TeamSession):
-            return existing_session.get("team_id") == session.team_id
-        elif isinstance(session, WorkflowSession):
-            return existing_session.get("workflow_id") == session.workflow_id
-        return False
-
     def upsert_sessions(
         self, sessions: List[Session], deserialize: Optional[bool] = True, preserve_updated_at: bool = False
     ) -> List[Union[Session, Dict[str, Any]]]:
@@ -355,6 +482,26 @@ class InMemoryDb(BaseDb):
             return []
 
     # -- Memory methods --
+    def _store_memory(self, memory_dict: Dict[str, Any]) -> None:
+        """Store a memory snapshot, replacing the previous snapshot with the same id and updating the user index."""
+        memory_id = memory_dict["memory_id"]
+        previous = self._memories.get(memory_id)
+        if previous is not None and previous.get("user_id") != memory_dict.get("user_id"):
+            _discard_from_index(self._memory_ids_by_user, previous.get("user_id"), memory_id)
+
+        self._memories[memory_id] = memory_dict
+        self._memory_ids_by_user.setdefault(memory_dict.get("user_id"), {})[memory_id] = None
+
+    def _remove_memory(self, memory_id: str, user_id: Optional[str] = None) -> bool:
+        """Remove a memory and its index entry. If user_id is given, only remove the memory if it belongs to that user."""
+        memory_dict = self._memories.get(memory_id)
+        if memory_dict is None or (user_id is not None and memory_dict.get("user_id") != user_id):
+            return False
+
+        del self._memories[memory_id]
+        _discard_from_index(self._memory_ids_by_user, memory_dict.get("user_id"), memory_id)
+        return True
+
     def delete_user_memory(self, memory_id: str, user_id: Optional[str] = None):
         """Delete a user memory from in-memory storage.
 
@@ -366,17 +513,7 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            original_count = len(self._memories)
-
-            # If user_id is provided, verify ownership before deleting
-            if user_id is not None:
-                self._memories = [
-                    m for m in self._memories if not (m.get("memory_id") == memory_id and m.get("user_id") == user_id)
-                ]
-            else:
-                self._memories = [m for m in self._memories if m.get("memory_id") != memory_id]
-
-            if len(self._memories) < original_count:
+            if self._remove_memory(memory_id, user_id=user_id):
                 log_debug(f"Successfully deleted user memory id: {memory_id}")
             else:
                 log_debug(f"No memory found with id: {memory_id}")
@@ -396,13 +533,8 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            # If user_id is provided, verify ownership before deleting
-            if user_id is not None:
-                self._memories = [
-                    m for m in self._memories if not (m.get("memory_id") in memory_ids and m.get("user_id") == user_id)
-                ]
-            else:
-                self._memories = [m for m in self._memories if m.get("memory_id") not in memory_ids]
+            for memory_id in memory_ids:
+                self._remove_memory(memory_id, user_id=user_id)
             log_debug(f"Successfully deleted {len(memory_ids)} user memories")
 
         except Exception as e:
@@ -420,7 +552,7 @@ class InMemoryDb(BaseDb):
         """
         try:
             topics = set()
-            for memory in self._memories:
+            for memory in self._memories.values():
                 memory_topics = memory.get("topics", [])
                 if isinstance(memory_topics, list):
                     topics.update(memory_topics)
@@ -447,18 +579,17 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs while reading the memory.
         """
         try:
-            for memory_data in self._memories:
-                if memory_data.get("memory_id") == memory_id:
-                    # Filter by user_id if provided
-                    if user_id is not None and memory_data.get("user_id") != user_id:
-                        continue
-
-                    memory_data_copy = deepcopy(memory_data)
-                    if not deserialize:
-                        return memory_data_copy
-                    return UserMemory.from_dict(memory_data_copy)
+            memory_data = self._memories.get(memory_id)
+            if memory_data is None:
+                return None
+            # Filter by user_id if provided
+            if user_id is not None and memory_data.get("user_id") != user_id:
+                return None
 
-            return None
+            memory_data_copy = _copy_memory(memory_data)
+            if not deserialize:
+                return memory_data_copy
+            return UserMemory.from_dict(memory_data_copy)
 
         except Exception as e:
             log_error(f"Exception reading from memory storage: {e}")
@@ -478,11 +609,14 @@ class InMemoryDb(BaseDb):
         deserialize: Optional[bool] = True,
     ) -> Union[List[UserMemory], Tuple[List[Dict[str, Any]], int]]:
         try:
+            if user_id is not None:
+                candidates = [self._memories[memory_id] for memory_id in self._memory_ids_by_user.get(user_id, {})]
+            else:
+                candidates = list(self._memories.values())
+
             # Apply filters
             filtered_memories = []
-            for memory_data in self._memories:
-                if user_id is not None and memory_data.get("user_id") != user_id:
-                    continue
+            for memory_data in candidates:
                 if agent_id is not None and memory_data.get("agent_id") != agent_id:
                     continue
                 if team_id is not None and memory_data.get("team_id") != team_id:
@@ -496,7 +630,7 @@ class InMemoryDb(BaseDb):
                     if search_content.lower() not in memory_content.lower():
                         continue
 
-                filtered_memories.append(deepcopy(memory_data))
+                filtered_memories.append(memory_data)
 
             total_count = len(filtered_memories)
 
@@ -510,6 +644,9 @@ class InMemoryDb(BaseDb):
                     start_idx = (page - 1) * limit
                 filtered_memories = filtered_memories[start_idx : start_idx + limit]
 
+            # Only copy the memories being returned
+            filtered_memories = [_copy_memory(memory_data) for memory_data in filtered_memories]
+
             if not deserialize:
                 return filtered_memories, total_count
 
@@ -535,24 +672,19 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs while getting stats.
         """
         try:
-            user_stats = {}
-
-            for memory in self._memories:
-                memory_user_id = memory.get("user_id")
-
-                if memory_user_id:
-                    if memory_user_id not in user_stats:
-                        user_stats[memory_user_id] = {
-                            "user_id": memory_user_id,
-                            "total_memories": 0,
-                            "last_memory_updated_at": 0,
-                        }
-                    user_stats[memory_user_id]["total_memories"] += 1
-                    updated_at = memory.get("updated_at", 0)
-                    if updated_at > user_stats[memory_user_id]["last_memory_updated_at"]:
-                        user_stats[memory_user_id]["last_memory_updated_at"] = updated_at
-
-            stats_list = list(user_stats.values())
+            stats_list = []
+            for memory_user_id, memory_ids in self._memory_ids_by_user.items():
+                if not memory_user_id:
+                    continue
+                stats_list.append(
+                    {
+                        "user_id": memory_user_id,
+                        "total_memories": len(memory_ids),
+                        "last_memory_updated_at": max(
+                            [self._memories[memory_id].get("updated_at") or 0 for memory_id in memory_ids]
+                        ),
+                    }
+                )
             stats_list.sort(key=lambda x: x["last_memory_updated_at"], reverse=True)
 
             total_count = len(stats_list)
@@ -580,16 +712,7 @@ class InMemoryDb(BaseDb):
             memory_dict = memory.to_dict() if hasattr(memory, "to_dict") else memory.__dict__
             memory_dict["updated_at"] = int(time.time())
 
-            # Find existing memory to update
-            memory_updated = False
-            for i, existing_memory in enumerate(self._memories):
-                if existing_memory.get("memory_id") == memory.memory_id:
-                    self._memories[i] = memory_dict
-                    memory_updated = True
-                    break
-
-            if not memory_updated:
-                self._memories.append(memory_dict)
+            self._store_memory(memory_dict)
 
             memory_dict_copy = deepcopy(memory_dict)
             if not deserialize:
@@ -643,8 +766,8 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            self._memories.clear()
-
+            for memory_id in list(self._memories):
+                self._remove_memory(memory_id)
         except Exception as e:
             log_warning(f"Exception deleting all memories: {e}")
             raise e
@@ -653,7 +776,7 @@ class InMemoryDb(BaseDb):
     def calculate_metrics(self) -> Optional[list[dict]]:
         """Calculate metrics for all dates without complete metrics."""
         try:
-            starting_date = self._get_metrics_calculation_starting_date(self._metrics)
+            starting_date = self._get_metrics_calculation_starting_date(list(self._metrics.values()))
             if starting_date is None:
                 log_info("No session data found. Won't calculate metrics.")
                 return None
@@ -689,19 +812,7 @@ class InMemoryDb(BaseDb):
                 metrics_record = calculate_date_metrics(date_to_process, sessions_for_date)
 
                 # Upsert metrics record
-                existing_record_idx = None
-                for i, existing_metric in enumerate(self._metrics):
-                    if (
-                        existing_metric.get("date") == str(date_to_process)
-                        and existing_metric.get("aggregation_period") == "daily"
-                    ):
-                        existing_record_idx = i
-                        break
-
-                if existing_record_idx is not None:
-                    self._metrics[existing_record_idx] = metrics_record
-                else:
-                    self._metrics.append(metrics_record)
+                self._put_record("metrics", (str(date_to_process), "daily"), metrics_record)
 
                 results.append(metrics_record)
 
@@ -728,9 +839,7 @@ class InMemoryDb(BaseDb):
 
         # No metrics records. Return the date of the first recorded session.
         if self._sessions:
-            # Sort by created_at
-            sorted_sessions = sorted(self._sessions, key=lambda x: x.get("created_at", 0))
-            first_session_date = sorted_sessions[0]["created_at"]
+            first_session_date = min(session.get("created_at", 0) for session in self._sessions.values())
             return datetime.fromtimestamp(first_session_date, tz=timezone.utc).date()
 
         return None
@@ -741,18 +850,19 @@ class InMemoryDb(BaseDb):
         """Get all sessions for metrics calculation."""
         try:
             filtered_sessions = []
-            for session in self._sessions:
+            for session in self._sessions.values():
                 created_at = session.get("created_at", 0)
                 if start_timestamp is not None and created_at < start_timestamp:
                     continue
                 if end_timestamp is not None and created_at >= end_timestamp:
                     continue
 
-                # Only include necessary fields for metrics
+                # Only include necessary fields for metrics. Metrics are calculated without modifying the sessions,
+                # so the stored snapshots are used as they are
                 filtered_session = {
                     "user_id": session.get("user_id"),
-                    "session_data": deepcopy(session.get("session_data")),
-                    "runs": deepcopy(session.get("runs")),
+                    "session_data": session.get("session_data"),
+                    "runs": session.get("runs"),
                     "created_at": session.get("created_at"),
                     "session_type": session.get("session_type"),
                 }
@@ -774,7 +884,7 @@ class InMemoryDb(BaseDb):
             filtered_metrics = []
             latest_updated_at = None
 
-            for metric in self._metrics:
+            for metric in self._metrics.values():
                 metric_date = datetime.strptime(metric.get("date", ""), "%Y-%m-%d").date()
 
                 if starting_date and metric_date < starting_date:
@@ -806,7 +916,7 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            self._knowledge = [item for item in self._knowledge if item.get("id") != id]
+            self._delete_record("knowledge", id)
 
         except Exception as e:
             log_error(f"Error deleting knowledge content: {e}")
@@ -825,11 +935,8 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs during retrieval.
         """
         try:
-            for item in self._knowledge:
-                if item.get("id") == id:
-                    return KnowledgeRow.model_validate(item)
-
-            return None
+            item = self._knowledge.get(id)
+            return KnowledgeRow.model_validate(item) if item is not None else None
 
         except Exception as e:
             log_error(f"Error getting knowledge content: {e}")
@@ -857,7 +964,7 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs during retrieval.
         """
         try:
-            knowledge_items = [deepcopy(item) for item in self._knowledge]
+            knowledge_items = list(self._knowledge.values())
 
             total_count = len(knowledge_items)
 
@@ -871,6 +978,7 @@ class InMemoryDb(BaseDb):
                     start_idx = (page - 1) * limit
                 knowledge_items = knowledge_items[start_idx : start_idx + limit]
 
+            # model_validate builds new containers, like get_knowledge_content
             return [KnowledgeRow.model_validate(item) for item in knowledge_items], total_count
 
         except Exception as e:
@@ -890,18 +998,7 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs during upsert.
         """
         try:
-            knowledge_dict = knowledge_row.model_dump()
-
-            # Find existing item to update
-            item_updated = False
-            for i, existing_item in enumerate(self._knowledge):
-                if existing_item.get("id") == knowledge_row.id:
-                    self._knowledge[i] = knowledge_dict
-                    item_updated = True
-                    break
-
-            if not item_updated:
-                self._knowledge.append(knowledge_dict)
+            self._put_record("knowledge", knowledge_row.id, knowledge_row.model_dump())
 
             return knowledge_row
 
@@ -919,7 +1016,7 @@ class InMemoryDb(BaseDb):
             eval_dict["created_at"] = current_time
             eval_dict["updated_at"] = current_time
 
-            self._eval_runs.append(eval_dict)
+            self._put_record("eval_runs", eval_run.run_id, eval_dict)
 
             log_debug(f"Created eval run with id '{eval_run.run_id}'")
 
@@ -932,10 +1029,7 @@ class InMemoryDb(BaseDb):
     def delete_eval_runs(self, eval_run_ids: List[str]) -> None:
         """Delete multiple eval runs from in-memory storage."""
         try:
-            original_count = len(self._eval_runs)
-            self._eval_runs = [run for run in self._eval_runs if run.get("run_id") not in eval_run_ids]
-
-            deleted_count = original_count - len(self._eval_runs)
+            deleted_count = sum(self._delete_record("eval_runs", eval_run_id) for eval_run_id in eval_run_ids)
             if deleted_count > 0:
                 log_debug(f"Deleted {deleted_count} eval runs")
             else:
@@ -950,14 +1044,14 @@ class InMemoryDb(BaseDb):
     ) -> Optional[Union[EvalRunRecord, Dict[str, Any]]]:
         """Get an eval run from in-memory storage."""
         try:
-            for run_data in self._eval_runs:
-                if run_data.get("run_id") == eval_run_id:
-                    run_data_copy = deepcopy(run_data)
-                    if not deserialize:
-                        return run_data_copy
-                    return EvalRunRecord.model_validate(run_data_copy)
+            run_data = self._eval_runs.get(eval_run_id)
+            if run_data is None:
+                return None
 
-            return None
+            run_data_copy = deepcopy(run_data)
+            if not deserialize:
+                return run_data_copy
+            return EvalRunRecord.model_validate(run_data_copy)
 
         except Exception as e:
             log_error(f"Exception getting eval run {eval_run_id}: {e}")
@@ -981,7 +1075,7 @@ class InMemoryDb(BaseDb):
         try:
             # Apply filters
             filtered_runs = []
-            for run_data in self._eval_runs:
+            for run_data in self._eval_runs.values():
                 if agent_id is not None and run_data.get("agent_id") != agent_id:
                     continue
                 if team_id is not None and run_data.get("team_id") != team_id:
@@ -1001,7 +1095,7 @@ class InMemoryDb(BaseDb):
                     elif filter_type == EvalFilterType.WORKFLOW and run_data.get("workflow_id") is None:
                         continue
 
-                filtered_runs.append(deepcopy(run_data))
+                filtered_runs.append(run_data)
 
             total_count = len(filtered_runs)
 
@@ -1018,10 +1112,11 @@ class InMemoryDb(BaseDb):
                     start_idx = (page - 1) * limit
                 filtered_runs = filtered_runs[start_idx : start_idx + limit]
 
+            # Only copy the eval runs being returned
             if not deserialize:
-                return filtered_runs, total_count
+                return [deepcopy(run) for run in filtered_runs], total_count
 
-            return [EvalRunRecord.model_validate(run) for run in filtered_runs]
+            return [EvalRunRecord.model_validate(deepcopy(run)) for run in filtered_runs]
 
         except Exception as e:
             log_error(f"Exception getting eval runs: {e}")
@@ -1032,21 +1127,20 @@ class InMemoryDb(BaseDb):
     ) -> Optional[Union[EvalRunRecord, Dict[str, Any]]]:
         """Rename an eval run."""
         try:
-            for i, run_data in enumerate(self._eval_runs):
-                if run_data.get("run_id") == eval_run_id:
-                    run_data["name"] = name
-                    run_data["updated_at"] = int(time.time())
-                    self._eval_runs[i] = run_data
+            run_data = self._eval_runs.get(eval_run_id)
+            if run_data is None:
+                return None
 
-                    log_debug(f"Renamed eval run with id '{eval_run_id}' to '{name}'")
+            run_data = {**run_data, "name": name, "updated_at": int(time.time())}
+            self._put_record("eval_runs", eval_run_id, run_data)
 
-                    run_data_copy = deepcopy(run_data)
-                    if not deserialize:
-                        return run_data_copy
+            log_debug(f"Renamed eval run with id '{eval_run_id}' to '{name}'")
 
-                    return EvalRunRecord.model_validate(run_data_copy)
+            run_data_copy = deepcopy(run_data)
+            if not deserialize:
+                return run_data_copy
 
-            return None
+            return EvalRunRecord.model_validate(run_data_copy)
 
         except Exception as e:
             log_error(f"Error renaming eval run {eval_run_id}: {e}")
@@ -1057,7 +1151,8 @@ class InMemoryDb(BaseDb):
     def clear_cultural_knowledge(self) -> None:
         """Delete all cultural knowledge from in-memory storage."""
         try:
-            self._cultural_knowledge = []
+            for id in list(self._cultural_knowledge):
+                self._delete_record("cultural_knowledge", id)
         except Exception as e:
             log_error(f"Error clearing cultural knowledge: {e}")
             raise e
@@ -1065,7 +1160,7 @@ class InMemoryDb(BaseDb):
     def delete_cultural_knowledge(self, id: str) -> None:
         """Delete a cultural knowledge entry from in-memory storage."""
         try:
-            self._cultural_knowledge = [ck for ck in self._cultural_knowledge if ck.get("id") != id]
+            self._delete_record("cultural_knowledge", id)
         except Exception as e:
             log_error(f"Error deleting cultural knowledge: {e}")
             raise e
@@ -1075,13 +1170,14 @@ class InMemoryDb(BaseDb):
     ) -> Optional[Union[CulturalKnowledge, Dict[str, Any]]]:
         """Get a cultural knowledge entry from in-memory storage."""
         try:
-            for ck_data in self._cultural_knowledge:
-                if ck_data.get("id") == id:
-                    ck_data_copy = deepcopy(ck_data)
-                    if not deserialize:
-                        return ck_data_copy
-                    return deserialize_cultural_knowledge_from_db(ck_data_copy)
-            return None
+            ck_data = self._cultural_knowledge.get(id)
+            if ck_data is None:
+                return None
+
+            ck_data_copy = deepcopy(ck_data)
+            if not deserialize:
+                return ck_data_copy
+            return deserialize_cultural_knowledge_from_db(ck_data_copy)
         except Exception as e:
             log_error(f"Error getting cultural knowledge: {e}")
             raise e
@@ -1100,7 +1196,7 @@ class InMemoryDb(BaseDb):
         """Get all cultural knowledge from in-memory storage."""
         try:
             filtered_ck = []
-            for ck_data in self._cultural_knowledge:
+            for ck_data in self._cultural_knowledge.values():
                 if name and ck_data.get("name") != name:
                     continue
                 if agent_id and ck_data.get("agent_id") != agent_id:
@@ -1155,11 +1251,9 @@ class InMemoryDb(BaseDb):
                 "team_id": cultural_knowledge.team_id,
             }
 
-            # Remove existing entry with same id
-            self._cultural_knowledge = [ck for ck in self._cultural_knowledge if ck.get("id") != cultural_knowledge.id]
-
-            # Add new entry
-            self._cultural_knowledge.append(ck_dict)
+            # Remove the existing entry with the same id, so the updated entry is listed last
+            self._delete_record("cultural_knowledge", cultural_knowledge.id)
+            self._put_record("cultural_knowledge", cultural_knowledge.id, ck_dict)
 
             return self.get_cultural_knowledge(cultural_knowledge.id, deserialize=deserialize)
         except Exception as e:
@@ -0,0 +1,3 @@
+from agno.db.log.log_db import LogDb
+
+__all__ = ["LogDb"]
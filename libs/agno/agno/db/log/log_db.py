@@ -0,0 +1,612 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Literal, Optional, Tuple, Union
+
+from agno.db.base import SessionType
+from agno.db.in_memory.in_memory_db import InMemoryDb
+from agno.db.schemas.culture import CulturalKnowledge
+from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
+from agno.db.schemas.knowledge import KnowledgeRow
+from agno.db.schemas.memory import UserMemory
+from agno.session import AgentSession, Session, TeamSession, WorkflowSession
+from agno.utils.log import log_debug, log_info, log_warning
+from agno.utils.string import generate_id
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # type: ignore
+
+# Tables kept by InMemoryDb, logged one file each
+TABLES = ("sessions", "memories", "knowledge", "eval_runs", "metrics", "cultural_knowledge")
+
+
+class _TableLog:
+    """Position of this process in the log file of one table."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.inode: Optional[int] = None
+        self.offset: int = 0
+        self.records: int = 0
+
+
+class LogDb(InMemoryDb):
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        session_table: Optional[str] = None,
+        culture_table: Optional[str] = None,
+        memory_table: Optional[str] = None,
+        metrics_table: Optional[str] = None,
+        eval_table: Optional[str] = None,
+        knowledge_table: Optional[str] = None,
+        sync_mode: Literal["always", "interval", "never"] = "interval",
+        sync_interval: float = 1.0,
+        compact_min_records: int = 1000,
+        id: Optional[str] = None,
+    ):
+        """
+        Interface for storing data in append-only log files.
+
+        Every write appends one JSON line to the log file of its table, instead of rewriting the whole table.
+        The tables are replayed into memory when the database is opened, and log files are compacted once
+        most of their lines are overwritten or deleted records.
+
+        Several processes can share the same db_path: writes are serialized with a lock file, and every
+        call first replays the lines other processes appended since the last call.
+
+        Args:
+            db_path (Optional[str]): Path to the directory where the log files will be stored.
+            session_table (Optional[str]): Name of the log file to store sessions (without .jsonl extension).
+            culture_table (Optional[str]): Name of the log file to store cultural knowledge.
+            memory_table (Optional[str]): Name of the log file to store memories.
+            metrics_table (Optional[str]): Name of the log file to store metrics.
+            eval_table (Optional[str]): Name of the log file to store evaluation runs.
+            knowledge_table (Optional[str]): Name of the log file to store knowledge content.
+            sync_mode (str): When to fsync the log files: after every write ("always"), at most once every
+                sync_interval seconds ("interval"), or leave it to the OS ("never").
+            sync_interval (float): Seconds between fsyncs when sync_mode is "interval".
+            compact_min_records (int): Minimum number of lines in a log file before it is compacted.
+            id (Optional[str]): ID of the database.
+        """
+        if sync_mode not in ("always", "interval", "never"):
+            raise ValueError(f"Invalid sync_mode: {sync_mode}. Expected 'always', 'interval' or 'never'")
+
+        if id is None:
+            seed = db_path or "agno_log_db"
+            id = generate_id(seed)
+        super().__init__(
+            id=id,
+            session_table=session_table,
+            culture_table=culture_table,
+            memory_table=memory_table,
+            metrics_table=metrics_table,
+            eval_table=eval_table,
+            knowledge_table=knowledge_table,
+        )
+
+        self.db_path = Path(db_path or os.path.join(os.getcwd(), "agno_log_db"))
+        self.db_path.mkdir(parents=True, exist_ok=True)
+        self.sync_mode = sync_mode
+        self.sync_interval = sync_interval
+        self.compact_min_records = compact_min_records
+
+        file_names = {
+            "sessions": self.session_table_name,
+            "memories": self.memory_table_name,
+            "knowledge": self.knowledge_table_name,
+            "eval_runs": self.eval_table_name,
+            "metrics": self.metrics_table_name,
+            "cultural_knowledge": self.culture_table_name,
+        }
+        self._logs: Dict[str, _TableLog] = {
+            table: _TableLog(self.db_path / f"{file_name}.jsonl") for table, file_name in file_names.items()
+        }
+
+        self._lock = threading.RLock()
+        self._lock_depth = 0
+        self._lock_file = open(self.db_path / ".lock", "a+")
+        self._last_sync = time.monotonic()
+        # Set while replaying log lines, so replayed records are not logged again
+        self._replaying = False
+
+        with self._write_lock():
+            self._refresh()
+
+    def table_exists(self, table_name: str) -> bool:
+        """Log implementation, always returns True."""
+        return True
+
+    def close(self) -> None:
+        """Flush the log files to disk and release the lock file."""
+        with self._lock:
+            if self.sync_mode != "never":
+                self._sync_files()
+            self._lock_file.close()
+
+    # -- Locking --
+    @contextmanager
+    def _write_lock(self) -> Iterator[None]:
+        """Hold the lock serializing writes, across threads and, where fcntl is available, across processes."""
+        with self._lock:
+            if self._lock_depth == 0 and fcntl is not None:
+                fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX)
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+                if self._lock_depth == 0 and fcntl is not None:
+                    fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+
+    @contextmanager
+    def _reading(self) -> Iterator[None]:
+        """Run a read on up-to-date tables. Reads don't need the cross-process write lock."""
+        with self._lock:
+            if self._lock_depth == 0:
+                self._refresh()
+            yield
+
+    @contextmanager
+    def _writing(self) -> Iterator[None]:
+        """Run a write on up-to-date tables holding the write lock, compacting the log files after it."""
+        with self._write_lock():
+            if self._lock_depth == 1:
+                self._refresh()
+            yield
+            if self._lock_depth == 1:
+                self._maybe_compact()
+
+    # -- Replaying the logs --
+    def _refresh(self) -> None:
+        """Replay the lines appended to the log files since the last refresh, by this or any other process."""
+        for table, table_log in self._logs.items():
+            try:
+                stat = table_log.path.stat()
+            except FileNotFoundError:
+                if table_log.inode is not None:
+                    self._reset_table(table)
+                continue
+
+            if stat.st_ino != table_log.inode or stat.st_size < table_log.offset:
+                # The file was compacted or replaced: load it from the start
+                self._reset_table(table)
+                table_log.inode = stat.st_ino
+            if stat.st_size > table_log.offset:
+                self._replay(table, table_log)
+
+    def _reset_table(self, table: str) -> None:
+        if table == "sessions":
+            self._sessions = {}
+            self._session_keys_by_id = {}
+            self._session_keys_by_user = {}
+            self._session_keys_by_component = {}
+        elif table == "memories":
+            self._memories = {}
+            self._memory_ids_by_user = {}
+        else:
+            setattr(self, f"_{table}", {})
+        table_log = self._logs[table]
+        table_log.inode = None
+        table_log.offset = 0
+        table_log.records = 0
+
+    def _replay(self, table: str, table_log: _TableLog) -> None:
+        with open(table_log.path, "rb") as f:
+            f.seek(table_log.offset)
+            data = f.read()
+
+        # Only consume complete lines: a line without its newline is still being written, or was cut by a crash
+        end = data.rfind(b"\n") + 1
+        if end < len(data) and self._lock_depth > 0:
+            # Nobody else can be writing while we hold the write lock, so the partial line is left over from a crash
+            log_warning(f"Truncating incomplete record at the end of {table_log.path}")
+            with open(table_log.path, "r+b") as f:
+                f.truncate(table_log.offset + end)
+
+        self._replaying = True
+        try:
+            for line in data[:end].splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    log_warning(f"Skipping invalid record in {table_log.path}")
+                    continue
+                self._apply(table, entry)
+                table_log.records += 1
+        finally:
+            self._replaying = False
+        table_log.offset += end
+
+    def _apply(self, table: str, entry: Dict[str, Any]) -> None:
+        key = entry.get("key")
+        if isinstance(key, list):
+            key = tuple(key)
+
+        if entry.get("op") == "put":
+            if table == "sessions":
+                self._store_session(key, entry["value"])  # type: ignore[arg-type]
+            elif table == "memories":
+                self._store_memory(entry["value"])
+            else:
+                self._put_record(table, key, entry["value"])
+        elif entry.get("op") == "del":
+            if table == "sessions":
+                self._remove_session(key)  # type: ignore[arg-type]
+            elif table == "memories":
+                self._remove_memory(key)  # type: ignore[arg-type]
+            else:
+                self._delete_record(table, key)
+
+    # -- Writing to the logs --
+    def _append(self, table: str, entry: Dict[str, Any]) -> None:
+        """Append one record to the log file of a table."""
+        table_log = self._logs[table]
+        line = (json.dumps(entry, default=str) + "\n").encode("utf-8")
+        with open(table_log.path, "ab") as f:
+            f.write(line)
+            if self.sync_mode == "always":
+                f.flush()
+                os.fsync(f.fileno())
+            if table_log.inode is None:
+                table_log.inode = os.fstat(f.fileno()).st_ino
+        table_log.offset += len(line)
+        table_log.records += 1
+
+        if self.sync_mode == "interval" and time.monotonic() - self._last_sync >= self.sync_interval:
+            self._sync_files()
+
+    def _sync_files(self) -> None:
+        for table_log in self._logs.values():
+            if table_log.path.exists():
+                with open(table_log.path, "rb") as f:
+                    os.fsync(f.fileno())
+        self._last_sync = time.monotonic()
+
+    def _log_put(self, table: str, key: Any, value: Dict[str, Any]) -> None:
+        if not self._replaying:
+            self._append(table, {"op": "put", "key": key, "value": value})
+
+    def _log_delete(self, table: str, key: Any) -> None:
+        if not self._replaying:
+            self._append(table, {"op": "del", "key": key})
+
+    def _store_session(self, key, session_dict: Dict[str, Any]) -> None:
+        self._log_put("sessions", key, session_dict)
+        super()._store_session(key, session_dict)
+
+    def _remove_session(self, key) -> None:
+        if key in self._sessions:
+            self._log_delete("sessions", key)
+        super()._remove_session(key)
+
+    def _store_memory(self, memory_dict: Dict[str, Any]) -> None:
+        self._log_put("memories", memory_dict["memory_id"], memory_dict)
+        super()._store_memory(memory_dict)
+
+    def _remove_memory(self, memory_id: str, user_id: Optional[str] = None) -> bool:
+        removed = super()._remove_memory(memory_id, user_id=user_id)
+        if removed:
+            self._log_delete("memories", memory_id)
+        return removed
+
+    def _put_record(self, table: str, key: Any, record: Dict[str, Any]) -> None:
+        self._log_put(table, key, record)
+        super()._put_record(table, key, record)
+
+    def _delete_record(self, table: str, key: Any) -> bool:
+        deleted = super()._delete_record(table, key)
+        if deleted:
+            self._log_delete(table, key)
+        return deleted
+
+    # -- Compaction --
+    def _live_records(self, table: str) -> Dict[Any, Dict[str, Any]]:
+        return getattr(self, f"_{table}")
+
+    def _maybe_compact(self) -> None:
+        for table, table_log in self._logs.items():
+            live = len(self._live_records(table))
+            if table_log.records >= self.compact_min_records and table_log.records > 2 * live:
+                self._compact_table(table)
+
+    def _compact_table(self, table: str) -> None:
+        """Rewrite the log file of a table with one line per live record."""
+        table_log = self._logs[table]
+        records = self._live_records(table)
+        tmp_path = table_log.path.with_suffix(".jsonl.tmp")
+
+        with open(tmp_path, "wb") as f:
+            for key, value in records.items():
+                entry = {"op": "put", "key": key, "value": value}
+                f.write((json.dumps(entry, default=str) + "\n").encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+            size = f.tell()
+        os.replace(tmp_path, table_log.path)
+
+        log_debug(f"Compacted {table_log.path}: {table_log.records} records down to {len(records)}")
+        table_log.inode = table_log.path.stat().st_ino
+        table_log.offset = size
+        table_log.records = len(records)
+
+    def compact(self) -> None:
+        """Compact all log files, keeping only the latest version of each record."""
+        with self._write_lock():
+            self._refresh()
+            for table in TABLES:
+                if self._logs[table].path.exists():
+                    self._compact_table(table)
+        log_info(f"Compacted log files in {self.db_path}")
+
+    # -- Synchronized InMemoryDb methods --
+
+    def delete_session(self, session_id: str) -> bool:
+        with self._writing():
+            return super().delete_session(session_id)
+
+    def delete_sessions(self, session_ids: List[str]) -> None:
+        with self._writing():
+            super().delete_sessions(session_ids)
+
+    def get_session(
+        self,
+        session_id: str,
+        session_type: SessionType,
+        user_id: Optional[str] = None,
+        deserialize: Optional[bool] = True,
+    ) -> Optional[Union[AgentSession, TeamSession, WorkflowSession, Dict[str, Any]]]:
+        with self._reading():
+            return super().get_session(session_id, session_type, user_id=user_id, deserialize=deserialize)
+
+    def get_session_updated_at(self, session_id: str, session_type: SessionType) -> Optional[int]:
+        with self._reading():
+            return super().get_session_updated_at(session_id, session_type)
+
+    def get_sessions(
+        self,
+        session_type: SessionType,
+        user_id: Optional[str] = None,
+        component_id: Optional[str] = None,
+        session_name: Optional[str] = None,
+        start_timestamp: Optional[int] = None,
+        end_timestamp: Optional[int] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        deserialize: Optional[bool] = True,
+    ) -> Union[List[Session], Tuple[List[Dict[str, Any]], int]]:
+        with self._reading():
+            return super().get_sessions(
+                session_type,
+                user_id=user_id,
+                component_id=component_id,
+                session_name=session_name,
+                start_timestamp=start_timestamp,
+                end_timestamp=end_timestamp,
+                limit=limit,
+                page=page,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                deserialize=deserialize,
+            )
+
+    def rename_session(
+        self, session_id: str, session_type: SessionType, session_name: str, deserialize: Optional[bool] = True
+    ) -> Optional[Union[Session, Dict[str, Any]]]:
+        with self._writing():
+            return super().rename_session(session_id, session_type, session_name, deserialize=deserialize)
+
+    def upsert_session(
+        self, session: Session, deserialize: Optional[bool] = True
+    ) -> Optional[Union[Session, Dict[str, Any]]]:
+        with self._writing():
+            return super().upsert_session(session, deserialize=deserialize)
+
+    def upsert_sessions(
+        self, sessions: List[Session], deserialize: Optional[bool] = True, preserve_updated_at: bool = False
+    ) -> List[Union[Session, Dict[str, Any]]]:
+        with self._writing():
+            return super().upsert_sessions(sessions, deserialize=deserialize, preserve_updated_at=preserve_updated_at)
+
+    def delete_user_memory(self, memory_id: str, user_id: Optional[str] = None):
+        with self._writing():
+            return super().delete_user_memory(memory_id, user_id=user_id)
+
+    def delete_user_memories(self, memory_ids: List[str], user_id: Optional[str] = None) -> None:
+        with self._writing():
+            super().delete_user_memories(memory_ids, user_id=user_id)
+
+    def get_all_memory_topics(self) -> List[str]:
+        with self._reading():
+            return super().get_all_memory_topics()
+
+    def get_user_memory(
+        self, memory_id: str, deserialize: Optional[bool] = True, user_id: Optional[str] = None
+    ) -> Optional[Union[UserMemory, Dict[str, Any]]]:
+        with self._reading():
+            return super().get_user_memory(memory_id, deserialize=deserialize, user_id=user_id)
+
+    def get_user_memories(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        team_id: Optional[str] = None,
+        topics: Optional[List[str]] = None,
+        search_content: Optional[str] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        deserialize: Optional[bool] = True,
+    ) -> Union[List[UserMemory], Tuple[List[Dict[str, Any]], int]]:
+        with self._reading():
+            return super().get_user_memories(
+                user_id=user_id,
+                agent_id=agent_id,
+                team_id=team_id,
+                topics=topics,
+                search_content=search_content,
+                limit=limit,
+                page=page,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                deserialize=deserialize,
+            )
+
+    def get_user_memory_stats(
+        self, limit: Optional[int] = None, page: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        with self._reading():
+            return super().get_user_memory_stats(limit=limit, page=page)
+
+    def upsert_user_memory(
+        self, memory: UserMemory, deserialize: Optional[bool] = True
+    ) -> Optional[Union[UserMemory, Dict[str, Any]]]:
+        with self._writing():
+            return super().upsert_user_memory(memory, deserialize=deserialize)
+
+    def upsert_memories(
+        self, memories: List[UserMemory], deserialize: Optional[bool] = True, preserve_updated_at: bool = False
+    ) -> List[Union[UserMemory, Dict[str, Any]]]:
+        with self._writing():
+            return super().upsert_memories(memories, deserialize=deserialize, preserve_updated_at=preserve_updated_at)
+
+    def clear_memories(self) -> None:
+        with self._writing():
+            super().clear_memories()
+
+    def calculate_metrics(self) -> Optional[list[dict]]:
+        with self._writing():
+            return super().calculate_metrics()
+
+    def get_metrics(
+        self,
+        starting_date: Optional[date] = None,
+        ending_date: Optional[date] = None,
+    ) -> Tuple[List[dict], Optional[int]]:
+        with self._reading():
+            return super().get_metrics(starting_date=starting_date, ending_date=ending_date)
+
+    def delete_knowledge_content(self, id: str):
+        with self._writing():
+            return super().delete_knowledge_content(id)
+
+    def get_knowledge_content(self, id: str) -> Optional[KnowledgeRow]:
+        with self._reading():
+            return super().get_knowledge_content(id)
+
+    def get_knowledge_contents(
+        self,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+    ) -> Tuple[List[KnowledgeRow], int]:
+        with self._reading():
+            return super().get_knowledge_contents(limit=limit, page=page, sort_by=sort_by, sort_order=sort_order)
+
+    def upsert_knowledge_content(self, knowledge_row: KnowledgeRow):
+        with self._writing():
+            return super().upsert_knowledge_content(knowledge_row)
+
+    def create_eval_run(self, eval_run: EvalRunRecord) -> Optional[EvalRunRecord]:
+        with self._writing():
+            return super().create_eval_run(eval_run)
+
+    def delete_eval_runs(self, eval_run_ids: List[str]) -> None:
+        with self._writing():
+            super().delete_eval_runs(eval_run_ids)
+
+    def get_eval_run(
+        self, eval_run_id: str, deserialize: Optional[bool] = True
+    ) -> Optional[Union[EvalRunRecord, Dict[str, Any]]]:
+        with self._reading():
+            return super().get_eval_run(eval_run_id, deserialize=deserialize)
+
+    def get_eval_runs(
+        self,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        team_id: Optional[str] = None,
+        workflow_id: Optional[str] = None,
+        model_id: Optional[str] = None,
+        filter_type: Optional[EvalFilterType] = None,
+        eval_type: Optional[List[EvalType]] = None,
+        deserialize: Optional[bool] = True,
+    ) -> Union[List[EvalRunRecord], Tuple[List[Dict[str, Any]], int]]:
+        with self._reading():
+            return super().get_eval_runs(
+                limit=limit,
+                page=page,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                agent_id=agent_id,
+                team_id=team_id,
+                workflow_id=workflow_id,
+                model_id=model_id,
+                filter_type=filter_type,
+                eval_type=eval_type,
+                deserialize=deserialize,
+            )
+
+    def rename_eval_run(
+        self, eval_run_id: str, name: str, deserialize: Optional[bool] = True
+    ) -> Optional[Union[EvalRunRecord, Dict[str, Any]]]:
+        with self._writing():
+            return super().rename_eval_run(eval_run_id, name, deserialize=deserialize)
+
+    def clear_cultural_knowledge(self) -> None:
+        with self._writing():
+            super().clear_cultural_knowledge()
+
+    def delete_cultural_knowledge(self, id: str) -> None:
+        with self._writing():
+            super().delete_cultural_knowledge(id)
+
+    def get_cultural_knowledge(
+        self, id: str, deserialize: Optional[bool] = True
+    ) -> Optional[Union[CulturalKnowledge, Dict[str, Any]]]:
+        with self._reading():
+            return super().get_cultural_knowledge(id, deserialize=deserialize)
+
+    def get_all_cultural_knowledge(
+        self,
+        name: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        team_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        deserialize: Optional[bool] = True,
+    ) -> Union[List[CulturalKnowledge], Tuple[List[Dict[str, Any]], int]]:
+        with self._reading():
+            return super().get_all_cultural_knowledge(
+                name=name,
+                agent_id=agent_id,
+                team_id=team_id,
+                limit=limit,
+                page=page,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                deserialize=deserialize,
+            )
+
+    def upsert_cultural_knowledge(
+        self, cultural_knowledge: CulturalKnowledge, deserialize: Optional[bool] = True
+    ) -> Optional[Union[CulturalKnowledge, Dict[str, Any]]]:
+        with self._writing():
+            return super().upsert_cultural_knowledge(cultural_knowledge, deserialize=deserialize)
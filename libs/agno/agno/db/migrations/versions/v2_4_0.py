@@ -0,0 +1,338 @@
+"""Migration v2.4.0: Content fingerprints for incremental knowledge loading
+
+Changes:
+- Add content_digest column to knowledge table (all databases)
+- Add chunk_digests column to knowledge table (all databases)
+"""
+
+from agno.db.base import AsyncBaseDb, BaseDb
+from agno.utils.log import log_error, log_info, log_warning
+
+try:
+    from sqlalchemy import text
+except ImportError:
+    raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
+
+
+def up(db: BaseDb, table_type: str, table_name: str) -> bool:
+    """
+    Apply the following changes to the database:
+    - Add content_digest, chunk_digests columns to knowledge table
+
+    Notice only the changes related to the given table_type are applied.
+
+    Returns:
+        bool: True if any migration was applied, False otherwise.
+    """
+    db_type = type(db).__name__
+
+    try:
+        if db_type == "PostgresDb":
+            return _migrate_postgres(db, table_type, table_name)
+        elif db_type == "MySQLDb":
+            return _migrate_mysql(db, table_type, table_name)
+        elif db_type == "SqliteDb":
+            return _migrate_sqlite(db, table_type, table_name)
+        elif db_type == "SingleStoreDb":
+            return _migrate_singlestore(db, table_type, table_name)
+        else:
+            log_info(f"{db_type} does not require schema migrations (NoSQL/document store)")
+        return False
+    except Exception as e:
+        log_error(f"Error running migration v2.4.0 for {db_type} on table {table_name}: {e}")
+        raise
+
+
+async def async_up(db: AsyncBaseDb, table_type: str, table_name: str) -> bool:
+    """
+    Apply the following changes to the database:
+    - Add content_digest, chunk_digests columns to knowledge table
+
+    Notice only the changes related to the given table_type are applied.
+
+    Returns:
+        bool: True if any migration was applied, False otherwise.
+    """
+    db_type = type(db).__name__
+
+    try:
+        if db_type == "AsyncPostgresDb":
+            return await _migrate_async_postgres(db, table_type, table_name)
+        elif db_type == "AsyncSqliteDb":
+            return await _migrate_async_sqlite(db, table_type, table_name)
+        else:
+            log_info(f"{db_type} does not require schema migrations (NoSQL/document store)")
+        return False
+    except Exception as e:
+        log_error(f"Error running migration v2.4.0 for {db_type} on table {table_name}: {e}")
+        raise
+
+
+def down(db: BaseDb, table_type: str, table_name: str) -> bool:
+    """
+    Revert the following changes to the database:
+    - Remove content_digest, chunk_digests columns from knowledge table
+
+    Notice only the changes related to the given table_type are reverted.
+
+    Returns:
+        bool: True if any migration was reverted, False otherwise.
+    """
+    db_type = type(db).__name__
+
+    try:
+        if db_type == "PostgresDb":
+            return _revert_postgres(db, table_type, table_name)
+        elif db_type in ("MySQLDb", "SingleStoreDb"):
+            return _revert_mysql(db, table_type, table_name)
+        elif db_type == "SqliteDb":
+            log_warning(
+                f"-- SQLite does not support DROP COLUMN easily. Manual migration may be required for {table_name}."
+            )
+            return False
+        else:
+            log_info(f"Revert not implemented for {db_type}")
+        return False
+    except Exception as e:
+        log_error(f"Error reverting migration v2.4.0 for {db_type} on table {table_name}: {e}")
+        raise
+
+
+async def async_down(db: AsyncBaseDb, table_type: str, table_name: str) -> bool:
+    """
+    Revert the following changes to the database:
+    - Remove content_digest, chunk_digests columns from knowledge table
+
+    Notice only the changes related to the given table_type are reverted.
+
+    Returns:
+        bool: True if any migration was reverted, False otherwise.
+    """
+    db_type = type(db).__name__
+
+    try:
+        if db_type == "AsyncPostgresDb":
+            return await _revert_async_postgres(db, table_type, table_name)
+        elif db_type == "AsyncSqliteDb":
+            log_warning(
+                f"-- SQLite does not support DROP COLUMN easily. Manual migration may be required for {table_name}."
+            )
+            return False
+        else:
+            log_info(f"Revert not implemented for {db_type}")
+        return False
+    except Exception as e:
+        log_error(f"Error reverting migration v2.4.0 for {db_type} on table {table_name}: {e}")
+        raise
+
+
+def _migrate_postgres(db: BaseDb, table_type: str, table_name: str) -> bool:
+    """Migrate PostgreSQL database."""
+    if table_type != "knowledge":
+        return False
+
+    db_schema = db.db_schema or "public"  # type: ignore
+
+    with db.Session() as sess, sess.begin():  # type: ignore
+        existing_columns = {
+            row[0]
+            for row in sess.execute(
+                text(
+                    """
+                    SELECT column_name
+                    FROM information_schema.columns
+                    WHERE table_schema = :schema
+                    AND table_name = :table_name
+                    """
+                ),
+                {"schema": db_schema, "table_name": table_name},
+            ).fetchall()
+        }
+        if not existing_columns:
+            log_info(f"Table {table_name} does not exist, skipping migration")
+            return False
+
+        if "content_digest" not in existing_columns:
+            log_info(f"-- Adding content_digest column to {table_name}")
+            sess.execute(text(f"ALTER TABLE {db_schema}.{table_name} ADD COLUMN content_digest VARCHAR"))
+        if "chunk_digests" not in existing_columns:
+            log_info(f"-- Adding chunk_digests column to {table_name}")
+            sess.execute(text(f"ALTER TABLE {db_schema}.{table_name} ADD COLUMN chunk_digests JSONB"))
+        sess.commit()
+        return True
+
+
+async def _migrate_async_postgres(db: AsyncBaseDb, table_type: str, table_name: str) -> bool:
+    """Migrate PostgreSQL database."""
+    if table_type != "knowledge":
+        return False
+
+    db_schema = db.db_schema or "public"  # type: ignore
+
+    async with db.async_session_factory() as sess, sess.begin():  # type: ignore
+        result = await sess.execute(
+            text(
+                """
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_schema = :schema
+                AND table_name = :table_name
+                """
+            ),
+            {"schema": db_schema, "table_name": table_name},
+        )
+        existing_columns = {row[0] for row in result.fetchall()}
+        if not existing_columns:
+            log_info(f"Table {table_name} does not exist, skipping migration")
+            return False
+
+        if "content_digest" not in existing_columns:
+            log_info(f"-- Adding content_digest column to {table_name}")
+            await sess.execute(text(f"ALTER TABLE {db_schema}.{table_name} ADD COLUMN content_digest VARCHAR"))
+        if "chunk_digests" not in existing_columns:
+            log_info(f"-- Adding chunk_digests column to {table_name}")
+            await sess.execute(text(f"ALTER TABLE {db_schema}.{table_name} ADD COLUMN chunk_digests JSONB"))
+        await sess.commit()
+        return True
+
+
+def _migrate_mysql(db: BaseDb, table_type: str, table_name: str) -> bool:
+    """Migrate MySQL database."""
+    if table_type != "knowledge":
+        return False
+
+    db_schema = db.db_schema or "agno"  # type: ignore
+
+    with db.Session() as sess, sess.begin():  # type: ignore
+        existing_columns = {
+            row[0]
+            for row in sess.execute(
+                text(
+                    """
+                    SELECT COLUMN_NAME
+                    FROM INFORMATION_SCHEMA.COLUMNS
+                    WHERE TABLE_SCHEMA = :schema
+                    AND TABLE_NAME = :table_name
+                    """
+                ),
+                {"schema": db_schema, "table_name": table_name},
+            ).fetchall()
+        }
+        if not existing_columns:
+            log_info(f"Table {table_name} does not exist, skipping migration")
+            return False
+
+        if "content_digest" not in existing_columns:
+            log_info(f"-- Adding content_digest column to {table_name}")
+            sess.execute(text(f"ALTER TABLE `{db_schema}`.`{table_name}` ADD COLUMN `content_digest` VARCHAR(64)"))
+        if "chunk_digests" not in existing_columns:
+            log_info(f"-- Adding chunk_digests column to {table_name}")
+            sess.execute(text(f"ALTER TABLE `{db_schema}`.`{table_name}` ADD COLUMN `chunk_digests` JSON"))
+        sess.commit()
+        return True
+
+
+def _migrate_singlestore(db: BaseDb, table_type: str, table_name: str) -> bool:
+    """Migrate SingleStore database."""
+    # SingleStore speaks the MySQL dialect for these statements
+    return _migrate_mysql(db, table_type, table_name)
+
+
+def _migrate_sqlite(db: BaseDb, table_type: str, table_name: str) -> bool:
+    """Migrate SQLite database."""
+    if table_type != "knowledge":
+        return False
+
+    with db.Session() as sess, sess.begin():  # type: ignore
+        existing_columns = {row[1] for row in sess.execute(text(f"PRAGMA table_info({table_name})")).fetchall()}
+        if not existing_columns:
+            log_info(f"Table {table_name} does not exist, skipping migration")
+            return False
+
+        if "content_digest" not in existing_columns:
+            log_info(f"-- Adding content_digest column to {table_name}")
+            sess.execute(text(f"ALTER TABLE {table_name} ADD COLUMN content_digest VARCHAR"))
+        if "chunk_digests" not in existing_columns:
+            log_info(f"-- Adding chunk_digests column to {table_name}")
+            sess.execute(text(f"ALTER TABLE {table_name} ADD COLUMN chunk_digests JSON"))
+        sess.commit()
+        return True
+
+
+async def _migrate_async_sqlite(db: AsyncBaseDb, table_type: str, table_name: str) -> bool:
+    """Migrate SQLite database."""
+    if table_type != "knowledge":
+        return False
+
+    async with db.async_session_factory() as sess, sess.begin():  # type: ignore
+        result = await sess.execute(text(f"PRAGMA table_info({table_name})"))
+        existing_columns = {row[1] for row in result.fetchall()}
+        if not existing_columns:
+            log_info(f"Table {table_name} does not exist, skipping migration")
+            return False
+
+        if "content_digest" not in existing_columns:
+            log_info(f"-- Adding content_digest column to {table_name}")
+            await sess.execute(text(f"ALTER TABLE {table_name} ADD COLUMN content_digest VARCHAR"))
+        if "chunk_digests" not in existing_columns:
+            log_info(f"-- Adding chunk_digests column to {table_name}")
+            await sess.execute(text(f"ALTER TABLE {table_name} ADD COLUMN chunk_digests JSON"))
+        await sess.commit()
+        return True
+
+
+def _revert_postgres(db: BaseDb, table_type: str, table_name: str) -> bool:
+    """Revert PostgreSQL migration."""
+    if table_type != "knowledge":
+        return False
+
+    db_schema = db.db_schema or "public"  # type: ignore
+
+    with db.Session() as sess, sess.begin():  # type: ignore
+        sess.execute(text(f"ALTER TABLE IF EXISTS {db_schema}.{table_name} DROP COLUMN IF EXISTS chunk_digests"))
+        sess.execute(text(f"ALTER TABLE IF EXISTS {db_schema}.{table_name} DROP COLUMN IF EXISTS content_digest"))
+        sess.commit()
+        return True
+
+
+async def _revert_async_postgres(db: AsyncBaseDb, table_type: str, table_name: str) -> bool:
+    """Revert PostgreSQL migration."""
+    if table_type != "knowledge":
+        return False
+
+    db_schema = db.db_schema or "public"  # type: ignore
+
+    async with db.async_session_factory() as sess, sess.begin():  # type: ignore
+        await sess.execute(text(f"ALTER TABLE IF EXISTS {db_schema}.{table_name} DROP COLUMN IF EXISTS chunk_digests"))
+        await sess.execute(text(f"ALTER TABLE IF EXISTS {db_schema}.{table_name} DROP COLUMN IF EXISTS content_digest"))
+        await sess.commit()
+        return True
+
+
+def _revert_mysql(db: BaseDb, table_type: str, table_name: str) -> bool:
+    """Revert MySQL and SingleStore migration."""
+    if table_type != "knowledge":
+        return False
+
+    db_schema = db.db_schema or "agno"  # type: ignore
+
+    with db.Session() as sess, sess.begin():  # type: ignore
+        existing_columns = {
+            row[0]
+            for row in sess.execute(
+                text(
+                    """
+                    SELECT COLUMN_NAME
+                    FROM INFORMATION_SCHEMA.COLUMNS
+                    WHERE TABLE_SCHEMA = :schema
+                    AND TABLE_NAME = :table_name
+                    """
+                ),
+                {"schema": db_schema, "table_name": table_name},
+            ).fetchall()
+        }
+        for column in ("chunk_digests", "content_digest"):
+            if column in existing_columns:
+                sess.execute(text(f"ALTER TABLE `{db_schema}`.`{table_name}` DROP COLUMN `{column}`"))
+        sess.commit()
+        return True
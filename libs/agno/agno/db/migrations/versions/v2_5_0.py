@@ -0,0 +1,177 @@
+"""Migration v2.5.0: Session runs stored as separate rows
+
+Changes:
+- Create the runs table and move the runs of each session out of the sessions table (PostgresDb, SqliteDb)
+
+Only applied to databases created with store_runs_separately=True.
+"""
+
+import json
+from typing import Any, List
+
+from agno.db.base import AsyncBaseDb, BaseDb
+from agno.db.utils import CustomJSONEncoder
+from agno.utils.log import log_error, log_info
+
+try:
+    from sqlalchemy import select, update
+except ImportError:
+    raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
+
+# Number of sessions moved per transaction
+BATCH_SIZE = 100
+
+
+def up(db: BaseDb, table_type: str, table_name: str) -> bool:
+    """
+    Apply the following changes to the database:
+    - Move the runs of each session from the sessions table to the runs table
+
+    Notice only the changes related to the given table_type are applied.
+
+    Returns:
+        bool: True if any migration was applied, False otherwise.
+    """
+    db_type = type(db).__name__
+
+    try:
+        if db_type in ("PostgresDb", "SqliteDb"):
+            return _move_runs_to_runs_table(db, table_type, table_name)
+        else:
+            log_info(f"{db_type} stores runs in the sessions table, no migration needed")
+        return False
+    except Exception as e:
+        log_error(f"Error running migration v2.5.0 for {db_type} on table {table_name}: {e}")
+        raise
+
+
+async def async_up(db: AsyncBaseDb, table_type: str, table_name: str) -> bool:
+    """
+    Apply the following changes to the database:
+    - Move the runs of each session from the sessions table to the runs table
+
+    Notice only the changes related to the given table_type are applied.
+
+    Returns:
+        bool: True if any migration was applied, False otherwise.
+    """
+    db_type = type(db).__name__
+    log_info(f"{db_type} stores runs in the sessions table, no migration needed")
+    return False
+
+
+def down(db: BaseDb, table_type: str, table_name: str) -> bool:
+    """
+    Revert the following changes to the database:
+    - Move the runs of each session back to the sessions table and drop the runs table
+
+    Notice only the changes related to the given table_type are reverted.
+
+    Returns:
+        bool: True if any migration was reverted, False otherwise.
+    """
+    db_type = type(db).__name__
+
+    try:
+        if db_type in ("PostgresDb", "SqliteDb"):
+            return _move_runs_to_sessions_table(db, table_type, table_name)
+        else:
+            log_info(f"Revert not implemented for {db_type}")
+        return False
+    except Exception as e:
+        log_error(f"Error reverting migration v2.5.0 for {db_type} on table {table_name}: {e}")
+        raise
+
+
+async def async_down(db: AsyncBaseDb, table_type: str, table_name: str) -> bool:
+    """
+    Revert the following changes to the database:
+    - Move the runs of each session back to the sessions table and drop the runs table
+
+    Notice only the changes related to the given table_type are reverted.
+
+    Returns:
+        bool: True if any migration was reverted, False otherwise.
+    """
+    log_info(f"Revert not implemented for {type(db).__name__}")
+    return False
+
+
+def _serialize_runs(db: BaseDb, runs: List[Any]) -> Any:
+    """Runs are stored as a JSON string by SqliteDb and as JSONB by PostgresDb."""
+    if type(db).__name__ == "SqliteDb":
+        return json.dumps(runs, cls=CustomJSONEncoder)
+    return runs
+
+
+def _move_runs_to_runs_table(db: BaseDb, table_type: str, table_name: str) -> bool:
+    """Move the runs stored in the sessions table to the runs table."""
+    if table_type != "sessions":
+        return False
+    if not getattr(db, "store_runs_separately", False):
+        log_info(f"Runs are stored in {table_name} (store_runs_separately is disabled), skipping migration")
+        return False
+
+    sessions_table = db._get_table(table_type="sessions")  # type: ignore
+    if sessions_table is None:
+        log_info(f"Table {table_name} does not exist, skipping migration")
+        return False
+    runs_table = db._get_runs_table(create_table_if_not_found=True)  # type: ignore
+
+    moved_sessions = 0
+    last_session_id = ""
+    while True:
+        with db.Session() as sess, sess.begin():  # type: ignore
+            rows = sess.execute(
+                select(sessions_table.c.session_id, sessions_table.c.runs)
+                .where(sessions_table.c.session_id > last_session_id)
+                .order_by(sessions_table.c.session_id)
+                .limit(BATCH_SIZE)
+            ).fetchall()
+            if not rows:
+                break
+
+            for session_id, runs in rows:
+                if isinstance(runs, str):
+                    runs = json.loads(runs)
+                if not runs:
+                    continue
+                db._write_session_runs(sess, runs_table, session_id, runs)  # type: ignore
+                sess.execute(update(sessions_table).where(sessions_table.c.session_id == session_id).values(runs=None))
+                moved_sessions += 1
+            last_session_id = rows[-1][0]
+
+    log_info(f"-- Moved the runs of {moved_sessions} sessions from {table_name} to {runs_table.name}")
+    return True
+
+
+def _move_runs_to_sessions_table(db: BaseDb, table_type: str, table_name: str) -> bool:
+    """Move the runs stored in the runs table back to the sessions table, and drop the runs table."""
+    if table_type != "sessions":
+        return False
+
+    sessions_table = db._get_table(table_type="sessions")  # type: ignore
+    runs_table = db._get_table(table_type="runs")  # type: ignore
+    if sessions_table is None or runs_table is None:
+        log_info(f"No runs table found for {table_name}, skipping revert")
+        return False
+
+    with db.Session() as sess, sess.begin():  # type: ignore
+        session_ids = [row[0] for row in sess.execute(select(runs_table.c.session_id).distinct()).fetchall()]
+
+    for i in range(0, len(session_ids), BATCH_SIZE):
+        with db.Session() as sess, sess.begin():  # type: ignore
+            sessions = [{"session_id": session_id} for session_id in session_ids[i : i + BATCH_SIZE]]
+            db._load_session_runs(sess, runs_table, sessions, None)  # type: ignore
+            for session in sessions:
+                sess.execute(
+                    update(sessions_table)
+                    .where(sessions_table.c.session_id == session["session_id"])
+                    .values(runs=_serialize_runs(db, session["runs"] or []))
+                )
+
+    runs_table.drop(db.db_engine)  # type: ignore
+    if runs_table in db.metadata.tables.values():  # type: ignore
+        db.metadata.remove(runs_table)  # type: ignore
+    log_info(f"-- Moved the runs of {len(session_ids)} sessions back to {table_name} and dropped {runs_table.name}")
+    return True
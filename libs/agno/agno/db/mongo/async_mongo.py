@@ -7,19 +7,26 @@ from agno.db.base import AsyncBaseDb, SessionType
 from agno.db.mongo.utils import (
     apply_pagination,
     apply_sorting,
-    bulk_upsert_metrics,
-    calculate_date_metrics,
+    bulk_upsert_metrics_async,
     create_collection_indexes_async,
     deserialize_cultural_knowledge_from_db,
-    fetch_all_sessions_data,
     get_dates_to_calculate_metrics_for,
+    get_metrics_aggregation_pipeline,
+    get_metrics_rows,
+    get_updated_days_pipeline,
     serialize_cultural_knowledge_for_db,
 )
 from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
 from agno.db.schemas.knowledge import KnowledgeRow
 from agno.db.schemas.memory import UserMemory
-from agno.db.utils import deserialize_session_json_fields
+from agno.db.utils import (
+    SECONDS_PER_DAY,
+    build_daily_metrics_records,
+    deserialize_session_json_fields,
+    get_dates_from_epoch_days,
+    get_epoch_day,
+)
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info
 from agno.utils.string import generate_id
@@ -1570,60 +1577,68 @@ class AsyncMongoDb(AsyncBaseDb):
             log_error(f"Exception getting metrics calculation starting date: {e}")
             return None
 
+    async def _get_days_with_updated_sessions(self, collection: AsyncIOMotorCollection, before: date) -> List[date]:
+        """Get the dates before the given date with sessions updated since the last metrics calculation.
+
+        The latest update of the metrics records is the watermark of the last calculation.
+        """
+        sessions_collection = await self._get_collection(table_type="sessions")
+        if sessions_collection is None:
+            return []
+
+        last_update = await collection.find_one({}, sort=[("updated_at", -1)], projection={"updated_at": 1})
+        if last_update is None or last_update.get("updated_at") is None:
+            return []
+
+        pipeline = get_updated_days_pipeline(
+            updated_since=last_update["updated_at"], created_before=get_epoch_day(before) * SECONDS_PER_DAY
+        )
+        results = await sessions_collection.aggregate(pipeline).to_list(length=None)
+        return get_dates_from_epoch_days(result["_id"] for result in results)
+
     async def calculate_metrics(self) -> Optional[list[dict]]:
-        """Calculate metrics for all dates without complete metrics."""
+        """Calculate metrics for all dates without complete metrics, and for the dates with sessions updated since the
+        last calculation. The sessions are aggregated in the database, so their runs are not loaded."""
         try:
             collection = await self._get_collection(table_type="metrics", create_collection_if_not_found=True)
             if collection is None:
                 return None
 
+            # Sessions updated from now on will be picked up by the next calculation
+            calculated_at = int(time.time())
+
             starting_date = await self._get_metrics_calculation_starting_date(collection)
             if starting_date is None:
                 log_info("No session data found. Won't calculate metrics.")
                 return None
 
             dates_to_process = get_dates_to_calculate_metrics_for(starting_date)
+            # Incremental rollup: past dates are only recalculated if their sessions were updated
+            dates_to_process = await self._get_days_with_updated_sessions(collection, starting_date) + dates_to_process
             if not dates_to_process:
                 log_info("Metrics already calculated for all relevant dates.")
                 return None
 
-            start_timestamp = int(
-                datetime.combine(dates_to_process[0], datetime.min.time()).replace(tzinfo=timezone.utc).timestamp()
-            )
-            end_timestamp = int(
-                datetime.combine(dates_to_process[-1] + timedelta(days=1), datetime.min.time())
-                .replace(tzinfo=timezone.utc)
-                .timestamp()
-            )
+            sessions_collection = await self._get_collection(table_type="sessions")
+            if sessions_collection is None:
+                return None
 
-            sessions = await self._get_all_sessions_for_metrics_calculation(
-                start_timestamp=start_timestamp, end_timestamp=end_timestamp
-            )
-            all_sessions_data = fetch_all_sessions_data(
-                sessions=sessions, dates_to_process=dates_to_process, start_timestamp=start_timestamp
+            pipeline = get_metrics_aggregation_pipeline(dates_to_process)
+            aggregation = await sessions_collection.aggregate(pipeline).to_list(length=1)
+            rows = get_metrics_rows(aggregation[0] if aggregation else None)
+
+            metrics_records = build_daily_metrics_records(
+                dates_to_process,
+                session_rows=rows["sessions"],
+                user_rows=rows["users"],
+                run_rows=rows["runs"],
+                calculated_at=calculated_at,
             )
-            if not all_sessions_data:
+            if not metrics_records:
                 log_info("No new session data found. Won't calculate metrics.")
                 return None
 
-            results = []
-            metrics_records = []
-
-            for date_to_process in dates_to_process:
-                date_key = date_to_process.isoformat()
-                sessions_for_date = all_sessions_data.get(date_key, {})
-
-                # Skip dates with no sessions
-                if not any(len(sessions) > 0 for sessions in sessions_for_date.values()):
-                    continue
-
-                metrics_record = calculate_date_metrics(date_to_process, sessions_for_date)
-                metrics_records.append(metrics_record)
-
-            if metrics_records:
-                results = bulk_upsert_metrics(collection, metrics_records)  # type: ignore
-
-            return results
+            return await bulk_upsert_metrics_async(collection, metrics_records)
 
         except Exception as e:
             log_error(f"Error calculating metrics: {e}")
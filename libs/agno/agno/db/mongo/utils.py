@@ -3,11 +3,12 @@
 import json
 import time
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 
 from agno.db.mongo.schemas import get_collection_indexes
 from agno.db.schemas.culture import CulturalKnowledge
+from agno.db.utils import METRICS_TOKEN_FIELDS, SECONDS_PER_DAY, get_day_ranges
 from agno.utils.log import log_error, log_warning
 
 try:
@@ -218,6 +219,133 @@ def bulk_upsert_metrics(collection: Collection, metrics_records: List[Dict[str,
     return results
 
 
+async def bulk_upsert_metrics_async(collection: Any, metrics_records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Bulk upsert metrics into the database, with an async collection.
+
+    Args:
+        collection (Any): The async collection to upsert the metrics into.
+        metrics_records (List[Dict[str, Any]]): The list of metrics records to upsert.
+
+    Returns:
+        The list of upserted metrics records.
+    """
+    results = []
+    for record in metrics_records:
+        record["date"] = record["date"].isoformat() if isinstance(record["date"], date) else record["date"]
+        try:
+            await collection.replace_one(
+                {
+                    "date": record["date"],
+                    "aggregation_period": record["aggregation_period"],
+                },
+                record,
+                upsert=True,
+            )
+
+            results.append(record)
+
+        except Exception as e:
+            log_error(f"Error upserting metrics record: {e}")
+            continue
+
+    return results
+
+
+# Days since the Unix epoch, in UTC
+_DAY_EXPRESSION = {"$toLong": {"$floor": {"$divide": ["$created_at", SECONDS_PER_DAY]}}}
+
+
+def get_metrics_aggregation_pipeline(dates: List[date]) -> List[Dict[str, Any]]:
+    """Return the pipeline aggregating the sessions created on the given dates, for build_daily_metrics_records.
+
+    Counts and token sums are computed by the database in a single aggregation, so session runs are never loaded.
+    The pipeline returns one document, with the session, user and run rows to be read with get_metrics_rows.
+    """
+    return [
+        {"$match": {"$or": [{"created_at": {"$gte": start, "$lt": end}} for start, end in get_day_ranges(dates)]}},
+        {
+            "$project": {
+                "day": _DAY_EXPRESSION,
+                "session_type": 1,
+                "user_id": 1,
+                "session_data.session_metrics": 1,
+                "runs.model": 1,
+                "runs.model_provider": 1,
+            }
+        },
+        {
+            "$facet": {
+                "sessions": [
+                    {
+                        "$group": {
+                            "_id": {"day": "$day", "session_type": "$session_type"},
+                            "sessions_count": {"$sum": 1},
+                            **{
+                                field: {"$sum": {"$ifNull": [f"$session_data.session_metrics.{field}", 0]}}
+                                for field in METRICS_TOKEN_FIELDS
+                            },
+                        }
+                    }
+                ],
+                "users": [
+                    {"$match": {"user_id": {"$nin": [None, ""]}}},
+                    {"$group": {"_id": {"day": "$day", "user_id": "$user_id"}}},
+                    {"$group": {"_id": "$_id.day", "users_count": {"$sum": 1}}},
+                ],
+                # Runs are grouped by model, so the runs of a session are read once for both counts
+                "runs": [
+                    {"$unwind": "$runs"},
+                    {
+                        "$group": {
+                            "_id": {
+                                "day": "$day",
+                                "session_type": "$session_type",
+                                "model_id": {"$ifNull": ["$runs.model", None]},
+                                "model_provider": {"$ifNull": ["$runs.model_provider", ""]},
+                            },
+                            "runs_count": {"$sum": 1},
+                        }
+                    },
+                ],
+            }
+        },
+    ]
+
+
+def get_metrics_rows(result: Optional[Dict[str, Any]]) -> Dict[str, List[Tuple[Any, ...]]]:
+    """Return the rows expected by build_daily_metrics_records from the result of get_metrics_aggregation_pipeline."""
+    result = result or {}
+    return {
+        "sessions": [
+            (row["_id"]["day"], row["_id"]["session_type"], row["sessions_count"])
+            + tuple(row[field] for field in METRICS_TOKEN_FIELDS)
+            for row in result.get("sessions", [])
+        ],
+        "users": [(row["_id"], row["users_count"]) for row in result.get("users", [])],
+        "runs": [
+            (
+                row["_id"]["day"],
+                row["_id"]["session_type"],
+                row["_id"]["model_id"],
+                row["_id"]["model_provider"],
+                row["runs_count"],
+            )
+            for row in result.get("runs", [])
+        ],
+    }
+
+
+def get_updated_days_pipeline(updated_since: int, created_before: int) -> List[Dict[str, Any]]:
+    """Return the pipeline selecting the days of the sessions created before a time and updated since another.
+
+    Used to recalculate the metrics of past days whose sessions got new runs since the last calculation.
+    """
+    return [
+        {"$match": {"updated_at": {"$gte": updated_since}, "created_at": {"$lt": created_before}}},
+        {"$group": {"_id": _DAY_EXPRESSION}},
+    ]
+
+
 # -- Cultural Knowledge util methods --
 def serialize_cultural_knowledge_for_db(cultural_knowledge: CulturalKnowledge) -> Dict[str, Any]:
     """Serialize a CulturalKnowledge object for database storage.
@@ -11,11 +11,11 @@ from agno.db.mysql.schemas import get_table_schema_definition
 from agno.db.mysql.utils import (
     apply_sorting,
     bulk_upsert_metrics,
-    calculate_date_metrics,
     create_schema,
     deserialize_cultural_knowledge_from_db,
-    fetch_all_sessions_data,
     get_dates_to_calculate_metrics_for,
+    get_metrics_aggregation_statements,
+    get_updated_days_statement,
     is_table_available,
     is_valid_table,
     serialize_cultural_knowledge_for_db,
@@ -24,6 +24,7 @@ from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
 from agno.db.schemas.knowledge import KnowledgeRow
 from agno.db.schemas.memory import UserMemory
+from agno.db.utils import SECONDS_PER_DAY, build_daily_metrics_records, get_dates_from_epoch_days, get_epoch_day
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.string import generate_id
@@ -136,7 +137,7 @@ class MySQLDb(BaseDb):
             Table: SQLAlchemy Table object
         """
         try:
-            table_schema = get_table_schema_definition(table_type)
+            table_schema = get_table_schema_definition(table_type).copy()
 
             log_debug(f"Creating table {table_name}")
 
@@ -1570,8 +1571,37 @@ class MySQLDb(BaseDb):
 
         return datetime.fromtimestamp(first_session_date, tz=timezone.utc).date()
 
+    def _get_days_with_updated_sessions(self, table: Table, before: date) -> List[date]:
+        """Get the dates before the given date with sessions updated since the last metrics calculation.
+
+        The latest update of the metrics records is the watermark of the last calculation.
+
+        Args:
+            table (Table): The metrics table.
+            before (date): The first date metrics will be calculated for anyway.
+
+        Returns:
+            List[date]: The dates whose metrics need to be recalculated.
+        """
+        sessions_table = self._get_table(table_type="sessions")
+        if sessions_table is None:
+            return []
+
+        with self.Session() as sess:
+            watermark = sess.execute(select(func.max(table.c.updated_at))).scalar()
+            if watermark is None:
+                return []
+
+            stmt = get_updated_days_statement(
+                sessions_table, updated_since=watermark, created_before=get_epoch_day(before) * SECONDS_PER_DAY
+            )
+            return get_dates_from_epoch_days(row[0] for row in sess.execute(stmt).fetchall())
+
     def calculate_metrics(self) -> Optional[list[dict]]:
-        """Calculate metrics for all dates without complete metrics.
+        """Calculate metrics for all dates without complete metrics, and for the dates with sessions updated since the
+        last calculation.
+
+        The sessions are aggregated in the database, so their runs are not loaded.
 
         Returns:
             Optional[list[dict]]: The calculated metrics.
@@ -1584,52 +1614,46 @@ class MySQLDb(BaseDb):
             if table is None:
                 return None
 
+            # Sessions updated from now on will be picked up by the next calculation
+            calculated_at = int(time.time())
+
             starting_date = self._get_metrics_calculation_starting_date(table)
+
             if starting_date is None:
                 log_info("No session data found. Won't calculate metrics.")
                 return None
 
             dates_to_process = get_dates_to_calculate_metrics_for(starting_date)
+            # Incremental rollup: past dates are only recalculated if their sessions were updated
+            dates_to_process = self._get_days_with_updated_sessions(table, starting_date) + dates_to_process
             if not dates_to_process:
                 log_info("Metrics already calculated for all relevant dates.")
                 return None
 
-            start_timestamp = int(
-                datetime.combine(dates_to_process[0], datetime.min.time()).replace(tzinfo=timezone.utc).timestamp()
-            )
-            end_timestamp = int(
-                datetime.combine(dates_to_process[-1] + timedelta(days=1), datetime.min.time())
-                .replace(tzinfo=timezone.utc)
-                .timestamp()
-            )
+            sessions_table = self._get_table(table_type="sessions")
+            if sessions_table is None:
+                return None
 
-            sessions = self._get_all_sessions_for_metrics_calculation(
-                start_timestamp=start_timestamp, end_timestamp=end_timestamp
-            )
-            all_sessions_data = fetch_all_sessions_data(
-                sessions=sessions, dates_to_process=dates_to_process, start_timestamp=start_timestamp
+            statements = get_metrics_aggregation_statements(sessions_table, dates_to_process)
+            with self.Session() as sess:
+                rows = {
+                    key: [row for stmt in key_statements for row in sess.execute(stmt).fetchall()]
+                    for key, key_statements in statements.items()
+                }
+
+            metrics_records = build_daily_metrics_records(
+                dates_to_process,
+                session_rows=rows["sessions"],
+                user_rows=rows["users"],
+                run_rows=rows["runs"],
+                calculated_at=calculated_at,
             )
-            if not all_sessions_data:
+            if not metrics_records:
                 log_info("No new session data found. Won't calculate metrics.")
                 return None
 
-            results = []
-            metrics_records = []
-
-            for date_to_process in dates_to_process:
-                date_key = date_to_process.isoformat()
-                sessions_for_date = all_sessions_data.get(date_key, {})
-
-                # Skip dates with no sessions
-                if not any(len(sessions) > 0 for sessions in sessions_for_date.values()):
-                    continue
-
-                metrics_record = calculate_date_metrics(date_to_process, sessions_for_date)
-                metrics_records.append(metrics_record)
-
-            if metrics_records:
-                with self.Session() as sess, sess.begin():
-                    results = bulk_upsert_metrics(session=sess, table=table, metrics_records=metrics_records)
+            with self.Session() as sess, sess.begin():
+                results = bulk_upsert_metrics(session=sess, table=table, metrics_records=metrics_records)
 
             return results
 
@@ -1824,6 +1848,8 @@ class MySQLDb(BaseDb):
                     "created_at": "created_at",
                     "updated_at": "updated_at",
                     "external_id": "external_id",
+                    "content_digest": "content_digest",
+                    "chunk_digests": "chunk_digests",
                 }
 
                 # Build insert and update data only for fields that exist in the table
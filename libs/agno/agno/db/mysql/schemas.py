@@ -74,6 +74,8 @@ KNOWLEDGE_TABLE_SCHEMA = {
     "status": {"type": lambda: String(50), "nullable": True},
     "status_message": {"type": Text, "nullable": True},
     "external_id": {"type": lambda: String(128), "nullable": True},
+    "content_digest": {"type": lambda: String(64), "nullable": True},
+    "chunk_digests": {"type": JSON, "nullable": True},
 }
 
 METRICS_TABLE_SCHEMA = {
@@ -9,13 +9,15 @@ from sqlalchemy import Engine
 
 from agno.db.mysql.schemas import get_table_schema_definition
 from agno.db.schemas.culture import CulturalKnowledge
+from agno.db.utils import METRICS_TOKEN_FIELDS, SECONDS_PER_DAY, get_day_ranges
 from agno.utils.log import log_debug, log_error, log_warning
 
 try:
-    from sqlalchemy import Table
+    from sqlalchemy import Integer, Table, and_, case, cast, column, func, literal_column, or_, select
     from sqlalchemy.dialects import mysql
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import Session
+    from sqlalchemy.sql import Select
     from sqlalchemy.sql.expression import text
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
@@ -298,6 +300,86 @@ def get_dates_to_calculate_metrics_for(starting_date: date) -> list[date]:
     return [starting_date + timedelta(days=x) for x in range(days_diff)]
 
 
+def _get_day(table: Table):
+    # Days since the Unix epoch, in UTC. The divisor is inlined so the expression can be grouped by.
+    return table.c.created_at.op("DIV")(literal_column(str(SECONDS_PER_DAY))).label("day")
+
+
+def _in_days(table: Table, dates: List[date]):
+    return or_(*[and_(table.c.created_at >= start, table.c.created_at < end) for start, end in get_day_ranges(dates)])
+
+
+def get_metrics_aggregation_statements(table: Table, dates: List[date]) -> Dict[str, List[Select]]:
+    """Return the statements aggregating the sessions created on the given dates, for build_daily_metrics_records.
+
+    Counts and token sums are computed with JSON functions in the database, so session runs are never loaded.
+
+    Args:
+        table (Table): The sessions table.
+        dates (List[date]): The dates to aggregate the sessions of.
+
+    Returns:
+        Dict[str, List[Select]]: The statements returning the session, user and run rows.
+    """
+    in_days = _in_days(table, dates)
+
+    token_values = [
+        func.coalesce(cast(func.json_extract(table.c.session_data, f"$.session_metrics.{field}"), Integer), 0).label(
+            field
+        )
+        for field in METRICS_TOKEN_FIELDS
+    ]
+    sessions = select(_get_day(table), table.c.session_type, *token_values).where(in_days).subquery()
+    session_rows = select(
+        sessions.c.day,
+        sessions.c.session_type,
+        func.count(),
+        *[func.sum(sessions.c[field]) for field in METRICS_TOKEN_FIELDS],
+    ).group_by(sessions.c.day, sessions.c.session_type)
+
+    users = (
+        select(_get_day(table), table.c.user_id)
+        .where(in_days, table.c.user_id.is_not(None), table.c.user_id != "")
+        .subquery()
+    )
+    user_rows = select(users.c.day, func.count(users.c.user_id.distinct())).group_by(users.c.day)
+
+    # Runs are grouped by model, so the runs of a session are read once for both the runs and the models counts
+    run = (
+        func.json_table(
+            case((func.json_type(table.c.runs) == literal_column("'ARRAY'"), table.c.runs), else_=func.json_array()),
+            literal_column(
+                "'$[*]' COLUMNS(model_id VARCHAR(255) PATH '$.model', model_provider VARCHAR(255) PATH '$.model_provider')"
+            ),
+        )
+        .table_valued(column("model_id"), column("model_provider"), joins_implicitly=True)
+        .alias("run")
+    )
+    runs = (
+        select(
+            _get_day(table),
+            table.c.session_type,
+            run.c.model_id,
+            func.coalesce(run.c.model_provider, "").label("model_provider"),
+        )
+        .select_from(table, run)
+        .where(in_days)
+        .subquery()
+    )
+    run_rows = select(*runs.c, func.count()).group_by(*runs.c)
+
+    return {"sessions": [session_rows], "users": [user_rows], "runs": [run_rows]}
+
+
+def get_updated_days_statement(table: Table, updated_since: int, created_before: int) -> Select:
+    """Return the statement selecting the days of the sessions created before a time and updated since another.
+
+    Used to recalculate the metrics of past days whose sessions got new runs since the last calculation.
+    """
+    day = _get_day(table)
+    return select(day).where(table.c.updated_at >= updated_since, table.c.created_at < created_before).group_by(day)
+
+
 # -- Cultural Knowledge util methods --
 def serialize_cultural_knowledge_for_db(cultural_knowledge: CulturalKnowledge) -> Dict[str, Any]:
     """Serialize a CulturalKnowledge object for database storage.
@@ -13,16 +13,17 @@ from agno.db.postgres.utils import (
     ais_table_available,
     ais_valid_table,
     apply_sorting,
-    calculate_date_metrics,
     deserialize_cultural_knowledge,
-    fetch_all_sessions_data,
     get_dates_to_calculate_metrics_for,
+    get_metrics_aggregation_statements,
+    get_updated_days_statement,
     serialize_cultural_knowledge,
 )
 from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
 from agno.db.schemas.knowledge import KnowledgeRow
 from agno.db.schemas.memory import UserMemory
+from agno.db.utils import SECONDS_PER_DAY, build_daily_metrics_records, get_dates_from_epoch_days, get_epoch_day
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 
@@ -1428,8 +1429,35 @@ class AsyncPostgresDb(AsyncBaseDb):
 
         return datetime.fromtimestamp(first_session_date, tz=timezone.utc).date()
 
+    async def _get_days_with_updated_sessions(self, table: Table, before: date) -> List[date]:
+        """Get the dates before the given date with sessions updated since the last metrics calculation.
+
+        The latest update of the metrics records is the watermark of the last calculation.
+
+        Args:
+            table (Table): The metrics table.
+            before (date): The first date metrics will be calculated for anyway.
+
+        Returns:
+            List[date]: The dates whose metrics need to be recalculated.
+        """
+        sessions_table = await self._get_table(table_type="sessions")
+
+        async with self.async_session_factory() as sess:
+            watermark = (await sess.execute(select(func.max(table.c.updated_at)))).scalar()
+            if watermark is None:
+                return []
+
+            stmt = get_updated_days_statement(
+                sessions_table, updated_since=watermark, created_before=get_epoch_day(before) * SECONDS_PER_DAY
+            )
+            return get_dates_from_epoch_days(row[0] for row in (await sess.execute(stmt)).fetchall())
+
     async def calculate_metrics(self) -> Optional[list[dict]]:
-        """Calculate metrics for all dates without complete metrics.
+        """Calculate metrics for all dates without complete metrics, and for the dates with sessions updated since the
+        last calculation.
+
+        The sessions are aggregated in the database, so their runs are not loaded.
 
         Returns:
             Optional[list[dict]]: The calculated metrics.
@@ -1440,6 +1468,9 @@ class AsyncPostgresDb(AsyncBaseDb):
         try:
             table = await self._get_table(table_type="metrics")
 
+            # Sessions updated from now on will be picked up by the next calculation
+            calculated_at = int(time.time())
+
             starting_date = await self._get_metrics_calculation_starting_date(table)
 
             if starting_date is None:
@@ -1447,48 +1478,32 @@ class AsyncPostgresDb(AsyncBaseDb):
                 return None
 
             dates_to_process = get_dates_to_calculate_metrics_for(starting_date)
+            # Incremental rollup: past dates are only recalculated if their sessions were updated
+            dates_to_process = await self._get_days_with_updated_sessions(table, starting_date) + dates_to_process
             if not dates_to_process:
                 log_info("Metrics already calculated for all relevant dates.")
                 return None
 
-            start_timestamp = int(
-                datetime.combine(dates_to_process[0], datetime.min.time()).replace(tzinfo=timezone.utc).timestamp()
-            )
-            end_timestamp = int(
-                datetime.combine(dates_to_process[-1] + timedelta(days=1), datetime.min.time())
-                .replace(tzinfo=timezone.utc)
-                .timestamp()
-            )
-
-            sessions = await self._get_all_sessions_for_metrics_calculation(
-                start_timestamp=start_timestamp, end_timestamp=end_timestamp
-            )
-
-            all_sessions_data = fetch_all_sessions_data(
-                sessions=sessions, dates_to_process=dates_to_process, start_timestamp=start_timestamp
+            sessions_table = await self._get_table(table_type="sessions")
+            statements = get_metrics_aggregation_statements(sessions_table, None, dates_to_process)
+            async with self.async_session_factory() as sess:
+                rows: Dict[str, List[Any]] = {}
+                for key, key_statements in statements.items():
+                    rows[key] = [row for stmt in key_statements for row in (await sess.execute(stmt)).fetchall()]
+
+            metrics_records = build_daily_metrics_records(
+                dates_to_process,
+                session_rows=rows["sessions"],
+                user_rows=rows["users"],
+                run_rows=rows["runs"],
+                calculated_at=calculated_at,
             )
-            if not all_sessions_data:
+            if not metrics_records:
                 log_info("No new session data found. Won't calculate metrics.")
                 return None
 
-            results = []
-            metrics_records = []
-
-            for date_to_process in dates_to_process:
-                date_key = date_to_process.isoformat()
-                sessions_for_date = all_sessions_data.get(date_key, {})
-
-                # Skip dates with no sessions
-                if not any(len(sessions) > 0 for sessions in sessions_for_date.values()):
-                    continue
-
-                metrics_record = calculate_date_metrics(date_to_process, sessions_for_date)
-
-                metrics_records.append(metrics_record)
-
-            if metrics_records:
-                async with self.async_session_factory() as sess, sess.begin():
-                    results = await abulk_upsert_metrics(session=sess, table=table, metrics_records=metrics_records)
+            async with self.async_session_factory() as sess, sess.begin():
+                results = await abulk_upsert_metrics(session=sess, table=table, metrics_records=metrics_records)
 
             log_debug("Updated metrics calculations")
 
@@ -1663,6 +1678,8 @@ class AsyncPostgresDb(AsyncBaseDb):
                     "created_at": "created_at",
                     "updated_at": "updated_at",
                     "external_id": "external_id",
+                    "content_digest": "content_digest",
+                    "chunk_digests": "chunk_digests",
                 }
 
                 # Build insert and update data only for fields that exist in the table
@@ -9,11 +9,11 @@ from agno.db.postgres.schemas import get_table_schema_definition
 from agno.db.postgres.utils import (
     apply_sorting,
     bulk_upsert_metrics,
-    calculate_date_metrics,
     create_schema,
     deserialize_cultural_knowledge,
-    fetch_all_sessions_data,
     get_dates_to_calculate_metrics_for,
+    get_metrics_aggregation_statements,
+    get_updated_days_statement,
     is_table_available,
     is_valid_table,
     serialize_cultural_knowledge,
@@ -22,6 +22,14 @@ from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
 from agno.db.schemas.knowledge import KnowledgeRow
 from agno.db.schemas.memory import UserMemory
+from agno.db.utils import (
+    SECONDS_PER_DAY,
+    attach_session_runs,
+    build_daily_metrics_records,
+    get_dates_from_epoch_days,
+    get_epoch_day,
+    get_session_run_rows,
+)
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.string import generate_id
@@ -50,6 +58,9 @@ class PostgresDb(BaseDb):
         eval_table: Optional[str] = None,
         knowledge_table: Optional[str] = None,
         versions_table: Optional[str] = None,
+        runs_table: Optional[str] = None,
+        store_runs_separately: bool = False,
+        session_runs_limit: Optional[int] = None,
         id: Optional[str] = None,
     ):
         """
@@ -71,6 +82,12 @@ class PostgresDb(BaseDb):
             knowledge_table (Optional[str]): Name of the table to store knowledge content.
             culture_table (Optional[str]): Name of the table to store cultural knowledge.
             versions_table (Optional[str]): Name of the table to store schema versions.
+            runs_table (Optional[str]): Name of the table to store session runs, when store_runs_separately is enabled.
+            store_runs_separately (bool): Store each run of a session as its own row in the runs table, instead of
+                storing all runs in the sessions table. Upserting a session then only writes its new and changed runs.
+            session_runs_limit (Optional[int]): Only load the latest runs of a session when reading it. Defaults to all runs.
+                Only applies to runs stored in the runs table: runs stored in the sessions table are always loaded whole,
+                as upserting the session writes them back.
             id (Optional[str]): ID of the database.
 
         Raises:
@@ -106,6 +123,10 @@ class PostgresDb(BaseDb):
         self.db_schema: str = db_schema if db_schema is not None else "ai"
         self.metadata: MetaData = MetaData()
 
+        self.runs_table_name: str = runs_table or "agno_session_runs"
+        self.store_runs_separately: bool = store_runs_separately
+        self.session_runs_limit: Optional[int] = session_runs_limit
+
         # Initialize database session
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine))
 
@@ -132,6 +153,8 @@ class PostgresDb(BaseDb):
             (self.knowledge_table_name, "knowledge"),
             (self.versions_table_name, "versions"),
         ]
+        if self.store_runs_separately:
+            tables_to_create.append((self.runs_table_name, "runs"))
 
         for table_name, table_type in tables_to_create:
             if table_name != self.versions_table_name:
@@ -281,6 +304,15 @@ class PostgresDb(BaseDb):
             )
             return self.culture_table
 
+        if table_type == "runs":
+            self.runs_table = self._get_or_create_table(
+                table_name=self.runs_table_name,
+                table_type="runs",
+                db_schema=self.db_schema,
+                create_table_if_not_found=create_table_if_not_found,
+            )
+            return self.runs_table
+
         if table_type == "versions":
             self.versions_table = self._get_or_create_table(
                 table_name=self.versions_table_name,
@@ -374,6 +406,129 @@ class PostgresDb(BaseDb):
             sess.execute(stmt)
 
     # -- Session methods --
+    def _get_runs_table(self, create_table_if_not_found: Optional[bool] = False) -> Optional[Table]:
+        """Get the runs table, if runs are stored separately from their sessions."""
+        if not self.store_runs_separately:
+            return None
+        return self._get_table(table_type="runs", create_table_if_not_found=create_table_if_not_found)
+
+    def _pop_session_runs(
+        self, session_dict: Dict[str, Any], runs_by_session: Dict[str, Optional[List[Dict[str, Any]]]]
+    ) -> Dict[str, Any]:
+        """If runs are stored separately, move the runs out of the given session dictionary into runs_by_session."""
+        if self.store_runs_separately:
+            runs_by_session[session_dict["session_id"]] = session_dict.get("runs")
+            session_dict["runs"] = None
+        return session_dict
+
+    def _write_session_runs(
+        self, sess: Any, runs_table: Table, session_id: str, runs: Optional[List[Dict[str, Any]]]
+    ) -> None:
+        """Insert the new runs of a session into the runs table and update the runs that changed.
+
+        Stored runs missing from the given runs are kept, so sessions read with only their latest runs can be upserted.
+        """
+        if not runs:
+            return
+
+        stmt = select(runs_table.c.run_id, runs_table.c.run_digest, runs_table.c.position).where(
+            runs_table.c.session_id == session_id
+        )
+        stored_runs = {row.run_id: (row.run_digest, row.position) for row in sess.execute(stmt).fetchall()}
+        rows = get_session_run_rows(session_id=session_id, runs=runs, stored_runs=stored_runs)
+        if not rows:
+            return
+
+        insert_stmt = postgresql.insert(runs_table)
+        insert_stmt = insert_stmt.on_conflict_do_update(
+            index_elements=["session_id", "run_id"],
+            set_=dict(
+                run_digest=insert_stmt.excluded.run_digest,
+                run_data=insert_stmt.excluded.run_data,
+                updated_at=insert_stmt.excluded.updated_at,
+            ),
+        )
+        sess.execute(insert_stmt, rows)
+        log_debug(f"Stored {len(rows)} new or updated runs for session {session_id}")
+
+    def _load_session_runs(
+        self, sess: Any, runs_table: Optional[Table], sessions: List[Dict[str, Any]], num_runs: Optional[int]
+    ) -> None:
+        """Set the runs stored in the runs table on the given session dictionaries, only the latest num_runs if given.
+
+        Runs still stored in the sessions table are kept whole, so upserting the session doesn't drop any of them.
+        """
+        if runs_table is None or not sessions or num_runs == 0:
+            attach_session_runs(sessions=sessions, run_rows=[])
+            return
+
+        session_ids = [session["session_id"] for session in sessions]
+        if num_runs is None:
+            stmt = (
+                select(runs_table.c.session_id, runs_table.c.run_data)
+                .where(runs_table.c.session_id.in_(session_ids))
+                .order_by(runs_table.c.session_id, runs_table.c.position)
+            )
+        else:
+            latest = (
+                func.row_number()
+                .over(partition_by=runs_table.c.session_id, order_by=runs_table.c.position.desc())
+                .label("latest")
+            )
+            runs = (
+                select(runs_table.c.session_id, runs_table.c.run_data, runs_table.c.position, latest)
+                .where(runs_table.c.session_id.in_(session_ids))
+                .subquery()
+            )
+            stmt = (
+                select(runs.c.session_id, runs.c.run_data)
+                .where(runs.c.latest <= num_runs)
+                .order_by(runs.c.session_id, runs.c.position)
+            )
+
+        attach_session_runs(sessions=sessions, run_rows=sess.execute(stmt).fetchall())
+
+    def get_session_runs(self, session_id: str, num_runs: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get the runs of a session, oldest first.
+
+        Together with get_session(..., num_runs=0), this allows loading the runs of a session lazily.
+
+        Args:
+            session_id (str): ID of the session to get the runs for.
+            num_runs (Optional[int]): Only get the latest num_runs runs. Defaults to all runs.
+
+        Returns:
+            List[Dict[str, Any]]: The serialized runs of the session.
+
+        Raises:
+            Exception: If an error occurs during retrieval.
+        """
+        try:
+            table = self._get_table(table_type="sessions")
+            if table is None:
+                return []
+            runs_table = self._get_runs_table()
+
+            with self.Session() as sess:
+                row = sess.execute(
+                    select(table.c.session_id, table.c.runs).where(table.c.session_id == session_id)
+                ).fetchone()
+                if row is None:
+                    return []
+
+                session = dict(row._mapping)
+                self._load_session_runs(sess, runs_table, [session], num_runs)
+                runs = session["runs"] or []
+                # Runs read from the sessions table are not limited by the query
+                if num_runs is not None:
+                    runs = runs[-num_runs:] if num_runs > 0 else []
+                return runs
+
+        except Exception as e:
+            log_error(f"Exception reading session runs: {e}")
+            raise e
+
     def delete_session(self, session_id: str) -> bool:
         """
         Delete a session from the database.
@@ -392,9 +547,13 @@ class PostgresDb(BaseDb):
             if table is None:
                 return False
 
+            runs_table = self._get_runs_table()
+
             with self.Session() as sess, sess.begin():
                 delete_stmt = table.delete().where(table.c.session_id == session_id)
                 result = sess.execute(delete_stmt)
+                if runs_table is not None:
+                    sess.execute(runs_table.delete().where(runs_table.c.session_id == session_id))
 
                 if result.rowcount == 0:
                     log_debug(f"No session found to delete with session_id: {session_id} in table {table.name}")
@@ -423,9 +582,13 @@ class PostgresDb(BaseDb):
             if table is None:
                 return
 
+            runs_table = self._get_runs_table()
+
             with self.Session() as sess, sess.begin():
                 delete_stmt = table.delete().where(table.c.session_id.in_(session_ids))
                 result = sess.execute(delete_stmt)
+                if runs_table is not None:
+                    sess.execute(runs_table.delete().where(runs_table.c.session_id.in_(session_ids)))
 
             log_debug(f"Successfully deleted {result.rowcount} sessions")
 
@@ -439,6 +602,7 @@ class PostgresDb(BaseDb):
         session_type: SessionType,
         user_id: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        num_runs: Optional[int] = None,
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         """
         Read a session from the database.
@@ -448,6 +612,8 @@ class PostgresDb(BaseDb):
             session_type (SessionType): Type of session to get.
             user_id (Optional[str]): User ID to filter by. Defaults to None.
             deserialize (Optional[bool]): Whether to serialize the session. Defaults to True.
+            num_runs (Optional[int]): Only load the latest num_runs runs of the session, or no runs if 0.
+                Defaults to session_runs_limit. Only applies to runs stored in the runs table.
 
         Returns:
             Union[Session, Dict[str, Any], None]:
@@ -461,6 +627,8 @@ class PostgresDb(BaseDb):
             table = self._get_table(table_type="sessions")
             if table is None:
                 return None
+            runs_table = self._get_runs_table()
+            num_runs = num_runs if num_runs is not None else self.session_runs_limit
 
             with self.Session() as sess:
                 stmt = select(table).where(table.c.session_id == session_id)
@@ -472,6 +640,8 @@ class PostgresDb(BaseDb):
                     return None
 
                 session = dict(result._mapping)
+                if runs_table is not None:
+                    self._load_session_runs(sess, runs_table, [session], num_runs)
 
             if not deserialize:
                 return session
@@ -489,6 +659,22 @@ class PostgresDb(BaseDb):
             log_error(f"Exception reading from session table: {e}")
             raise e
 
+    def get_session_updated_at(self, session_id: str, session_type: SessionType) -> Optional[int]:
+        """Get the updated_at of a stored session, or None if it doesn't exist. Only reads that column."""
+        try:
+            table = self._get_table(table_type="sessions")
+            if table is None:
+                return None
+
+            with self.Session() as sess:
+                stmt = select(table.c.updated_at).where(table.c.session_id == session_id)
+                result = sess.execute(stmt).fetchone()
+                return (result[0] or 0) if result is not None else None
+
+        except Exception as e:
+            log_error(f"Exception reading from sessions table: {e}")
+            raise e
+
     def get_sessions(
         self,
         session_type: Optional[SessionType] = None,
@@ -531,6 +717,7 @@ class PostgresDb(BaseDb):
             table = self._get_table(table_type="sessions")
             if table is None:
                 return [] if deserialize else ([], 0)
+            runs_table = self._get_runs_table()
 
             with self.Session() as sess, sess.begin():
                 stmt = select(table)
@@ -576,6 +763,8 @@ class PostgresDb(BaseDb):
                     return [], 0
 
                 session = [dict(record._mapping) for record in records]
+                if runs_table is not None:
+                    self._load_session_runs(sess, runs_table, session, self.session_runs_limit)
                 if not deserialize:
                     return session, total_count
 
@@ -616,6 +805,7 @@ class PostgresDb(BaseDb):
             table = self._get_table(table_type="sessions")
             if table is None:
                 return None
+            runs_table = self._get_runs_table()
 
             with self.Session() as sess, sess.begin():
                 stmt = (
@@ -639,9 +829,12 @@ class PostgresDb(BaseDb):
                 if not row:
                     return None
 
+                session = dict(row._mapping)
+                if runs_table is not None:
+                    self._load_session_runs(sess, runs_table, [session], self.session_runs_limit)
+
             log_debug(f"Renamed session with id '{session_id}' to '{session_name}'")
 
-            session = dict(row._mapping)
             if not deserialize:
                 return session
 
@@ -681,8 +874,10 @@ class PostgresDb(BaseDb):
             table = self._get_table(table_type="sessions", create_table_if_not_found=True)
             if table is None:
                 return None
+            runs_table = self._get_runs_table(create_table_if_not_found=True)
 
-            session_dict = session.to_dict()
+            runs_by_session: Dict[str, Optional[List[Dict[str, Any]]]] = {}
+            session_dict = self._pop_session_runs(session.to_dict(), runs_by_session)
 
             if isinstance(session, AgentSession):
                 with self.Session() as sess, sess.begin():
@@ -715,6 +910,9 @@ class PostgresDb(BaseDb):
                     result = sess.execute(stmt)
                     row = result.fetchone()
                     session_dict = dict(row._mapping)
+                    if runs_table is not None:
+                        session_dict["runs"] = runs_by_session.get(session.session_id)
+                        self._write_session_runs(sess, runs_table, session.session_id, session_dict["runs"])
 
                     if session_dict is None or not deserialize:
                         return session_dict
@@ -751,6 +949,9 @@ class PostgresDb(BaseDb):
                     result = sess.execute(stmt)
                     row = result.fetchone()
                     session_dict = dict(row._mapping)
+                    if runs_table is not None:
+                        session_dict["runs"] = runs_by_session.get(session.session_id)
+                        self._write_session_runs(sess, runs_table, session.session_id, session_dict["runs"])
 
                     if session_dict is None or not deserialize:
                         return session_dict
@@ -787,6 +988,9 @@ class PostgresDb(BaseDb):
                     result = sess.execute(stmt)
                     row = result.fetchone()
                     session_dict = dict(row._mapping)
+                    if runs_table is not None:
+                        session_dict["runs"] = runs_by_session.get(session.session_id)
+                        self._write_session_runs(sess, runs_table, session.session_id, session_dict["runs"])
 
                     if session_dict is None or not deserialize:
                         return session_dict
@@ -823,6 +1027,8 @@ class PostgresDb(BaseDb):
             table = self._get_table(table_type="sessions", create_table_if_not_found=True)
             if table is None:
                 return []
+            runs_table = self._get_runs_table(create_table_if_not_found=True)
+            runs_by_session: Dict[str, Optional[List[Dict[str, Any]]]] = {}
 
             # Group sessions by type for better handling
             agent_sessions = [s for s in sessions if isinstance(s, AgentSession)]
@@ -835,7 +1041,7 @@ class PostgresDb(BaseDb):
             if agent_sessions:
                 session_records = []
                 for agent_session in agent_sessions:
-                    session_dict = agent_session.to_dict()
+                    session_dict = self._pop_session_runs(agent_session.to_dict(), runs_by_session)
                     # Use preserved updated_at if flag is set (even if None), otherwise use current time
                     updated_at = session_dict.get("updated_at") if preserve_updated_at else int(time.time())
                     session_records.append(
@@ -868,6 +1074,8 @@ class PostgresDb(BaseDb):
                     result = sess.execute(stmt, session_records)
                     for row in result.fetchall():
                         session_dict = dict(row._mapping)
+                        if runs_table is not None:
+                            session_dict["runs"] = runs_by_session.get(session_dict["session_id"])
                         if deserialize:
                             deserialized_agent_session = AgentSession.from_dict(session_dict)
                             if deserialized_agent_session is None:
@@ -880,7 +1088,7 @@ class PostgresDb(BaseDb):
             if team_sessions:
                 session_records = []
                 for team_session in team_sessions:
-                    session_dict = team_session.to_dict()
+                    session_dict = self._pop_session_runs(team_session.to_dict(), runs_by_session)
                     # Use preserved updated_at if flag is set (even if None), otherwise use current time
                     updated_at = session_dict.get("updated_at") if preserve_updated_at else int(time.time())
                     session_records.append(
@@ -913,6 +1121,8 @@ class PostgresDb(BaseDb):
                     result = sess.execute(stmt, session_records)
                     for row in result.fetchall():
                         session_dict = dict(row._mapping)
+                        if runs_table is not None:
+                            session_dict["runs"] = runs_by_session.get(session_dict["session_id"])
                         if deserialize:
                             deserialized_team_session = TeamSession.from_dict(session_dict)
                             if deserialized_team_session is None:
@@ -925,7 +1135,7 @@ class PostgresDb(BaseDb):
             if workflow_sessions:
                 session_records = []
                 for workflow_session in workflow_sessions:
-                    session_dict = workflow_session.to_dict()
+                    session_dict = self._pop_session_runs(workflow_session.to_dict(), runs_by_session)
                     # Use preserved updated_at if flag is set (even if None), otherwise use current time
                     updated_at = session_dict.get("updated_at") if preserve_updated_at else int(time.time())
                     session_records.append(
@@ -958,6 +1168,8 @@ class PostgresDb(BaseDb):
                     result = sess.execute(stmt, session_records)
                     for row in result.fetchall():
                         session_dict = dict(row._mapping)
+                        if runs_table is not None:
+                            session_dict["runs"] = runs_by_session.get(session_dict["session_id"])
                         if deserialize:
                             deserialized_workflow_session = WorkflowSession.from_dict(session_dict)
                             if deserialized_workflow_session is None:
@@ -966,6 +1178,11 @@ class PostgresDb(BaseDb):
                         else:
                             results.append(session_dict)
 
+            if runs_table is not None:
+                with self.Session() as sess, sess.begin():
+                    for session_id, runs in runs_by_session.items():
+                        self._write_session_runs(sess, runs_table, session_id, runs)
+
             return results
 
         except Exception as e:
@@ -1447,7 +1664,10 @@ class PostgresDb(BaseDb):
             if table is None:
                 return []
 
+            runs_table = self._get_runs_table()
+
             stmt = select(
+                table.c.session_id,
                 table.c.user_id,
                 table.c.session_data,
                 table.c.runs,
@@ -1462,8 +1682,12 @@ class PostgresDb(BaseDb):
 
             with self.Session() as sess:
                 result = sess.execute(stmt).fetchall()
+                if runs_table is None:
+                    return [record._mapping for record in result]
 
-                return [record._mapping for record in result]
+                sessions = [dict(record._mapping) for record in result]
+                self._load_session_runs(sess, runs_table, sessions, None)
+                return sessions
 
         except Exception as e:
             log_error(f"Exception reading from sessions table: {e}")
@@ -1504,8 +1728,37 @@ class PostgresDb(BaseDb):
 
         return datetime.fromtimestamp(first_session_date, tz=timezone.utc).date()
 
+    def _get_days_with_updated_sessions(self, table: Table, before: date) -> List[date]:
+        """Get the dates before the given date with sessions updated since the last metrics calculation.
+
+        The latest update of the metrics records is the watermark of the last calculation.
+
+        Args:
+            table (Table): The metrics table.
+            before (date): The first date metrics will be calculated for anyway.
+
+        Returns:
+            List[date]: The dates whose metrics need to be recalculated.
+        """
+        sessions_table = self._get_table(table_type="sessions")
+        if sessions_table is None:
+            return []
+
+        with self.Session() as sess:
+            watermark = sess.execute(select(func.max(table.c.updated_at))).scalar()
+            if watermark is None:
+                return []
+
+            stmt = get_updated_days_statement(
+                sessions_table, updated_since=watermark, created_before=get_epoch_day(before) * SECONDS_PER_DAY
+            )
+            return get_dates_from_epoch_days(row[0] for row in sess.execute(stmt).fetchall())
+
     def calculate_metrics(self) -> Optional[list[dict]]:
-        """Calculate metrics for all dates without complete metrics.
+        """Calculate metrics for all dates without complete metrics, and for the dates with sessions updated since the
+        last calculation.
+
+        The sessions are aggregated in the database, so their runs are not loaded.
 
         Returns:
             Optional[list[dict]]: The calculated metrics.
@@ -1518,6 +1771,9 @@ class PostgresDb(BaseDb):
             if table is None:
                 return None
 
+            # Sessions updated from now on will be picked up by the next calculation
+            calculated_at = int(time.time())
+
             starting_date = self._get_metrics_calculation_starting_date(table)
 
             if starting_date is None:
@@ -1525,48 +1781,36 @@ class PostgresDb(BaseDb):
                 return None
 
             dates_to_process = get_dates_to_calculate_metrics_for(starting_date)
+            # Incremental rollup: past dates are only recalculated if their sessions were updated
+            dates_to_process = self._get_days_with_updated_sessions(table, starting_date) + dates_to_process
             if not dates_to_process:
                 log_info("Metrics already calculated for all relevant dates.")
                 return None
 
-            start_timestamp = int(
-                datetime.combine(dates_to_process[0], datetime.min.time()).replace(tzinfo=timezone.utc).timestamp()
-            )
-            end_timestamp = int(
-                datetime.combine(dates_to_process[-1] + timedelta(days=1), datetime.min.time())
-                .replace(tzinfo=timezone.utc)
-                .timestamp()
-            )
+            sessions_table = self._get_table(table_type="sessions")
+            if sessions_table is None:
+                return None
 
-            sessions = self._get_all_sessions_for_metrics_calculation(
-                start_timestamp=start_timestamp, end_timestamp=end_timestamp
-            )
+            statements = get_metrics_aggregation_statements(sessions_table, self._get_runs_table(), dates_to_process)
+            with self.Session() as sess:
+                rows = {
+                    key: [row for stmt in key_statements for row in sess.execute(stmt).fetchall()]
+                    for key, key_statements in statements.items()
+                }
 
-            all_sessions_data = fetch_all_sessions_data(
-                sessions=sessions, dates_to_process=dates_to_process, start_timestamp=start_timestamp
+            metrics_records = build_daily_metrics_records(
+                dates_to_process,
+                session_rows=rows["sessions"],
+                user_rows=rows["users"],
+                run_rows=rows["runs"],
+                calculated_at=calculated_at,
             )
-            if not all_sessions_data:
+            if not metrics_records:
                 log_info("No new session data found. Won't calculate metrics.")
                 return None
 
-            results = []
-            metrics_records = []
-
-            for date_to_process in dates_to_process:
-                date_key = date_to_process.isoformat()
-                sessions_for_date = all_sessions_data.get(date_key, {})
-
-                # Skip dates with no sessions
-                if not any(len(sessions) > 0 for sessions in sessions_for_date.values()):
-                    continue
-
-                metrics_record = calculate_date_metrics(date_to_process, sessions_for_date)
-
-                metrics_records.append(metrics_record)
-
-            if metrics_records:
-                with self.Session() as sess, sess.begin():
-                    results = bulk_upsert_metrics(session=sess, table=table, metrics_records=metrics_records)
+            with self.Session() as sess, sess.begin():
+                results = bulk_upsert_metrics(session=sess, table=table, metrics_records=metrics_records)
 
             log_debug("Updated metrics calculations")
 
@@ -1752,6 +1996,8 @@ class PostgresDb(BaseDb):
                     "created_at": "created_at",
                     "updated_at": "updated_at",
                     "external_id": "external_id",
+                    "content_digest": "content_digest",
+                    "chunk_digests": "chunk_digests",
                 }
 
                 # Build insert and update data only for fields that exist in the table
@@ -32,6 +32,16 @@ SESSION_TABLE_SCHEMA = {
     ],
 }
 
+SESSION_RUNS_TABLE_SCHEMA = {
+    "session_id": {"type": String, "primary_key": True, "nullable": False},
+    "run_id": {"type": String, "primary_key": True, "nullable": False},
+    "position": {"type": BigInteger, "nullable": False},
+    "run_digest": {"type": String, "nullable": False},
+    "run_data": {"type": JSONB, "nullable": False},
+    "created_at": {"type": BigInteger, "nullable": False, "index": True},
+    "updated_at": {"type": BigInteger, "nullable": True},
+}
+
 MEMORY_TABLE_SCHEMA = {
     "memory_id": {"type": String, "primary_key": True, "nullable": False},
     "memory": {"type": JSONB, "nullable": False},
@@ -75,6 +85,8 @@ KNOWLEDGE_TABLE_SCHEMA = {
     "created_at": {"type": BigInteger, "nullable": True},
     "updated_at": {"type": BigInteger, "nullable": True},
     "external_id": {"type": String, "nullable": True},
+    "content_digest": {"type": String, "nullable": True},
+    "chunk_digests": {"type": JSONB, "nullable": True},
 }
 
 METRICS_TABLE_SCHEMA = {
@@ -134,6 +146,7 @@ def get_table_schema_definition(table_type: str) -> dict[str, Any]:
     """
     schemas = {
         "sessions": SESSION_TABLE_SCHEMA,
+        "runs": SESSION_RUNS_TABLE_SCHEMA,
         "evals": EVAL_TABLE_SCHEMA,
         "metrics": METRICS_TABLE_SCHEMA,
         "memories": MEMORY_TABLE_SCHEMA,
@@ -10,13 +10,16 @@ from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 from agno.db.postgres.schemas import get_table_schema_definition
 from agno.db.schemas.culture import CulturalKnowledge
+from agno.db.utils import METRICS_TOKEN_FIELDS, SECONDS_PER_DAY, get_day_ranges
 from agno.utils.log import log_debug, log_error, log_warning
 
 try:
-    from sqlalchemy import Table
+    from sqlalchemy import BigInteger, Table, and_, case, column, func, literal, literal_column, or_, select
     from sqlalchemy.dialects import postgresql
+    from sqlalchemy.dialects.postgresql import JSONB
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import Session
+    from sqlalchemy.sql import Select
     from sqlalchemy.sql.expression import text
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
@@ -385,6 +388,94 @@ def get_dates_to_calculate_metrics_for(starting_date: date) -> list[date]:
     return [starting_date + timedelta(days=x) for x in range(days_diff)]
 
 
+def _get_day(table: Table):
+    # Days since the Unix epoch, in UTC, with integer division. The divisor is inlined so the expression can be grouped by.
+    return table.c.created_at.op("/")(literal_column(str(SECONDS_PER_DAY))).label("day")
+
+
+def _in_days(table: Table, dates: List[date]):
+    return or_(*[and_(table.c.created_at >= start, table.c.created_at < end) for start, end in get_day_ranges(dates)])
+
+
+def get_metrics_aggregation_statements(
+    table: Table, runs_table: Optional[Table], dates: List[date]
+) -> Dict[str, List[Select]]:
+    """Return the statements aggregating the sessions created on the given dates, for build_daily_metrics_records.
+
+    Counts and token sums are computed with JSONB functions in the database, so session runs are never loaded.
+
+    Args:
+        table (Table): The sessions table.
+        runs_table (Optional[Table]): The runs table, if runs are stored separately from their sessions.
+        dates (List[date]): The dates to aggregate the sessions of.
+
+    Returns:
+        Dict[str, List[Select]]: The statements returning the session, user and run rows.
+    """
+    in_days = _in_days(table, dates)
+
+    token_values = [
+        func.coalesce(table.c.session_data[("session_metrics", field)].astext.cast(BigInteger), 0).label(field)
+        for field in METRICS_TOKEN_FIELDS
+    ]
+    sessions = select(_get_day(table), table.c.session_type, *token_values).where(in_days).subquery()
+    session_rows = select(
+        sessions.c.day,
+        sessions.c.session_type,
+        func.count(),
+        *[func.sum(sessions.c[field]) for field in METRICS_TOKEN_FIELDS],
+    ).group_by(sessions.c.day, sessions.c.session_type)
+
+    users = (
+        select(_get_day(table), table.c.user_id)
+        .where(in_days, table.c.user_id.is_not(None), table.c.user_id != "")
+        .subquery()
+    )
+    user_rows = select(users.c.day, func.count(users.c.user_id.distinct())).group_by(users.c.day)
+
+    # Runs are grouped by model, so the runs of a session are read once for both the runs and the models counts
+    runs = case(
+        (func.jsonb_typeof(table.c.runs) == literal_column("'array'"), table.c.runs),
+        else_=literal_column("'[]'::jsonb"),
+    )
+    run = func.jsonb_array_elements(runs).table_valued(column("value", JSONB), joins_implicitly=True).alias("run")
+    run_subqueries = [
+        select(
+            _get_day(table),
+            table.c.session_type,
+            run.c.value["model"].astext.label("model_id"),
+            func.coalesce(run.c.value["model_provider"].astext, literal("")).label("model_provider"),
+        )
+        .select_from(table, run)
+        .where(in_days)
+        .subquery()
+    ]
+    if runs_table is not None:
+        run_subqueries.append(
+            select(
+                _get_day(table),
+                table.c.session_type,
+                runs_table.c.run_data["model"].astext.label("model_id"),
+                func.coalesce(runs_table.c.run_data["model_provider"].astext, literal("")).label("model_provider"),
+            )
+            .select_from(runs_table.join(table, runs_table.c.session_id == table.c.session_id))
+            .where(in_days)
+            .subquery()
+        )
+    run_rows = [select(*subquery.c, func.count()).group_by(*subquery.c) for subquery in run_subqueries]
+
+    return {"sessions": [session_rows], "users": [user_rows], "runs": run_rows}
+
+
+def get_updated_days_statement(table: Table, updated_since: int, created_before: int) -> Select:
+    """Return the statement selecting the days of the sessions created before a time and updated since another.
+
+    Used to recalculate the metrics of past days whose sessions got new runs since the last calculation.
+    """
+    day = _get_day(table)
+    return select(day).where(table.c.updated_at >= updated_since, table.c.created_at < created_before).group_by(day)
+
+
 # -- Cultural Knowledge util methods --
 def serialize_cultural_knowledge(cultural_knowledge: CulturalKnowledge) -> Dict[str, Any]:
     """Serialize a CulturalKnowledge object for database storage.
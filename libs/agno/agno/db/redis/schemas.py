@@ -81,6 +81,8 @@ KNOWLEDGE_SCHEMA = {
     "status": {"type": "string"},
     "status_message": {"type": "string"},
     "external_id": {"type": "string"},
+    "content_digest": {"type": "string"},
+    "chunk_digests": {"type": "json"},
 }
 
 
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, model_validator
 
@@ -21,6 +21,9 @@ class KnowledgeRow(BaseModel):
     created_at: Optional[int] = None
     updated_at: Optional[int] = None
     external_id: Optional[str] = None
+    # Fingerprints used by incremental loads: digest of the source bytes and of each indexed chunk
+    content_digest: Optional[str] = None
+    chunk_digests: Optional[List[str]] = None
 
     model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True)
 
@@ -33,7 +36,7 @@ class KnowledgeRow(BaseModel):
         return self
 
     def to_dict(self) -> Dict[str, Any]:
-        _dict = self.model_dump(exclude={"updated_at"})
+        _dict = self.model_dump(exclude={"updated_at", "chunk_digests"})
 
         _dict["updated_at"] = datetime.fromtimestamp(self.updated_at).isoformat() if self.updated_at else None
 
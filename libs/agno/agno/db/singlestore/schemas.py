@@ -74,6 +74,8 @@ KNOWLEDGE_TABLE_SCHEMA = {
     "created_at": {"type": BigInteger, "nullable": True},
     "updated_at": {"type": BigInteger, "nullable": True},
     "external_id": {"type": lambda: String(128), "nullable": True},
+    "content_digest": {"type": lambda: String(64), "nullable": True},
+    "chunk_digests": {"type": JSON, "nullable": True},
 }
 
 METRICS_TABLE_SCHEMA = {
@@ -1847,6 +1847,8 @@ class SingleStoreDb(BaseDb):
                 return None
 
             with self.Session() as sess, sess.begin():
+                # Only write the columns present in the table, so tables created by older versions keep working
+                table_columns = set(table.columns.keys())
                 # Only include fields that are not None in the update
                 update_fields = {
                     k: v
@@ -1863,11 +1865,15 @@ class SingleStoreDb(BaseDb):
                         "created_at": knowledge_row.created_at,
                         "updated_at": knowledge_row.updated_at,
                         "external_id": knowledge_row.external_id,
+                        "content_digest": knowledge_row.content_digest,
+                        "chunk_digests": knowledge_row.chunk_digests,
                     }.items()
-                    if v is not None
+                    if v is not None and k in table_columns
                 }
 
-                stmt = mysql.insert(table).values(knowledge_row.model_dump())
+                stmt = mysql.insert(table).values(
+                    {k: v for k, v in knowledge_row.model_dump().items() if k in table_columns}
+                )
                 stmt = stmt.on_duplicate_key_update(**update_fields)
                 sess.execute(stmt)
 
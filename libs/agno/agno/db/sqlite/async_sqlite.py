@@ -16,13 +16,20 @@ from agno.db.sqlite.utils import (
     ais_table_available,
     ais_valid_table,
     apply_sorting,
-    calculate_date_metrics,
     deserialize_cultural_knowledge_from_db,
-    fetch_all_sessions_data,
     get_dates_to_calculate_metrics_for,
+    get_metrics_aggregation_statements,
+    get_updated_days_statement,
     serialize_cultural_knowledge_for_db,
 )
-from agno.db.utils import deserialize_session_json_fields, serialize_session_json_fields
+from agno.db.utils import (
+    SECONDS_PER_DAY,
+    build_daily_metrics_records,
+    deserialize_session_json_fields,
+    get_dates_from_epoch_days,
+    get_epoch_day,
+    serialize_session_json_fields,
+)
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.string import generate_id
@@ -159,7 +166,7 @@ class AsyncSqliteDb(AsyncBaseDb):
             Table: SQLAlchemy Table object
         """
         try:
-            table_schema = get_table_schema_definition(table_type)
+            table_schema = get_table_schema_definition(table_type).copy()
             log_debug(f"Creating table {table_name}")
 
             columns: List[Column] = []
@@ -1559,8 +1566,37 @@ class AsyncSqliteDb(AsyncBaseDb):
 
         return datetime.fromtimestamp(first_session_date, tz=timezone.utc).date()
 
+    async def _get_days_with_updated_sessions(self, table: Table, before: date) -> List[date]:
+        """Get the dates before the given date with sessions updated since the last metrics calculation.
+
+        The latest update of the metrics records is the watermark of the last calculation.
+
+        Args:
+            table (Table): The metrics table.
+            before (date): The first date metrics will be calculated for anyway.
+
+        Returns:
+            List[date]: The dates whose metrics need to be recalculated.
+        """
+        sessions_table = await self._get_table(table_type="sessions")
+        if sessions_table is None:
+            return []
+
+        async with self.async_session_factory() as sess:
+            watermark = (await sess.execute(select(func.max(table.c.updated_at)))).scalar()
+            if watermark is None:
+                return []
+
+            stmt = get_updated_days_statement(
+                sessions_table, updated_since=watermark, created_before=get_epoch_day(before) * SECONDS_PER_DAY
+            )
+            return get_dates_from_epoch_days(row[0] for row in (await sess.execute(stmt)).fetchall())
+
     async def calculate_metrics(self) -> Optional[list[dict]]:
-        """Calculate metrics for all dates without complete metrics.
+        """Calculate metrics for all dates without complete metrics, and for the dates with sessions updated since the
+        last calculation.
+
+        The sessions are aggregated in the database, so their runs are not loaded.
 
         Returns:
             Optional[list[dict]]: The calculated metrics.
@@ -1573,54 +1609,45 @@ class AsyncSqliteDb(AsyncBaseDb):
             if table is None:
                 return None
 
+            # Sessions updated from now on will be picked up by the next calculation
+            calculated_at = int(time.time())
+
             starting_date = await self._get_metrics_calculation_starting_date(table)
+
             if starting_date is None:
                 log_info("No session data found. Won't calculate metrics.")
                 return None
 
             dates_to_process = get_dates_to_calculate_metrics_for(starting_date)
+            # Incremental rollup: past dates are only recalculated if their sessions were updated
+            dates_to_process = await self._get_days_with_updated_sessions(table, starting_date) + dates_to_process
             if not dates_to_process:
                 log_info("Metrics already calculated for all relevant dates.")
                 return None
 
-            start_timestamp = int(
-                datetime.combine(dates_to_process[0], datetime.min.time()).replace(tzinfo=timezone.utc).timestamp()
-            )
-            end_timestamp = int(
-                datetime.combine(dates_to_process[-1] + timedelta(days=1), datetime.min.time())
-                .replace(tzinfo=timezone.utc)
-                .timestamp()
-            )
+            sessions_table = await self._get_table(table_type="sessions")
+            if sessions_table is None:
+                return None
 
-            sessions = await self._get_all_sessions_for_metrics_calculation(
-                start_timestamp=start_timestamp, end_timestamp=end_timestamp
-            )
-            all_sessions_data = fetch_all_sessions_data(
-                sessions=sessions,
-                dates_to_process=dates_to_process,
-                start_timestamp=start_timestamp,
+            statements = get_metrics_aggregation_statements(sessions_table, None, dates_to_process)
+            async with self.async_session_factory() as sess:
+                rows: Dict[str, List[Any]] = {}
+                for key, key_statements in statements.items():
+                    rows[key] = [row for stmt in key_statements for row in (await sess.execute(stmt)).fetchall()]
+
+            metrics_records = build_daily_metrics_records(
+                dates_to_process,
+                session_rows=rows["sessions"],
+                user_rows=rows["users"],
+                run_rows=rows["runs"],
+                calculated_at=calculated_at,
             )
-            if not all_sessions_data:
+            if not metrics_records:
                 log_info("No new session data found. Won't calculate metrics.")
                 return None
 
-            results = []
-            metrics_records = []
-
-            for date_to_process in dates_to_process:
-                date_key = date_to_process.isoformat()
-                sessions_for_date = all_sessions_data.get(date_key, {})
-
-                # Skip dates with no sessions
-                if not any(len(sessions) > 0 for sessions in sessions_for_date.values()):
-                    continue
-
-                metrics_record = calculate_date_metrics(date_to_process, sessions_for_date)
-                metrics_records.append(metrics_record)
-
-            if metrics_records:
-                async with self.async_session_factory() as sess, sess.begin():
-                    results = await abulk_upsert_metrics(session=sess, table=table, metrics_records=metrics_records)
+            async with self.async_session_factory() as sess, sess.begin():
+                results = await abulk_upsert_metrics(session=sess, table=table, metrics_records=metrics_records)
 
             log_debug("Updated metrics calculations")
 
@@ -1790,6 +1817,8 @@ class AsyncSqliteDb(AsyncBaseDb):
                 return None
 
             async with self.async_session_factory() as sess, sess.begin():
+                # Only write the columns present in the table, so tables created by older versions keep working
+                table_columns = set(table.columns.keys())
                 update_fields = {
                     k: v
                     for k, v in {
@@ -1805,14 +1834,16 @@ class AsyncSqliteDb(AsyncBaseDb):
                         "created_at": knowledge_row.created_at,
                         "updated_at": knowledge_row.updated_at,
                         "external_id": knowledge_row.external_id,
+                        "content_digest": knowledge_row.content_digest,
+                        "chunk_digests": knowledge_row.chunk_digests,
                     }.items()
                     # Filtering out None fields if updating
-                    if v is not None
+                    if v is not None and k in table_columns
                 }
 
                 stmt = (
                     sqlite.insert(table)
-                    .values(knowledge_row.model_dump())
+                    .values({k: v for k, v in knowledge_row.model_dump().items() if k in table_columns})
                     .on_conflict_do_update(index_elements=["id"], set_=update_fields)
                 )
                 await sess.execute(stmt)
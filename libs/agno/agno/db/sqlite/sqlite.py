@@ -1,3 +1,5 @@
+import json
+import threading
 import time
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
@@ -14,15 +16,25 @@ from agno.db.sqlite.schemas import get_table_schema_definition
 from agno.db.sqlite.utils import (
     apply_sorting,
     bulk_upsert_metrics,
-    calculate_date_metrics,
     deserialize_cultural_knowledge_from_db,
-    fetch_all_sessions_data,
     get_dates_to_calculate_metrics_for,
+    get_metrics_aggregation_statements,
+    get_updated_days_statement,
     is_table_available,
     is_valid_table,
     serialize_cultural_knowledge_for_db,
 )
-from agno.db.utils import deserialize_session_json_fields, serialize_session_json_fields
+from agno.db.utils import (
+    SECONDS_PER_DAY,
+    CustomJSONEncoder,
+    attach_session_runs,
+    build_daily_metrics_records,
+    deserialize_session_json_fields,
+    get_dates_from_epoch_days,
+    get_epoch_day,
+    get_session_run_rows,
+    serialize_session_json_fields,
+)
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.string import generate_id
@@ -50,6 +62,9 @@ class SqliteDb(BaseDb):
         eval_table: Optional[str] = None,
         knowledge_table: Optional[str] = None,
         versions_table: Optional[str] = None,
+        runs_table: Optional[str] = None,
+        store_runs_separately: bool = False,
+        session_runs_limit: Optional[int] = None,
         id: Optional[str] = None,
     ):
         """
@@ -72,6 +87,12 @@ class SqliteDb(BaseDb):
             eval_table (Optional[str]): Name of the table to store evaluation runs data.
             knowledge_table (Optional[str]): Name of the table to store knowledge documents data.
             versions_table (Optional[str]): Name of the table to store schema versions.
+            runs_table (Optional[str]): Name of the table to store session runs, when store_runs_separately is enabled.
+            store_runs_separately (bool): Store each run of a session as its own row in the runs table, instead of
+                storing all runs in the sessions table. Upserting a session then only writes its new and changed runs.
+            session_runs_limit (Optional[int]): Only load the latest runs of a session when reading it. Defaults to all runs.
+                Only applies to runs stored in the runs table: runs stored in the sessions table are always loaded whole,
+                as upserting the session writes them back.
             id (Optional[str]): ID of the database.
 
         Raises:
@@ -112,6 +133,12 @@ class SqliteDb(BaseDb):
         self.db_url: Optional[str] = db_url
         self.db_file: Optional[str] = db_file
         self.metadata: MetaData = MetaData()
+        # Tables are added to the metadata before they are reflected: threads must not see them half-loaded
+        self._tables_lock = threading.RLock()
+
+        self.runs_table_name: str = runs_table or "agno_session_runs"
+        self.store_runs_separately: bool = store_runs_separately
+        self.session_runs_limit: Optional[int] = session_runs_limit
 
         # Initialize database session
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine))
@@ -139,6 +166,8 @@ class SqliteDb(BaseDb):
             (self.knowledge_table_name, "knowledge"),
             (self.versions_table_name, "versions"),
         ]
+        if self.store_runs_separately:
+            tables_to_create.append((self.runs_table_name, "runs"))
 
         for table_name, table_type in tables_to_create:
             if table_name != self.versions_table_name:
@@ -160,7 +189,7 @@ class SqliteDb(BaseDb):
             Table: SQLAlchemy Table object
         """
         try:
-            table_schema = get_table_schema_definition(table_type)
+            table_schema = get_table_schema_definition(table_type).copy()
             log_debug(f"Creating table {table_name}")
 
             columns: List[Column] = []
@@ -277,6 +306,14 @@ class SqliteDb(BaseDb):
             )
             return self.culture_table
 
+        elif table_type == "runs":
+            self.runs_table = self._get_or_create_table(
+                table_name=self.runs_table_name,
+                table_type="runs",
+                create_table_if_not_found=create_table_if_not_found,
+            )
+            return self.runs_table
+
         elif table_type == "versions":
             self.versions_table = self._get_or_create_table(
                 table_name=self.versions_table_name,
@@ -304,32 +341,38 @@ class SqliteDb(BaseDb):
         Returns:
             Table: SQLAlchemy Table object
         """
-        with self.Session() as sess, sess.begin():
-            table_is_available = is_table_available(session=sess, table_name=table_name)
+        with self._tables_lock:
+            with self.Session() as sess, sess.begin():
+                table_is_available = is_table_available(session=sess, table_name=table_name)
 
-        if not table_is_available:
-            if not create_table_if_not_found:
-                return None
+            if not table_is_available:
+                if not create_table_if_not_found:
+                    return None
 
-            if table_name != self.versions_table_name:
-                # Also store the schema version for the created table
-                latest_schema_version = MigrationManager(self).latest_schema_version
-                self.upsert_schema_version(table_name=table_name, version=latest_schema_version.public)
+                if table_name != self.versions_table_name:
+                    # Also store the schema version for the created table
+                    latest_schema_version = MigrationManager(self).latest_schema_version
+                    self.upsert_schema_version(table_name=table_name, version=latest_schema_version.public)
 
-            return self._create_table(table_name=table_name, table_type=table_type)
+                return self._create_table(table_name=table_name, table_type=table_type)
 
-        # SQLite version of table validation (no schema)
-        if not is_valid_table(db_engine=self.db_engine, table_name=table_name, table_type=table_type):
-            raise ValueError(f"Table {table_name} has an invalid schema")
+            # Tables are reflected once, then reused
+            table = self.metadata.tables.get(table_name)
+            if table is not None:
+                return table
 
-        try:
-            table = Table(table_name, self.metadata, autoload_with=self.db_engine)
-            log_debug(f"Loaded existing table {table_name}")
-            return table
+            # SQLite version of table validation (no schema)
+            if not is_valid_table(db_engine=self.db_engine, table_name=table_name, table_type=table_type):
+                raise ValueError(f"Table {table_name} has an invalid schema")
 
-        except Exception as e:
-            log_error(f"Error loading existing table {table_name}: {e}")
-            raise e
+            try:
+                table = Table(table_name, self.metadata, autoload_with=self.db_engine)
+                log_debug(f"Loaded existing table {table_name}")
+                return table
+
+            except Exception as e:
+                log_error(f"Error loading existing table {table_name}: {e}")
+                raise e
 
     def get_latest_schema_version(self, table_name: str):
         """Get the latest version of the database schema."""
@@ -368,6 +411,130 @@ class SqliteDb(BaseDb):
             sess.execute(stmt)
 
     # -- Session methods --
+    def _get_runs_table(self, create_table_if_not_found: Optional[bool] = False) -> Optional[Table]:
+        """Get the runs table, if runs are stored separately from their sessions."""
+        if not self.store_runs_separately:
+            return None
+        return self._get_table(table_type="runs", create_table_if_not_found=create_table_if_not_found)
+
+    def _pop_session_runs(
+        self, session_dict: Dict[str, Any], runs_by_session: Dict[str, Optional[List[Dict[str, Any]]]]
+    ) -> Dict[str, Any]:
+        """If runs are stored separately, move the runs out of the given session dictionary into runs_by_session."""
+        if self.store_runs_separately:
+            runs_by_session[session_dict["session_id"]] = session_dict.get("runs")
+            session_dict["runs"] = None
+        return session_dict
+
+    def _write_session_runs(
+        self, sess: Any, runs_table: Table, session_id: str, runs: Optional[List[Dict[str, Any]]]
+    ) -> None:
+        """Insert the new runs of a session into the runs table and update the runs that changed.
+
+        Stored runs missing from the given runs are kept, so sessions read with only their latest runs can be upserted.
+        """
+        if not runs:
+            return
+
+        stmt = select(runs_table.c.run_id, runs_table.c.run_digest, runs_table.c.position).where(
+            runs_table.c.session_id == session_id
+        )
+        stored_runs = {row.run_id: (row.run_digest, row.position) for row in sess.execute(stmt).fetchall()}
+        rows = get_session_run_rows(session_id=session_id, runs=runs, stored_runs=stored_runs)
+        if not rows:
+            return
+
+        for row in rows:
+            row["run_data"] = json.dumps(row["run_data"], cls=CustomJSONEncoder)
+        insert_stmt = sqlite.insert(runs_table)
+        insert_stmt = insert_stmt.on_conflict_do_update(
+            index_elements=["session_id", "run_id"],
+            set_=dict(
+                run_digest=insert_stmt.excluded.run_digest,
+                run_data=insert_stmt.excluded.run_data,
+                updated_at=insert_stmt.excluded.updated_at,
+            ),
+        )
+        sess.execute(insert_stmt, rows)
+        log_debug(f"Stored {len(rows)} new or updated runs for session {session_id}")
+
+    def _load_session_runs(
+        self, sess: Any, runs_table: Optional[Table], sessions: List[Dict[str, Any]], num_runs: Optional[int]
+    ) -> None:
+        """Set the runs stored in the runs table on the given session dictionaries, only the latest num_runs if given.
+
+        Runs still stored in the sessions table are kept whole, so upserting the session doesn't drop any of them.
+        """
+        if runs_table is None or not sessions or num_runs == 0:
+            attach_session_runs(sessions=sessions, run_rows=[])
+            return
+
+        session_ids = [session["session_id"] for session in sessions]
+        if num_runs is None:
+            stmt = (
+                select(runs_table.c.session_id, runs_table.c.run_data)
+                .where(runs_table.c.session_id.in_(session_ids))
+                .order_by(runs_table.c.session_id, runs_table.c.position)
+            )
+        else:
+            latest = (
+                func.row_number()
+                .over(partition_by=runs_table.c.session_id, order_by=runs_table.c.position.desc())
+                .label("latest")
+            )
+            runs = (
+                select(runs_table.c.session_id, runs_table.c.run_data, runs_table.c.position, latest)
+                .where(runs_table.c.session_id.in_(session_ids))
+                .subquery()
+            )
+            stmt = (
+                select(runs.c.session_id, runs.c.run_data)
+                .where(runs.c.latest <= num_runs)
+                .order_by(runs.c.session_id, runs.c.position)
+            )
+
+        attach_session_runs(sessions=sessions, run_rows=sess.execute(stmt).fetchall())
+
+    def get_session_runs(self, session_id: str, num_runs: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get the runs of a session, oldest first.
+
+        Together with get_session(..., num_runs=0), this allows loading the runs of a session lazily.
+
+        Args:
+            session_id (str): ID of the session to get the runs for.
+            num_runs (Optional[int]): Only get the latest num_runs runs. Defaults to all runs.
+
+        Returns:
+            List[Dict[str, Any]]: The serialized runs of the session.
+
+        Raises:
+            Exception: If an error occurs during retrieval.
+        """
+        try:
+            table = self._get_table(table_type="sessions")
+            if table is None:
+                return []
+            runs_table = self._get_runs_table()
+
+            with self.Session() as sess:
+                row = sess.execute(
+                    select(table.c.session_id, table.c.runs).where(table.c.session_id == session_id)
+                ).fetchone()
+                if row is None:
+                    return []
+
+                session = deserialize_session_json_fields(dict(row._mapping))
+                self._load_session_runs(sess, runs_table, [session], num_runs)
+                runs = session["runs"] or []
+                # Runs read from the sessions table are not limited by the query
+                if num_runs is not None:
+                    runs = runs[-num_runs:] if num_runs > 0 else []
+                return runs
+
+        except Exception as e:
+            log_error(f"Exception reading session runs: {e}")
+            raise e
 
     def delete_session(self, session_id: str) -> bool:
         """
@@ -384,9 +551,13 @@ class SqliteDb(BaseDb):
             if table is None:
                 return False
 
+            runs_table = self._get_runs_table()
+
             with self.Session() as sess, sess.begin():
                 delete_stmt = table.delete().where(table.c.session_id == session_id)
                 result = sess.execute(delete_stmt)
+                if runs_table is not None:
+                    sess.execute(runs_table.delete().where(runs_table.c.session_id == session_id))
                 if result.rowcount == 0:
                     log_debug(f"No session found to deletewith session_id: {session_id}")
                     return False
@@ -413,9 +584,13 @@ class SqliteDb(BaseDb):
             if table is None:
                 return
 
+            runs_table = self._get_runs_table()
+
             with self.Session() as sess, sess.begin():
                 delete_stmt = table.delete().where(table.c.session_id.in_(session_ids))
                 result = sess.execute(delete_stmt)
+                if runs_table is not None:
+                    sess.execute(runs_table.delete().where(runs_table.c.session_id.in_(session_ids)))
 
             log_debug(f"Successfully deleted {result.rowcount} sessions")
 
@@ -429,6 +604,7 @@ class SqliteDb(BaseDb):
         session_type: SessionType,
         user_id: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        num_runs: Optional[int] = None,
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         """
         Read a session from the database.
@@ -438,6 +614,8 @@ class SqliteDb(BaseDb):
             session_type (SessionType): Type of session to get.
             user_id (Optional[str]): User ID to filter by. Defaults to None.
             deserialize (Optional[bool]): Whether to serialize the session. Defaults to True.
+            num_runs (Optional[int]): Only load the latest num_runs runs of the session, or no runs if 0.
+                Defaults to session_runs_limit. Only applies to runs stored in the runs table.
 
         Returns:
             Optional[Union[Session, Dict[str, Any]]]:
@@ -451,6 +629,8 @@ class SqliteDb(BaseDb):
             table = self._get_table(table_type="sessions")
             if table is None:
                 return None
+            runs_table = self._get_runs_table()
+            num_runs = num_runs if num_runs is not None else self.session_runs_limit
 
             with self.Session() as sess, sess.begin():
                 stmt = select(table).where(table.c.session_id == session_id)
@@ -464,6 +644,8 @@ class SqliteDb(BaseDb):
                     return None
 
                 session_raw = deserialize_session_json_fields(dict(result._mapping))
+                if runs_table is not None:
+                    self._load_session_runs(sess, runs_table, [session_raw], num_runs)
                 if not session_raw or not deserialize:
                     return session_raw
 
@@ -480,6 +662,22 @@ class SqliteDb(BaseDb):
             log_debug(f"Exception reading from sessions table: {e}")
             raise e
 
+    def get_session_updated_at(self, session_id: str, session_type: SessionType) -> Optional[int]:
+        """Get the updated_at of a stored session, or None if it doesn't exist. Only reads that column."""
+        try:
+            table = self._get_table(table_type="sessions")
+            if table is None:
+                return None
+
+            with self.Session() as sess, sess.begin():
+                stmt = select(table.c.updated_at).where(table.c.session_id == session_id)
+                result = sess.execute(stmt).fetchone()
+                return (result[0] or 0) if result is not None else None
+
+        except Exception as e:
+            log_debug(f"Exception reading from sessions table: {e}")
+            raise e
+
     def get_sessions(
         self,
         session_type: Optional[SessionType] = None,
@@ -522,6 +720,7 @@ class SqliteDb(BaseDb):
             table = self._get_table(table_type="sessions")
             if table is None:
                 return [] if deserialize else ([], 0)
+            runs_table = self._get_runs_table()
 
             with self.Session() as sess, sess.begin():
                 stmt = select(table)
@@ -563,6 +762,8 @@ class SqliteDb(BaseDb):
                     return [] if deserialize else ([], 0)
 
                 sessions_raw = [deserialize_session_json_fields(dict(record._mapping)) for record in records]
+                if runs_table is not None:
+                    self._load_session_runs(sess, runs_table, sessions_raw, self.session_runs_limit)
                 if not deserialize:
                     return sessions_raw, total_count
                 if not sessions_raw:
@@ -647,8 +848,12 @@ class SqliteDb(BaseDb):
             table = self._get_table(table_type="sessions", create_table_if_not_found=True)
             if table is None:
                 return None
+            runs_table = self._get_runs_table(create_table_if_not_found=True)
 
-            serialized_session = serialize_session_json_fields(session.to_dict())
+            runs_by_session: Dict[str, Optional[List[Dict[str, Any]]]] = {}
+            serialized_session = serialize_session_json_fields(
+                self._pop_session_runs(session.to_dict(), runs_by_session)
+            )
 
             if isinstance(session, AgentSession):
                 with self.Session() as sess, sess.begin():
@@ -683,6 +888,9 @@ class SqliteDb(BaseDb):
                     row = result.fetchone()
 
                     session_raw = deserialize_session_json_fields(dict(row._mapping)) if row else None
+                    if session_raw is not None and runs_table is not None:
+                        session_raw["runs"] = runs_by_session.get(session.session_id)
+                        self._write_session_runs(sess, runs_table, session.session_id, session_raw["runs"])
                     if session_raw is None or not deserialize:
                         return session_raw
                     return AgentSession.from_dict(session_raw)
@@ -721,6 +929,9 @@ class SqliteDb(BaseDb):
                     row = result.fetchone()
 
                     session_raw = deserialize_session_json_fields(dict(row._mapping)) if row else None
+                    if session_raw is not None and runs_table is not None:
+                        session_raw["runs"] = runs_by_session.get(session.session_id)
+                        self._write_session_runs(sess, runs_table, session.session_id, session_raw["runs"])
                     if session_raw is None or not deserialize:
                         return session_raw
                     return TeamSession.from_dict(session_raw)
@@ -758,6 +969,9 @@ class SqliteDb(BaseDb):
                     row = result.fetchone()
 
                     session_raw = deserialize_session_json_fields(dict(row._mapping)) if row else None
+                    if session_raw is not None and runs_table is not None:
+                        session_raw["runs"] = runs_by_session.get(session.session_id)
+                        self._write_session_runs(sess, runs_table, session.session_id, session_raw["runs"])
                     if session_raw is None or not deserialize:
                         return session_raw
                     return WorkflowSession.from_dict(session_raw)
@@ -801,6 +1015,9 @@ class SqliteDb(BaseDb):
                     if result is not None
                 ]
 
+            runs_table = self._get_runs_table(create_table_if_not_found=True)
+            runs_by_session: Dict[str, Optional[List[Dict[str, Any]]]] = {}
+
             # Group sessions by type for batch processing
             agent_sessions = []
             team_sessions = []
@@ -821,7 +1038,9 @@ class SqliteDb(BaseDb):
                 if agent_sessions:
                     agent_data = []
                     for session in agent_sessions:
-                        serialized_session = serialize_session_json_fields(session.to_dict())
+                        serialized_session = serialize_session_json_fields(
+                            self._pop_session_runs(session.to_dict(), runs_by_session)
+                        )
                         # Use preserved updated_at if flag is set and value exists, otherwise use current time
                         updated_at = serialized_session.get("updated_at") if preserve_updated_at else int(time.time())
                         agent_data.append(
@@ -864,6 +1083,8 @@ class SqliteDb(BaseDb):
 
                         for row in result:
                             session_dict = deserialize_session_json_fields(dict(row._mapping))
+                            if runs_table is not None:
+                                session_dict["runs"] = runs_by_session.get(session_dict["session_id"])
                             if deserialize:
                                 deserialized_agent_session = AgentSession.from_dict(session_dict)
                                 if deserialized_agent_session is None:
@@ -876,7 +1097,9 @@ class SqliteDb(BaseDb):
                 if team_sessions:
                     team_data = []
                     for session in team_sessions:
-                        serialized_session = serialize_session_json_fields(session.to_dict())
+                        serialized_session = serialize_session_json_fields(
+                            self._pop_session_runs(session.to_dict(), runs_by_session)
+                        )
                         # Use preserved updated_at if flag is set and value exists, otherwise use current time
                         updated_at = serialized_session.get("updated_at") if preserve_updated_at else int(time.time())
                         team_data.append(
@@ -919,6 +1142,8 @@ class SqliteDb(BaseDb):
 
                         for row in result:
                             session_dict = deserialize_session_json_fields(dict(row._mapping))
+                            if runs_table is not None:
+                                session_dict["runs"] = runs_by_session.get(session_dict["session_id"])
                             if deserialize:
                                 deserialized_team_session = TeamSession.from_dict(session_dict)
                                 if deserialized_team_session is None:
@@ -931,7 +1156,9 @@ class SqliteDb(BaseDb):
                 if workflow_sessions:
                     workflow_data = []
                     for session in workflow_sessions:
-                        serialized_session = serialize_session_json_fields(session.to_dict())
+                        serialized_session = serialize_session_json_fields(
+                            self._pop_session_runs(session.to_dict(), runs_by_session)
+                        )
                         # Use preserved updated_at if flag is set and value exists, otherwise use current time
                         updated_at = serialized_session.get("updated_at") if preserve_updated_at else int(time.time())
                         workflow_data.append(
@@ -974,6 +1201,8 @@ class SqliteDb(BaseDb):
 
                         for row in result:
                             session_dict = deserialize_session_json_fields(dict(row._mapping))
+                            if runs_table is not None:
+                                session_dict["runs"] = runs_by_session.get(session_dict["session_id"])
                             if deserialize:
                                 deserialized_workflow_session = WorkflowSession.from_dict(session_dict)
                                 if deserialized_workflow_session is None:
@@ -982,6 +1211,10 @@ class SqliteDb(BaseDb):
                             else:
                                 results.append(session_dict)
 
+                if runs_table is not None:
+                    for session_id, runs in runs_by_session.items():
+                        self._write_session_runs(sess, runs_table, session_id, runs)
+
             return results
 
         except Exception as e:
@@ -1497,7 +1730,10 @@ class SqliteDb(BaseDb):
             if table is None:
                 return []
 
+            runs_table = self._get_runs_table()
+
             stmt = select(
+                table.c.session_id,
                 table.c.user_id,
                 table.c.session_data,
                 table.c.runs,
@@ -1512,7 +1748,12 @@ class SqliteDb(BaseDb):
 
             with self.Session() as sess:
                 result = sess.execute(stmt).fetchall()
-                return [record._mapping for record in result]
+                if runs_table is None:
+                    return [record._mapping for record in result]
+
+                sessions = [dict(record._mapping) for record in result]
+                self._load_session_runs(sess, runs_table, sessions, None)
+                return sessions
 
         except Exception as e:
             log_error(f"Error reading from sessions table: {e}")
@@ -1552,8 +1793,37 @@ class SqliteDb(BaseDb):
 
         return datetime.fromtimestamp(first_session_date, tz=timezone.utc).date()
 
+    def _get_days_with_updated_sessions(self, table: Table, before: date) -> List[date]:
+        """Get the dates before the given date with sessions updated since the last metrics calculation.
+
+        The latest update of the metrics records is the watermark of the last calculation.
+
+        Args:
+            table (Table): The metrics table.
+            before (date): The first date metrics will be calculated for anyway.
+
+        Returns:
+            List[date]: The dates whose metrics need to be recalculated.
+        """
+        sessions_table = self._get_table(table_type="sessions")
+        if sessions_table is None:
+            return []
+
+        with self.Session() as sess:
+            watermark = sess.execute(select(func.max(table.c.updated_at))).scalar()
+            if watermark is None:
+                return []
+
+            stmt = get_updated_days_statement(
+                sessions_table, updated_since=watermark, created_before=get_epoch_day(before) * SECONDS_PER_DAY
+            )
+            return get_dates_from_epoch_days(row[0] for row in sess.execute(stmt).fetchall())
+
     def calculate_metrics(self) -> Optional[list[dict]]:
-        """Calculate metrics for all dates without complete metrics.
+        """Calculate metrics for all dates without complete metrics, and for the dates with sessions updated since the
+        last calculation.
+
+        The sessions are aggregated in the database, so their runs are not loaded.
 
         Returns:
             Optional[list[dict]]: The calculated metrics.
@@ -1566,54 +1836,46 @@ class SqliteDb(BaseDb):
             if table is None:
                 return None
 
+            # Sessions updated from now on will be picked up by the next calculation
+            calculated_at = int(time.time())
+
             starting_date = self._get_metrics_calculation_starting_date(table)
+
             if starting_date is None:
                 log_info("No session data found. Won't calculate metrics.")
                 return None
 
             dates_to_process = get_dates_to_calculate_metrics_for(starting_date)
+            # Incremental rollup: past dates are only recalculated if their sessions were updated
+            dates_to_process = self._get_days_with_updated_sessions(table, starting_date) + dates_to_process
             if not dates_to_process:
                 log_info("Metrics already calculated for all relevant dates.")
                 return None
 
-            start_timestamp = int(
-                datetime.combine(dates_to_process[0], datetime.min.time()).replace(tzinfo=timezone.utc).timestamp()
-            )
-            end_timestamp = int(
-                datetime.combine(dates_to_process[-1] + timedelta(days=1), datetime.min.time())
-                .replace(tzinfo=timezone.utc)
-                .timestamp()
-            )
+            sessions_table = self._get_table(table_type="sessions")
+            if sessions_table is None:
+                return None
 
-            sessions = self._get_all_sessions_for_metrics_calculation(
-                start_timestamp=start_timestamp, end_timestamp=end_timestamp
-            )
-            all_sessions_data = fetch_all_sessions_data(
-                sessions=sessions,
-                dates_to_process=dates_to_process,
-                start_timestamp=start_timestamp,
+            statements = get_metrics_aggregation_statements(sessions_table, self._get_runs_table(), dates_to_process)
+            with self.Session() as sess:
+                rows = {
+                    key: [row for stmt in key_statements for row in sess.execute(stmt).fetchall()]
+                    for key, key_statements in statements.items()
+                }
+
+            metrics_records = build_daily_metrics_records(
+                dates_to_process,
+                session_rows=rows["sessions"],
+                user_rows=rows["users"],
+                run_rows=rows["runs"],
+                calculated_at=calculated_at,
             )
-            if not all_sessions_data:
+            if not metrics_records:
                 log_info("No new session data found. Won't calculate metrics.")
                 return None
 
-            results = []
-            metrics_records = []
-
-            for date_to_process in dates_to_process:
-                date_key = date_to_process.isoformat()
-                sessions_for_date = all_sessions_data.get(date_key, {})
-
-                # Skip dates with no sessions
-                if not any(len(sessions) > 0 for sessions in sessions_for_date.values()):
-                    continue
-
-                metrics_record = calculate_date_metrics(date_to_process, sessions_for_date)
-                metrics_records.append(metrics_record)
-
-            if metrics_records:
-                with self.Session() as sess, sess.begin():
-                    results = bulk_upsert_metrics(session=sess, table=table, metrics_records=metrics_records)
+            with self.Session() as sess, sess.begin():
+                results = bulk_upsert_metrics(session=sess, table=table, metrics_records=metrics_records)
 
             log_debug("Updated metrics calculations")
 
@@ -1783,6 +2045,8 @@ class SqliteDb(BaseDb):
                 return None
 
             with self.Session() as sess, sess.begin():
+                # Only write the columns present in the table, so tables created by older versions keep working
+                table_columns = set(table.columns.keys())
                 update_fields = {
                     k: v
                     for k, v in {
@@ -1798,14 +2062,16 @@ class SqliteDb(BaseDb):
                         "created_at": knowledge_row.created_at,
                         "updated_at": knowledge_row.updated_at,
                         "external_id": knowledge_row.external_id,
+                        "content_digest": knowledge_row.content_digest,
+                        "chunk_digests": knowledge_row.chunk_digests,
                     }.items()
                     # Filtering out None fields if updating
-                    if v is not None
+                    if v is not None and k in table_columns
                 }
 
                 stmt = (
                     sqlite.insert(table)
-                    .values(knowledge_row.model_dump())
+                    .values({k: v for k, v in knowledge_row.model_dump().items() if k in table_columns})
                     .on_conflict_do_update(index_elements=["id"], set_=update_fields)
                 )
                 sess.execute(stmt)
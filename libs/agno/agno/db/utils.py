@@ -1,8 +1,11 @@
 """Logic shared across different database implementations"""
 
+import hashlib
 import json
-from datetime import date, datetime
-from uuid import UUID
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID, uuid4
 
 from agno.models.message import Message
 from agno.models.metrics import Metrics
@@ -114,3 +117,189 @@ def deserialize_session_json_fields(session: dict) -> dict:
             log_warning(f"Warning: Could not parse runs as JSON, keeping as string: {e}")
 
     return session
+
+
+def get_session_run_rows(
+    session_id: str, runs: List[Dict[str, Any]], stored_runs: Dict[str, Tuple[str, int]]
+) -> List[Dict[str, Any]]:
+    """Get the rows to write to the runs table for the runs of a session.
+
+    Only new runs and runs that changed since they were stored are returned. New runs are positioned after the stored ones.
+
+    Args:
+        session_id (str): The ID of the session the runs belong to.
+        runs (List[Dict[str, Any]]): The serialized runs of the session.
+        stored_runs (Dict[str, Tuple[str, int]]): Digest and position of the runs already stored, keyed by run_id.
+
+    Returns:
+        List[Dict[str, Any]]: The rows to insert or update.
+    """
+    now = int(time.time())
+    next_position = max((position for _, position in stored_runs.values()), default=-1) + 1
+    rows: List[Dict[str, Any]] = []
+    for run in runs:
+        serialized_run = json.dumps(run, sort_keys=True, cls=CustomJSONEncoder)
+        digest = hashlib.sha256(serialized_run.encode("utf-8")).hexdigest()
+        run_id = run.get("run_id") or digest
+
+        stored = stored_runs.get(run_id)
+        if stored is not None and stored[0] == digest:
+            continue
+        if stored is not None:
+            position = stored[1]
+        else:
+            position = next_position
+            next_position += 1
+        stored_runs[run_id] = (digest, position)
+
+        rows.append(
+            {
+                "session_id": session_id,
+                "run_id": run_id,
+                "position": position,
+                "run_digest": digest,
+                "run_data": run,
+                "created_at": run.get("created_at") or now,
+                "updated_at": now,
+            }
+        )
+    return rows
+
+
+def attach_session_runs(sessions: List[Dict[str, Any]], run_rows: Iterable[Tuple[str, Any]]) -> None:
+    """Set the runs loaded from the runs table on the given session dictionaries.
+
+    Sessions without rows in the runs table keep all the runs stored in the sessions table. Those are never limited
+    to the latest runs: the session would be written back without the runs that were left out.
+
+    Args:
+        sessions (List[Dict[str, Any]]): The session dictionaries to update in place.
+        run_rows (Iterable[Tuple[str, Any]]): (session_id, run_data) rows, ordered by position.
+    """
+    runs_by_session: Dict[str, List[Dict[str, Any]]] = {}
+    for session_id, run_data in run_rows:
+        if isinstance(run_data, str):
+            run_data = json.loads(run_data)
+        runs_by_session.setdefault(session_id, []).append(run_data)
+
+    for session in sessions:
+        runs = runs_by_session.get(session["session_id"]) or session.get("runs")
+        session["runs"] = runs or None
+
+
+# -- Metrics util methods --
+# Token counters summed from the session_metrics of the sessions of each day
+METRICS_TOKEN_FIELDS = [
+    "input_tokens",
+    "output_tokens",
+    "total_tokens",
+    "audio_total_tokens",
+    "audio_input_tokens",
+    "audio_output_tokens",
+    "cache_read_tokens",
+    "cache_write_tokens",
+    "reasoning_tokens",
+]
+SECONDS_PER_DAY = 86400
+
+
+def get_epoch_day(day: date) -> int:
+    """Return the number of days between the Unix epoch and the given UTC date."""
+    return (day - date(1970, 1, 1)).days
+
+
+def get_day_ranges(days: Iterable[date]) -> List[Tuple[int, int]]:
+    """Return the [start, end) timestamp ranges covering the given UTC dates, merging consecutive dates."""
+    ranges: List[Tuple[int, int]] = []
+    for day in sorted(set(days)):
+        start = get_epoch_day(day) * SECONDS_PER_DAY
+        if ranges and ranges[-1][1] == start:
+            ranges[-1] = (ranges[-1][0], start + SECONDS_PER_DAY)
+        else:
+            ranges.append((start, start + SECONDS_PER_DAY))
+    return ranges
+
+
+def build_daily_metrics_records(
+    dates_to_process: List[date],
+    session_rows: Iterable[Sequence[Any]],
+    user_rows: Iterable[Sequence[Any]],
+    run_rows: Iterable[Sequence[Any]],
+    calculated_at: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Build the daily metrics records from sessions aggregated by the database.
+
+    Days are counted since the Unix epoch, from the created_at timestamp of the sessions. Rows with the same key
+    are added up, so counts can be aggregated from several sources, e.g. runs stored in the sessions and in a runs table.
+
+    Args:
+        dates_to_process (List[date]): The dates to build records for. Dates without sessions are skipped.
+        session_rows: (day, session_type, sessions_count, *token sums in METRICS_TOKEN_FIELDS order) rows.
+        user_rows: (day, users_count) rows.
+        run_rows: (day, session_type, model_id, model_provider, runs_count) rows. Runs without a model count as runs
+            of their session type, but not as model runs.
+        calculated_at (Optional[int]): The time of the calculation, used as created_at and updated_at of the records.
+
+    Returns:
+        List[Dict[str, Any]]: The metrics records, in the format of the metrics table.
+    """
+    sessions_counts: Dict[Tuple[int, str], int] = {}
+    token_metrics: Dict[int, Dict[str, int]] = {}
+    for day, session_type, sessions_count, *token_sums in session_rows:
+        key = (int(day), session_type)
+        sessions_counts[key] = sessions_counts.get(key, 0) + int(sessions_count or 0)
+        day_tokens = token_metrics.setdefault(int(day), dict.fromkeys(METRICS_TOKEN_FIELDS, 0))
+        for field, value in zip(METRICS_TOKEN_FIELDS, token_sums):
+            day_tokens[field] += int(value or 0)
+
+    users_counts = {int(day): int(users_count or 0) for day, users_count in user_rows}
+
+    runs_counts: Dict[Tuple[int, str], int] = {}
+    model_counts: Dict[int, Dict[Tuple[str, str], int]] = {}
+    for day, session_type, model_id, model_provider, count in run_rows:
+        key = (int(day), session_type)
+        runs_counts[key] = runs_counts.get(key, 0) + int(count or 0)
+        if model_id:
+            day_models = model_counts.setdefault(int(day), {})
+            model_key = (model_id, model_provider or "")
+            day_models[model_key] = day_models.get(model_key, 0) + int(count or 0)
+
+    calculated_at = calculated_at or int(time.time())
+    today = datetime.now(timezone.utc).date()
+    records = []
+    for date_to_process in dates_to_process:
+        day = get_epoch_day(date_to_process)
+        counts = {
+            session_type: sessions_counts.get((day, session_type), 0) for session_type in ("agent", "team", "workflow")
+        }
+        # Skip dates with no sessions
+        if not any(counts.values()):
+            continue
+
+        records.append(
+            {
+                "id": str(uuid4()),
+                "date": date_to_process,
+                "completed": date_to_process < today,
+                "token_metrics": token_metrics.get(day, dict.fromkeys(METRICS_TOKEN_FIELDS, 0)),
+                "model_metrics": [
+                    {"model_id": model_id, "model_provider": model_provider, "count": count}
+                    for (model_id, model_provider), count in sorted(model_counts.get(day, {}).items())
+                ],
+                "created_at": calculated_at,
+                "updated_at": calculated_at,
+                "aggregation_period": "daily",
+                "users_count": users_counts.get(day, 0),
+                **{f"{session_type}_sessions_count": count for session_type, count in counts.items()},
+                **{
+                    f"{session_type}_runs_count": runs_counts.get((day, session_type), 0)
+                    for session_type in ("agent", "team", "workflow")
+                },
+            }
+        )
+    return records
+
+
+def get_dates_from_epoch_days(days: Iterable[Any]) -> List[date]:
+    """Return the UTC dates of the given numbers of days since the Unix epoch."""
+    return sorted({date(1970, 1, 1) + timedelta(days=int(day)) for day in days if day is not None})
@@ -1,5 +1,6 @@
-from typing import List
+from typing import List, Union
 
+from agno.knowledge.chunking.normalization import NormalizationProfile
 from agno.knowledge.chunking.strategy import ChunkingStrategy
 from agno.knowledge.document.base import Document
 
@@ -7,9 +8,15 @@ from agno.knowledge.document.base import Document
 class DocumentChunking(ChunkingStrategy):
     """A chunking strategy that splits text based on document structure like paragraphs and sections"""
 
-    def __init__(self, chunk_size: int = 5000, overlap: int = 0):
+    def __init__(
+        self,
+        chunk_size: int = 5000,
+        overlap: int = 0,
+        normalization: Union[str, NormalizationProfile] = NormalizationProfile.PLAIN,
+    ):
         self.chunk_size = chunk_size
         self.overlap = overlap
+        self.normalization = NormalizationProfile(normalization)
 
     def chunk(self, document: Document) -> List[Document]:
         """Split document into chunks based on document structure"""
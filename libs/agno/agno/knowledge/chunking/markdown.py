@@ -1,6 +1,6 @@
 import os
 import tempfile
-from typing import List
+from typing import List, Union
 
 try:
     from unstructured.chunking.title import chunk_by_title  # type: ignore
@@ -8,6 +8,7 @@ try:
 except ImportError:
     raise ImportError("`unstructured` not installed. Please install it using `pip install unstructured markdown`")
 
+from agno.knowledge.chunking.normalization import NormalizationProfile
 from agno.knowledge.chunking.strategy import ChunkingStrategy
 from agno.knowledge.document.base import Document
 
@@ -15,9 +16,15 @@ from agno.knowledge.document.base import Document
 class MarkdownChunking(ChunkingStrategy):
     """A chunking strategy that splits markdown based on structure like headers, paragraphs and sections"""
 
-    def __init__(self, chunk_size: int = 5000, overlap: int = 0):
+    def __init__(
+        self,
+        chunk_size: int = 5000,
+        overlap: int = 0,
+        normalization: Union[str, NormalizationProfile] = NormalizationProfile.MARKDOWN,
+    ):
         self.chunk_size = chunk_size
         self.overlap = overlap
+        self.normalization = NormalizationProfile(normalization)
 
     def _partition_markdown_content(self, content: str) -> List[str]:
         """
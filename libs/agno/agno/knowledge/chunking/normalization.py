@@ -0,0 +1,115 @@
+import re
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import List, Match, Tuple, Union
+
+
+class NormalizationProfile(str, Enum):
+    """How chunking strategies normalize the whitespace of documents before splitting them."""
+
+    # Collapse every run of whitespace, line breaks included, into a single space
+    PLAIN = "plain"
+    # Keep line and paragraph breaks and the indentation of lines, collapse other runs of whitespace into a space
+    MARKDOWN = "markdown"
+    # Keep the text as is
+    NONE = "none"
+
+
+# Runs of whitespace the profiles may change. Single spaces between words, the bulk of whitespace, are skipped.
+_WHITESPACE_RUNS = re.compile(r"(?! \S)\s+")
+
+
+@dataclass
+class NormalizedText:
+    """Normalized text, with the mapping of its offsets back to the original text"""
+
+    text: str
+    # Offsets of the normalized text from which the shift to the original offsets changes, and the new shifts
+    anchors: List[int] = field(default_factory=list)
+    shifts: List[int] = field(default_factory=list)
+
+    def to_original(self, offset: int) -> int:
+        """Map an offset in the normalized text to the offset of the same character in the original text.
+
+        Offsets inside a collapsed run of whitespace map inside the original run.
+        """
+        index = bisect_right(self.anchors, offset) - 1
+        return offset + self.shifts[index] if index >= 0 else offset
+
+
+def _plain_replacement(run: str) -> Tuple[str, int]:
+    return " ", 0
+
+
+def _markdown_replacement(run: str) -> Tuple[str, int]:
+    """Return the replacement of a run of whitespace, and the length of the end of the run kept as is."""
+    last_break = max(run.rfind("\n"), run.rfind("\r"))
+    if last_break == -1:
+        return " ", 0
+    breaks = run.count("\n") + run.count("\r") - run.count("\r\n")
+    # The indentation of the next line is kept
+    indentation = min(len(run) - len(run.rstrip(" \t")), len(run) - last_break - 1)
+    return "\n\n" if breaks > 1 else "\n", indentation
+
+
+def normalize_text(
+    text: str, profile: Union[str, NormalizationProfile] = NormalizationProfile.PLAIN, track_offsets: bool = False
+) -> NormalizedText:
+    """Normalize the whitespace of a text in a single pass.
+
+    Args:
+        text: The text to normalize.
+        profile: The normalization profile.
+        track_offsets: Record the mapping of the offsets of the normalized text to the original text.
+
+    Returns:
+        NormalizedText: The normalized text, with its offset mapping if `track_offsets` is set.
+    """
+    profile = NormalizationProfile(profile)
+    if profile == NormalizationProfile.NONE:
+        return NormalizedText(text=text)
+    if profile == NormalizationProfile.PLAIN:
+        if not track_offsets:
+            return NormalizedText(text=_WHITESPACE_RUNS.sub(" ", text))
+        replace = _plain_replacement
+    else:
+        replace = _markdown_replacement
+
+    if not track_offsets:
+
+        def substitute(match: Match[str]) -> str:
+            run = match.group()
+            head, kept = replace(run)
+            return head + run[len(run) - kept :] if kept else head
+
+        return NormalizedText(text=_WHITESPACE_RUNS.sub(substitute, text))
+
+    parts: List[str] = []
+    anchors: List[int] = []
+    shifts: List[int] = []
+    position = 0  # Offset in the original text
+    length = 0  # Length of the normalized text so far
+    shift = 0
+    for match in _WHITESPACE_RUNS.finditer(text):
+        start, end = match.span()
+        run = match.group()
+        head, kept = replace(run)
+        if kept == len(run) - len(head) and run.startswith(head):
+            continue
+
+        parts.append(text[position:start])
+        parts.append(head)
+        length += start - position + len(head)
+        if kept:
+            parts.append(text[end - kept : end])
+        position = end
+        # Characters after the head, starting with the kept end of the run, are copied from the original text
+        if end - kept - length != shift:
+            shift = end - kept - length
+            anchors.append(length)
+            shifts.append(shift)
+        length += kept
+    parts.append(text[position:])
+
+    return NormalizedText(text="".join(parts), anchors=anchors, shifts=shifts)
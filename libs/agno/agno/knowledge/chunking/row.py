@@ -1,4 +1,4 @@
-from typing import List
+from typing import Iterable, List
 
 from agno.knowledge.chunking.strategy import ChunkingStrategy
 from agno.knowledge.document.base import Document
@@ -24,6 +24,13 @@ class RowChunking(ChunkingStrategy):
         else:
             start_index = 1
 
+        return self.chunk_rows(document, rows, start_index=start_index)
+
+    def chunk_rows(self, document: Document, rows: Iterable[str], start_index: int = 1) -> List[Document]:
+        """Turn rows of a document into one chunk per row, numbering them from `start_index`.
+
+        Used by streaming readers to chunk a file batch by batch while keeping the row numbers of the whole file.
+        """
         chunks = []
         for i, row in enumerate(rows):
             if self.clean_rows:
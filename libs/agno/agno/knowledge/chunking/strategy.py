@@ -2,34 +2,27 @@ from abc import ABC, abstractmethod
 from enum import Enum
 from typing import List, Optional
 
+from agno.knowledge.chunking.normalization import NormalizationProfile, NormalizedText, normalize_text
 from agno.knowledge.document.base import Document
 
 
 class ChunkingStrategy(ABC):
     """Base class for chunking strategies"""
 
+    # How clean_text normalizes whitespace. Plain text collapses every run of whitespace into a space.
+    normalization: NormalizationProfile = NormalizationProfile.PLAIN
+
     @abstractmethod
     def chunk(self, document: Document) -> List[Document]:
         raise NotImplementedError
 
     def clean_text(self, text: str) -> str:
-        """Clean the text by replacing multiple newlines with a single newline"""
-        import re
-
-        # Replace multiple newlines with a single newline
-        cleaned_text = re.sub(r"\n+", "\n", text)
-        # Replace multiple spaces with a single space
-        cleaned_text = re.sub(r"\s+", " ", cleaned_text)
-        # Replace multiple tabs with a single tab
-        cleaned_text = re.sub(r"\t+", "\t", cleaned_text)
-        # Replace multiple carriage returns with a single carriage return
-        cleaned_text = re.sub(r"\r+", "\r", cleaned_text)
-        # Replace multiple form feeds with a single form feed
-        cleaned_text = re.sub(r"\f+", "\f", cleaned_text)
-        # Replace multiple vertical tabs with a single vertical tab
-        cleaned_text = re.sub(r"\v+", "\v", cleaned_text)
+        """Normalize the whitespace of the text in a single pass, following the normalization profile"""
+        return normalize_text(text, self.normalization).text
 
-        return cleaned_text
+    def normalize(self, text: str) -> NormalizedText:
+        """Normalize the text like clean_text, keeping the mapping of its offsets back to the original text"""
+        return normalize_text(text, self.normalization, track_offsets=True)
 
 
 class ChunkingStrategyType(str, Enum):
@@ -42,6 +35,7 @@ class ChunkingStrategyType(str, Enum):
     FIXED_SIZE_CHUNKER = "FixedSizeChunker"
     ROW_CHUNKER = "RowChunker"
     MARKDOWN_CHUNKER = "MarkdownChunker"
+    TOKEN_CHUNKER = "TokenChunker"
 
     @classmethod
     def from_string(cls, strategy_name: str) -> "ChunkingStrategyType":
@@ -76,6 +70,7 @@ class ChunkingStrategyFactory:
             ChunkingStrategyType.FIXED_SIZE_CHUNKER: cls._create_fixed_chunking,
             ChunkingStrategyType.ROW_CHUNKER: cls._create_row_chunking,
             ChunkingStrategyType.MARKDOWN_CHUNKER: cls._create_markdown_chunking,
+            ChunkingStrategyType.TOKEN_CHUNKER: cls._create_token_chunking,
         }
         return strategy_map[strategy_type](chunk_size=chunk_size, overlap=overlap, **kwargs)
 
@@ -163,3 +158,16 @@ class ChunkingStrategyFactory:
         if overlap is not None:
             kwargs["overlap"] = overlap
         return MarkdownChunking(**kwargs)
+
+    @classmethod
+    def _create_token_chunking(
+        cls, chunk_size: Optional[int] = None, overlap: Optional[int] = None, **kwargs
+    ) -> ChunkingStrategy:
+        from agno.knowledge.chunking.tokens import TokenChunking
+
+        # TokenChunking measures chunk_size and overlap in tokens
+        if chunk_size is not None:
+            kwargs["chunk_size"] = chunk_size
+        if overlap is not None:
+            kwargs["overlap"] = overlap
+        return TokenChunking(**kwargs)
@@ -0,0 +1,216 @@
+import re
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Any, List, Optional, Pattern, Union
+
+from agno.knowledge.chunking.normalization import NormalizationProfile
+from agno.knowledge.chunking.strategy import ChunkingStrategy
+from agno.knowledge.document.base import Document
+from agno.utils.log import log_debug
+
+
+class Tokenizer(ABC):
+    """Base class for the tokenizers used to measure chunks in tokens"""
+
+    @abstractmethod
+    def token_offsets(self, text: str) -> List[int]:
+        """Return the character offset where each token of the text starts, in increasing order."""
+        raise NotImplementedError
+
+    def token_offsets_batch(self, texts: List[str]) -> List[List[int]]:
+        """Return the token offsets of several texts. Tokenizers that can encode in parallel override this."""
+        return [self.token_offsets(text) for text in texts]
+
+    def count_tokens(self, text: str) -> int:
+        return len(self.token_offsets(text))
+
+
+class TiktokenTokenizer(Tokenizer):
+    """Tokenizer of the OpenAI models and embedders, using `tiktoken`.
+
+    Args:
+        encoding_name: The tiktoken encoding, e.g. "cl100k_base" for the text-embedding-3 models.
+        num_threads: Number of threads used to encode batches of texts.
+    """
+
+    def __init__(self, encoding_name: str = "cl100k_base", num_threads: int = 8):
+        try:
+            import tiktoken
+        except ImportError:
+            raise ImportError("`tiktoken` not installed. Please install it using `pip install tiktoken`")
+
+        self.encoding = tiktoken.get_encoding(encoding_name)
+        self.num_threads = num_threads
+
+    def token_offsets(self, text: str) -> List[int]:
+        tokens = self.encoding.encode_ordinary(text)
+        return self.encoding.decode_with_offsets(tokens)[1]
+
+    def token_offsets_batch(self, texts: List[str]) -> List[List[int]]:
+        batch = self.encoding.encode_ordinary_batch(texts, num_threads=self.num_threads)
+        return [self.encoding.decode_with_offsets(tokens)[1] for tokens in batch]
+
+    def count_tokens(self, text: str) -> int:
+        return len(self.encoding.encode_ordinary(text))
+
+
+class HuggingFaceTokenizer(Tokenizer):
+    """Tokenizer of a Hugging Face model, using `tokenizers`.
+
+    Args:
+        tokenizer: A `tokenizers.Tokenizer`, or the name of a model on the Hugging Face Hub.
+    """
+
+    def __init__(self, tokenizer: Union[str, Any]):
+        if isinstance(tokenizer, str):
+            try:
+                from tokenizers import Tokenizer as HFTokenizer
+            except ImportError:
+                raise ImportError("`tokenizers` not installed. Please install it using `pip install tokenizers`")
+            tokenizer = HFTokenizer.from_pretrained(tokenizer)
+        self.tokenizer = tokenizer
+
+    def token_offsets(self, text: str) -> List[int]:
+        encoding = self.tokenizer.encode(text, add_special_tokens=False)
+        return [start for start, _ in encoding.offsets]
+
+    def token_offsets_batch(self, texts: List[str]) -> List[List[int]]:
+        encodings = self.tokenizer.encode_batch(texts, add_special_tokens=False)
+        return [[start for start, _ in encoding.offsets] for encoding in encodings]
+
+
+class RegexTokenizer(Tokenizer):
+    """Approximates tokens without any dependency: runs of up to 4 word characters, and punctuation marks.
+
+    Counts are usually higher than BPE tokenizer counts for English prose, so chunks stay within the budget
+    of the embedder. Use the tokenizer of the embedder for exact budgets.
+    """
+
+    def __init__(self, pattern: str = r"\w{1,4}|[^\w\s]"):
+        self.pattern: Pattern[str] = re.compile(pattern)
+
+    def token_offsets(self, text: str) -> List[int]:
+        return [match.start() for match in self.pattern.finditer(text)]
+
+
+class TokenChunking(ChunkingStrategy):
+    """Chunking strategy that splits text into chunks of at most `chunk_size` tokens, ending at natural break points.
+
+    The document is tokenized once. Each chunk ends at the last paragraph, line, sentence or word boundary
+    that keeps it within the budget, and is only split inside a word if no boundary keeps at least half of it.
+    Chunks carry their token count and the character offsets of their text in the original content.
+
+    Documents longer than `fast_path_threshold` characters are cut into segments at word boundaries and
+    the segments are tokenized as one batch, in parallel for tokenizers that support it.
+
+    Args:
+        chunk_size: Maximum number of tokens per chunk.
+        overlap: Number of tokens repeated at the start of the next chunk.
+        tokenizer: The tokenizer measuring the chunks. Defaults to `TiktokenTokenizer`, for OpenAI embedders.
+        fast_path_threshold: Length in characters above which documents are tokenized in parallel segments.
+        normalization: How whitespace is normalized. Defaults to keeping line and paragraph breaks.
+    """
+
+    # Break points, from the most to the least preferred
+    boundary_patterns = [re.compile(r"\n\s*\n"), re.compile(r"\n"), re.compile(r"(?<=[.!?])\s"), re.compile(r"\s")]
+    segment_size = 50_000
+
+    def __init__(
+        self,
+        chunk_size: int = 512,
+        overlap: int = 0,
+        tokenizer: Optional[Tokenizer] = None,
+        fast_path_threshold: int = 200_000,
+        normalization: Union[str, NormalizationProfile] = NormalizationProfile.MARKDOWN,
+    ):
+        # overlap must be less than chunk size
+        if overlap >= chunk_size:
+            raise ValueError(f"Invalid parameters: overlap ({overlap}) must be less than chunk size ({chunk_size}).")
+
+        self.chunk_size = chunk_size
+        self.overlap = overlap
+        self.tokenizer = tokenizer if tokenizer is not None else TiktokenTokenizer()
+        self.fast_path_threshold = fast_path_threshold
+        self.normalization = NormalizationProfile(normalization)
+
+    def _token_offsets(self, text: str) -> List[int]:
+        if len(text) <= self.fast_path_threshold:
+            return self.tokenizer.token_offsets(text)
+
+        # Cut at whitespace, where BPE tokenizers start a new token anyway
+        segment_starts = [0]
+        while len(text) - segment_starts[-1] > self.segment_size:
+            start = segment_starts[-1]
+            cut = text.rfind(" ", start + self.segment_size // 2, start + self.segment_size)
+            segment_starts.append(cut if cut != -1 else start + self.segment_size)
+        segment_ends = segment_starts[1:] + [len(text)]
+        log_debug(f"Tokenizing {len(text)} characters in {len(segment_starts)} segments")
+
+        batch = self.tokenizer.token_offsets_batch(
+            [text[start:end] for start, end in zip(segment_starts, segment_ends)]
+        )
+        offsets: List[int] = []
+        for start, segment_offsets in zip(segment_starts, batch):
+            offsets.extend(start + offset for offset in segment_offsets)
+        return offsets
+
+    def _find_end(self, content: str, starts: List[int], start_token: int) -> int:
+        """Return the index of the token the chunk starting at `start_token` ends before."""
+        max_end = start_token + self.chunk_size
+        if max_end >= len(starts):
+            return len(starts)
+        min_end = start_token + max(1, self.chunk_size // 2)
+        # Only the second half of the chunk is searched for a break point
+        window_start, window_end = starts[min_end], starts[max_end] + 1
+        for pattern in self.boundary_patterns:
+            last_match = None
+            for last_match in pattern.finditer(content, window_start, window_end):
+                pass
+            if last_match is not None:
+                return bisect_left(starts, last_match.start())
+        return max_end
+
+    def chunk(self, document: Document) -> List[Document]:
+        """Split document into chunks of at most chunk_size tokens"""
+        normalized = self.normalize(document.content)
+        content = normalized.text
+        starts = self._token_offsets(content)
+        if len(starts) <= self.chunk_size:
+            return [document]
+
+        chunks: List[Document] = []
+        chunk_meta_data = document.meta_data
+        chunk_number = 1
+        start_token = 0
+        while start_token < len(starts):
+            end_token = self._find_end(content, starts, start_token)
+            start_char = starts[start_token] if start_token > 0 else 0
+            end_char = starts[end_token] if end_token < len(starts) else len(content)
+
+            # Trim the whitespace around the chunk, keeping the offsets exact
+            chunk = content[start_char:end_char]
+            stripped = chunk.lstrip()
+            start_char += len(chunk) - len(stripped)
+            chunk = stripped.rstrip()
+            end_char = start_char + len(chunk)
+
+            if chunk:
+                meta_data = chunk_meta_data.copy()
+                meta_data["chunk"] = chunk_number
+                chunk_id = None
+                if document.id:
+                    chunk_id = f"{document.id}_{chunk_number}"
+                elif document.name:
+                    chunk_id = f"{document.name}_{chunk_number}"
+                meta_data["chunk_size"] = len(chunk)
+                meta_data["chunk_tokens"] = end_token - start_token
+                meta_data["start_char"] = normalized.to_original(start_char)
+                meta_data["end_char"] = normalized.to_original(end_char)
+                chunks.append(Document(id=chunk_id, name=document.name, meta_data=meta_data, content=chunk))
+                chunk_number += 1
+
+            if end_token >= len(starts):
+                break
+            start_token = max(end_token - self.overlap, start_token + 1)
+
+        return chunks
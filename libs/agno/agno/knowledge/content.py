@@ -48,6 +48,9 @@ class Content:
     created_at: Optional[int] = None
     updated_at: Optional[int] = None
     external_id: Optional[str] = None
+    # Fingerprints used by incremental loads
+    content_digest: Optional[str] = None
+    chunk_digests: Optional[List[str]] = None
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Content":
@@ -71,4 +74,6 @@ class Content:
             created_at=data.get("created_at"),
             updated_at=data.get("updated_at"),
             external_id=data.get("external_id"),
+            content_digest=data.get("content_digest"),
+            chunk_digests=data.get("chunk_digests"),
         )
@@ -0,0 +1,223 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+from weakref import WeakKeyDictionary
+
+from agno.knowledge.embedder.base import Embedder
+from agno.utils.log import log_debug
+
+
+@dataclass
+class EmbeddingBatcherStats:
+    """Counters for a BatchingEmbedder"""
+
+    requests: int = 0
+    texts: int = 0
+    batches: int = 0
+
+    @property
+    def texts_per_batch(self) -> float:
+        return self.texts / self.batches if self.batches else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "requests": self.requests,
+            "texts": self.texts,
+            "batches": self.batches,
+            "texts_per_batch": self.texts_per_batch,
+        }
+
+
+class _PendingBatch:
+    """Texts waiting to be embedded on one event loop."""
+
+    def __init__(self) -> None:
+        self.items: List[Tuple[str, "asyncio.Future[Tuple[List[float], Optional[Dict]]]"]] = []
+        self.tokens: int = 0
+        self.flush_handle: Optional[asyncio.TimerHandle] = None
+        self.tasks: Set["asyncio.Task[None]"] = set()
+
+
+@dataclass
+class BatchingEmbedder(Embedder):
+    """Embedder wrapper that coalesces concurrent async embedding requests into provider-sized batches.
+
+    Texts from concurrent inserts and searches are queued and sent to the wrapped embedder as one batch
+    once `batch_size` texts or `max_batch_tokens` estimated tokens are pending, or `max_latency` seconds
+    after the first text was queued. Share one instance between vector dbs to batch across all of them.
+
+    Sync batch calls, made by vector db inserts, are split under the same limits and sent to the wrapped
+    embedder's batch interface. Single sync texts are passed through unchanged.
+
+    Example:
+        >>> embedder = BatchingEmbedder(embedder=OpenAIEmbedder(), max_latency=0.02)
+        >>> vector_db = PgVector(table_name="docs", db_url=db_url, embedder=embedder)
+    """
+
+    embedder: Optional[Embedder] = None
+    # Maximum time in seconds a text waits for its batch to fill up
+    max_latency: float = 0.01
+    # Maximum estimated tokens per batch, using ~4 characters per token
+    max_batch_tokens: Optional[int] = None
+    stats: EmbeddingBatcherStats = field(default_factory=EmbeddingBatcherStats)
+
+    def __post_init__(self):
+        if self.embedder is None:
+            raise ValueError("BatchingEmbedder requires an embedder to wrap")
+        self.dimensions = self.embedder.dimensions
+        self.batch_size = self.embedder.batch_size
+        # Vector dbs only take their batch path when enable_batch is set
+        self.enable_batch = True
+        self._pending: "WeakKeyDictionary[asyncio.AbstractEventLoop, _PendingBatch]" = WeakKeyDictionary()
+
+    @property
+    def id(self) -> Optional[str]:
+        return getattr(self.embedder, "id", None)
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self.embedder.get_embedding(text)  # type: ignore
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.embedder.get_embedding_and_usage(text)  # type: ignore
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """
+        Embed texts in batches of at most `batch_size` texts and `max_batch_tokens` estimated tokens.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            Tuple of (List of embedding vectors, List of usage dictionaries)
+        """
+        self.stats.requests += 1
+        self.stats.texts += len(texts)
+
+        embeddings: List[List[float]] = []
+        usages: List[Optional[Dict]] = []
+        for batch in self._split(texts):
+            self.stats.batches += 1
+            log_debug(f"Embedding batch of {len(batch)} texts")
+            if hasattr(self.embedder, "get_embeddings_batch_and_usage"):
+                batch_embeddings, batch_usages = self.embedder.get_embeddings_batch_and_usage(batch)  # type: ignore
+            else:
+                results = [self.embedder.get_embedding_and_usage(text) for text in batch]  # type: ignore
+                batch_embeddings = [embedding for embedding, _ in results]
+                batch_usages = [usage for _, usage in results]
+            for i in range(len(batch)):
+                embeddings.append(batch_embeddings[i] if i < len(batch_embeddings) else [])
+                usages.append(batch_usages[i] if i < len(batch_usages) else None)
+        return embeddings, usages
+
+    def _split(self, texts: List[str]) -> List[List[str]]:
+        """Split texts into batches under the batch size and token limits."""
+        batches: List[List[str]] = []
+        batch: List[str] = []
+        batch_tokens = 0
+        for text in texts:
+            tokens = len(text) // 4 + 1
+            if batch and (
+                len(batch) >= self.batch_size
+                or (self.max_batch_tokens is not None and batch_tokens + tokens > self.max_batch_tokens)
+            ):
+                batches.append(batch)
+                batch, batch_tokens = [], 0
+            batch.append(text)
+            batch_tokens += tokens
+        if batch:
+            batches.append(batch)
+        return batches
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        return (await self.async_get_embedding_and_usage(text))[0]
+
+    async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        embeddings, usages = await self.async_get_embeddings_batch_and_usage([text])
+        return embeddings[0], usages[0]
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """
+        Queue texts for embedding and wait for the batches they end up in.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            Tuple of (List of embedding vectors, List of usage dictionaries)
+        """
+        if not texts:
+            return [], []
+
+        loop = asyncio.get_running_loop()
+        pending = self._pending.get(loop)
+        if pending is None:
+            pending = _PendingBatch()
+            self._pending[loop] = pending
+
+        self.stats.requests += 1
+        self.stats.texts += len(texts)
+
+        futures = []
+        for text in texts:
+            tokens = len(text) // 4 + 1
+            if pending.items and (
+                len(pending.items) >= self.batch_size
+                or (self.max_batch_tokens is not None and pending.tokens + tokens > self.max_batch_tokens)
+            ):
+                self._flush(loop, pending)
+            future: "asyncio.Future[Tuple[List[float], Optional[Dict]]]" = loop.create_future()
+            pending.items.append((text, future))
+            pending.tokens += tokens
+            futures.append(future)
+
+        if len(pending.items) >= self.batch_size:
+            self._flush(loop, pending)
+        elif pending.items and pending.flush_handle is None:
+            pending.flush_handle = loop.call_later(self.max_latency, self._flush, loop, pending)
+
+        results = await asyncio.gather(*futures)
+        return [embedding for embedding, _ in results], [usage for _, usage in results]
+
+    def _flush(self, loop: asyncio.AbstractEventLoop, pending: _PendingBatch) -> None:
+        """Send the pending texts to the wrapped embedder as one batch."""
+        if pending.flush_handle is not None:
+            pending.flush_handle.cancel()
+            pending.flush_handle = None
+        if not pending.items:
+            return
+
+        items = pending.items
+        pending.items = []
+        pending.tokens = 0
+        self.stats.batches += 1
+
+        task = loop.create_task(self._embed_batch(items))
+        # Keep a reference until the batch is done, so the task is not garbage collected
+        pending.tasks.add(task)
+        task.add_done_callback(pending.tasks.discard)
+
+    async def _embed_batch(self, items: List[Tuple[str, "asyncio.Future[Tuple[List[float], Optional[Dict]]]"]]) -> None:
+        texts = [text for text, _ in items]
+        log_debug(f"Embedding batch of {len(texts)} texts")
+        try:
+            if hasattr(self.embedder, "async_get_embeddings_batch_and_usage"):
+                embeddings, usages = await self.embedder.async_get_embeddings_batch_and_usage(texts)  # type: ignore
+            else:
+                results = await asyncio.gather(
+                    *[self.embedder.async_get_embedding_and_usage(text) for text in texts]  # type: ignore
+                )
+                embeddings = [embedding for embedding, _ in results]
+                usages = [usage for _, usage in results]
+        except Exception as e:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for i, (_, future) in enumerate(items):
+            if not future.done():
+                embedding = embeddings[i] if i < len(embeddings) else []
+                usage = usages[i] if i < len(usages) else None
+                future.set_result((embedding, usage))
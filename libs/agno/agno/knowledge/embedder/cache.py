@@ -0,0 +1,329 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from hashlib import sha256
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from agno.knowledge.embedder.base import Embedder
+from agno.utils.log import log_debug, log_warning
+
+
+@dataclass
+class EmbeddingCacheStats:
+    """Hit/miss counters for an EmbeddingCache"""
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    memory_evictions: int = 0
+    disk_evictions: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "hits": self.hits,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "memory_evictions": self.memory_evictions,
+            "disk_evictions": self.disk_evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+
+class EmbeddingCache:
+    """Content-addressed embedding cache with an in-memory LRU tier and an optional SQLite tier.
+
+    Entries are keyed by (embedder class, model id, dimensions, sha256 of the text), so one cache
+    can be shared by several embedders without collisions.
+
+    Args:
+        max_memory_entries: Maximum number of embeddings kept in the in-memory LRU. 0 disables the memory tier.
+        db_file: Path to the SQLite file for the on-disk tier. If not set, only the memory tier is used.
+        max_disk_bytes: Maximum total size of the embeddings stored on disk. Least recently used entries are
+            evicted once this is exceeded.
+    """
+
+    def __init__(
+        self,
+        max_memory_entries: int = 10_000,
+        db_file: Optional[str] = None,
+        max_disk_bytes: int = 1024 * 1024 * 1024,
+    ):
+        self.max_memory_entries = max_memory_entries
+        self.db_file = db_file
+        self.max_disk_bytes = max_disk_bytes
+        self.stats = EmbeddingCacheStats()
+
+        self._memory: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._disk_bytes: int = 0
+
+    @staticmethod
+    def make_key(embedder: Embedder, text: str) -> str:
+        """Build the cache key for a text embedded by the given embedder."""
+        model_id = getattr(embedder, "id", None)
+        text_hash = sha256(text.encode("utf-8", errors="surrogatepass")).hexdigest()
+        return f"{embedder.__class__.__name__}:{model_id}:{embedder.dimensions}:{text_hash}"
+
+    @property
+    def connection(self) -> Optional[sqlite3.Connection]:
+        if self.db_file is None:
+            return None
+        if self._connection is None:
+            Path(self.db_file).parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.db_file, check_same_thread=False, isolation_level=None)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "key TEXT PRIMARY KEY, embedding BLOB NOT NULL, size INTEGER NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS idx_embeddings_accessed_at ON embeddings(accessed_at)")
+            row = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM embeddings").fetchone()
+            self._disk_bytes = int(row[0])
+            log_debug(f"Opened embedding cache at {self.db_file} ({self._disk_bytes} bytes)")
+        return self._connection
+
+    def get(self, key: str) -> Optional[List[float]]:
+        """Return the cached embedding for a key, promoting disk hits into the memory tier."""
+        with self._lock:
+            embedding = self._memory.get(key)
+            if embedding is not None:
+                self._memory.move_to_end(key)
+                self.stats.memory_hits += 1
+                return embedding
+
+            connection = self.connection
+            if connection is not None:
+                try:
+                    row = connection.execute("SELECT embedding FROM embeddings WHERE key = ?", (key,)).fetchone()
+                    if row is not None:
+                        connection.execute("UPDATE embeddings SET accessed_at = ? WHERE key = ?", (time.time(), key))
+                        embedding = array("d", row[0]).tolist()
+                        self._set_memory(key, embedding)
+                        self.stats.disk_hits += 1
+                        return embedding
+                except sqlite3.Error as e:
+                    log_warning(f"Error reading from embedding cache: {e}")
+
+            self.stats.misses += 1
+            return None
+
+    def set(self, key: str, embedding: List[float]) -> None:
+        """Store an embedding in every enabled tier."""
+        if not embedding:
+            return
+        with self._lock:
+            self._set_memory(key, embedding)
+
+            connection = self.connection
+            if connection is not None:
+                blob = array("d", embedding).tobytes()
+                try:
+                    previous = connection.execute("SELECT size FROM embeddings WHERE key = ?", (key,)).fetchone()
+                    connection.execute(
+                        "INSERT OR REPLACE INTO embeddings (key, embedding, size, accessed_at) VALUES (?, ?, ?, ?)",
+                        (key, blob, len(blob), time.time()),
+                    )
+                    self._disk_bytes += len(blob) - (previous[0] if previous else 0)
+                    self._evict_disk()
+                except sqlite3.Error as e:
+                    log_warning(f"Error writing to embedding cache: {e}")
+
+    def clear(self) -> None:
+        """Remove every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            connection = self.connection
+            if connection is not None:
+                connection.execute("DELETE FROM embeddings")
+                self._disk_bytes = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _set_memory(self, key: str, embedding: List[float]) -> None:
+        if self.max_memory_entries <= 0:
+            return
+        self._memory[key] = embedding
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            self.stats.memory_evictions += 1
+
+    def _evict_disk(self) -> None:
+        """Evict least recently used entries until the disk tier is back under 90% of its budget."""
+        if self._disk_bytes <= self.max_disk_bytes or self._connection is None:
+            return
+        target = int(self.max_disk_bytes * 0.9)
+        rows = self._connection.execute("SELECT key, size FROM embeddings ORDER BY accessed_at ASC").fetchall()
+        evicted_keys = []
+        for key, size in rows:
+            if self._disk_bytes <= target:
+                break
+            evicted_keys.append((key,))
+            self._disk_bytes -= size
+        self._connection.executemany("DELETE FROM embeddings WHERE key = ?", evicted_keys)
+        self.stats.disk_evictions += len(evicted_keys)
+        log_debug(f"Evicted {len(evicted_keys)} embeddings from the disk cache")
+
+
+@dataclass
+class CachedEmbedder(Embedder):
+    """Embedder wrapper that serves repeated texts from an EmbeddingCache.
+
+    Usage is only reported for embeddings computed by the wrapped embedder; cache hits return `None` usage.
+
+    Example:
+        >>> embedder = CachedEmbedder(
+        ...     embedder=OpenAIEmbedder(),
+        ...     cache=EmbeddingCache(db_file="tmp/embeddings.db"),
+        ... )
+    """
+
+    embedder: Optional[Embedder] = None
+    cache: EmbeddingCache = field(default_factory=EmbeddingCache)
+
+    def __post_init__(self):
+        if self.embedder is None:
+            raise ValueError("CachedEmbedder requires an embedder to wrap")
+        self.dimensions = self.embedder.dimensions
+        self.enable_batch = self.embedder.enable_batch
+        self.batch_size = self.embedder.batch_size
+
+    @property
+    def id(self) -> Optional[str]:
+        return getattr(self.embedder, "id", None)
+
+    def _key(self, text: str) -> str:
+        return self.cache.make_key(self.embedder, text)  # type: ignore
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding_and_usage(text)[0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        key = self._key(text)
+        embedding = self.cache.get(key)
+        if embedding is not None:
+            return embedding, None
+        embedding, usage = self.embedder.get_embedding_and_usage(text)  # type: ignore
+        self.cache.set(key, embedding)
+        return embedding, usage
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        return (await self.async_get_embedding_and_usage(text))[0]
+
+    async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        key = self._key(text)
+        embedding = self.cache.get(key)
+        if embedding is not None:
+            return embedding, None
+        embedding, usage = await self.embedder.async_get_embedding_and_usage(text)  # type: ignore
+        self.cache.set(key, embedding)
+        return embedding, usage
+
+    def _lookup_batch(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]], Dict[str, List[int]]]:
+        """Resolve cache hits, grouping the misses by key so duplicate texts are only embedded once"""
+        embeddings: List[List[float]] = [[] for _ in texts]
+        usages: List[Optional[Dict]] = [None] * len(texts)
+        missing: Dict[str, List[int]] = {}
+        for i, text in enumerate(texts):
+            key = self._key(text)
+            if key in missing:
+                missing[key].append(i)
+                continue
+            cached = self.cache.get(key)
+            if cached is not None:
+                embeddings[i] = cached
+            else:
+                missing[key] = [i]
+        return embeddings, usages, missing
+
+    def _store_batch(
+        self,
+        embeddings: List[List[float]],
+        usages: List[Optional[Dict]],
+        missing: Dict[str, List[int]],
+        new_embeddings: List[List[float]],
+        new_usages: List[Optional[Dict]],
+    ) -> None:
+        """Cache the embeddings computed for the misses, and fill them in at every position of their text"""
+        for j, key in enumerate(missing):
+            embedding = new_embeddings[j] if j < len(new_embeddings) else []
+            usage = new_usages[j] if j < len(new_usages) else None
+            self.cache.set(key, embedding)
+            for position, i in enumerate(missing[key]):
+                embeddings[i] = embedding
+                # Only the first occurrence is charged for the usage
+                usages[i] = usage if position == 0 else None
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """
+        Get embeddings and usage for multiple texts, only sending cache misses to the wrapped embedder.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            Tuple of (List of embedding vectors, List of usage dictionaries)
+        """
+        embeddings, usages, missing = self._lookup_batch(texts)
+        if not missing:
+            return embeddings, usages
+
+        missing_texts = [texts[indexes[0]] for indexes in missing.values()]
+        if hasattr(self.embedder, "get_embeddings_batch_and_usage"):
+            new_embeddings, new_usages = self.embedder.get_embeddings_batch_and_usage(missing_texts)  # type: ignore
+        else:
+            results = [self.embedder.get_embedding_and_usage(text) for text in missing_texts]  # type: ignore
+            new_embeddings = [embedding for embedding, _ in results]
+            new_usages = [usage for _, usage in results]
+
+        self._store_batch(embeddings, usages, missing, new_embeddings, new_usages)
+        return embeddings, usages
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """
+        Get embeddings and usage for multiple texts, only sending cache misses to the wrapped embedder.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            Tuple of (List of embedding vectors, List of usage dictionaries)
+        """
+        embeddings, usages, missing = self._lookup_batch(texts)
+        if not missing:
+            return embeddings, usages
+
+        missing_texts = [texts[indexes[0]] for indexes in missing.values()]
+        if hasattr(self.embedder, "async_get_embeddings_batch_and_usage"):
+            new_embeddings, new_usages = await self.embedder.async_get_embeddings_batch_and_usage(missing_texts)  # type: ignore
+        else:
+            results = await asyncio.gather(
+                *[self.embedder.async_get_embedding_and_usage(text) for text in missing_texts]  # type: ignore
+            )
+            new_embeddings = [embedding for embedding, _ in results]
+            new_usages = [usage for _, usage in results]
+
+        self._store_batch(embeddings, usages, missing, new_embeddings, new_usages)
+        return embeddings, usages
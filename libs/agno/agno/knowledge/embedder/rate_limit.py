@@ -0,0 +1,126 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from agno.knowledge.embedder.base import Embedder
+from agno.utils.rate_limit import RateLimiter, estimate_tokens
+
+
+def _get_used_tokens(usage: Optional[Dict]) -> Optional[int]:
+    """Tokens used by an embedding request according to the usage reported by the provider."""
+    if not usage:
+        return None
+    tokens = usage.get("total_tokens") or usage.get("prompt_tokens") or usage.get("input_tokens")
+    return tokens if isinstance(tokens, int) else None
+
+
+def _get_batch_used_tokens(usages: List[Optional[Dict]]) -> Optional[int]:
+    """Tokens used by a batch request. Providers may report the usage of the whole batch on every text,
+    so each usage object is counted once."""
+    unique_usages = {id(usage): usage for usage in usages if usage}
+    used_tokens = [used for used in map(_get_used_tokens, unique_usages.values()) if used is not None]
+    return sum(used_tokens) if used_tokens else None
+
+
+@dataclass
+class RateLimitedEmbedder(Embedder):
+    """Embedder wrapper that paces the requests of the wrapped embedder with a RateLimiter.
+
+    Share the rate limiter with every embedder (and model) using the same API key, so inserts running
+    in parallel stay under the provider quota instead of retrying on 429 errors.
+
+    Example:
+        >>> embedder = RateLimitedEmbedder(
+        ...     embedder=OpenAIEmbedder(),
+        ...     rate_limiter=get_rate_limiter("openai:embeddings", requests_per_minute=3000, tokens_per_minute=1_000_000),
+        ... )
+    """
+
+    embedder: Optional[Embedder] = None
+    rate_limiter: Optional[RateLimiter] = None
+
+    def __post_init__(self):
+        if self.embedder is None:
+            raise ValueError("RateLimitedEmbedder requires an embedder to wrap")
+        if self.rate_limiter is None:
+            raise ValueError("RateLimitedEmbedder requires a rate_limiter")
+        self.dimensions = self.embedder.dimensions
+        self.enable_batch = self.embedder.enable_batch
+        self.batch_size = self.embedder.batch_size
+
+    @property
+    def id(self) -> Optional[str]:
+        return getattr(self.embedder, "id", None)
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding_and_usage(text)[0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        with self.rate_limiter.limit(tokens=estimate_tokens(text)) as lease:  # type: ignore
+            embedding, usage = self.embedder.get_embedding_and_usage(text)  # type: ignore
+            lease.set_usage(_get_used_tokens(usage))
+        return embedding, usage
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        return (await self.async_get_embedding_and_usage(text))[0]
+
+    async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        async with self.rate_limiter.alimit(tokens=estimate_tokens(text)) as lease:  # type: ignore
+            embedding, usage = await self.embedder.async_get_embedding_and_usage(text)  # type: ignore
+            lease.set_usage(_get_used_tokens(usage))
+        return embedding, usage
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """
+        Get embeddings and usage for multiple texts, admitting each batch of `batch_size` texts as one request.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            Tuple of (List of embedding vectors, List of usage dictionaries)
+        """
+        if not hasattr(self.embedder, "get_embeddings_batch_and_usage"):
+            results = [self.get_embedding_and_usage(text) for text in texts]
+            return [embedding for embedding, _ in results], [usage for _, usage in results]
+
+        embeddings: List[List[float]] = []
+        usages: List[Optional[Dict]] = []
+        for i in range(0, len(texts), self.batch_size):
+            batch_texts = texts[i : i + self.batch_size]
+            tokens = sum(estimate_tokens(text) for text in batch_texts)
+            with self.rate_limiter.limit(tokens=tokens) as lease:  # type: ignore
+                batch_embeddings, batch_usages = self.embedder.get_embeddings_batch_and_usage(batch_texts)  # type: ignore
+                lease.set_usage(_get_batch_used_tokens(batch_usages))
+            embeddings.extend(batch_embeddings)
+            usages.extend(batch_usages)
+        return embeddings, usages
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """
+        Get embeddings and usage for multiple texts, admitting each batch of `batch_size` texts as one request.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            Tuple of (List of embedding vectors, List of usage dictionaries)
+        """
+        if not hasattr(self.embedder, "async_get_embeddings_batch_and_usage"):
+            results = await asyncio.gather(*[self.async_get_embedding_and_usage(text) for text in texts])
+            return [embedding for embedding, _ in results], [usage for _, usage in results]
+
+        # Admit every batch the wrapped embedder sends as its own request
+        embeddings: List[List[float]] = []
+        usages: List[Optional[Dict]] = []
+        for i in range(0, len(texts), self.batch_size):
+            batch_texts = texts[i : i + self.batch_size]
+            tokens = sum(estimate_tokens(text) for text in batch_texts)
+            async with self.rate_limiter.alimit(tokens=tokens) as lease:  # type: ignore
+                batch_embeddings, batch_usages = await self.embedder.async_get_embeddings_batch_and_usage(batch_texts)  # type: ignore
+                lease.set_usage(_get_batch_used_tokens(batch_usages))
+            embeddings.extend(batch_embeddings)
+            usages.extend(batch_usages)
+        return embeddings, usages
@@ -1,13 +1,18 @@
 import asyncio
 import hashlib
 import io
+import multiprocessing
+import pickle
 import time
-from dataclasses import dataclass
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import partial
 from io import BytesIO
 from os.path import basename
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Union, cast, overload
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union, cast, overload
 
 from httpx import AsyncClient
 
@@ -42,6 +47,21 @@ class Knowledge:
     contents_db: Optional[Union[BaseDb, AsyncBaseDb]] = None
     max_results: int = 10
     readers: Optional[Dict[str, Reader]] = None
+    # Concurrency of directory loads: files in flight, threads running readers and concurrent vector db inserts
+    max_concurrent_files: int = 4
+    max_reader_workers: Optional[int] = None
+    max_concurrent_inserts: int = 2
+    # Files larger than this many bytes are read and inserted in batches of stream_batch_size records,
+    # so memory stays bounded whatever the size of the file
+    stream_threshold_bytes: int = 50 * 1024 * 1024
+    stream_batch_size: int = 1000
+
+    # Processes parsing files read whole. Parsing is CPU bound, so reader threads don't use more than one core;
+    # with reader_processes set, files are parsed on that many processes. Readers that can't be pickled use threads
+    reader_processes: Optional[int] = None
+
+    _reader_executor: Optional[ThreadPoolExecutor] = field(default=None, init=False, repr=False)
+    _reader_process_pool: Optional[ProcessPoolExecutor] = field(default=None, init=False, repr=False)
 
     def __post_init__(self):
         from agno.vectordb import VectorDb
@@ -70,6 +90,7 @@ class Knowledge:
         exclude: Optional[List[str]] = None,
         upsert: bool = True,
         skip_if_exists: bool = False,
+        incremental: bool = False,
         remote_content: Optional[RemoteContent] = None,
     ) -> None: ...
 
@@ -78,6 +99,7 @@ class Knowledge:
             arguments = args[0]
             upsert = kwargs.get("upsert", True)
             skip_if_exists = kwargs.get("skip_if_exists", False)
+            incremental = kwargs.get("incremental", False)
             for argument in arguments:
                 await self.add_content_async(
                     name=argument.get("name"),
@@ -92,6 +114,7 @@ class Knowledge:
                     exclude=argument.get("exclude"),
                     upsert=argument.get("upsert", upsert),
                     skip_if_exists=argument.get("skip_if_exists", skip_if_exists),
+                    incremental=argument.get("incremental", incremental),
                     remote_content=argument.get("remote_content", None),
                 )
 
@@ -108,6 +131,7 @@ class Knowledge:
             exclude = kwargs.get("exclude")
             upsert = kwargs.get("upsert", True)
             skip_if_exists = kwargs.get("skip_if_exists", False)
+            incremental = kwargs.get("incremental", False)
             remote_content = kwargs.get("remote_content", None)
             for path in paths:
                 await self.add_content_async(
@@ -119,6 +143,7 @@ class Knowledge:
                     exclude=exclude,
                     upsert=upsert,
                     skip_if_exists=skip_if_exists,
+                    incremental=incremental,
                     reader=reader,
                 )
             for url in urls:
@@ -145,6 +170,7 @@ class Knowledge:
                     exclude=exclude,
                     upsert=upsert,
                     skip_if_exists=skip_if_exists,
+                    incremental=incremental,
                     reader=reader,
                 )
             if topics:
@@ -191,6 +217,7 @@ class Knowledge:
         exclude: Optional[List[str]] = None,
         upsert: bool = True,
         skip_if_exists: bool = False,
+        incremental: bool = False,
         remote_content: Optional[RemoteContent] = None,
     ) -> None: ...
 
@@ -216,6 +243,8 @@ class Knowledge:
             exclude: Optional list of file patterns to exclude
             upsert: Whether to update existing content if it already exists
             skip_if_exists: Whether to skip adding content if it already exists
+            incremental: Whether to only re-process files whose bytes changed since the last load, and only
+                replace the chunks whose text changed. Requires a contents_db.
             remote_content: Optional remote content (S3, GCS, etc.) to add
         """
         asyncio.run(self.add_contents_async(*args, **kwargs))
@@ -234,6 +263,7 @@ class Knowledge:
         exclude: Optional[List[str]] = None,
         upsert: bool = True,
         skip_if_exists: bool = False,
+        incremental: bool = False,
         reader: Optional[Reader] = None,
         auth: Optional[ContentAuth] = None,
     ) -> None: ...
@@ -257,6 +287,7 @@ class Knowledge:
         upsert: bool = True,
         skip_if_exists: bool = True,
         auth: Optional[ContentAuth] = None,
+        incremental: bool = False,
     ) -> None:
         # Validation: At least one of the parameters must be provided
         if all(argument is None for argument in [path, url, text_content, topics, remote_content]):
@@ -289,7 +320,11 @@ class Knowledge:
         content.content_hash = self._build_content_hash(content)
         content.id = generate_id(content.content_hash)
 
-        await self._load_content(content, upsert, skip_if_exists, include, exclude)
+        if incremental and not self.contents_db:
+            log_warning("Incremental loading requires a contents_db, loading all content")
+            incremental = False
+
+        await self._load_content(content, upsert, skip_if_exists, include, exclude, incremental=incremental)
 
     @overload
     def add_content(
@@ -303,6 +338,7 @@ class Knowledge:
         exclude: Optional[List[str]] = None,
         upsert: bool = True,
         skip_if_exists: bool = False,
+        incremental: bool = False,
         reader: Optional[Reader] = None,
         auth: Optional[ContentAuth] = None,
     ) -> None: ...
@@ -326,6 +362,7 @@ class Knowledge:
         upsert: bool = True,
         skip_if_exists: bool = False,
         auth: Optional[ContentAuth] = None,
+        incremental: bool = False,
     ) -> None:
         """
         Synchronously add content to the knowledge base.
@@ -344,6 +381,8 @@ class Knowledge:
             exclude: Optional list of file patterns to exclude
             upsert: Whether to update existing content if it already exists
             skip_if_exists: Whether to skip adding content if it already exists
+            incremental: Whether to only re-process files whose bytes changed since the last load, and only
+                replace the chunks whose text changed. Requires a contents_db.
         """
         asyncio.run(
             self.add_content_async(
@@ -361,6 +400,7 @@ class Knowledge:
                 upsert=upsert,
                 skip_if_exists=skip_if_exists,
                 auth=auth,
+                incremental=incremental,
             )
         )
 
@@ -391,6 +431,8 @@ class Knowledge:
         skip_if_exists: bool,
         include: Optional[List[str]] = None,
         exclude: Optional[List[str]] = None,
+        incremental: bool = False,
+        insert_semaphore: Optional[asyncio.Semaphore] = None,
     ):
         from agno.vectordb import VectorDb
 
@@ -403,8 +445,11 @@ class Knowledge:
             if self._should_include_file(str(path), include, exclude):
                 log_debug(f"Adding file {path} due to include/exclude filters")
 
+                if incremental and await self._skip_unchanged(content, self._compute_file_digest(path)):
+                    return
+
                 await self._add_to_contents_db(content)
-                if self._should_skip(content.content_hash, skip_if_exists):  # type: ignore[arg-type]
+                if not incremental and self._should_skip(content.content_hash, skip_if_exists):  # type: ignore[arg-type]
                     content.status = ContentStatus.COMPLETED
                     await self._aupdate_content(content)
                     return
@@ -414,32 +459,19 @@ class Knowledge:
                     await self._process_lightrag_content(content, KnowledgeContentOrigin.PATH)
                     return
 
+                stream_reader = content.reader or ReaderFactory.get_reader_for_extension(path.suffix)
+                if not incremental and stream_reader is not None and self._should_read_in_batches(path):
+                    await self._load_file_in_batches(content, stream_reader, path, upsert, insert_semaphore)
+                    return
+
                 if content.reader:
-                    # TODO: We will refactor this to eventually pass authorization to all readers
-                    import inspect
-
-                    read_signature = inspect.signature(content.reader.read)
-                    if "password" in read_signature.parameters and content.auth and content.auth.password:
-                        read_documents = content.reader.read(
-                            path, name=content.name or path.name, password=content.auth.password
-                        )
-                    else:
-                        read_documents = content.reader.read(path, name=content.name or path.name)
+                    read_documents = await self._read_file(content.reader, path, content)
 
                 else:
                     reader = ReaderFactory.get_reader_for_extension(path.suffix)
                     log_debug(f"Using Reader: {reader.__class__.__name__}")
                     if reader:
-                        # TODO: We will refactor this to eventually pass authorization to all readers
-                        import inspect
-
-                        read_signature = inspect.signature(reader.read)
-                        if "password" in read_signature.parameters and content.auth and content.auth.password:
-                            read_documents = reader.read(
-                                path, name=content.name or path.name, password=content.auth.password
-                            )
-                        else:
-                            read_documents = reader.read(path, name=content.name or path.name)
+                        read_documents = await self._read_file(reader, path, content)
 
                 if not content.file_type:
                     content.file_type = path.suffix
@@ -456,29 +488,222 @@ class Knowledge:
                 for read_document in read_documents:
                     read_document.content_id = content.id
 
-                await self._handle_vector_db_insert(content, read_documents, upsert)
+                if insert_semaphore is not None:
+                    async with insert_semaphore:
+                        await self._handle_vector_db_insert(content, read_documents, upsert, incremental=incremental)
+                else:
+                    await self._handle_vector_db_insert(content, read_documents, upsert, incremental=incremental)
 
         elif path.is_dir():
-            for file_path in path.iterdir():
-                # Apply include/exclude filtering
-                if not self._should_include_file(str(file_path), include, exclude):
-                    log_debug(f"Skipping file {file_path} due to include/exclude filters")
-                    continue
-
-                file_content = Content(
-                    name=content.name,
-                    path=str(file_path),
-                    metadata=content.metadata,
-                    description=content.description,
-                    reader=content.reader,
-                )
-                file_content.content_hash = self._build_content_hash(file_content)
-                file_content.id = generate_id(file_content.content_hash)
-
-                await self._load_from_path(file_content, upsert, skip_if_exists, include, exclude)
+            await self._load_from_directory(content, path, upsert, skip_if_exists, include, exclude, incremental)
         else:
             log_warning(f"Invalid path: {path}")
 
+    def _should_read_in_batches(self, path: Path) -> bool:
+        try:
+            return path.stat().st_size > self.stream_threshold_bytes
+        except OSError:
+            return False
+
+    async def _load_file_in_batches(
+        self,
+        content: Content,
+        reader: Reader,
+        path: Path,
+        upsert: bool,
+        insert_semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> None:
+        """Read a large file in batches with Reader.iter_read, inserting every batch as soon as it is read."""
+        import inspect
+
+        from agno.vectordb import VectorDb
+
+        self.vector_db = cast(VectorDb, self.vector_db)
+
+        read_kwargs: Dict[str, Any] = {}
+        if "password" in inspect.signature(reader.read).parameters and content.auth and content.auth.password:
+            read_kwargs["password"] = content.auth.password
+
+        if not content.file_type:
+            content.file_type = path.suffix
+        if not content.size:
+            content.size = path.stat().st_size
+        log_info(f"Reading {path} in batches of {self.stream_batch_size} with {reader.__class__.__name__}")
+
+        batches = reader.iter_read(
+            path, name=content.name or path.name, batch_size=self.stream_batch_size, **read_kwargs
+        )
+        num_batches = 0
+        num_documents = 0
+        try:
+            while True:
+                read_documents = await self._read_in_executor(next, batches, None)  # type: ignore[arg-type]
+                if read_documents is None:
+                    break
+                for read_document in read_documents:
+                    read_document.content_id = content.id
+
+                # Only the first batch is upserted: upserts replace every document of the content hash
+                use_upsert = upsert and num_batches == 0 and self.vector_db.upsert_available()
+                if insert_semaphore is not None:
+                    async with insert_semaphore:
+                        await self._insert_documents(content, read_documents, use_upsert)
+                else:
+                    await self._insert_documents(content, read_documents, use_upsert)
+                num_batches += 1
+                num_documents += len(read_documents)
+        except Exception as e:
+            log_error(f"Error loading {path} in batches: {e}")
+            content.status = ContentStatus.FAILED
+            content.status_message = f"Could not load batch {num_batches + 1}: {e}"
+            await self._aupdate_content(content)
+            return
+        finally:
+            batches.close()  # type: ignore[attr-defined]
+
+        log_debug(f"Loaded {num_documents} documents from {path} in {num_batches} batches")
+        content.status = ContentStatus.COMPLETED
+        await self._aupdate_content(content)
+
+    async def _insert_documents(self, content: Content, documents: List[Document], upsert: bool) -> None:
+        from agno.vectordb import VectorDb
+
+        self.vector_db = cast(VectorDb, self.vector_db)
+        if upsert:
+            await self.vector_db.async_upsert(content.content_hash, documents, content.metadata)  # type: ignore[arg-type]
+        else:
+            await self.vector_db.async_insert(
+                content.content_hash,  # type: ignore[arg-type]
+                documents=documents,
+                filters=content.metadata,  # type: ignore[arg-type]
+            )
+
+    async def _load_from_directory(
+        self,
+        content: Content,
+        path: Path,
+        upsert: bool,
+        skip_if_exists: bool,
+        include: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+        incremental: bool = False,
+    ):
+        """
+        Load every file under a directory through a bounded pipeline.
+
+        Files are queued as the directory is walked, so the walk is paused while the queue is full.
+        Up to `max_concurrent_files` files are processed at once: readers run on the reader thread pool,
+        while at most `max_concurrent_inserts` files are embedded and inserted into the vector db.
+        Each file reports its progress through its own ContentStatus.
+        """
+        num_workers = max(1, self.max_concurrent_files)
+        queue: "asyncio.Queue[Optional[Content]]" = asyncio.Queue(maxsize=num_workers * 2)
+        insert_semaphore = asyncio.Semaphore(max(1, self.max_concurrent_inserts))
+        num_loaded = 0
+
+        async def produce():
+            try:
+                for file_path in self._walk_directory(path, include, exclude):
+                    file_content = Content(
+                        name=content.name,
+                        path=str(file_path),
+                        metadata=content.metadata,
+                        description=content.description,
+                        reader=content.reader,
+                    )
+                    file_content.content_hash = self._build_content_hash(file_content)
+                    file_content.id = generate_id(file_content.content_hash)
+                    await queue.put(file_content)
+            finally:
+                for _ in range(num_workers):
+                    await queue.put(None)
+
+        async def consume():
+            nonlocal num_loaded
+            while True:
+                file_content = await queue.get()
+                if file_content is None:
+                    return
+                try:
+                    await self._load_from_path(
+                        file_content,
+                        upsert,
+                        skip_if_exists,
+                        include,
+                        exclude,
+                        incremental=incremental,
+                        insert_semaphore=insert_semaphore,
+                    )
+                except Exception as e:
+                    log_error(f"Error loading {file_content.path}: {e}")
+                    file_content.status = ContentStatus.FAILED
+                    file_content.status_message = str(e)
+                    await self._aupdate_content(file_content)
+                num_loaded += 1
+                log_debug(f"Loaded {num_loaded} files from {path}")
+
+        await asyncio.gather(produce(), *[consume() for _ in range(num_workers)])
+
+    def _walk_directory(self, path: Path, include: Optional[List[str]], exclude: Optional[List[str]]) -> Iterator[Path]:
+        """Yield the files under a directory, applying the include/exclude filters to files and subdirectories."""
+        for file_path in path.iterdir():
+            if not self._should_include_file(str(file_path), include, exclude):
+                log_debug(f"Skipping file {file_path} due to include/exclude filters")
+                continue
+            if file_path.is_dir():
+                yield from self._walk_directory(file_path, include, exclude)
+            else:
+                yield file_path
+
+    async def _read_in_executor(self, read: Callable[..., List[Document]], *args, **kwargs) -> List[Document]:
+        """Run a synchronous reader on the reader thread pool, so reading does not block the event loop."""
+        if self._reader_executor is None:
+            self._reader_executor = ThreadPoolExecutor(
+                max_workers=self.max_reader_workers, thread_name_prefix="agno-knowledge-reader"
+            )
+            # Shut the pool down with the knowledge base, if close() is not called
+            weakref.finalize(self, self._reader_executor.shutdown, wait=False)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._reader_executor, partial(read, *args, **kwargs))
+
+    def _can_read_in_process(self, reader: Reader) -> bool:
+        """Whether the reader can be sent to the reader processes, which requires pickling it."""
+        try:
+            pickle.dumps(reader)
+            return True
+        except Exception as e:
+            log_debug(f"{reader.__class__.__name__} can't be pickled, reading on threads instead: {e}")
+            return False
+
+    async def _read_file(self, reader: Reader, path: Path, content: Content) -> List[Document]:
+        """Read a file with the reader, on the reader processes if enabled, otherwise on the reader thread pool."""
+        import inspect
+
+        read_kwargs: Dict[str, Any] = {"name": content.name or path.name}
+        # TODO: We will refactor this to eventually pass authorization to all readers
+        if "password" in inspect.signature(reader.read).parameters and content.auth and content.auth.password:
+            read_kwargs["password"] = content.auth.password
+
+        if self.reader_processes and self._can_read_in_process(reader):
+            if self._reader_process_pool is None:
+                # Spawned, not forked: the event loop and reader threads of this process must not be copied
+                self._reader_process_pool = ProcessPoolExecutor(
+                    max_workers=self.reader_processes, mp_context=multiprocessing.get_context("spawn")
+                )
+                weakref.finalize(self, self._reader_process_pool.shutdown, wait=False)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._reader_process_pool, partial(reader.read, path, **read_kwargs))
+        return await self._read_in_executor(reader.read, path, **read_kwargs)
+
+    def close(self) -> None:
+        """Shut down the reader thread and process pools. They are started again by the next load."""
+        if self._reader_executor is not None:
+            self._reader_executor.shutdown(wait=True)
+            self._reader_executor = None
+        if self._reader_process_pool is not None:
+            self._reader_process_pool.shutdown(wait=True)
+            self._reader_process_pool = None
+
     async def _load_from_url(
         self,
         content: Content,
@@ -606,6 +831,7 @@ class Knowledge:
         content: Content,
         upsert: bool = True,
         skip_if_exists: bool = False,
+        incremental: bool = False,
     ):
         from agno.vectordb import VectorDb
 
@@ -632,8 +858,16 @@ class Knowledge:
 
         log_info(f"Adding content from {content.name}")
 
+        if incremental and content.file_data and content.file_data.content is not None:
+            raw_content = content.file_data.content
+            content_digest = hashlib.sha256(
+                raw_content if isinstance(raw_content, bytes) else str(raw_content).encode("utf-8", errors="replace")
+            ).hexdigest()
+            if await self._skip_unchanged(content, content_digest):
+                return
+
         await self._add_to_contents_db(content)
-        if self._should_skip(content.content_hash, skip_if_exists):  # type: ignore[arg-type]
+        if not incremental and self._should_skip(content.content_hash, skip_if_exists):  # type: ignore[arg-type]
             content.status = ContentStatus.COMPLETED
             await self._aupdate_content(content)
             return
@@ -696,7 +930,7 @@ class Knowledge:
             await self._aupdate_content(content)
             return
 
-        await self._handle_vector_db_insert(content, read_documents, upsert)
+        await self._handle_vector_db_insert(content, read_documents, upsert, incremental=incremental)
 
     async def _load_from_topics(
         self,
@@ -947,7 +1181,7 @@ class Knowledge:
                 read_document.content_id = content.id
             await self._handle_vector_db_insert(content_entry, read_documents, upsert)
 
-    async def _handle_vector_db_insert(self, content: Content, read_documents, upsert):
+    async def _handle_vector_db_insert(self, content: Content, read_documents, upsert, incremental: bool = False):
         from agno.vectordb import VectorDb
 
         self.vector_db = cast(VectorDb, self.vector_db)
@@ -959,7 +1193,16 @@ class Knowledge:
             await self._aupdate_content(content)
             return
 
-        if self.vector_db.upsert_available() and upsert:
+        if incremental:
+            try:
+                await self._replace_changed_chunks(content, read_documents)
+            except Exception as e:
+                log_error(f"Error replacing changed chunks: {e}")
+                content.status = ContentStatus.FAILED
+                content.status_message = "Could not replace changed chunks"
+                await self._aupdate_content(content)
+                return
+        elif self.vector_db.upsert_available() and upsert:
             try:
                 await self.vector_db.async_upsert(content.content_hash, read_documents, content.metadata)  # type: ignore[arg-type]
             except Exception as e:
@@ -985,6 +1228,95 @@ class Knowledge:
         content.status = ContentStatus.COMPLETED
         await self._aupdate_content(content)
 
+    async def _replace_changed_chunks(self, content: Content, read_documents: List[Document]) -> None:
+        """
+        Diff the chunks of a document against the chunk digests recorded by the previous load.
+
+        Chunks whose text is unchanged are kept in the vector database, removed chunks are deleted
+        and only new or edited chunks are embedded and inserted.
+        """
+        from agno.vectordb import VectorDb
+
+        self.vector_db = cast(VectorDb, self.vector_db)
+
+        previous_digests = set(content.chunk_digests or [])
+        documents_by_digest: Dict[str, Document] = {}
+        for document in read_documents:
+            digest = hashlib.sha256(f"{content.id}:{document.content}".encode()).hexdigest()
+            if digest in documents_by_digest:
+                continue
+            document.id = digest
+            document.meta_data["chunk_digest"] = digest
+            documents_by_digest[digest] = document
+
+        if not previous_digests and self.vector_db.content_hash_exists(content.content_hash):  # type: ignore[arg-type]
+            # Loaded before chunk digests were recorded: replace every chunk once
+            self.vector_db.delete_by_content_id(content.id)  # type: ignore[arg-type]
+
+        removed_digests = previous_digests - documents_by_digest.keys()
+        for digest in removed_digests:
+            self.vector_db.delete_by_metadata({"chunk_digest": digest})
+
+        added_documents = [
+            document for digest, document in documents_by_digest.items() if digest not in previous_digests
+        ]
+        if added_documents:
+            await self.vector_db.async_insert(
+                content.content_hash,  # type: ignore[arg-type]
+                documents=added_documents,
+                filters=content.metadata,  # type: ignore[arg-type]
+            )
+
+        log_debug(
+            f"Incremental load of {content.id}: {len(added_documents)} chunks added, "
+            f"{len(removed_digests)} removed, {len(documents_by_digest) - len(added_documents)} unchanged"
+        )
+        content.chunk_digests = list(documents_by_digest.keys())
+
+    def _compute_file_digest(self, path: Path) -> str:
+        """Compute the sha256 digest of a file, reading it in blocks."""
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    async def _skip_unchanged(self, content: Content, content_digest: str) -> bool:
+        """
+        Compare a content digest with the one recorded by the previous load.
+
+        Sets the new digest on the content and carries over the previous chunk digests, so changed
+        content can be diffed chunk by chunk.
+
+        Returns:
+            bool: True if the content is unchanged and was fully loaded before, False otherwise
+        """
+        from agno.vectordb import VectorDb
+
+        self.vector_db = cast(VectorDb, self.vector_db)
+
+        content.content_digest = content_digest
+        if not self.contents_db or not content.id:
+            return False
+
+        if isinstance(self.contents_db, AsyncBaseDb):
+            previous_row = await self.contents_db.get_knowledge_content(content.id)
+        else:
+            previous_row = self.contents_db.get_knowledge_content(content.id)
+        if previous_row is None:
+            return False
+
+        content.chunk_digests = previous_row.chunk_digests
+        if (
+            previous_row.content_digest == content_digest
+            and previous_row.status == ContentStatus.COMPLETED
+            and self.vector_db
+            and self.vector_db.content_hash_exists(content.content_hash)  # type: ignore[arg-type]
+        ):
+            log_debug(f"Content unchanged: {content.path or content.name}, skipping...")
+            return True
+        return False
+
     async def _load_content(
         self,
         content: Content,
@@ -992,15 +1324,16 @@ class Knowledge:
         skip_if_exists: bool,
         include: Optional[List[str]] = None,
         exclude: Optional[List[str]] = None,
+        incremental: bool = False,
     ) -> None:
         if content.path:
-            await self._load_from_path(content, upsert, skip_if_exists, include, exclude)
+            await self._load_from_path(content, upsert, skip_if_exists, include, exclude, incremental=incremental)
 
         if content.url:
             await self._load_from_url(content, upsert, skip_if_exists)
 
         if content.file_data:
-            await self._load_from_content(content, upsert, skip_if_exists)
+            await self._load_from_content(content, upsert, skip_if_exists, incremental=incremental)
 
         if content.topics:
             await self._load_from_topics(content, upsert, skip_if_exists)
@@ -1115,6 +1448,8 @@ class Knowledge:
                 status_message=safe_status_message,
                 created_at=created_at,
                 updated_at=updated_at,
+                content_digest=content.content_digest,
+                chunk_digests=content.chunk_digests,
             )
             if isinstance(self.contents_db, AsyncBaseDb):
                 await self.contents_db.upsert_knowledge_content(knowledge_row=content_row)
@@ -1160,6 +1495,10 @@ class Knowledge:
                 content_row.external_id = self._ensure_string_field(
                     content.external_id, "content.external_id", default=""
                 )
+            if content.content_digest is not None:
+                content_row.content_digest = content.content_digest
+            if content.chunk_digests is not None:
+                content_row.chunk_digests = content.chunk_digests
             content_row.updated_at = int(time.time())
             self.contents_db.upsert_knowledge_content(knowledge_row=content_row)
 
@@ -1202,6 +1541,10 @@ class Knowledge:
                 content_row.status_message = content.status_message if content.status_message else ""
             if content.external_id is not None:
                 content_row.external_id = content.external_id
+            if content.content_digest is not None:
+                content_row.content_digest = content.content_digest
+            if content.chunk_digests is not None:
+                content_row.chunk_digests = content.chunk_digests
 
             content_row.updated_at = int(time.time())
             if isinstance(self.contents_db, AsyncBaseDb):
@@ -24,6 +24,7 @@ class ArxivReader(Reader):
             ChunkingStrategyType.AGENTIC_CHUNKER,
             ChunkingStrategyType.DOCUMENT_CHUNKER,
             ChunkingStrategyType.RECURSIVE_CHUNKER,
+            ChunkingStrategyType.TOKEN_CHUNKER,
             ChunkingStrategyType.SEMANTIC_CHUNKER,
         ]
 
@@ -1,6 +1,6 @@
 import asyncio
 from dataclasses import dataclass, field
-from typing import Any, List, Optional
+from typing import Any, Iterator, List, Optional
 
 from agno.knowledge.chunking.fixed import FixedSizeChunking
 from agno.knowledge.chunking.strategy import ChunkingStrategy, ChunkingStrategyFactory, ChunkingStrategyType
@@ -62,6 +62,23 @@ class Reader:
     async def async_read(self, obj: Any, name: Optional[str] = None, password: Optional[str] = None) -> List[Document]:
         raise NotImplementedError
 
+    def iter_read(
+        self, obj: Any, name: Optional[str] = None, batch_size: int = 1000, **kwargs
+    ) -> Iterator[List[Document]]:
+        """Read documents in batches, so large inputs can be processed with bounded memory.
+
+        Readers that can parse their input incrementally override this. By default the whole input is read at once.
+
+        Args:
+            obj: The input to read.
+            name: Name of the documents.
+            batch_size: Number of records (e.g. rows) per batch, for readers that stream their input.
+
+        Yields:
+            List[Document]: The documents of each batch.
+        """
+        yield self.read(obj, name=name, **kwargs)
+
     @classmethod
     def get_supported_chunking_strategies(cls) -> List[ChunkingStrategyType]:
         raise NotImplementedError
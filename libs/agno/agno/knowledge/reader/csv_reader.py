@@ -1,8 +1,9 @@
 import asyncio
 import csv
 import io
+from itertools import islice
 from pathlib import Path
-from typing import IO, Any, List, Optional, Union
+from typing import IO, Any, Iterator, List, Optional, Union
 from uuid import uuid4
 
 try:
@@ -33,12 +34,21 @@ class CSVReader(Reader):
             ChunkingStrategyType.AGENTIC_CHUNKER,
             ChunkingStrategyType.DOCUMENT_CHUNKER,
             ChunkingStrategyType.RECURSIVE_CHUNKER,
+            ChunkingStrategyType.TOKEN_CHUNKER,
         ]
 
     @classmethod
     def get_supported_content_types(self) -> List[ContentType]:
         return [ContentType.CSV, ContentType.XLSX, ContentType.XLS]
 
+    @staticmethod
+    def _get_csv_name(file: Union[Path, IO[Any]], name: Optional[str] = None) -> str:
+        if name:
+            return name
+        if isinstance(file, Path):
+            return file.stem
+        return getattr(file, "name", "csv_file").split(".")[0] if hasattr(file, "name") else "csv_file"
+
     def read(
         self, file: Union[Path, IO[Any]], delimiter: str = ",", quotechar: str = '"', name: Optional[str] = None
     ) -> List[Document]:
@@ -53,11 +63,7 @@ class CSVReader(Reader):
                 file.seek(0)
                 file_content = io.StringIO(file.read().decode("utf-8"))  # type: ignore
 
-            csv_name = name or (
-                Path(file.name).stem
-                if isinstance(file, Path)
-                else (getattr(file, "name", "csv_file").split(".")[0] if hasattr(file, "name") else "csv_file")
-            )
+            csv_name = self._get_csv_name(file, name)
             csv_content = ""
             with file_content as csvfile:
                 csv_reader = csv.reader(csvfile, delimiter=delimiter, quotechar=quotechar)
@@ -81,6 +87,79 @@ class CSVReader(Reader):
             log_error(f"Error reading: {getattr(file, 'name', str(file)) if isinstance(file, IO) else file}: {e}")
             return []
 
+    def iter_read(  # type: ignore[override]
+        self,
+        file: Union[Path, IO[Any]],
+        name: Optional[str] = None,
+        batch_size: int = 1000,
+        delimiter: str = ",",
+        quotechar: str = '"',
+    ) -> Iterator[List[Document]]:
+        """
+        Read a CSV file incrementally, yielding the documents of `batch_size` rows at a time.
+
+        Memory stays bounded by the batch size, whatever the size of the file. With RowChunking the chunks are
+        the same as the ones of `read`, numbered across the whole file. Other chunking strategies chunk each
+        batch of rows separately.
+
+        Args:
+            file: Path or file-like object
+            name: Name of the documents
+            batch_size: Number of rows per batch
+            delimiter: CSV delimiter
+            quotechar: CSV quote character
+
+        Yields:
+            List of Document objects for each batch of rows
+        """
+        if isinstance(file, Path):
+            if not file.exists():
+                raise FileNotFoundError(f"Could not find file: {file}")
+            log_debug(f"Reading in batches: {file}")
+            csv_file: IO[str] = file.open(newline="", mode="r", encoding=self.encoding or "utf-8")
+        else:
+            log_debug(f"Reading retrieved file in batches: {name or getattr(file, 'name', 'csv_file')}")
+            file.seek(0)
+            csv_file = io.TextIOWrapper(file, encoding=self.encoding or "utf-8", newline="")  # type: ignore[arg-type]
+
+        csv_name = self._get_csv_name(file, name)
+        # Chunk ids are derived from the id of the file document, as with `read`
+        file_document = Document(name=csv_name, id=str(uuid4()), content="")
+        row_chunking = (
+            self.chunking_strategy if self.chunk and isinstance(self.chunking_strategy, RowChunking) else None
+        )
+        try:
+            csv_reader = csv.reader(csv_file, delimiter=delimiter, quotechar=quotechar)
+            start_row = 1
+            page_number = 1
+            while True:
+                rows = [", ".join(row) for row in islice(csv_reader, batch_size)]
+                if not rows:
+                    break
+
+                if row_chunking is not None:
+                    if row_chunking.skip_header and start_row == 1:
+                        yield row_chunking.chunk_rows(file_document, rows[1:], start_index=2)
+                    else:
+                        yield row_chunking.chunk_rows(file_document, rows, start_index=start_row)
+                else:
+                    page = Document(
+                        name=csv_name,
+                        id=str(uuid4()),
+                        meta_data={"page": page_number, "start_row": start_row, "rows": len(rows)},
+                        content="\n".join(rows),
+                    )
+                    yield self.chunk_document(page) if self.chunk else [page]
+
+                start_row += len(rows)
+                page_number += 1
+        finally:
+            if isinstance(csv_file, io.TextIOWrapper) and not isinstance(file, Path):
+                # Leave the caller's file object open
+                csv_file.detach()
+            else:
+                csv_file.close()
+
     async def async_read(
         self,
         file: Union[Path, IO[Any]],
@@ -114,11 +193,7 @@ class CSVReader(Reader):
                 file.seek(0)
                 file_content_io = io.StringIO(file.read().decode("utf-8"))  # type: ignore
 
-            csv_name = name or (
-                Path(file.name).stem
-                if isinstance(file, Path)
-                else (getattr(file, "name", "csv_file").split(".")[0] if hasattr(file, "name") else "csv_file")
-            )
+            csv_name = self._get_csv_name(file, name)
 
             file_content_io.seek(0)
             csv_reader = csv.reader(file_content_io, delimiter=delimiter, quotechar=quotechar)
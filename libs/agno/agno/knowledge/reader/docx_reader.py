@@ -31,6 +31,7 @@ class DocxReader(Reader):
             ChunkingStrategyType.SEMANTIC_CHUNKER,
             ChunkingStrategyType.AGENTIC_CHUNKER,
             ChunkingStrategyType.RECURSIVE_CHUNKER,
+            ChunkingStrategyType.TOKEN_CHUNKER,
         ]
 
     @classmethod
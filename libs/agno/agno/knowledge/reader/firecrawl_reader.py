@@ -51,6 +51,7 @@ class FirecrawlReader(Reader):
             ChunkingStrategyType.AGENTIC_CHUNKER,
             ChunkingStrategyType.DOCUMENT_CHUNKER,
             ChunkingStrategyType.RECURSIVE_CHUNKER,
+            ChunkingStrategyType.TOKEN_CHUNKER,
         ]
 
     @classmethod
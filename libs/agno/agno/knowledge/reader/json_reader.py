@@ -1,8 +1,9 @@
 import asyncio
 import json
-from io import BytesIO
+import re
+from io import BytesIO, TextIOWrapper
 from pathlib import Path
-from typing import IO, Any, List, Optional, Union
+from typing import IO, Any, Iterator, List, Optional, Union
 from uuid import uuid4
 
 from agno.knowledge.chunking.fixed import FixedSizeChunking
@@ -12,6 +13,92 @@ from agno.knowledge.reader.base import Reader
 from agno.knowledge.types import ContentType
 from agno.utils.log import log_debug, log_error
 
+_WHITESPACE = re.compile(r"\s*")
+# Characters that can continue a number, e.g. when "1." or "1e" is all that was read of "1.5" or "1e-3"
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+
+
+def _iter_json_items(stream: IO[str], read_size: int = 64 * 1024) -> Iterator[Any]:
+    """Yield the items of a top-level JSON array one at a time, reading the stream incrementally.
+
+    Only the item being parsed is kept in memory. A top-level value that is not an array is parsed whole
+    and yielded as a single item.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    eof = False
+
+    def read_more(size: int) -> None:
+        nonlocal buffer, pos, eof
+        data = stream.read(size)
+        if not data:
+            eof = True
+            return
+        buffer = buffer[pos:] + data
+        pos = 0
+
+    def skip_whitespace() -> bool:
+        """Move to the next non-whitespace character, returning False at the end of the stream."""
+        nonlocal pos
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()  # type: ignore[union-attr]
+            if pos < len(buffer):
+                return True
+            if eof:
+                return False
+            read_more(read_size)
+
+    if not skip_whitespace():
+        return
+    if buffer[pos] != "[":
+        yield json.loads(buffer[pos:] + stream.read())
+        return
+
+    pos += 1
+    expect_item = True
+    is_first = True
+    size = read_size
+    while True:
+        if not skip_whitespace():
+            raise ValueError("Unexpected end of JSON array")
+        char = buffer[pos]
+        if char == "]":
+            if expect_item and not is_first:
+                raise ValueError("Trailing comma in JSON array")
+            return
+        if not expect_item:
+            if char != ",":
+                raise ValueError(f"Expected ',' or ']' in JSON array, got {char!r}")
+            pos += 1
+            expect_item = True
+            continue
+
+        try:
+            item, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            # The item continues in the next block: read bigger blocks so large items are not re-parsed too often
+            read_more(size)
+            size *= 2
+            continue
+        if (
+            isinstance(item, (int, float))
+            and not isinstance(item, bool)
+            and not eof
+            and (end >= len(buffer) or buffer[end] in _NUMBER_CHARS)
+        ):
+            # A number at the end of the buffer may continue in the next block
+            read_more(size)
+            continue
+
+        yield item
+        pos = end
+        expect_item = False
+        is_first = False
+        size = read_size
+
 
 class JSONReader(Reader):
     """Reader for JSON files"""
@@ -29,6 +116,7 @@ class JSONReader(Reader):
             ChunkingStrategyType.AGENTIC_CHUNKER,
             ChunkingStrategyType.DOCUMENT_CHUNKER,
             ChunkingStrategyType.RECURSIVE_CHUNKER,
+            ChunkingStrategyType.TOKEN_CHUNKER,
             ChunkingStrategyType.SEMANTIC_CHUNKER,
         ]
 
@@ -76,6 +164,57 @@ class JSONReader(Reader):
             log_error(f"Error reading: {path}: {e}")
             raise
 
+    def iter_read(  # type: ignore[override]
+        self, path: Union[Path, IO[Any]], name: Optional[str] = None, batch_size: int = 1000
+    ) -> Iterator[List[Document]]:
+        """Read a JSON file incrementally, yielding the documents of `batch_size` items at a time.
+
+        The items of a top-level array are parsed one at a time, so memory stays bounded by the batch size.
+
+        Args:
+            path (Union[Path, IO[Any]]): Path to a JSON file or a file-like object
+            name (Optional[str]): Name of the documents
+            batch_size (int): Number of items per batch
+
+        Yields:
+            List[Document]: The documents of each batch
+        """
+        if isinstance(path, Path):
+            if not path.exists():
+                raise FileNotFoundError(f"Could not find file: {path}")
+            log_debug(f"Reading in batches: {path}")
+            json_name = name or path.name.split(".")[0]
+            stream: IO[str] = path.open(mode="r", encoding=self.encoding or "utf-8")
+        elif isinstance(path, BytesIO):
+            json_name = name or path.name.split(".")[0]
+            log_debug(f"Reading uploaded file in batches: {json_name}")
+            path.seek(0)
+            stream = TextIOWrapper(path, encoding=self.encoding or "utf-8")
+        else:
+            raise ValueError("Unsupported file type. Must be Path or BytesIO.")
+
+        try:
+            documents: List[Document] = []
+            for page_number, content in enumerate(_iter_json_items(stream), start=1):
+                document = Document(
+                    name=json_name,
+                    id=str(uuid4()),
+                    meta_data={"page": page_number},
+                    content=json.dumps(content),
+                )
+                documents.extend(self.chunk_document(document) if self.chunk else [document])
+                if page_number % batch_size == 0:
+                    yield documents
+                    documents = []
+            if documents:
+                yield documents
+        finally:
+            if isinstance(stream, TextIOWrapper) and not isinstance(path, Path):
+                # Leave the caller's file object open
+                stream.detach()
+            else:
+                stream.close()
+
     async def async_read(self, path: Union[Path, IO[Any]], name: Optional[str] = None) -> List[Document]:
         """Asynchronously read JSON files.
 
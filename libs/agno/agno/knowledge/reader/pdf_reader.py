@@ -208,6 +208,7 @@ class BasePDFReader(Reader):
             ChunkingStrategyType.AGENTIC_CHUNKER,
             ChunkingStrategyType.SEMANTIC_CHUNKER,
             ChunkingStrategyType.RECURSIVE_CHUNKER,
+            ChunkingStrategyType.TOKEN_CHUNKER,
         ]
 
     def _build_chunked_documents(self, documents: List[Document]) -> List[Document]:
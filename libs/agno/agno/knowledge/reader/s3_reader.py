@@ -42,6 +42,7 @@ class S3Reader(Reader):
             ChunkingStrategyType.AGENTIC_CHUNKER,
             ChunkingStrategyType.DOCUMENT_CHUNKER,
             ChunkingStrategyType.RECURSIVE_CHUNKER,
+            ChunkingStrategyType.TOKEN_CHUNKER,
             ChunkingStrategyType.SEMANTIC_CHUNKER,
         ]
 
@@ -25,6 +25,7 @@ class TextReader(Reader):
             ChunkingStrategyType.AGENTIC_CHUNKER,
             ChunkingStrategyType.DOCUMENT_CHUNKER,
             ChunkingStrategyType.RECURSIVE_CHUNKER,
+            ChunkingStrategyType.TOKEN_CHUNKER,
             ChunkingStrategyType.SEMANTIC_CHUNKER,
         ]
 
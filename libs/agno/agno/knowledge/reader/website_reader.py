@@ -1,9 +1,14 @@
 import asyncio
-import random
+import json
+import sqlite3
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple
-from urllib.parse import urljoin, urlparse
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+from urllib.parse import urldefrag, urljoin, urlparse, urlsplit, urlunsplit
+from urllib.robotparser import RobotFileParser
 
 import httpx
 
@@ -20,6 +25,121 @@ except ImportError:
     raise ImportError("The `bs4` package is not installed. Please install it via `pip install beautifulsoup4`.")
 
 
+def _strip_fragment(url: str) -> str:
+    return urldefrag(url)[0]
+
+
+def _normalize_url(url: str) -> str:
+    """Normalize a URL for deduplication: lowercase scheme and host, no default port, fragment or empty path."""
+    parsed = urlsplit(url)
+    scheme = parsed.scheme.lower()
+    netloc = parsed.netloc.lower()
+    if (scheme == "http" and netloc.endswith(":80")) or (scheme == "https" and netloc.endswith(":443")):
+        netloc = netloc.rsplit(":", 1)[0]
+    return urlunsplit((scheme, netloc, parsed.path or "/", parsed.query, ""))
+
+
+@dataclass
+class CrawlStats:
+    """Counters of the last crawl of a WebsiteReader"""
+
+    # Pages downloaded and parsed
+    fetched: int = 0
+    # Pages revalidated as unchanged, left out of the results
+    unchanged: int = 0
+    disallowed: int = 0
+    errors: int = 0
+
+
+@dataclass
+class _CachedPage:
+    """Validators of a crawled page, kept for revalidation on the next crawl"""
+
+    links: List[str]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class _PageCache:
+    """ETag/Last-Modified validators and links of crawled pages, evicting the least recently used beyond `max_pages`.
+
+    Kept in a SQLite file when `db_file` is set, so pages are revalidated across restarts, otherwise in memory.
+    """
+
+    def __init__(self, db_file: Optional[str], max_pages: int):
+        self.db_file = db_file
+        self.max_pages = max_pages
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            if self.db_file is not None:
+                Path(self.db_file).parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(
+                self.db_file or ":memory:", check_same_thread=False, isolation_level=None, timeout=30
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS website_pages ("
+                "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, links TEXT NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_website_pages_accessed_at ON website_pages(accessed_at)"
+            )
+        return self._connection
+
+    def get(self, url: str) -> Optional[_CachedPage]:
+        with self._lock:
+            try:
+                row = self.connection.execute(
+                    "SELECT etag, last_modified, links FROM website_pages WHERE url = ?", (url,)
+                ).fetchone()
+                if row is None:
+                    return None
+                self.connection.execute("UPDATE website_pages SET accessed_at = ? WHERE url = ?", (time.time(), url))
+            except sqlite3.Error as e:
+                log_warning(f"Error reading from the website page cache: {e}")
+                return None
+        return _CachedPage(links=json.loads(row[2]), etag=row[0], last_modified=row[1])
+
+    def set(self, url: str, page: _CachedPage) -> None:
+        with self._lock:
+            try:
+                connection = self.connection
+                connection.execute(
+                    "INSERT OR REPLACE INTO website_pages (url, etag, last_modified, links, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (url, page.etag, page.last_modified, json.dumps(page.links), time.time()),
+                )
+                connection.execute(
+                    "DELETE FROM website_pages WHERE url IN "
+                    "(SELECT url FROM website_pages ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_pages,),
+                )
+            except sqlite3.Error as e:
+                log_warning(f"Error writing to the website page cache: {e}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.connection.execute("SELECT COUNT(*) FROM website_pages").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class _HostState:
+    """Per-host politeness state of a crawl"""
+
+    def __init__(self, semaphore: asyncio.Semaphore):
+        self.semaphore = semaphore
+        self.next_request_at = 0.0
+        self.robots_lock = asyncio.Lock()
+
+
 @dataclass
 class WebsiteReader(Reader):
     """Reader for Websites"""
@@ -28,7 +148,6 @@ class WebsiteReader(Reader):
     max_links: int = 10
 
     _visited: Set[str] = field(default_factory=set)
-    _urls_to_crawl: List[Tuple[str, int]] = field(default_factory=list)
 
     def __init__(
         self,
@@ -37,16 +156,56 @@ class WebsiteReader(Reader):
         max_links: int = 10,
         timeout: int = 10,
         proxy: Optional[str] = None,
+        max_concurrency: int = 10,
+        max_concurrency_per_host: int = 2,
+        politeness_delay: float = 1.0,
+        respect_robots_txt: bool = True,
+        robots_ttl: int = 3600,
+        revalidate: bool = True,
+        page_cache_file: Optional[str] = None,
+        max_cached_pages: int = 10_000,
+        user_agent: Optional[str] = None,
         **kwargs,
     ):
+        """
+        Args:
+            max_depth: Maximum link depth to crawl from the starting URL.
+            max_links: Maximum number of pages to return.
+            timeout: Timeout of each request, in seconds.
+            proxy: Proxy to send the requests through.
+            max_concurrency: Maximum number of requests in flight, over one connection pool.
+            max_concurrency_per_host: Maximum number of requests in flight to the same host.
+            politeness_delay: Minimum seconds between two requests to the same host. A larger robots.txt
+                Crawl-delay takes precedence.
+            respect_robots_txt: Skip the pages disallowed by robots.txt.
+            robots_ttl: Seconds a fetched robots.txt is cached for.
+            revalidate: Revalidate pages crawled before with their ETag/Last-Modified. Unchanged pages are
+                left out of the results, so they are not embedded again.
+            page_cache_file: SQLite file storing the validators of the crawled pages, so they are revalidated
+                after a restart. If not set, the validators are only kept in memory.
+            max_cached_pages: Maximum number of pages whose validators are kept.
+            user_agent: User-Agent sent with the requests and matched against robots.txt.
+        """
         super().__init__(chunking_strategy=chunking_strategy, **kwargs)
         self.max_depth = max_depth
         self.max_links = max_links
         self.proxy = proxy
         self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.max_concurrency_per_host = max_concurrency_per_host
+        self.politeness_delay = politeness_delay
+        self.respect_robots_txt = respect_robots_txt
+        self.robots_ttl = robots_ttl
+        self.revalidate = revalidate
+        self.page_cache_file = page_cache_file
+        self.max_cached_pages = max_cached_pages
+        self.user_agent = user_agent
+        self.crawl_stats = CrawlStats()
 
         self._visited = set()
-        self._urls_to_crawl = []
+        self._hosts: Dict[str, _HostState] = {}
+        self._robots_cache: Dict[str, Tuple[Optional[RobotFileParser], float]] = {}
+        self._page_cache = _PageCache(db_file=page_cache_file, max_pages=max_cached_pages)
 
     @classmethod
     def get_supported_chunking_strategies(self) -> List[ChunkingStrategyType]:
@@ -55,6 +214,7 @@ class WebsiteReader(Reader):
             ChunkingStrategyType.AGENTIC_CHUNKER,
             ChunkingStrategyType.DOCUMENT_CHUNKER,
             ChunkingStrategyType.RECURSIVE_CHUNKER,
+            ChunkingStrategyType.TOKEN_CHUNKER,
             ChunkingStrategyType.SEMANTIC_CHUNKER,
             ChunkingStrategyType.FIXED_SIZE_CHUNKER,
         ]
@@ -63,26 +223,6 @@ class WebsiteReader(Reader):
     def get_supported_content_types(self) -> List[ContentType]:
         return [ContentType.URL]
 
-    def delay(self, min_seconds=1, max_seconds=3):
-        """
-        Introduce a random delay.
-
-        :param min_seconds: Minimum number of seconds to delay. Default is 1.
-        :param max_seconds: Maximum number of seconds to delay. Default is 3.
-        """
-        sleep_time = random.uniform(min_seconds, max_seconds)
-        time.sleep(sleep_time)
-
-    async def async_delay(self, min_seconds=1, max_seconds=3):
-        """
-        Introduce a random delay asynchronously.
-
-        :param min_seconds: Minimum number of seconds to delay. Default is 1.
-        :param max_seconds: Maximum number of seconds to delay. Default is 3.
-        """
-        sleep_time = random.uniform(min_seconds, max_seconds)
-        await asyncio.sleep(sleep_time)
-
     def _get_primary_domain(self, url: str) -> str:
         """
         Extract primary domain from the given URL.
@@ -142,6 +282,9 @@ class WebsiteReader(Reader):
         """
         Crawls a website and returns a dictionary of URLs and their corresponding content.
 
+        Runs the concurrent crawler of `async_crawl` on an event loop, in a separate thread if this thread
+        already runs one.
+
         Parameters:
         - url (str): The starting URL to begin the crawl.
         - starting_depth (int, optional): The starting depth level for the crawl. Defaults to 1.
@@ -153,112 +296,24 @@ class WebsiteReader(Reader):
         Raises:
         - httpx.HTTPStatusError: If there's an HTTP status error.
         - httpx.RequestError: If there's a request-related error (connection, timeout, etc).
-
-        Note:
-        The function focuses on extracting the main content by prioritizing content inside common HTML tags
-        like `<article>`, `<main>`, and `<div>` with class names such as "content", "main-content", etc.
-        The crawler will also respect the `max_depth` attribute of the WebCrawler class, ensuring it does not
-        crawl deeper than the specified depth.
         """
-        num_links = 0
-        crawler_result: Dict[str, str] = {}
-        primary_domain = self._get_primary_domain(url)
-        # Add starting URL with its depth to the global list
-        self._urls_to_crawl.append((url, starting_depth))
-        while self._urls_to_crawl:
-            # Unpack URL and depth from the global list
-            current_url, current_depth = self._urls_to_crawl.pop(0)
-
-            # Skip if
-            # - URL is already visited
-            # - does not end with the primary domain,
-            # - exceeds max depth
-            # - exceeds max links
-            if (
-                current_url in self._visited
-                or not urlparse(current_url).netloc.endswith(primary_domain)
-                or (current_depth > self.max_depth and current_url != url)
-                or num_links >= self.max_links
-            ):
-                continue
-
-            self._visited.add(current_url)
-            self.delay()
-
-            try:
-                log_debug(f"Crawling: {current_url}")
-
-                response = (
-                    httpx.get(current_url, timeout=self.timeout, proxy=self.proxy, follow_redirects=True)
-                    if self.proxy
-                    else httpx.get(current_url, timeout=self.timeout, follow_redirects=True)
-                )
-                response.raise_for_status()
-
-                soup = BeautifulSoup(response.content, "html.parser")
-
-                # Extract main content
-                main_content = self._extract_main_content(soup)
-                if main_content:
-                    crawler_result[current_url] = main_content
-                    num_links += 1
-
-                # Add found URLs to the global list, with incremented depth
-                for link in soup.find_all("a", href=True):
-                    if not isinstance(link, Tag):
-                        continue
-
-                    href_str = str(link["href"])
-                    full_url = urljoin(current_url, href_str)
-
-                    if not isinstance(full_url, str):
-                        continue
-
-                    parsed_url = urlparse(full_url)
-                    if parsed_url.netloc.endswith(primary_domain) and not any(
-                        parsed_url.path.endswith(ext) for ext in [".pdf", ".jpg", ".png"]
-                    ):
-                        full_url_str = str(full_url)
-                        if (
-                            full_url_str not in self._visited
-                            and (full_url_str, current_depth + 1) not in self._urls_to_crawl
-                        ):
-                            self._urls_to_crawl.append((full_url_str, current_depth + 1))
-
-            except httpx.HTTPStatusError as e:
-                # Log HTTP status errors but continue crawling other pages
-                # Skip redirect errors (3xx) as they should be handled by follow_redirects
-                if e.response.status_code >= 300 and e.response.status_code < 400:
-                    log_debug(f"Redirect encountered for {current_url}, skipping: {e}")
-                else:
-                    log_warning(f"HTTP status error while crawling {current_url}: {e}")
-                # For the initial URL, we should raise the error only if it's not a redirect
-                if current_url == url and not crawler_result and not (300 <= e.response.status_code < 400):
-                    raise
-            except httpx.RequestError as e:
-                # Log request errors but continue crawling other pages
-                log_warning(f"Request error while crawling {current_url}: {e}")
-                # For the initial URL, we should raise the error
-                if current_url == url and not crawler_result:
-                    raise
-            except Exception as e:
-                # Log other exceptions but continue crawling other pages
-                log_warning(f"Failed to crawl {current_url}: {e}")
-                # For the initial URL, we should raise the error
-                if current_url == url and not crawler_result:
-                    # Wrap non-HTTP exceptions in a RequestError
-                    raise httpx.RequestError(f"Failed to crawl starting URL {url}: {str(e)}", request=None) from e
-
-        # If we couldn't crawl any pages, raise an error
-        if not crawler_result:
-            raise httpx.RequestError(f"Failed to extract any content from {url}", request=None)
-
-        return crawler_result
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.async_crawl(url, starting_depth))
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, self.async_crawl(url, starting_depth)).result()
 
     async def async_crawl(self, url: str, starting_depth: int = 1) -> Dict[str, str]:
         """
         Asynchronously crawls a website and returns a dictionary of URLs and their corresponding content.
 
+        Pages are crawled breadth-first, fetching up to `max_concurrency` pages at once over one connection pool,
+        with at most `max_concurrency_per_host` requests and one request every `politeness_delay` seconds per host.
+        robots.txt is honoured and cached per host. Pages crawled before are revalidated with their ETag or
+        Last-Modified date: unchanged pages are not downloaded again and are left out of the results, only
+        their links are followed.
+
         Parameters:
         - url (str): The starting URL to begin the crawl.
         - starting_depth (int, optional): The starting depth level for the crawl. Defaults to 1.
@@ -271,93 +326,200 @@ class WebsiteReader(Reader):
         - httpx.HTTPStatusError: If there's an HTTP status error.
         - httpx.RequestError: If there's a request-related error (connection, timeout, etc).
         """
-        num_links = 0
-        crawler_result: Dict[str, str] = {}
         primary_domain = self._get_primary_domain(url)
-
-        # Clear previously visited URLs and URLs to crawl
         self._visited = set()
-        self._urls_to_crawl = [(url, starting_depth)]
-
-        client_args = {"proxy": self.proxy} if self.proxy else {}
-        async with httpx.AsyncClient(**client_args) as client:  # type: ignore
-            while self._urls_to_crawl and num_links < self.max_links:
-                current_url, current_depth = self._urls_to_crawl.pop(0)
-
-                if (
-                    current_url in self._visited
-                    or not urlparse(current_url).netloc.endswith(primary_domain)
-                    or current_depth > self.max_depth
-                    or num_links >= self.max_links
-                ):
-                    continue
-
-                self._visited.add(current_url)
-                await self.async_delay()
-
-                try:
-                    log_debug(f"Crawling asynchronously: {current_url}")
-                    response = await client.get(current_url, timeout=self.timeout, follow_redirects=True)
-                    response.raise_for_status()
-
-                    soup = BeautifulSoup(response.content, "html.parser")
-
-                    # Extract main content
-                    main_content = self._extract_main_content(soup)
-                    if main_content:
-                        crawler_result[current_url] = main_content
-                        num_links += 1
-
-                    # Add found URLs to the list, with incremented depth
-                    for link in soup.find_all("a", href=True):
-                        if not isinstance(link, Tag):
-                            continue
-
-                        href_str = str(link["href"])
-                        full_url = urljoin(current_url, href_str)
-
-                        if not isinstance(full_url, str):
-                            continue
-
-                        parsed_url = urlparse(full_url)
-                        if parsed_url.netloc.endswith(primary_domain) and not any(
-                            parsed_url.path.endswith(ext) for ext in [".pdf", ".jpg", ".png"]
-                        ):
-                            full_url_str = str(full_url)
-                            if (
-                                full_url_str not in self._visited
-                                and (full_url_str, current_depth + 1) not in self._urls_to_crawl
-                            ):
-                                self._urls_to_crawl.append((full_url_str, current_depth + 1))
-
-                except httpx.HTTPStatusError as e:
-                    # Log HTTP status errors but continue crawling other pages
-                    log_warning(f"HTTP status error while crawling asynchronously {current_url}: {e}")
-                    # For the initial URL, we should raise the error
-                    if current_url == url and not crawler_result:
-                        raise
-                except httpx.RequestError as e:
-                    # Log request errors but continue crawling other pages
-                    log_warning(f"Request error while crawling asynchronously {current_url}: {e}")
-                    # For the initial URL, we should raise the error
-                    if current_url == url and not crawler_result:
-                        raise
-                except Exception as e:
-                    # Log other exceptions but continue crawling other pages
-                    log_warning(f"Failed to crawl asynchronously {current_url}: {e}")
-                    # For the initial URL, we should raise the error
-                    if current_url == url and not crawler_result:
-                        # Wrap non-HTTP exceptions in a RequestError
-                        raise httpx.RequestError(
-                            f"Failed to crawl starting URL {url} asynchronously: {str(e)}", request=None
-                        ) from e
+        self.crawl_stats = CrawlStats()
+        self._hosts = {}
+
+        # Results are kept in discovery order, so the pages kept under max_links don't depend on timing.
+        # Unchanged pages count towards max_links, with no content.
+        crawled: Dict[int, Tuple[str, Optional[str]]] = {}
+        discovered: Dict[str, int] = {}
+
+        def discover(page_url: str) -> bool:
+            key = _normalize_url(page_url)
+            if key in discovered:
+                return False
+            discovered[key] = len(discovered)
+            self._visited.add(page_url)
+            return True
+
+        client_args: Dict[str, Any] = {"proxy": self.proxy} if self.proxy else {}
+        limits = httpx.Limits(max_connections=self.max_concurrency, max_keepalive_connections=self.max_concurrency)
+        headers = {"User-Agent": self.user_agent} if self.user_agent else {}
+        async with httpx.AsyncClient(
+            limits=limits, headers=headers, timeout=self.timeout, follow_redirects=True, **client_args
+        ) as client:
+            # The starting URL is crawled first: its errors are raised to the caller
+            start_url = _strip_fragment(url)
+            discover(start_url)
+            try:
+                page = await self._crawl_page(client, start_url)
+            except httpx.HTTPStatusError as e:
+                log_warning(f"HTTP status error while crawling asynchronously {start_url}: {e}")
+                raise
+            except httpx.RequestError as e:
+                log_warning(f"Request error while crawling asynchronously {start_url}: {e}")
+                raise
+            except Exception as e:
+                log_warning(f"Failed to crawl asynchronously {start_url}: {e}")
+                raise httpx.RequestError(
+                    f"Failed to crawl starting URL {url} asynchronously: {str(e)}", request=None
+                ) from e
+
+            level: List[str] = []
+            if page is not None:
+                content, links = page
+                if content is None or content:
+                    crawled[0] = (start_url, content)
+                level = [link for link in self._filter_links(links, primary_domain) if discover(link)]
+
+            depth = starting_depth + 1
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def crawl_link(link: str) -> Optional[Tuple[Optional[str], List[str]]]:
+                async with semaphore:
+                    if len(crawled) >= self.max_links:
+                        return None
+                    try:
+                        return await self._crawl_page(client, link)
+                    except httpx.HTTPStatusError as e:
+                        log_warning(f"HTTP status error while crawling asynchronously {link}: {e}")
+                    except httpx.RequestError as e:
+                        log_warning(f"Request error while crawling asynchronously {link}: {e}")
+                    except Exception as e:
+                        log_warning(f"Failed to crawl asynchronously {link}: {e}")
+                    self.crawl_stats.errors += 1
+                    return None
+
+            while level and depth <= self.max_depth and len(crawled) < self.max_links:
+                pages = await asyncio.gather(*[crawl_link(link) for link in level])
+                next_level: List[str] = []
+                for link, page in zip(level, pages):
+                    if page is None:
+                        continue
+                    content, links = page
+                    if content is None or content:
+                        crawled[discovered[_normalize_url(link)]] = (link, content)
+                    next_level.extend(link for link in self._filter_links(links, primary_domain) if discover(link))
+                level = next_level
+                depth += 1
+
+        kept_pages = [crawled[index] for index in sorted(crawled)[: self.max_links]]
+        crawler_result = {page_url: content for page_url, content in kept_pages if content is not None}
+        log_debug(
+            f"Crawled {len(kept_pages)} pages from {url}: {self.crawl_stats.fetched} fetched, "
+            f"{self.crawl_stats.unchanged} unchanged, {self.crawl_stats.disallowed} disallowed by robots.txt"
+        )
 
         # If we couldn't crawl any pages, raise an error
-        if not crawler_result:
+        if not kept_pages:
             raise httpx.RequestError(f"Failed to extract any content from {url} asynchronously", request=None)
 
         return crawler_result
 
+    def _filter_links(self, links: List[str], primary_domain: str) -> List[str]:
+        """Keep the links to pages of the crawled domain."""
+        filtered = []
+        for link in links:
+            parsed_url = urlparse(link)
+            if parsed_url.scheme not in ("http", "https"):
+                continue
+            if parsed_url.netloc.endswith(primary_domain) and not any(
+                parsed_url.path.endswith(ext) for ext in [".pdf", ".jpg", ".png"]
+            ):
+                filtered.append(link)
+        return filtered
+
+    def _get_host(self, url: str) -> "_HostState":
+        host = urlparse(url).netloc.lower()
+        state = self._hosts.get(host)
+        if state is None:
+            state = _HostState(asyncio.Semaphore(self.max_concurrency_per_host))
+            self._hosts[host] = state
+        return state
+
+    async def _wait_for_turn(self, host: "_HostState", delay: float) -> None:
+        """Space the requests to a host by at least `delay` seconds."""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        start_at = max(now, host.next_request_at)
+        host.next_request_at = start_at + delay
+        if start_at > now:
+            await asyncio.sleep(start_at - now)
+
+    async def _get_robots(self, client: httpx.AsyncClient, url: str) -> Optional[RobotFileParser]:
+        """Get the parsed robots.txt of the host of a URL, fetching it at most once per `robots_ttl` seconds."""
+        parsed = urlparse(url)
+        origin = f"{parsed.scheme}://{parsed.netloc.lower()}"
+        host = self._get_host(url)
+        async with host.robots_lock:
+            cached = self._robots_cache.get(origin)
+            if cached is not None and time.monotonic() - cached[1] < self.robots_ttl:
+                return cached[0]
+
+            robots: Optional[RobotFileParser] = None
+            try:
+                response = await client.get(f"{origin}/robots.txt")
+                if response.status_code == 200:
+                    robots = RobotFileParser()
+                    robots.parse(response.text.splitlines())
+            except httpx.HTTPError as e:
+                log_debug(f"Could not fetch robots.txt of {origin}: {e}")
+            self._robots_cache[origin] = (robots, time.monotonic())
+            return robots
+
+    async def _crawl_page(self, client: httpx.AsyncClient, url: str) -> Optional[Tuple[Optional[str], List[str]]]:
+        """Fetch a page and return its main content and links, or None if robots.txt disallows it.
+
+        The content is None if the page is unchanged since the previous crawl.
+        """
+        delay = self.politeness_delay
+        if self.respect_robots_txt:
+            robots = await self._get_robots(client, url)
+            if robots is not None:
+                if not robots.can_fetch(self.user_agent or "*", url):
+                    log_debug(f"Skipping {url}, disallowed by robots.txt")
+                    self.crawl_stats.disallowed += 1
+                    return None
+                crawl_delay = robots.crawl_delay(self.user_agent or "*")
+                if crawl_delay is not None:
+                    delay = max(delay, float(crawl_delay))
+
+        cached = self._page_cache.get(url) if self.revalidate else None
+        request_headers: Dict[str, str] = {}
+        if cached is not None:
+            if cached.etag:
+                request_headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                request_headers["If-Modified-Since"] = cached.last_modified
+
+        host = self._get_host(url)
+        async with host.semaphore:
+            await self._wait_for_turn(host, delay)
+            log_debug(f"Crawling asynchronously: {url}")
+            response = await client.get(url, headers=request_headers)
+
+        if response.status_code == 304 and cached is not None:
+            self.crawl_stats.unchanged += 1
+            return None, cached.links
+        response.raise_for_status()
+        self.crawl_stats.fetched += 1
+
+        soup = BeautifulSoup(response.content, "html.parser")
+        links = []
+        for link in soup.find_all("a", href=True):
+            if isinstance(link, Tag):
+                links.append(_strip_fragment(urljoin(str(response.url), str(link["href"]))))
+        # Extract main content
+        content = self._extract_main_content(soup)
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if self.revalidate and (etag or last_modified):
+            self._page_cache.set(url, _CachedPage(links=links, etag=etag, last_modified=last_modified))
+        return content, links
+
     def read(self, url: str, name: Optional[str] = None) -> List[Document]:
         """
         Reads a website and returns a list of documents.
@@ -30,6 +30,7 @@ def _get_chunker_class(strategy_type):
         ChunkingStrategyType.MARKDOWN_CHUNKER: lambda: _import_class(
             "agno.knowledge.chunking.markdown", "MarkdownChunking"
         ),
+        ChunkingStrategyType.TOKEN_CHUNKER: lambda: _import_class("agno.knowledge.chunking.tokens", "TokenChunking"),
     }
 
     if strategy_type not in strategy_class_mapping:
@@ -0,0 +1,264 @@
+import math
+import sqlite3
+import threading
+from array import array
+from dataclasses import dataclass, field
+from hashlib import sha256
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from agno.db.schemas import UserMemory
+from agno.knowledge.embedder.base import Embedder
+from agno.utils.log import log_debug, log_warning
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+
+@dataclass
+class _UserIndex:
+    """Embeddings of the memories of a single user"""
+
+    # memory_id -> (digest of the embedded text, normalized embedding)
+    entries: Dict[str, Tuple[str, List[float]]] = field(default_factory=dict)
+    # Matrix of the normalized embeddings, rebuilt lazily after a change
+    memory_ids: List[str] = field(default_factory=list)
+    matrix: Optional[object] = None
+
+
+class MemoryIndex:
+    """Vector index of user memories, used for semantic memory retrieval.
+
+    Memories are embedded once and kept in one matrix per user, so searching only embeds the query.
+    With db_file set, the embeddings are also stored in a SQLite file and loaded from it on the first
+    search of each user, so they are not computed again after a restart.
+
+    Args:
+        embedder: The embedder used for the memories and the queries.
+        db_file: Path to the SQLite file storing the embeddings. If not set, the index only lives in memory.
+    """
+
+    def __init__(self, embedder: Embedder, db_file: Optional[str] = None):
+        self.embedder = embedder
+        self.db_file = db_file
+        self._users: Dict[str, _UserIndex] = {}
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @staticmethod
+    def get_memory_text(memory: UserMemory) -> str:
+        """The text embedded for a memory: its content followed by its topics."""
+        if memory.topics:
+            return f"{memory.memory}\nTopics: {', '.join(memory.topics)}"
+        return memory.memory
+
+    @staticmethod
+    def _digest(text: str) -> str:
+        return sha256(text.encode("utf-8", errors="surrogatepass")).hexdigest()
+
+    @property
+    def _embedder_key(self) -> str:
+        """Identifies the embedder, so embeddings stored by another embedder are not used."""
+        return f"{self.embedder.__class__.__name__}:{getattr(self.embedder, 'id', None)}:{self.embedder.dimensions}"
+
+    @property
+    def connection(self) -> Optional[sqlite3.Connection]:
+        if self.db_file is None:
+            return None
+        if self._connection is None:
+            Path(self.db_file).parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.db_file, check_same_thread=False, isolation_level=None)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS memory_embeddings ("
+                "user_id TEXT NOT NULL, memory_id TEXT NOT NULL, embedder TEXT NOT NULL, "
+                "text_digest TEXT NOT NULL, embedding BLOB NOT NULL, PRIMARY KEY (user_id, memory_id))"
+            )
+        return self._connection
+
+    def _get_user_index(self, user_id: str) -> _UserIndex:
+        """Get the index of a user, loading their stored embeddings the first time. Must hold the lock."""
+        user_index = self._users.get(user_id)
+        if user_index is not None:
+            return user_index
+
+        user_index = _UserIndex()
+        connection = self.connection
+        if connection is not None:
+            try:
+                rows = connection.execute(
+                    "SELECT memory_id, text_digest, embedding FROM memory_embeddings WHERE user_id = ? AND embedder = ?",
+                    (user_id, self._embedder_key),
+                ).fetchall()
+                for memory_id, text_digest, embedding in rows:
+                    user_index.entries[memory_id] = (text_digest, array("d", embedding).tolist())
+                if rows:
+                    log_debug(f"Loaded {len(rows)} memory embeddings of user {user_id} from {self.db_file}")
+            except sqlite3.Error as e:
+                log_warning(f"Error reading memory embeddings from {self.db_file}: {e}")
+        self._users[user_id] = user_index
+        return user_index
+
+    def _store(self, user_id: str, entries: Iterable[Tuple[str, str, List[float]]]) -> None:
+        """Store (memory_id, text_digest, embedding) entries of a user in the db file. Must hold the lock."""
+        connection = self.connection
+        if connection is None:
+            return
+        try:
+            connection.executemany(
+                "INSERT OR REPLACE INTO memory_embeddings (user_id, memory_id, embedder, text_digest, embedding) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (user_id, memory_id, self._embedder_key, text_digest, array("d", embedding).tobytes())
+                    for memory_id, text_digest, embedding in entries
+                ],
+            )
+        except sqlite3.Error as e:
+            log_warning(f"Error storing memory embeddings in {self.db_file}: {e}")
+
+    def _delete(self, user_id: Optional[str], memory_ids: Optional[List[str]] = None) -> None:
+        """Delete stored embeddings: the given memories of a user, all memories of a user, or everything."""
+        connection = self.connection
+        if connection is None:
+            return
+        try:
+            if user_id is None:
+                connection.execute("DELETE FROM memory_embeddings")
+            elif memory_ids is None:
+                connection.execute("DELETE FROM memory_embeddings WHERE user_id = ?", (user_id,))
+            else:
+                connection.executemany(
+                    "DELETE FROM memory_embeddings WHERE user_id = ? AND memory_id = ?",
+                    [(user_id, memory_id) for memory_id in memory_ids],
+                )
+        except sqlite3.Error as e:
+            log_warning(f"Error deleting memory embeddings from {self.db_file}: {e}")
+
+    def _embed(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """Embed texts in one batch when the embedder supports it, and normalize the embeddings."""
+        embeddings: List[Optional[List[float]]]
+        try:
+            if len(texts) > 1 and hasattr(self.embedder, "get_embeddings_batch_and_usage"):
+                embeddings = list(self.embedder.get_embeddings_batch_and_usage(texts)[0])
+            else:
+                embeddings = [self.embedder.get_embedding(text) for text in texts]
+        except Exception as e:
+            log_warning(f"Error embedding memories: {e}")
+            return [None] * len(texts)
+
+        normalized: List[Optional[List[float]]] = []
+        for i in range(len(texts)):
+            embedding = embeddings[i] if i < len(embeddings) else None
+            norm = math.sqrt(sum(value * value for value in embedding)) if embedding else 0
+            normalized.append([value / norm for value in embedding] if embedding and norm else None)
+        return normalized
+
+    def _index(self, user_id: str, memories: List[UserMemory]) -> None:
+        """Embed memories, in one batch, and add them to the index of the user."""
+        texts = [self.get_memory_text(memory) for memory in memories]
+        embeddings = self._embed(texts)
+
+        with self._lock:
+            user_index = self._get_user_index(user_id)
+            stored = []
+            for memory, text, embedding in zip(memories, texts, embeddings):
+                memory_id: str = memory.memory_id  # type: ignore[assignment]
+                if embedding is None:
+                    log_warning(f"Could not embed memory {memory_id}, it won't be returned by semantic search")
+                    user_index.entries.pop(memory_id, None)
+                    continue
+                user_index.entries[memory_id] = (self._digest(text), embedding)
+                stored.append((memory_id, self._digest(text), embedding))
+            user_index.matrix = None
+            self._store(user_id, stored)
+
+    def _is_indexed(self, user_index: _UserIndex, memory: UserMemory) -> bool:
+        entry = user_index.entries.get(memory.memory_id)  # type: ignore[arg-type]
+        return entry is not None and entry[0] == self._digest(self.get_memory_text(memory))
+
+    def upsert(self, user_id: str, memory: UserMemory) -> None:
+        """Embed a memory and add it to the index of the user, replacing its previous version."""
+        if memory.memory_id is None:
+            return
+        with self._lock:
+            if self._is_indexed(self._get_user_index(user_id), memory):
+                return
+        self._index(user_id, [memory])
+
+    def remove(self, user_id: str, memory_id: str) -> None:
+        """Remove a memory from the index of the user."""
+        with self._lock:
+            user_index = self._get_user_index(user_id)
+            if user_index.entries.pop(memory_id, None) is not None:
+                user_index.matrix = None
+            self._delete(user_id, [memory_id])
+
+    def clear(self) -> None:
+        """Remove all memories from the index."""
+        with self._lock:
+            self._users.clear()
+            self._delete(None)
+
+    def close(self) -> None:
+        """Close the db file."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def sync(self, user_id: str, memories: List[UserMemory]) -> None:
+        """Bring the index of the user in line with their stored memories.
+
+        Only new or changed memories are embedded, in one batch, and memories no longer stored are dropped.
+        This picks up memories written to the db without going through the index, e.g. by the memory tools.
+        """
+        memory_ids = {memory.memory_id for memory in memories if memory.memory_id is not None}
+        with self._lock:
+            user_index = self._get_user_index(user_id)
+            stale_ids = [memory_id for memory_id in user_index.entries if memory_id not in memory_ids]
+            for memory_id in stale_ids:
+                del user_index.entries[memory_id]
+            if stale_ids:
+                user_index.matrix = None
+                self._delete(user_id, stale_ids)
+
+            # Deduplicated by memory_id, so a memory is embedded once
+            missing = {
+                memory.memory_id: memory
+                for memory in memories
+                if memory.memory_id is not None and not self._is_indexed(user_index, memory)
+            }
+
+        if missing:
+            self._index(user_id, list(missing.values()))
+            log_debug(f"Embedded {len(missing)} memories of user {user_id}")
+
+    def search(self, user_id: str, query: str, limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        """Return the ids of the memories of the user most similar to the query, with their cosine similarity."""
+        query_embedding = self._embed([query])[0]
+        if query_embedding is None:
+            log_warning("Could not embed the memory search query")
+            return []
+
+        with self._lock:
+            user_index = self._get_user_index(user_id)
+            if not user_index.entries:
+                return []
+            if user_index.matrix is None:
+                user_index.memory_ids = list(user_index.entries)
+                embeddings = [user_index.entries[memory_id][1] for memory_id in user_index.memory_ids]
+                user_index.matrix = np.asarray(embeddings, dtype=np.float32) if np is not None else embeddings
+            memory_ids = user_index.memory_ids
+            matrix = user_index.matrix
+
+        if np is not None:
+            scores = (matrix @ np.asarray(query_embedding, dtype=np.float32)).tolist()  # type: ignore[operator]
+        else:
+            scores = [sum(a * b for a, b in zip(row, query_embedding)) for row in matrix]  # type: ignore[attr-defined]
+
+        results = sorted(zip(memory_ids, scores), key=lambda result: result[1], reverse=True)
+        if limit is not None and limit > 0:
+            results = results[:limit]
+        return results
@@ -8,6 +8,8 @@ from pydantic import BaseModel, Field
 
 from agno.db.base import AsyncBaseDb, BaseDb
 from agno.db.schemas import UserMemory
+from agno.knowledge.embedder.base import Embedder
+from agno.memory.index import MemoryIndex
 from agno.models.base import Model
 from agno.models.message import Message
 from agno.models.utils import get_model
@@ -63,6 +65,11 @@ class MemoryManager:
     # The database to store memories
     db: Optional[Union[BaseDb, AsyncBaseDb]] = None
 
+    # Embedder used for semantic memory retrieval. If provided, memories are embedded when they are added.
+    embedder: Optional[Embedder] = None
+    # SQLite file storing the memory embeddings, so they are not computed again after a restart
+    embeddings_db_file: Optional[str] = None
+
     debug_mode: bool = False
 
     def __init__(
@@ -76,6 +83,8 @@ class MemoryManager:
         update_memories: bool = True,
         add_memories: bool = True,
         clear_memories: bool = False,
+        embedder: Optional[Embedder] = None,
+        embeddings_db_file: Optional[str] = None,
         debug_mode: bool = False,
     ):
         self.model = model  # type: ignore[assignment]
@@ -87,8 +96,13 @@ class MemoryManager:
         self.update_memories = update_memories
         self.add_memories = add_memories
         self.clear_memories = clear_memories
+        self.embedder = embedder
+        self.embeddings_db_file = embeddings_db_file
         self.debug_mode = debug_mode
 
+        # Index of the embedded memories, created on first use
+        self._memory_index: Optional[MemoryIndex] = None
+
         self._get_models()
 
     def _get_models(self) -> None:
@@ -108,6 +122,19 @@ class MemoryManager:
             self.model = OpenAIChat(id="gpt-4o")
         return self.model
 
+    def get_embedder(self) -> Embedder:
+        if self.embedder is None:
+            from agno.knowledge.embedder.openai import OpenAIEmbedder
+
+            self.embedder = OpenAIEmbedder()
+            log_debug("Embedder not provided, using OpenAIEmbedder as default.")
+        return self.embedder
+
+    def get_memory_index(self) -> MemoryIndex:
+        if self._memory_index is None or self._memory_index.embedder is not self.get_embedder():
+            self._memory_index = MemoryIndex(embedder=self.get_embedder(), db_file=self.embeddings_db_file)
+        return self._memory_index
+
     def read_from_db(self, user_id: Optional[str] = None):
         if self.db:
             # If no user_id is provided, read all memories
@@ -230,6 +257,8 @@ class MemoryManager:
                 memory.updated_at = now_epoch_s()
 
             self._upsert_db_memory(memory=memory)
+            if self.embedder is not None:
+                self.get_memory_index().upsert(user_id=user_id, memory=memory)
             return memory.memory_id
 
         else:
@@ -261,6 +290,8 @@ class MemoryManager:
             memory.user_id = user_id
 
             self._upsert_db_memory(memory=memory)
+            if self.embedder is not None:
+                self.get_memory_index().upsert(user_id=user_id, memory=memory)
 
             return memory.memory_id
         else:
@@ -271,6 +302,8 @@ class MemoryManager:
         """Clears the memory."""
         if self.db:
             self.db.clear_memories()
+        if self._memory_index is not None:
+            self._memory_index.clear()
 
     def delete_user_memory(
         self,
@@ -287,6 +320,8 @@ class MemoryManager:
 
         if self.db:
             self._delete_db_memory(memory_id=memory_id, user_id=user_id)
+            if self._memory_index is not None:
+                self._memory_index.remove(user_id=user_id, memory_id=memory_id)
         else:
             log_warning("Memory DB not provided.")
             return None
@@ -512,18 +547,19 @@ class MemoryManager:
         self,
         query: Optional[str] = None,
         limit: Optional[int] = None,
-        retrieval_method: Optional[Literal["last_n", "first_n", "agentic"]] = None,
+        retrieval_method: Optional[Literal["last_n", "first_n", "agentic", "semantic"]] = None,
         user_id: Optional[str] = None,
     ) -> List[UserMemory]:
         """Search through user memories using the specified retrieval method.
 
         Args:
-            query: The search query for agentic search. Required if retrieval_method is "agentic".
+            query: The search query. Required if retrieval_method is "agentic" or "semantic".
             limit: Maximum number of memories to return. Defaults to self.retrieval_limit if not specified. Optional.
             retrieval_method: The method to use for retrieving memories. Defaults to self.retrieval if not specified.
                 - "last_n": Return the most recent memories
                 - "first_n": Return the oldest memories
                 - "agentic": Return memories most similar to the query, but using an agentic approach
+                - "semantic": Return memories most similar to the query, ranked by embedding similarity
             user_id: The user to search for. Optional.
 
         Returns:
@@ -554,6 +590,14 @@ class MemoryManager:
 
             return self._search_user_memories_agentic(user_id=user_id, query=query, limit=limit)
 
+        elif retrieval_method == "semantic":
+            if not query:
+                raise ValueError("Query is required for semantic search")
+
+            return self._search_user_memories_semantic(
+                user_id=user_id, query=query, limit=limit, user_memories=memories.get(user_id, [])
+            )
+
         elif retrieval_method == "first_n":
             return self._get_first_n_memories(user_id=user_id, limit=limit)
 
@@ -650,6 +694,26 @@ class MemoryManager:
                         memories_to_return.append(memory)
         return memories_to_return[:limit]
 
+    def _search_user_memories_semantic(
+        self, user_id: str, query: str, limit: Optional[int] = None, user_memories: Optional[List[UserMemory]] = None
+    ) -> List[UserMemory]:
+        """Search through user memories by embedding similarity, without a model call."""
+        if user_memories is None:
+            memories = self.read_from_db(user_id=user_id) or {}
+            user_memories = memories.get(user_id, [])
+        if not user_memories:
+            return []
+
+        log_debug("Searching for memories", center=True)
+        memory_index = self.get_memory_index()
+        # Only embeds the memories that are not indexed yet or changed since they were indexed
+        memory_index.sync(user_id=user_id, memories=user_memories)
+
+        memories_by_id = {memory.memory_id: memory for memory in user_memories}
+        results = memory_index.search(user_id=user_id, query=query, limit=limit)
+        log_debug("Search for memories complete", center=True)
+        return [memories_by_id[memory_id] for memory_id, _ in results if memory_id in memories_by_id]
+
     def _get_last_n_memories(self, user_id: str, limit: Optional[int] = None) -> List[UserMemory]:
         """Get the most recent user memories.
 
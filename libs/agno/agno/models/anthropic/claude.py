@@ -2,7 +2,7 @@ import json
 from collections.abc import AsyncIterator
 from dataclasses import asdict, dataclass
 from os import getenv
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
 import httpx
 from pydantic import BaseModel, ValidationError
@@ -15,7 +15,12 @@ from agno.models.response import ModelResponse
 from agno.run.agent import RunOutput
 from agno.utils.http import get_default_async_client, get_default_sync_client
 from agno.utils.log import log_debug, log_error, log_warning
-from agno.utils.models.claude import MCPServerConfiguration, format_messages, format_tools_for_model
+from agno.utils.models.claude import (
+    MCPServerConfiguration,
+    add_cache_breakpoints,
+    format_messages,
+    format_tools_for_model,
+)
 
 try:
     from anthropic import Anthropic as AnthropicClient
@@ -117,6 +122,9 @@ class Claude(Model):
     top_k: Optional[int] = None
     cache_system_prompt: Optional[bool] = False
     extended_cache_time: Optional[bool] = False
+    # Place prompt cache breakpoints on the tools, the system prompt and the conversation history,
+    # so multi-turn sessions read the unchanged prefix of every request from the cache
+    auto_cache: Optional[bool] = False
     request_params: Optional[Dict[str, Any]] = None
 
     # Anthropic beta and experimental features
@@ -444,6 +452,24 @@ class Claude(Model):
         if not self._supports_structured_outputs():
             raise ValueError(f"Model '{self.id}' does not support structured outputs.\n\n")
 
+    def _get_cache_control(self) -> Dict[str, Any]:
+        if self.extended_cache_time is not None and self.extended_cache_time is True:
+            return {"type": "ephemeral", "ttl": "1h"}
+        return {"type": "ephemeral"}
+
+    def _format_messages(self, messages: List[Message]) -> Tuple[List[Dict[str, Any]], str]:
+        """
+        Format the messages for the Anthropic API, placing cache breakpoints on the history if auto_cache is enabled.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], str]: The API messages and the concatenated system messages.
+        """
+        chat_messages, system_message = format_messages(messages)
+        if self.auto_cache:
+            # Up to 4 breakpoints are allowed per request: the tools, the system prompt and two in the history
+            chat_messages = add_cache_breakpoints(chat_messages, self._get_cache_control())  # type: ignore[arg-type]
+        return chat_messages, system_message  # type: ignore[return-value]
+
     def _prepare_request_kwargs(
         self,
         system_message: str,
@@ -467,13 +493,10 @@ class Claude(Model):
         # Pass response_format and tools to get_request_params for beta header handling
         request_kwargs = self.get_request_params(response_format=response_format, tools=tools).copy()
         if system_message:
-            if self.cache_system_prompt:
-                cache_control = (
-                    {"type": "ephemeral", "ttl": "1h"}
-                    if self.extended_cache_time is not None and self.extended_cache_time is True
-                    else {"type": "ephemeral"}
-                )
-                request_kwargs["system"] = [{"text": system_message, "type": "text", "cache_control": cache_control}]
+            if self.cache_system_prompt or self.auto_cache:
+                request_kwargs["system"] = [
+                    {"text": system_message, "type": "text", "cache_control": self._get_cache_control()}
+                ]
             else:
                 request_kwargs["system"] = [{"text": system_message, "type": "text"}]
 
@@ -488,7 +511,11 @@ class Claude(Model):
 
         # Format tools (this will handle strict mode)
         if tools:
-            request_kwargs["tools"] = format_tools_for_model(tools)
+            formatted_tools = format_tools_for_model(tools)
+            if self.auto_cache and formatted_tools:
+                # A breakpoint on the last tool caches all tool definitions
+                formatted_tools[-1] = {**formatted_tools[-1], "cache_control": self._get_cache_control()}
+            request_kwargs["tools"] = formatted_tools
 
         # Build output_format if response_format is provided
         output_format = self._build_output_format(response_format)
@@ -515,7 +542,7 @@ class Claude(Model):
             if run_response and run_response.metrics:
                 run_response.metrics.set_time_to_first_token()
 
-            chat_messages, system_message = format_messages(messages)
+            chat_messages, system_message = self._format_messages(messages)
             request_kwargs = self._prepare_request_kwargs(system_message, tools=tools, response_format=response_format)
 
             if self._has_beta_features(response_format=response_format, tools=tools):
@@ -578,7 +605,7 @@ class Claude(Model):
             RateLimitError: If the API rate limit is exceeded
             APIStatusError: For other API-related errors
         """
-        chat_messages, system_message = format_messages(messages)
+        chat_messages, system_message = self._format_messages(messages)
         request_kwargs = self._prepare_request_kwargs(system_message, tools=tools, response_format=response_format)
 
         try:
@@ -638,7 +665,7 @@ class Claude(Model):
             if run_response and run_response.metrics:
                 run_response.metrics.set_time_to_first_token()
 
-            chat_messages, system_message = format_messages(messages)
+            chat_messages, system_message = self._format_messages(messages)
             request_kwargs = self._prepare_request_kwargs(system_message, tools=tools, response_format=response_format)
 
             # Beta features
@@ -703,7 +730,7 @@ class Claude(Model):
             if run_response and run_response.metrics:
                 run_response.metrics.set_time_to_first_token()
 
-            chat_messages, system_message = format_messages(messages)
+            chat_messages, system_message = self._format_messages(messages)
             request_kwargs = self._prepare_request_kwargs(system_message, tools=tools, response_format=response_format)
 
             if self._has_beta_features(response_format=response_format, tools=tools):
@@ -12,7 +12,6 @@ from agno.models.response import ModelResponse
 from agno.run.agent import RunOutput
 from agno.utils.http import get_default_async_client, get_default_sync_client
 from agno.utils.log import log_debug, log_error, log_warning
-from agno.utils.models.claude import format_messages
 
 try:
     from anthropic import AnthropicBedrock, APIConnectionError, APIStatusError, AsyncAnthropicBedrock, RateLimitError
@@ -172,7 +171,11 @@ class Claude(AnthropicClaude):
         )
         return self.async_client
 
-    def get_request_params(self) -> Dict[str, Any]:
+    def get_request_params(
+        self,
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
         """
         Generate keyword arguments for API requests.
 
@@ -211,7 +214,7 @@ class Claude(AnthropicClaude):
         """
 
         try:
-            chat_messages, system_message = format_messages(messages)
+            chat_messages, system_message = self._format_messages(messages)
             request_kwargs = self._prepare_request_kwargs(system_message, tools)
 
             if run_response and run_response.metrics:
@@ -268,7 +271,7 @@ class Claude(AnthropicClaude):
             APIStatusError: For other API-related errors
         """
 
-        chat_messages, system_message = format_messages(messages)
+        chat_messages, system_message = self._format_messages(messages)
         request_kwargs = self._prepare_request_kwargs(system_message, tools)
 
         try:
@@ -316,7 +319,7 @@ class Claude(AnthropicClaude):
         """
 
         try:
-            chat_messages, system_message = format_messages(messages)
+            chat_messages, system_message = self._format_messages(messages)
             request_kwargs = self._prepare_request_kwargs(system_message, tools)
 
             if run_response and run_response.metrics:
@@ -376,7 +379,7 @@ class Claude(AnthropicClaude):
         """
 
         try:
-            chat_messages, system_message = format_messages(messages)
+            chat_messages, system_message = self._format_messages(messages)
             request_kwargs = self._prepare_request_kwargs(system_message, tools)
 
             if run_response and run_response.metrics:
@@ -2,10 +2,12 @@ import asyncio
 import collections.abc
 import json
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import copy_context
 from dataclasses import dataclass, field
 from hashlib import md5
-from pathlib import Path
-from time import time
+from time import perf_counter
 from types import AsyncGeneratorType, GeneratorType
 from typing import (
     Any,
@@ -26,6 +28,7 @@ from pydantic import BaseModel
 
 from agno.exceptions import AgentRunException
 from agno.media import Audio, File, Image, Video
+from agno.models.cache import ModelResponseCache, get_default_model_response_cache
 from agno.models.message import Citations, Message
 from agno.models.metrics import Metrics
 from agno.models.response import ModelResponse, ModelResponseEvent, ToolExecution
@@ -35,6 +38,7 @@ from agno.run.team import TeamRunOutput, TeamRunOutputEvent
 from agno.run.workflow import WorkflowRunOutputEvent
 from agno.tools.function import Function, FunctionCall, FunctionExecutionResult, UserInputField
 from agno.utils.log import log_debug, log_error, log_info, log_warning
+from agno.utils.rate_limit import RateLimiter, RateLimitLease, estimate_tokens
 from agno.utils.timer import Timer
 from agno.utils.tools import get_function_call_for_tool_call, get_function_call_for_tool_execution
 
@@ -105,6 +109,13 @@ def _handle_agent_exception(a_exc: AgentRunException, additional_input: Optional
             m.stop_after_tool_call = True
 
 
+def _get_used_tokens(metrics: Optional[Metrics]) -> Optional[int]:
+    """Tokens used by a request according to the metrics reported by the provider."""
+    if metrics is None:
+        return None
+    return metrics.total_tokens or (metrics.input_tokens + metrics.output_tokens) or None
+
+
 @dataclass
 class Model(ABC):
     # ID of the model to use.
@@ -144,6 +155,13 @@ class Model(ABC):
     cache_response: bool = False
     cache_ttl: Optional[int] = None
     cache_dir: Optional[str] = None
+    # Cache used when cache_response is True.
+    # Defaults to an in-memory LRU in front of a SQLite file in cache_dir, shared by the models of the process.
+    response_cache: Optional[ModelResponseCache] = None
+
+    # Client-side rate limiter pacing the requests to the Model API.
+    # Share one instance between the models using the same API key.
+    rate_limiter: Optional[RateLimiter] = None
 
     def __post_init__(self):
         if self.provider is None and self.name is not None:
@@ -181,66 +199,51 @@ class Model(ABC):
         cache_str = json.dumps(cache_data, sort_keys=True)
         return md5(cache_str.encode()).hexdigest()
 
-    def _get_model_cache_file_path(self, cache_key: str) -> Path:
-        """Get the file path for a cache key."""
-        if self.cache_dir:
-            cache_dir = Path(self.cache_dir)
-        else:
-            cache_dir = Path.home() / ".agno" / "cache" / "model_responses"
-
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        return cache_dir / f"{cache_key}.json"
-
-    def _get_cached_model_response(self, cache_key: str) -> Optional[Dict[str, Any]]:
-        """Retrieve a cached response if it exists and is not expired."""
-        cache_file = self._get_model_cache_file_path(cache_key)
-
-        if not cache_file.exists():
-            return None
-
-        try:
-            with open(cache_file, "r") as f:
-                cached_data = json.load(f)
-
-            # Check TTL if set (None means no expiration)
-            if self.cache_ttl is not None:
-                if time() - cached_data["timestamp"] > self.cache_ttl:
-                    return None
-
-            return cached_data
-        except Exception:
-            return None
+    def _get_response_cache(self) -> ModelResponseCache:
+        """Get the cache used when cache_response is enabled."""
+        if self.response_cache is None:
+            self.response_cache = get_default_model_response_cache(self.cache_dir)
+        return self.response_cache
+
+    def _get_cached_model_response(self, cache_key: str) -> Tuple[Optional[Dict[str, Any]], Metrics]:
+        """Retrieve a cached response if it exists and is not expired, with the metrics of the lookup."""
+        started_at = perf_counter()
+        cached_data = self._get_response_cache().get(cache_key, ttl=self.cache_ttl)
+        cache_metrics = Metrics(
+            response_cache_hits=1 if cached_data else 0,
+            response_cache_misses=0 if cached_data else 1,
+            response_cache_time=perf_counter() - started_at,
+        )
+        return cached_data, cache_metrics
 
     def _save_model_response_to_cache(self, cache_key: str, result: ModelResponse, is_streaming: bool = False) -> None:
         """Save a model response to cache."""
         try:
-            cache_file = self._get_model_cache_file_path(cache_key)
-
-            cache_data = {
-                "timestamp": int(time()),
-                "is_streaming": is_streaming,
-                "result": result.to_dict(),
-            }
-            with open(cache_file, "w") as f:
-                json.dump(cache_data, f)
-        except Exception:
-            pass
+            self._get_response_cache().set(cache_key, {"is_streaming": is_streaming, "result": result.to_dict()})
+        except Exception as e:
+            log_warning(f"Error saving model response to cache: {e}")
 
     def _save_streaming_responses_to_cache(self, cache_key: str, responses: List[ModelResponse]) -> None:
         """Save streaming responses to cache."""
-        cache_file = self._get_model_cache_file_path(cache_key)
+        try:
+            self._get_response_cache().set(
+                cache_key, {"is_streaming": True, "streaming_responses": [r.to_dict() for r in responses]}
+            )
+        except Exception as e:
+            log_warning(f"Error saving streaming model responses to cache: {e}")
 
-        cache_data = {
-            "timestamp": int(time()),
-            "is_streaming": True,
-            "streaming_responses": [r.to_dict() for r in responses],
-        }
+    def _add_cached_response_message(
+        self, messages: List[Message], content: Optional[str], cache_metrics: Metrics
+    ) -> None:
+        """Add the assistant message of a response served from the cache, carrying the metrics of the lookup."""
+        messages.append(Message(role=self.assistant_message_role, content=content, metrics=cache_metrics))
 
-        try:
-            with open(cache_file, "w") as f:
-                json.dump(cache_data, f)
-        except Exception:
-            pass
+    def _add_response_cache_metrics(self, messages: List[Message], cache_metrics: Metrics) -> None:
+        """Add the metrics of a cache miss to the first assistant message of the response."""
+        for message in messages:
+            if message.role == self.assistant_message_role:
+                message.metrics = message.metrics + cache_metrics
+                return
 
     def _model_response_from_cache(self, cached_data: Dict[str, Any]) -> ModelResponse:
         """Reconstruct a ModelResponse from cached data."""
@@ -251,6 +254,42 @@ class Model(ABC):
         for cached_response in cached_data:
             yield ModelResponse.from_dict(cached_response)
 
+    def _estimate_request_tokens(self, messages: List[Message], tools: Optional[List[Dict[str, Any]]] = None) -> int:
+        """Estimate the tokens a request will use, counting its input and the maximum output."""
+        tokens = 0
+        for message in messages:
+            tokens += estimate_tokens(message.get_content_string())
+            if message.tool_calls:
+                tokens += estimate_tokens(json.dumps(message.tool_calls, default=str))
+        if tools:
+            tokens += estimate_tokens(json.dumps(tools, default=str))
+        max_tokens = getattr(self, "max_tokens", None) or getattr(self, "max_completion_tokens", None)
+        if isinstance(max_tokens, int):
+            tokens += max_tokens
+        return tokens
+
+    @contextmanager
+    def _limit_request(
+        self, messages: List[Message], tools: Optional[List[Dict[str, Any]]] = None
+    ) -> Iterator[Optional[RateLimitLease]]:
+        """Wait for the rate limiter, if any, before sending a request."""
+        if self.rate_limiter is None:
+            yield None
+            return
+        with self.rate_limiter.limit(tokens=self._estimate_request_tokens(messages, tools)) as lease:
+            yield lease
+
+    @asynccontextmanager
+    async def _alimit_request(
+        self, messages: List[Message], tools: Optional[List[Dict[str, Any]]] = None
+    ) -> AsyncIterator[Optional[RateLimitLease]]:
+        """Wait for the rate limiter, if any, before sending a request, without blocking the event loop."""
+        if self.rate_limiter is None:
+            yield None
+            return
+        async with self.rate_limiter.alimit(tokens=self._estimate_request_tokens(messages, tools)) as lease:
+            yield lease
+
     @abstractmethod
     def invoke(self, *args, **kwargs) -> ModelResponse:
         pass
@@ -312,6 +351,7 @@ class Model(ABC):
         tool_call_limit: Optional[int] = None,
         run_response: Optional[Union[RunOutput, TeamRunOutput]] = None,
         send_media_to_model: bool = True,
+        max_parallel_tool_calls: Optional[int] = None,
     ) -> ModelResponse:
         """
         Generate a response from the model.
@@ -324,6 +364,7 @@ class Model(ABC):
             tool_call_limit: Tool call limit
             run_response: Run response to use
             send_media_to_model: Whether to send media to the model
+            max_parallel_tool_calls: Maximum number of tool calls of one assistant message executed in parallel
         """
         try:
             # Check cache if enabled
@@ -331,11 +372,14 @@ class Model(ABC):
                 cache_key = self._get_model_cache_key(
                     messages, stream=False, response_format=response_format, tools=tools
                 )
-                cached_data = self._get_cached_model_response(cache_key)
+                cached_data, cache_metrics = self._get_cached_model_response(cache_key)
 
                 if cached_data:
                     log_info("Cache hit for model response")
-                    return self._model_response_from_cache(cached_data)
+                    cached_response = self._model_response_from_cache(cached_data)
+                    self._add_cached_response_message(messages, cached_response.content, cache_metrics)
+                    return cached_response
+            messages_start = len(messages)
 
             log_debug(f"{self.get_provider()} Response Start", center=True, symbol="-")
             log_debug(f"Model: {self.id}", center=True, symbol="-")
@@ -384,6 +428,7 @@ class Model(ABC):
                         function_call_results=function_call_results,
                         current_function_call_count=function_call_count,
                         function_call_limit=tool_call_limit,
+                        max_parallel_tool_calls=max_parallel_tool_calls,
                     ):
                         if isinstance(function_call_response, ModelResponse):
                             # The session state is updated by the function call
@@ -476,6 +521,7 @@ class Model(ABC):
             # Save to cache if enabled
             if self.cache_response:
                 self._save_model_response_to_cache(cache_key, model_response, is_streaming=False)
+                self._add_response_cache_metrics(messages[messages_start:], cache_metrics)
         finally:
             # Close the Gemini client
             if self.__class__.__name__ == "Gemini" and self.client is not None:  # type: ignore
@@ -509,11 +555,14 @@ class Model(ABC):
                 cache_key = self._get_model_cache_key(
                     messages, stream=False, response_format=response_format, tools=tools
                 )
-                cached_data = self._get_cached_model_response(cache_key)
+                cached_data, cache_metrics = self._get_cached_model_response(cache_key)
 
                 if cached_data:
                     log_info("Cache hit for model response")
-                    return self._model_response_from_cache(cached_data)
+                    cached_response = self._model_response_from_cache(cached_data)
+                    self._add_cached_response_message(messages, cached_response.content, cache_metrics)
+                    return cached_response
+            messages_start = len(messages)
 
             log_debug(f"{self.get_provider()} Async Response Start", center=True, symbol="-")
             log_debug(f"Model: {self.id}", center=True, symbol="-")
@@ -652,6 +701,7 @@ class Model(ABC):
             # Save to cache if enabled
             if self.cache_response:
                 self._save_model_response_to_cache(cache_key, model_response, is_streaming=False)
+                self._add_response_cache_metrics(messages[messages_start:], cache_metrics)
         finally:
             # Close the Gemini client
             if self.__class__.__name__ == "Gemini" and self.client is not None:
@@ -683,14 +733,17 @@ class Model(ABC):
             Tuple[Message, bool]: (assistant_message, should_continue)
         """
         # Generate response
-        provider_response = self.invoke(
-            assistant_message=assistant_message,
-            messages=messages,
-            response_format=response_format,
-            tools=tools,
-            tool_choice=tool_choice or self._tool_choice,
-            run_response=run_response,
-        )
+        with self._limit_request(messages=messages, tools=tools) as lease:
+            provider_response = self.invoke(
+                assistant_message=assistant_message,
+                messages=messages,
+                response_format=response_format,
+                tools=tools,
+                tool_choice=tool_choice or self._tool_choice,
+                run_response=run_response,
+            )
+            if lease is not None:
+                lease.set_usage(_get_used_tokens(provider_response.response_usage))
 
         # Populate the assistant message
         self._populate_assistant_message(assistant_message=assistant_message, provider_response=provider_response)
@@ -738,14 +791,17 @@ class Model(ABC):
             Tuple[Message, bool]: (assistant_message, should_continue)
         """
         # Generate response
-        provider_response = await self.ainvoke(
-            messages=messages,
-            response_format=response_format,
-            tools=tools,
-            tool_choice=tool_choice or self._tool_choice,
-            assistant_message=assistant_message,
-            run_response=run_response,
-        )
+        async with self._alimit_request(messages=messages, tools=tools) as lease:
+            provider_response = await self.ainvoke(
+                messages=messages,
+                response_format=response_format,
+                tools=tools,
+                tool_choice=tool_choice or self._tool_choice,
+                assistant_message=assistant_message,
+                run_response=run_response,
+            )
+            if lease is not None:
+                lease.set_usage(_get_used_tokens(provider_response.response_usage))
 
         # Populate the assistant message
         self._populate_assistant_message(assistant_message=assistant_message, provider_response=provider_response)
@@ -859,20 +915,22 @@ class Model(ABC):
         """
         Process a streaming response from the model.
         """
-
-        for response_delta in self.invoke_stream(
-            messages=messages,
-            assistant_message=assistant_message,
-            response_format=response_format,
-            tools=tools,
-            tool_choice=tool_choice or self._tool_choice,
-            run_response=run_response,
-        ):
-            for model_response_delta in self._populate_stream_data(
-                stream_data=stream_data,
-                model_response_delta=response_delta,
+        with self._limit_request(messages=messages, tools=tools) as lease:
+            for response_delta in self.invoke_stream(
+                messages=messages,
+                assistant_message=assistant_message,
+                response_format=response_format,
+                tools=tools,
+                tool_choice=tool_choice or self._tool_choice,
+                run_response=run_response,
             ):
-                yield model_response_delta
+                for model_response_delta in self._populate_stream_data(
+                    stream_data=stream_data,
+                    model_response_delta=response_delta,
+                ):
+                    yield model_response_delta
+            if lease is not None:
+                lease.set_usage(_get_used_tokens(stream_data.response_metrics))
 
         # Populate assistant message from stream data after the stream ends
         self._populate_assistant_message_from_stream_data(assistant_message=assistant_message, stream_data=stream_data)
@@ -887,6 +945,7 @@ class Model(ABC):
         stream_model_response: bool = True,
         run_response: Optional[Union[RunOutput, TeamRunOutput]] = None,
         send_media_to_model: bool = True,
+        max_parallel_tool_calls: Optional[int] = None,
     ) -> Iterator[Union[ModelResponse, RunOutputEvent, TeamRunOutputEvent]]:
         """
         Generate a streaming response from the model.
@@ -898,19 +957,24 @@ class Model(ABC):
                 cache_key = self._get_model_cache_key(
                     messages, stream=True, response_format=response_format, tools=tools
                 )
-                cached_data = self._get_cached_model_response(cache_key)
+                cached_data, cache_metrics = self._get_cached_model_response(cache_key)
 
                 if cached_data:
                     log_info("Cache hit for streaming model response")
                     # Yield cached responses
+                    cached_content = ""
                     for response in self._streaming_responses_from_cache(cached_data["streaming_responses"]):
+                        if isinstance(response.content, str):
+                            cached_content += response.content
                         yield response
+                    self._add_cached_response_message(messages, cached_content or None, cache_metrics)
                     return
 
                 log_info("Cache miss for streaming model response")
 
             # Track streaming responses for caching
             streaming_responses: List[ModelResponse] = []
+            messages_start = len(messages)
 
             log_debug(f"{self.get_provider()} Response Stream Start", center=True, symbol="-")
             log_debug(f"Model: {self.id}", center=True, symbol="-")
@@ -972,6 +1036,7 @@ class Model(ABC):
                         function_call_results=function_call_results,
                         current_function_call_count=function_call_count,
                         function_call_limit=tool_call_limit,
+                        max_parallel_tool_calls=max_parallel_tool_calls,
                     ):
                         if self.cache_response and isinstance(function_call_response, ModelResponse):
                             streaming_responses.append(function_call_response)
@@ -1032,6 +1097,7 @@ class Model(ABC):
             # Save streaming responses to cache if enabled
             if self.cache_response and cache_key and streaming_responses:
                 self._save_streaming_responses_to_cache(cache_key, streaming_responses)
+                self._add_response_cache_metrics(messages[messages_start:], cache_metrics)
         finally:
             # Close the Gemini client
             if self.__class__.__name__ == "Gemini" and self.client is not None:
@@ -1057,19 +1123,22 @@ class Model(ABC):
         """
         Process a streaming response from the model.
         """
-        async for response_delta in self.ainvoke_stream(
-            messages=messages,
-            assistant_message=assistant_message,
-            response_format=response_format,
-            tools=tools,
-            tool_choice=tool_choice or self._tool_choice,
-            run_response=run_response,
-        ):  # type: ignore
-            for model_response_delta in self._populate_stream_data(
-                stream_data=stream_data,
-                model_response_delta=response_delta,
-            ):
-                yield model_response_delta
+        async with self._alimit_request(messages=messages, tools=tools) as lease:
+            async for response_delta in self.ainvoke_stream(
+                messages=messages,
+                assistant_message=assistant_message,
+                response_format=response_format,
+                tools=tools,
+                tool_choice=tool_choice or self._tool_choice,
+                run_response=run_response,
+            ):  # type: ignore
+                for model_response_delta in self._populate_stream_data(
+                    stream_data=stream_data,
+                    model_response_delta=response_delta,
+                ):
+                    yield model_response_delta
+            if lease is not None:
+                lease.set_usage(_get_used_tokens(stream_data.response_metrics))
 
         # Populate assistant message from stream data after the stream ends
         self._populate_assistant_message_from_stream_data(assistant_message=assistant_message, stream_data=stream_data)
@@ -1095,19 +1164,24 @@ class Model(ABC):
                 cache_key = self._get_model_cache_key(
                     messages, stream=True, response_format=response_format, tools=tools
                 )
-                cached_data = self._get_cached_model_response(cache_key)
+                cached_data, cache_metrics = self._get_cached_model_response(cache_key)
 
                 if cached_data:
                     log_info("Cache hit for async streaming model response")
                     # Yield cached responses
+                    cached_content = ""
                     for response in self._streaming_responses_from_cache(cached_data["streaming_responses"]):
+                        if isinstance(response.content, str):
+                            cached_content += response.content
                         yield response
+                    self._add_cached_response_message(messages, cached_content or None, cache_metrics)
                     return
 
                 log_info("Cache miss for async streaming model response")
 
             # Track streaming responses for caching
             streaming_responses: List[ModelResponse] = []
+            messages_start = len(messages)
 
             log_debug(f"{self.get_provider()} Async Response Stream Start", center=True, symbol="-")
             log_debug(f"Model: {self.id}", center=True, symbol="-")
@@ -1230,6 +1304,7 @@ class Model(ABC):
             # Save streaming responses to cache if enabled
             if self.cache_response and cache_key and streaming_responses:
                 self._save_streaming_responses_to_cache(cache_key, streaming_responses)
+                self._add_response_cache_metrics(messages[messages_start:], cache_metrics)
 
         finally:
             # Close the Gemini client
@@ -1466,17 +1541,8 @@ class Model(ABC):
             tool_call_error=True,
         )
 
-    def run_function_call(
-        self,
-        function_call: FunctionCall,
-        function_call_results: List[Message],
-        additional_input: Optional[List[Message]] = None,
-    ) -> Iterator[Union[ModelResponse, RunOutputEvent, TeamRunOutputEvent]]:
-        # Start function call
-        function_call_timer = Timer()
-        function_call_timer.start()
-        # Yield a tool_call_started event
-        yield ModelResponse(
+    def _create_function_call_started_response(self, function_call: FunctionCall) -> ModelResponse:
+        return ModelResponse(
             content=function_call.get_call_str(),
             tool_executions=[
                 ToolExecution(
@@ -1488,22 +1554,58 @@ class Model(ABC):
             event=ModelResponseEvent.tool_call_started.value,
         )
 
-        # Run function calls sequentially
+    def _execute_function_call(
+        self, function_call: FunctionCall
+    ) -> Tuple[Timer, FunctionExecutionResult, Optional[AgentRunException]]:
+        """Execute a function call, returning its timer, its execution result and the AgentRunException it raised."""
+        function_call_timer = Timer()
+        function_call_timer.start()
+
         function_execution_result: FunctionExecutionResult = FunctionExecutionResult(status="failure")
+        agent_run_exception: Optional[AgentRunException] = None
         try:
             function_execution_result = function_call.execute()
         except AgentRunException as a_exc:
-            # Update additional messages from function call
-            _handle_agent_exception(a_exc, additional_input)
-            # Set function call success to False if an exception occurred
+            agent_run_exception = a_exc
         except Exception as e:
             log_error(f"Error executing function {function_call.function.name}: {e}")
             raise e
 
-        function_call_success = function_execution_result.status == "success"
-
         # Stop function call timer
         function_call_timer.stop()
+        return function_call_timer, function_execution_result, agent_run_exception
+
+    def run_function_call(
+        self,
+        function_call: FunctionCall,
+        function_call_results: List[Message],
+        additional_input: Optional[List[Message]] = None,
+    ) -> Iterator[Union[ModelResponse, RunOutputEvent, TeamRunOutputEvent]]:
+        # Yield a tool_call_started event
+        yield self._create_function_call_started_response(function_call)
+
+        execution = self._execute_function_call(function_call)
+        yield from self._process_function_call_execution(
+            function_call=function_call,
+            execution=execution,
+            function_call_results=function_call_results,
+            additional_input=additional_input,
+        )
+
+    def _process_function_call_execution(
+        self,
+        function_call: FunctionCall,
+        execution: Tuple[Timer, FunctionExecutionResult, Optional[AgentRunException]],
+        function_call_results: List[Message],
+        additional_input: Optional[List[Message]] = None,
+    ) -> Iterator[Union[ModelResponse, RunOutputEvent, TeamRunOutputEvent]]:
+        """Process the output of an executed function call and add its result to the function call results."""
+        function_call_timer, function_execution_result, agent_run_exception = execution
+        if agent_run_exception is not None:
+            # Update additional messages from function call
+            _handle_agent_exception(agent_run_exception, additional_input)
+
+        function_call_success = function_execution_result.status == "success"
 
         # Process function call output
         function_call_output: str = ""
@@ -1608,6 +1710,77 @@ class Model(ABC):
         # Add function call to function call results
         function_call_results.append(function_call_result)
 
+    def _get_paused_tool_executions(self, fc: FunctionCall) -> List[ToolExecution]:
+        """Get the tool executions to pause for a function call that can't be executed right away."""
+        paused_tool_executions = []
+
+        # The function cannot be executed without user confirmation
+        if fc.function.requires_confirmation:
+            paused_tool_executions.append(
+                ToolExecution(
+                    tool_call_id=fc.call_id,
+                    tool_name=fc.function.name,
+                    tool_args=fc.arguments,
+                    requires_confirmation=True,
+                )
+            )
+        # If the function requires user input, we yield a message to the user
+        if fc.function.requires_user_input:
+            user_input_schema = fc.function.user_input_schema
+            if fc.arguments and user_input_schema:
+                for name, value in fc.arguments.items():
+                    for user_input_field in user_input_schema:
+                        if user_input_field.name == name:
+                            user_input_field.value = value
+
+            paused_tool_executions.append(
+                ToolExecution(
+                    tool_call_id=fc.call_id,
+                    tool_name=fc.function.name,
+                    tool_args=fc.arguments,
+                    requires_user_input=True,
+                    user_input_schema=user_input_schema,
+                )
+            )
+        # If the function is from the user control flow tools, we handle it here
+        if fc.function.name == "get_user_input" and fc.arguments and fc.arguments.get("user_input_fields"):
+            user_input_schema = []
+            for input_field in fc.arguments.get("user_input_fields", []):
+                field_type = input_field.get("field_type")
+                try:
+                    python_type = eval(field_type) if isinstance(field_type, str) else field_type
+                except (NameError, SyntaxError):
+                    python_type = str  # Default to str if type is invalid
+                user_input_schema.append(
+                    UserInputField(
+                        name=input_field.get("field_name"),
+                        field_type=python_type,
+                        description=input_field.get("field_description"),
+                    )
+                )
+
+            paused_tool_executions.append(
+                ToolExecution(
+                    tool_call_id=fc.call_id,
+                    tool_name=fc.function.name,
+                    tool_args=fc.arguments,
+                    requires_user_input=True,
+                    user_input_schema=user_input_schema,
+                )
+            )
+        # If the function requires external execution, we yield a message to the user
+        if fc.function.external_execution:
+            paused_tool_executions.append(
+                ToolExecution(
+                    tool_call_id=fc.call_id,
+                    tool_name=fc.function.name,
+                    tool_args=fc.arguments,
+                    external_execution_required=True,
+                )
+            )
+
+        return paused_tool_executions
+
     def run_function_calls(
         self,
         function_calls: List[FunctionCall],
@@ -1615,97 +1788,90 @@ class Model(ABC):
         additional_input: Optional[List[Message]] = None,
         current_function_call_count: int = 0,
         function_call_limit: Optional[int] = None,
+        max_parallel_tool_calls: Optional[int] = None,
     ) -> Iterator[Union[ModelResponse, RunOutputEvent, TeamRunOutputEvent]]:
+        """Run the function calls of an assistant message.
+
+        If max_parallel_tool_calls is greater than 1, the function calls that can run in parallel
+        (see Function.parallel_safe) are executed in a thread pool of that size. Their outputs are still
+        processed, and their results added to function_call_results, in call order.
+
+        Function calls that are not parallel safe split the calls into segments: they only start once all
+        calls before them finished, and the calls after them only start once they finished.
+        """
         # Additional messages from function calls that will be added to the function call results
         if additional_input is None:
             additional_input = []
 
+        # Decide upfront which function calls are executed: (function call, over the limit, paused tool executions)
+        planned_function_calls: List[Tuple[FunctionCall, bool, List[ToolExecution]]] = []
         for fc in function_calls:
             if function_call_limit is not None:
                 current_function_call_count += 1
                 # We have reached the function call limit, so we add an error result to the function call results
                 if current_function_call_count > function_call_limit:
-                    function_call_results.append(self.create_tool_call_limit_error_result(fc))
+                    planned_function_calls.append((fc, True, []))
                     continue
+            planned_function_calls.append((fc, False, self._get_paused_tool_executions(fc)))
+
+        # Function calls that can run in parallel
+        executor: Optional[ThreadPoolExecutor] = None
+        executions: Dict[int, Future] = {}
+        parallel_indexes = {
+            i
+            for i, (fc, over_limit, paused_tool_executions) in enumerate(planned_function_calls)
+            if not over_limit and not paused_tool_executions and fc.function.parallel_safe
+        }
+        if max_parallel_tool_calls is not None and max_parallel_tool_calls > 1 and len(parallel_indexes) > 1:
+            executor = ThreadPoolExecutor(
+                max_workers=min(max_parallel_tool_calls, len(parallel_indexes)), thread_name_prefix="agno-tool-call"
+            )
 
-            paused_tool_executions = []
-
-            # The function cannot be executed without user confirmation
-            if fc.function.requires_confirmation:
-                paused_tool_executions.append(
-                    ToolExecution(
-                        tool_call_id=fc.call_id,
-                        tool_name=fc.function.name,
-                        tool_args=fc.arguments,
-                        requires_confirmation=True,
-                    )
-                )
-            # If the function requires user input, we yield a message to the user
-            if fc.function.requires_user_input:
-                user_input_schema = fc.function.user_input_schema
-                if fc.arguments and user_input_schema:
-                    for name, value in fc.arguments.items():
-                        for user_input_field in user_input_schema:
-                            if user_input_field.name == name:
-                                user_input_field.value = value
+        try:
+            for i, (fc, over_limit, paused_tool_executions) in enumerate(planned_function_calls):
+                if executor is not None and i in parallel_indexes and i not in executions:
+                    # Start the segment of parallel safe calls up to the next call that isn't, which is only
+                    # started once all of them are processed
+                    j = i
+                    while j < len(planned_function_calls) and (
+                        j in parallel_indexes or planned_function_calls[j][1] or planned_function_calls[j][2]
+                    ):
+                        if j in parallel_indexes:
+                            segment_fc = planned_function_calls[j][0]
+                            yield self._create_function_call_started_response(segment_fc)
+                            # Each function call runs in a copy of the current context, so context variables are preserved
+                            executions[j] = executor.submit(copy_context().run, self._execute_function_call, segment_fc)
+                        j += 1
+
+                if over_limit:
+                    function_call_results.append(self.create_tool_call_limit_error_result(fc))
+                    continue
 
-                paused_tool_executions.append(
-                    ToolExecution(
-                        tool_call_id=fc.call_id,
-                        tool_name=fc.function.name,
-                        tool_args=fc.arguments,
-                        requires_user_input=True,
-                        user_input_schema=user_input_schema,
-                    )
-                )
-            # If the function is from the user control flow tools, we handle it here
-            if fc.function.name == "get_user_input" and fc.arguments and fc.arguments.get("user_input_fields"):
-                user_input_schema = []
-                for input_field in fc.arguments.get("user_input_fields", []):
-                    field_type = input_field.get("field_type")
-                    try:
-                        python_type = eval(field_type) if isinstance(field_type, str) else field_type
-                    except (NameError, SyntaxError):
-                        python_type = str  # Default to str if type is invalid
-                    user_input_schema.append(
-                        UserInputField(
-                            name=input_field.get("field_name"),
-                            field_type=python_type,
-                            description=input_field.get("field_description"),
-                        )
+                if paused_tool_executions:
+                    yield ModelResponse(
+                        tool_executions=paused_tool_executions,
+                        event=ModelResponseEvent.tool_call_paused.value,
                     )
+                    # We don't execute the function calls here
+                    continue
 
-                paused_tool_executions.append(
-                    ToolExecution(
-                        tool_call_id=fc.call_id,
-                        tool_name=fc.function.name,
-                        tool_args=fc.arguments,
-                        requires_user_input=True,
-                        user_input_schema=user_input_schema,
+                if i in executions:
+                    yield from self._process_function_call_execution(
+                        function_call=fc,
+                        execution=executions[i].result(),
+                        function_call_results=function_call_results,
+                        additional_input=additional_input,
                     )
-                )
-            # If the function requires external execution, we yield a message to the user
-            if fc.function.external_execution:
-                paused_tool_executions.append(
-                    ToolExecution(
-                        tool_call_id=fc.call_id,
-                        tool_name=fc.function.name,
-                        tool_args=fc.arguments,
-                        external_execution_required=True,
+                else:
+                    yield from self.run_function_call(
+                        function_call=fc, function_call_results=function_call_results, additional_input=additional_input
                     )
-                )
-
-            if paused_tool_executions:
-                yield ModelResponse(
-                    tool_executions=paused_tool_executions,
-                    event=ModelResponseEvent.tool_call_paused.value,
-                )
-                # We don't execute the function calls here
-                continue
-
-            yield from self.run_function_call(
-                function_call=fc, function_call_results=function_call_results, additional_input=additional_input
-            )
+        finally:
+            if executor is not None:
+                # Don't start the remaining function calls if the run stopped early
+                for execution in executions.values():
+                    execution.cancel()
+                executor.shutdown(wait=True)
 
         # Add any additional messages at the end
         if additional_input:
@@ -2227,6 +2393,10 @@ class Model(ABC):
         for k, v in self.__dict__.items():
             if k in {"response_format", "_tools", "_functions"}:
                 continue
+            # Keep sharing the rate limiter and the response cache
+            if k in {"rate_limiter", "response_cache"}:
+                setattr(new_model, k, v)
+                continue
             # Skip client objects
             if k in {"client", "async_client", "http_client", "mistral_client", "model_client"}:
                 setattr(new_model, k, None)
@@ -0,0 +1,292 @@
+"""Tiered cache of model responses, used when `cache_response` is enabled on a Model."""
+
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from agno.utils.log import log_debug, log_warning
+
+
+@dataclass
+class ModelResponseCacheStats:
+    """Hit/miss counters for a ModelResponseCache"""
+
+    memory_hits: int = 0
+    backend_hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    memory_evictions: int = 0
+    # Total time spent in lookups, in seconds
+    lookup_time: float = 0.0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.backend_hits
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "hits": self.hits,
+            "memory_hits": self.memory_hits,
+            "backend_hits": self.backend_hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "memory_evictions": self.memory_evictions,
+            "hit_rate": self.hit_rate,
+            "lookup_time": self.lookup_time,
+        }
+
+
+class ModelResponseCacheBackend(ABC):
+    """Persistent tier of a ModelResponseCache.
+
+    Entries are JSON strings, stored with the time they were written.
+    Implementations must be safe to use from several threads.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        """Return the entry stored under a key and the time it was written, if any."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, value: str) -> None:
+        """Store an entry, replacing any previous entry with the same key."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class SqliteModelResponseCacheBackend(ModelResponseCacheBackend):
+    """Stores cached model responses in a single SQLite file.
+
+    Writes are atomic and the file can be shared by several processes on the same host.
+    Entries older than `ttl` seconds are removed on write, and least recently used entries are evicted
+    once the stored responses exceed `max_bytes`. The size is read from the file within the write
+    transaction, so it accounts for the entries written by every process.
+
+    Args:
+        db_file: Path to the SQLite file.
+        max_bytes: Maximum total size of the stored responses.
+        ttl: Seconds after which entries are removed. None keeps them until evicted.
+    """
+
+    def __init__(self, db_file: str, max_bytes: int = 512 * 1024 * 1024, ttl: Optional[int] = None):
+        self.db_file = db_file
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            Path(self.db_file).parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.db_file, check_same_thread=False, isolation_level=None, timeout=30)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS model_responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_model_responses_accessed_at ON model_responses(accessed_at)"
+            )
+            log_debug(f"Opened model response cache at {self.db_file}")
+        return self._connection
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        with self._lock:
+            try:
+                row = self.connection.execute(
+                    "SELECT value, created_at FROM model_responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                self.connection.execute("UPDATE model_responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            except sqlite3.Error as e:
+                log_warning(f"Error reading from model response cache: {e}")
+                return None
+        return row[0], row[1]
+
+    def set(self, key: str, value: str) -> None:
+        now = time.time()
+        with self._lock:
+            try:
+                connection = self.connection
+                connection.execute("BEGIN IMMEDIATE")
+                try:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO model_responses (key, value, size, created_at, accessed_at) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (key, value, len(value), now, now),
+                    )
+                    self._evict(now)
+                    connection.execute("COMMIT")
+                except BaseException:
+                    connection.execute("ROLLBACK")
+                    raise
+            except sqlite3.Error as e:
+                log_warning(f"Error writing to model response cache: {e}")
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self.connection.execute("DELETE FROM model_responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self.connection.execute("DELETE FROM model_responses")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _evict(self, now: float) -> None:
+        """Remove expired entries, then least recently used entries until under 90% of the size budget.
+
+        Must run within a write transaction, so the size is not changed by other processes meanwhile.
+        """
+        if self.ttl is not None:
+            self.connection.execute("DELETE FROM model_responses WHERE created_at < ?", (now - self.ttl,))
+
+        total_bytes = int(self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM model_responses").fetchone()[0])
+        if total_bytes <= self.max_bytes:
+            return
+        target = int(self.max_bytes * 0.9)
+        rows = self.connection.execute("SELECT key, size FROM model_responses ORDER BY accessed_at ASC").fetchall()
+        evicted_keys = []
+        for key, size in rows:
+            if total_bytes <= target:
+                break
+            evicted_keys.append((key,))
+            total_bytes -= size
+        self.connection.executemany("DELETE FROM model_responses WHERE key = ?", evicted_keys)
+        log_debug(f"Evicted {len(evicted_keys)} responses from the model response cache")
+
+
+class ModelResponseCache:
+    """Model response cache with an in-process LRU tier in front of an optional persistent backend.
+
+    Entries are kept as JSON strings, so every hit returns a fresh dict the caller is free to modify.
+    Share one backend between workers (e.g. a SqlModelResponseCacheBackend on the database of the app)
+    so a response computed by one worker is a hit for all of them.
+
+    Args:
+        max_memory_entries: Maximum number of responses kept in the in-memory LRU. 0 disables the memory tier.
+        backend: The persistent tier. If not set, only the memory tier is used.
+
+    Example:
+        >>> cache = ModelResponseCache(backend=SqliteModelResponseCacheBackend(db_file="tmp/responses.db"))
+        >>> model = OpenAIChat(id="gpt-4o", cache_response=True, response_cache=cache)
+    """
+
+    def __init__(self, max_memory_entries: int = 1024, backend: Optional[ModelResponseCacheBackend] = None):
+        self.max_memory_entries = max_memory_entries
+        self.backend = backend
+        self.stats = ModelResponseCacheStats()
+
+        self._memory: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, ttl: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Return the response cached under a key, unless it is older than `ttl` seconds.
+
+        Backend hits are promoted into the memory tier.
+        """
+        started_at = time.perf_counter()
+        try:
+            with self._lock:
+                entry = self._memory.get(key)
+                if entry is not None:
+                    if ttl is not None and time.time() - entry[1] > ttl:
+                        del self._memory[key]
+                    else:
+                        self._memory.move_to_end(key)
+                        self.stats.memory_hits += 1
+                        return json.loads(entry[0])
+
+            if self.backend is not None:
+                try:
+                    stored = self.backend.get(key)
+                except Exception as e:
+                    log_warning(f"Error reading from model response cache: {e}")
+                    stored = None
+                if stored is not None and (ttl is None or time.time() - stored[1] <= ttl):
+                    with self._lock:
+                        self._set_memory(key, stored)
+                        self.stats.backend_hits += 1
+                    return json.loads(stored[0])
+
+            with self._lock:
+                self.stats.misses += 1
+            return None
+        finally:
+            elapsed = time.perf_counter() - started_at
+            with self._lock:
+                self.stats.lookup_time += elapsed
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a response in every tier."""
+        entry = (json.dumps(value), time.time())
+        with self._lock:
+            self._set_memory(key, entry)
+            self.stats.writes += 1
+        if self.backend is not None:
+            try:
+                self.backend.set(key, entry[0])
+            except Exception as e:
+                log_warning(f"Error writing to model response cache: {e}")
+
+    def clear(self) -> None:
+        """Remove every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+        if self.backend is not None:
+            self.backend.clear()
+
+    def _set_memory(self, key: str, entry: Tuple[str, float]) -> None:
+        if self.max_memory_entries <= 0:
+            return
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            self.stats.memory_evictions += 1
+
+
+_default_caches: Dict[str, ModelResponseCache] = {}
+_default_caches_lock = threading.Lock()
+
+
+def get_default_model_response_cache(cache_dir: Optional[str] = None) -> ModelResponseCache:
+    """Get the process-wide cache storing responses in `model_responses.db` under `cache_dir`.
+
+    Defaults to `~/.agno/cache/model_responses`.
+    """
+    path = Path(cache_dir) if cache_dir else Path.home() / ".agno" / "cache" / "model_responses"
+    db_file = str(path / "model_responses.db")
+    with _default_caches_lock:
+        cache = _default_caches.get(db_file)
+        if cache is None:
+            cache = ModelResponseCache(backend=SqliteModelResponseCacheBackend(db_file=db_file))
+            _default_caches[db_file] = cache
+        return cache
@@ -0,0 +1,93 @@
+"""Model response cache backend storing responses in a SQL database."""
+
+import time
+from typing import Optional, Tuple
+
+from agno.db.base import BaseDb
+from agno.models.cache import ModelResponseCacheBackend
+
+try:
+    from sqlalchemy import Column, Float, MetaData, String, Table, Text, delete, select
+    from sqlalchemy.engine import Engine
+    from sqlalchemy.exc import IntegrityError
+    from sqlalchemy.schema import CreateSchema
+except ImportError:
+    raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
+
+
+class SqlModelResponseCacheBackend(ModelResponseCacheBackend):
+    """Stores cached model responses in a table of a SQL database, so all workers share the same hits.
+
+    Works with the databases built on a SQLAlchemy engine: PostgresDb, SqliteDb, MySQLDb and SingleStoreDb.
+
+    Example:
+        >>> backend = SqlModelResponseCacheBackend(db=PostgresDb(db_url=db_url), ttl=24 * 60 * 60)
+        >>> model = OpenAIChat(id="gpt-4o", cache_response=True, response_cache=ModelResponseCache(backend=backend))
+    """
+
+    def __init__(
+        self,
+        db: Optional[BaseDb] = None,
+        db_engine: Optional[Engine] = None,
+        db_schema: Optional[str] = None,
+        table_name: str = "agno_model_response_cache",
+        ttl: Optional[int] = None,
+    ):
+        """
+        Args:
+            db (Optional[BaseDb]): The database to store the responses in.
+            db_engine (Optional[Engine]): The SQLAlchemy engine to use, if no db is given.
+            db_schema (Optional[str]): The database schema to use. Defaults to the schema of the db.
+            table_name (str): Name of the table to store the responses in.
+            ttl (Optional[int]): Seconds after which responses are removed on write. None keeps them.
+
+        Raises:
+            ValueError: If neither a db with a SQLAlchemy engine nor a db_engine is provided.
+        """
+        engine = db_engine or getattr(db, "db_engine", None)
+        if not isinstance(engine, Engine):
+            raise ValueError("SqlModelResponseCacheBackend requires a db with a sync SQLAlchemy engine, or a db_engine")
+        self.db_engine: Engine = engine
+        self.ttl = ttl
+
+        if db_schema is None and engine.dialect.name != "sqlite":
+            db_schema = getattr(db, "db_schema", None)
+        self.table = Table(
+            table_name,
+            MetaData(schema=db_schema),
+            Column("key", String(255), primary_key=True),
+            Column("value", Text, nullable=False),
+            Column("created_at", Float, nullable=False, index=True),
+        )
+        if db_schema is not None and engine.dialect.name == "postgresql":
+            with self.db_engine.begin() as conn:
+                conn.execute(CreateSchema(db_schema, if_not_exists=True))
+        self.table.create(self.db_engine, checkfirst=True)
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        with self.db_engine.connect() as conn:
+            row = conn.execute(
+                select(self.table.c.value, self.table.c.created_at).where(self.table.c.key == key)
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], float(row[1])
+
+    def set(self, key: str, value: str) -> None:
+        now = time.time()
+        with self.db_engine.begin() as conn:
+            try:
+                with conn.begin_nested():
+                    conn.execute(self.table.insert().values(key=key, value=value, created_at=now))
+            except IntegrityError:
+                conn.execute(self.table.update().where(self.table.c.key == key).values(value=value, created_at=now))
+            if self.ttl is not None:
+                conn.execute(delete(self.table).where(self.table.c.created_at < now - self.ttl))
+
+    def delete(self, key: str) -> None:
+        with self.db_engine.begin() as conn:
+            conn.execute(delete(self.table).where(self.table.c.key == key))
+
+    def clear(self) -> None:
+        with self.db_engine.begin() as conn:
+            conn.execute(delete(self.table))
@@ -25,6 +25,12 @@ class Metrics:
     # Tokens employed in reasoning
     reasoning_tokens: int = 0
 
+    # Model response cache usage
+    response_cache_hits: int = 0
+    response_cache_misses: int = 0
+    # Time spent looking up responses in the cache, in seconds
+    response_cache_time: float = 0.0
+
     # Time metrics
     # Internal timer utility for tracking execution time
     timer: Optional[Timer] = None
@@ -63,6 +69,9 @@ class Metrics:
             cache_read_tokens=self.cache_read_tokens + other.cache_read_tokens,
             cache_write_tokens=self.cache_write_tokens + other.cache_write_tokens,
             reasoning_tokens=self.reasoning_tokens + other.reasoning_tokens,
+            response_cache_hits=self.response_cache_hits + other.response_cache_hits,
+            response_cache_misses=self.response_cache_misses + other.response_cache_misses,
+            response_cache_time=self.response_cache_time + other.response_cache_time,
         )
 
         # Handle provider_metrics
@@ -1,7 +1,8 @@
+import asyncio
 from contextlib import asynccontextmanager
 from functools import partial
 from os import getenv
-from typing import Any, Dict, List, Literal, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple, Union
 from uuid import uuid4
 
 from fastapi import APIRouter, FastAPI, HTTPException
@@ -50,6 +51,9 @@ from agno.utils.log import log_debug, log_error, log_warning
 from agno.utils.string import generate_id, generate_id_from_name
 from agno.workflow.workflow import Workflow
 
+if TYPE_CHECKING:
+    from agno.os.ingestion import IngestionQueue
+
 
 @asynccontextmanager
 async def mcp_lifespan(_, mcp_tools):
@@ -64,6 +68,29 @@ async def mcp_lifespan(_, mcp_tools):
     for tool in mcp_tools:
         await tool.close()
 
+    # Close the pools keeping MCP connections alive across runs
+    pools = {id(tool.pool): tool.pool for tool in mcp_tools if getattr(tool, "pool", None) is not None}
+    for pool in pools.values():
+        await pool.close()
+
+
+@asynccontextmanager
+async def ingestion_lifespan(_, agent_os: "AgentOS"):
+    """Run the knowledge ingestion workers inside a FastAPI app"""
+    from agno.os.ingestion import IngestionWorkerPool
+
+    pool = IngestionWorkerPool(
+        queue=agent_os.ingestion_queue,  # type: ignore[arg-type]
+        knowledge=agent_os.knowledge_instances,
+        num_workers=agent_os.ingestion_workers,
+    )
+    pool.start()
+
+    yield
+
+    # Jobs being processed are resumed by the next workers if they don't finish in time
+    await asyncio.to_thread(pool.stop, 30)
+
 
 def _combine_app_lifespans(lifespans: list) -> Any:
     """Combine multiple FastAPI app lifespan context managers into one."""
@@ -110,6 +137,8 @@ class AgentOS:
         on_route_conflict: Literal["preserve_agentos", "preserve_base_app", "error"] = "preserve_agentos",
         telemetry: bool = True,
         auto_provision_dbs: bool = True,
+        ingestion_queue: Optional["IngestionQueue"] = None,
+        ingestion_workers: int = 2,
     ):
         """Initialize AgentOS.
 
@@ -131,6 +160,8 @@ class AgentOS:
             base_app: Optional base FastAPI app to use for the AgentOS. All routes and middleware will be added to this app.
             on_route_conflict: What to do when a route conflict is detected in case a custom base_app is provided.
             telemetry: Whether to enable telemetry
+            ingestion_queue: Optional queue of knowledge ingestion jobs. Uploads are spooled and processed by ingestion workers
+            ingestion_workers: Number of ingestion workers run by the app. Set to 0 to run them in separate processes
 
         """
         if not agents and not workflows and not teams and not knowledge:
@@ -146,6 +177,8 @@ class AgentOS:
         self.knowledge = knowledge
         self.settings: AgnoAPISettings = settings or AgnoAPISettings()
         self.auto_provision_dbs = auto_provision_dbs
+        self.ingestion_queue = ingestion_queue
+        self.ingestion_workers = ingestion_workers
         self._app_set = False
 
         if base_app:
@@ -234,7 +267,7 @@ class AgentOS:
         updated_routers = [
             get_session_router(dbs=self.dbs),
             get_metrics_router(dbs=self.dbs),
-            get_knowledge_router(knowledge_instances=self.knowledge_instances),
+            get_knowledge_router(knowledge_instances=self.knowledge_instances, ingestion_queue=self.ingestion_queue),
             get_memory_router(dbs=self.dbs),
             get_eval_router(dbs=self.dbs, agents=self.agents, teams=self.teams),
         ]
@@ -446,12 +479,18 @@ class AgentOS:
             get_memory_router(dbs=self.dbs),
             get_eval_router(dbs=self.dbs, agents=self.agents, teams=self.teams),
             get_metrics_router(dbs=self.dbs),
-            get_knowledge_router(knowledge_instances=self.knowledge_instances),
+            get_knowledge_router(knowledge_instances=self.knowledge_instances, ingestion_queue=self.ingestion_queue),
         ]
 
         for router in routers:
             self._add_router(fastapi_app, router)
 
+        # Run the knowledge ingestion workers with the app
+        if self.ingestion_queue is not None and self.ingestion_workers > 0:
+            fastapi_app.router.lifespan_context = _combine_app_lifespans(
+                [fastapi_app.router.lifespan_context, partial(ingestion_lifespan, agent_os=self)]
+            )
+
         # Mount MCP if needed
         if self.enable_mcp_server and self._mcp_app:
             fastapi_app.mount("/", self._mcp_app)
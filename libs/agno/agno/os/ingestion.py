@@ -0,0 +1,589 @@
+"""Durable queue of knowledge ingestion jobs, and the workers processing them.
+
+Uploads are streamed to a spool directory and recorded as jobs in a table of a SQL database, instead of being held
+in memory and processed by the request worker. Ingestion workers claim jobs with a lease, retry failed jobs with a
+backoff, and resume the jobs of workers that stopped while processing them once their lease expires.
+"""
+
+import asyncio
+import os
+import shutil
+import socket
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from tempfile import gettempdir
+from typing import IO, Any, Dict, List, Optional, Union
+from uuid import uuid4
+
+from agno.db.base import BaseDb
+from agno.knowledge.content import Content, ContentStatus, FileData
+from agno.knowledge.knowledge import Knowledge
+from agno.utils.log import log_debug, log_error, log_info, log_warning
+
+try:
+    from sqlalchemy import JSON, BigInteger, Column, Integer, MetaData, String, Table, Text, and_, or_, select, update
+    from sqlalchemy.engine import Engine
+    from sqlalchemy.schema import CreateSchema
+except ImportError:
+    raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
+
+
+class IngestionJobLostError(Exception):
+    """The lease of a job expired and another worker claimed it."""
+
+
+class IngestionJobStatus(str, Enum):
+    """Enumeration of possible ingestion job statuses."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    FAILED = "failed"
+
+
+@dataclass
+class IngestionJob:
+    """A content to load into a knowledge base, with the options of the upload"""
+
+    id: str
+    content_id: str
+    db_id: Optional[str] = None
+    status: IngestionJobStatus = IngestionJobStatus.PENDING
+    payload: Dict[str, Any] = field(default_factory=dict)
+    attempts: int = 0
+    max_attempts: int = 3
+    error: Optional[str] = None
+    claimed_by: Optional[str] = None
+    available_at: int = 0
+    lease_expires_at: Optional[int] = None
+    created_at: int = 0
+    updated_at: Optional[int] = None
+
+    @classmethod
+    def from_row(cls, row: Any) -> "IngestionJob":
+        return cls(
+            id=row.id,
+            content_id=row.content_id,
+            db_id=row.db_id,
+            status=IngestionJobStatus(row.status),
+            payload=row.payload or {},
+            attempts=row.attempts,
+            max_attempts=row.max_attempts,
+            error=row.error,
+            claimed_by=row.claimed_by,
+            available_at=row.available_at,
+            lease_expires_at=row.lease_expires_at,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
+
+
+class IngestionQueue:
+    """Queue of knowledge ingestion jobs, stored in a table of a SQL database.
+
+    Works with the databases built on a sync SQLAlchemy engine: PostgresDb, SqliteDb, MySQLDb and SingleStoreDb.
+    Jobs are claimed with a compare-and-set update, so any number of workers, in any number of processes, can share
+    the queue. The spool directory must be shared by the API and the workers.
+
+    Example:
+        >>> queue = IngestionQueue(db=SqliteDb(db_file="tmp/agno.db"), spool_dir="tmp/spool")
+        >>> agent_os = AgentOS(knowledge=[knowledge], ingestion_queue=queue, ingestion_workers=4)
+    """
+
+    def __init__(
+        self,
+        db: Optional[BaseDb] = None,
+        db_engine: Optional[Engine] = None,
+        db_schema: Optional[str] = None,
+        table_name: str = "agno_ingestion_jobs",
+        spool_dir: Optional[Union[str, Path]] = None,
+        max_attempts: int = 3,
+        retry_delay: int = 5,
+        lease_seconds: int = 60,
+    ):
+        """
+        Args:
+            db (Optional[BaseDb]): The database to store the jobs in.
+            db_engine (Optional[Engine]): The SQLAlchemy engine to use, if no db is given.
+            db_schema (Optional[str]): The database schema to use. Defaults to the schema of the db.
+            table_name (str): Name of the table to store the jobs in.
+            spool_dir (Optional[Union[str, Path]]): Directory the uploaded files are spooled to until they are
+                processed. Defaults to a directory in the system temp directory.
+            max_attempts (int): Number of times a job is attempted before it is marked as failed.
+            retry_delay (int): Seconds before the first retry of a failed job, doubled on every retry.
+            lease_seconds (int): Seconds a claimed job is reserved for its worker without a heartbeat, before other
+                workers resume it.
+
+        Raises:
+            ValueError: If neither a db with a SQLAlchemy engine nor a db_engine is provided.
+        """
+        engine = db_engine or getattr(db, "db_engine", None)
+        if not isinstance(engine, Engine):
+            raise ValueError("IngestionQueue requires a db with a sync SQLAlchemy engine, or a db_engine")
+        self.db_engine: Engine = engine
+
+        self.spool_dir = Path(spool_dir) if spool_dir is not None else Path(gettempdir()) / "agno_ingestion"
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.lease_seconds = lease_seconds
+
+        if db_schema is None and engine.dialect.name != "sqlite":
+            db_schema = getattr(db, "db_schema", None)
+        self.table = Table(
+            table_name,
+            MetaData(schema=db_schema),
+            Column("id", String(64), primary_key=True),
+            Column("content_id", String(255), nullable=False, index=True),
+            Column("db_id", String(255), nullable=True),
+            Column("status", String(16), nullable=False, index=True),
+            Column("payload", JSON, nullable=True),
+            Column("attempts", Integer, nullable=False, default=0),
+            Column("max_attempts", Integer, nullable=False),
+            Column("error", Text, nullable=True),
+            Column("claimed_by", String(255), nullable=True),
+            Column("available_at", BigInteger, nullable=False),
+            Column("lease_expires_at", BigInteger, nullable=True),
+            Column("created_at", BigInteger, nullable=False),
+            Column("updated_at", BigInteger, nullable=True),
+        )
+        if db_schema is not None and engine.dialect.name == "postgresql":
+            with self.db_engine.begin() as conn:
+                conn.execute(CreateSchema(db_schema, if_not_exists=True))
+        self.table.create(self.db_engine, checkfirst=True)
+
+    def _spool(self, source: Union[bytes, IO[bytes]], job_id: str, suffix: str) -> str:
+        """Write the content to the spool directory, in chunks for file objects"""
+        self.spool_dir.mkdir(parents=True, exist_ok=True)
+        path = self.spool_dir / f"{job_id}{suffix}"
+        part_path = path.with_name(f"{path.name}.part")
+        with open(part_path, "wb") as spool_file:
+            if isinstance(source, bytes):
+                spool_file.write(source)
+            else:
+                shutil.copyfileobj(source, spool_file, 1024 * 1024)
+        # Renamed once complete, so workers never see a partial file
+        os.replace(part_path, path)
+        return str(path)
+
+    async def aenqueue(
+        self,
+        knowledge: Knowledge,
+        content: Content,
+        source: Optional[Union[bytes, IO[bytes]]] = None,
+        reader_id: Optional[str] = None,
+        chunker: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        chunk_overlap: Optional[int] = None,
+    ) -> IngestionJob:
+        """Spool the content, record it as processing in the contents db and add a job to load it.
+
+        Args:
+            knowledge (Knowledge): The knowledge base to load the content into. Must have a contents db.
+            content (Content): The content to load, with its id and content hash.
+            source (Optional[Union[bytes, IO[bytes]]]): The uploaded bytes or file, if any.
+            reader_id (Optional[str]): ID of the reader to use.
+            chunker (Optional[str]): Chunking strategy to apply.
+            chunk_size (Optional[int]): Chunk size to use.
+            chunk_overlap (Optional[int]): Chunk overlap to use.
+        """
+        if knowledge.contents_db is None:
+            raise ValueError("Content can only be queued for knowledge bases with a contents db")
+
+        now = int(time.time())
+        job_id = str(uuid4())
+        file_data = content.file_data
+        spool_path = None
+        if source is not None:
+            suffix = Path(file_data.filename).suffix if file_data and file_data.filename else ""
+            spool_path = await asyncio.to_thread(self._spool, source, job_id, suffix)
+
+        job = IngestionJob(
+            id=job_id,
+            content_id=content.id,  # type: ignore[arg-type]
+            db_id=knowledge.contents_db.id,
+            payload={
+                "name": content.name,
+                "description": content.description,
+                "url": content.url,
+                "metadata": content.metadata,
+                "size": content.size,
+                "content_hash": content.content_hash,
+                "file_type": file_data.type if file_data else None,
+                "filename": file_data.filename if file_data else None,
+                "spool_path": spool_path,
+                "reader_id": reader_id,
+                "chunker": chunker,
+                "chunk_size": chunk_size,
+                "chunk_overlap": chunk_overlap,
+            },
+            max_attempts=self.max_attempts,
+            available_at=now,
+            created_at=now,
+        )
+
+        try:
+            content.status = ContentStatus.PROCESSING
+            content.status_message = "Queued for ingestion"
+            content.created_at = now
+            await knowledge._add_to_contents_db(content)
+            await asyncio.to_thread(self.add_job, job)
+        except Exception:
+            if spool_path is not None:
+                Path(spool_path).unlink(missing_ok=True)
+            raise
+
+        log_debug(f"Queued ingestion job {job.id} for content {job.content_id}")
+        return job
+
+    def add_job(self, job: IngestionJob) -> None:
+        """Add a job to the queue."""
+        with self.db_engine.begin() as conn:
+            conn.execute(
+                self.table.insert().values(
+                    id=job.id,
+                    content_id=job.content_id,
+                    db_id=job.db_id,
+                    status=job.status.value,
+                    payload=job.payload,
+                    attempts=job.attempts,
+                    max_attempts=job.max_attempts,
+                    available_at=job.available_at,
+                    created_at=job.created_at,
+                )
+            )
+
+    def get_job(self, job_id: str) -> Optional[IngestionJob]:
+        """Get a job of the queue, if it exists."""
+        with self.db_engine.connect() as conn:
+            row = conn.execute(select(self.table).where(self.table.c.id == job_id)).fetchone()
+        return IngestionJob.from_row(row) if row is not None else None
+
+    def get_jobs(self, status: Optional[IngestionJobStatus] = None) -> List[IngestionJob]:
+        """Get the jobs of the queue, optionally filtered by status, oldest first."""
+        statement = select(self.table).order_by(self.table.c.created_at)
+        if status is not None:
+            statement = statement.where(self.table.c.status == status.value)
+        with self.db_engine.connect() as conn:
+            return [IngestionJob.from_row(row) for row in conn.execute(statement).fetchall()]
+
+    def _claimable(self, now: int) -> Any:
+        # Pending jobs that are due, and jobs whose worker stopped renewing its lease
+        return or_(
+            and_(self.table.c.status == IngestionJobStatus.PENDING.value, self.table.c.available_at <= now),
+            and_(self.table.c.status == IngestionJobStatus.RUNNING.value, self.table.c.lease_expires_at < now),
+        )
+
+    def claim(self, worker_id: str, db_ids: Optional[List[str]] = None) -> Optional[IngestionJob]:
+        """Claim the oldest job available, reserving it for the worker for lease_seconds.
+
+        Args:
+            worker_id (str): ID of the worker claiming the job.
+            db_ids (Optional[List[str]]): Only claim the jobs of these contents dbs.
+
+        Returns:
+            Optional[IngestionJob]: The claimed job, with its attempts incremented, or None if no job is available.
+        """
+        now = int(time.time())
+        statement = select(self.table.c.id).where(self._claimable(now))
+        if db_ids is not None:
+            statement = statement.where(self.table.c.db_id.in_(db_ids))
+        statement = statement.order_by(self.table.c.created_at).limit(10)
+        with self.db_engine.connect() as conn:
+            candidates: List[str] = list(conn.execute(statement).scalars().all())
+
+        for job_id in candidates:
+            with self.db_engine.begin() as conn:
+                result: Any = conn.execute(
+                    update(self.table)
+                    .where(self.table.c.id == job_id, self._claimable(now))
+                    .values(
+                        status=IngestionJobStatus.RUNNING.value,
+                        attempts=self.table.c.attempts + 1,
+                        claimed_by=worker_id,
+                        lease_expires_at=now + self.lease_seconds,
+                        updated_at=now,
+                    )
+                )
+            # Another worker claimed the job first
+            if result.rowcount == 1:
+                return self.get_job(job_id)
+        return None
+
+    def heartbeat(self, job_id: str, worker_id: str) -> bool:
+        """Renew the lease of a claimed job.
+
+        Returns:
+            bool: False if the job is no longer claimed by the worker.
+        """
+        now = int(time.time())
+        with self.db_engine.begin() as conn:
+            result: Any = conn.execute(
+                update(self.table)
+                .where(self.table.c.id == job_id, self.table.c.claimed_by == worker_id)
+                .values(lease_expires_at=now + self.lease_seconds, updated_at=now)
+            )
+        return result.rowcount == 1
+
+    def complete(self, job_id: str, worker_id: str) -> None:
+        """Remove a job that was processed.
+
+        Raises:
+            IngestionJobLostError: If the job is no longer claimed by the worker.
+        """
+        with self.db_engine.begin() as conn:
+            result: Any = conn.execute(
+                self.table.delete().where(self.table.c.id == job_id, self.table.c.claimed_by == worker_id)
+            )
+        if result.rowcount != 1:
+            raise IngestionJobLostError(f"Ingestion job {job_id} is no longer claimed by worker {worker_id}")
+
+    def fail(self, job: IngestionJob, error: str, worker_id: str) -> Optional[int]:
+        """Record a failed attempt of a job, scheduling a retry if it has attempts left.
+
+        Returns:
+            Optional[int]: Seconds until the job is retried, or None if the job failed for good.
+
+        Raises:
+            IngestionJobLostError: If the job is no longer claimed by the worker.
+        """
+        now = int(time.time())
+        values: Dict[str, Any] = {"error": error, "claimed_by": None, "lease_expires_at": None, "updated_at": now}
+        retry_in = None
+        if job.attempts < job.max_attempts:
+            retry_in = self.retry_delay * 2 ** (job.attempts - 1)
+            values.update(status=IngestionJobStatus.PENDING.value, available_at=now + retry_in)
+        else:
+            values.update(status=IngestionJobStatus.FAILED.value)
+        with self.db_engine.begin() as conn:
+            result: Any = conn.execute(
+                update(self.table)
+                .where(self.table.c.id == job.id, self.table.c.claimed_by == worker_id)
+                .values(**values)
+            )
+        if result.rowcount != 1:
+            raise IngestionJobLostError(f"Ingestion job {job.id} is no longer claimed by worker {worker_id}")
+        return retry_in
+
+
+class IngestionWorkerPool:
+    """Runs ingestion workers claiming and processing the jobs of an IngestionQueue.
+
+    The workers run as concurrent tasks of an event loop, in a background thread started with start(), or in the
+    current thread with run(). To process jobs in separate processes, run a pool with the same queue and knowledge
+    bases in each process, and set ingestion_workers=0 on the AgentOS.
+
+    Example:
+        >>> IngestionWorkerPool(queue=queue, knowledge=[knowledge], num_workers=4).run()
+    """
+
+    def __init__(
+        self,
+        queue: IngestionQueue,
+        knowledge: List[Knowledge],
+        num_workers: int = 2,
+        poll_interval: float = 1.0,
+    ):
+        """
+        Args:
+            queue (IngestionQueue): The queue to claim jobs from.
+            knowledge (List[Knowledge]): The knowledge bases to load the content into, matched by contents db id.
+            num_workers (int): Number of jobs processed concurrently.
+            poll_interval (float): Seconds an idle worker waits before looking for jobs again.
+        """
+        self.queue = queue
+        self.knowledge = knowledge
+        self.num_workers = num_workers
+        self.poll_interval = poll_interval
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}-{uuid4().hex[:8]}"
+
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _get_knowledge(self, db_id: Optional[str]) -> Optional[Knowledge]:
+        for knowledge in self.knowledge:
+            if knowledge.contents_db and knowledge.contents_db.id == db_id:
+                return knowledge
+        return None
+
+    async def process_job(self, job: IngestionJob) -> None:
+        """Load the content of a claimed job, then complete the job or record the failed attempt.
+
+        The attempt is abandoned if the lease of the job is lost, leaving the job to the worker that claimed it.
+        """
+        try:
+            await self._process_job(job)
+        except IngestionJobLostError:
+            log_warning(f"Abandoned attempt {job.attempts} of ingestion job {job.id}: its lease was lost")
+
+    async def _process_job(self, job: IngestionJob) -> None:
+        knowledge = self._get_knowledge(job.db_id)
+        if knowledge is None:
+            error = f"Knowledge instance with id '{job.db_id}' not found"
+            await asyncio.to_thread(self.queue.fail, job, error, self.worker_id)
+            return
+
+        payload = job.payload
+        content = Content(
+            id=job.content_id,
+            name=payload.get("name"),
+            description=payload.get("description"),
+            url=payload.get("url"),
+            metadata=payload.get("metadata"),
+            size=payload.get("size"),
+            content_hash=payload.get("content_hash"),
+            created_at=job.created_at,
+            status=ContentStatus.PROCESSING,
+            status_message=f"Processing (attempt {job.attempts} of {job.max_attempts})",
+        )
+
+        if job.attempts > job.max_attempts:
+            # The last worker holding the job stopped while processing it
+            error = "The ingestion worker stopped while processing the content"
+            await asyncio.to_thread(self.queue.fail, job, error, self.worker_id)
+            await self._update_content_status(knowledge, content, ContentStatus.FAILED, error)
+            return
+
+        spool_path = payload.get("spool_path")
+        attempt = asyncio.create_task(self._attempt(knowledge, content, job))
+        heartbeat = asyncio.create_task(self._heartbeat(job))
+        try:
+            done, _ = await asyncio.wait({attempt, heartbeat}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            heartbeat.cancel()
+            attempt.cancel()
+        if attempt not in done:
+            # The heartbeat stopped: another worker claimed the job, stop loading it
+            await asyncio.gather(attempt, return_exceptions=True)
+            raise IngestionJobLostError(f"Ingestion job {job.id} is no longer claimed by worker {self.worker_id}")
+
+        exception = attempt.exception()
+        if exception is not None:
+            error = str(exception)
+            failed = True
+        else:
+            error = content.status_message or "Content could not be loaded"
+            failed = content.status == ContentStatus.FAILED
+
+        if not failed:
+            await asyncio.to_thread(self.queue.complete, job.id, self.worker_id)
+            await self._update_content_status(knowledge, content, ContentStatus.COMPLETED, "")
+            self._remove_spool_file(spool_path)
+            log_info(f"Content {content.id} processed successfully")
+            return
+
+        log_warning(f"Attempt {job.attempts} of ingestion job {job.id} failed: {error}")
+        retry_in = await asyncio.to_thread(self.queue.fail, job, error, self.worker_id)
+        if retry_in is not None:
+            message = f"Attempt {job.attempts} of {job.max_attempts} failed, retrying in {retry_in}s: {error}"
+            await self._update_content_status(knowledge, content, ContentStatus.PROCESSING, message)
+        else:
+            await self._update_content_status(knowledge, content, ContentStatus.FAILED, error)
+            self._remove_spool_file(spool_path)
+
+    async def _attempt(self, knowledge: Knowledge, content: Content, job: IngestionJob) -> None:
+        from agno.os.routers.knowledge.knowledge import resolve_content_reader
+
+        payload = job.payload
+        resolve_content_reader(
+            knowledge,
+            content,
+            reader_id=payload.get("reader_id"),
+            chunker=payload.get("chunker"),
+            chunk_size=payload.get("chunk_size"),
+            chunk_overlap=payload.get("chunk_overlap"),
+        )
+        spool_path = payload.get("spool_path")
+        if spool_path is not None:
+            with open(spool_path, "rb") as spool_file:
+                content.file_data = FileData(
+                    content=spool_file,  # type: ignore[arg-type]
+                    type=payload.get("file_type"),
+                    filename=payload.get("filename"),
+                    size=payload.get("size"),
+                )
+                await self._load_content(knowledge, content, job)
+        else:
+            await self._load_content(knowledge, content, job)
+
+    async def _load_content(self, knowledge: Knowledge, content: Content, job: IngestionJob) -> None:
+        # Retries replace the documents a failed attempt may have inserted
+        retry = job.attempts > 1
+        await knowledge._load_content(content, upsert=retry, skip_if_exists=not retry)
+
+    async def _update_content_status(
+        self, knowledge: Knowledge, content: Content, status: ContentStatus, status_message: str
+    ) -> None:
+        try:
+            await knowledge._aupdate_content(Content(id=content.id, status=status, status_message=status_message))
+        except Exception as e:
+            log_error(f"Could not update the status of content {content.id}: {e}")
+
+    def _remove_spool_file(self, spool_path: Optional[str]) -> None:
+        if spool_path is not None:
+            try:
+                Path(spool_path).unlink(missing_ok=True)
+            except OSError as e:
+                log_warning(f"Could not remove spooled file {spool_path}: {e}")
+
+    async def _heartbeat(self, job: IngestionJob) -> None:
+        """Renew the lease of a job until cancelled. Returns once the job is no longer claimed by the worker."""
+        while True:
+            await asyncio.sleep(max(self.queue.lease_seconds / 3, 0.1))
+            try:
+                claimed = await asyncio.to_thread(self.queue.heartbeat, job.id, self.worker_id)
+            except Exception as e:
+                # The lease is renewed again on the next beat, before it expires
+                log_warning(f"Could not renew the lease of ingestion job {job.id}: {e}")
+                continue
+            if not claimed:
+                log_warning(f"Ingestion job {job.id} is no longer claimed by this worker")
+                return
+
+    async def run_once(self) -> bool:
+        """Claim and process one job.
+
+        Returns:
+            bool: True if a job was processed, False if no job was available.
+        """
+        db_ids = [knowledge.contents_db.id for knowledge in self.knowledge if knowledge.contents_db]
+        job = await asyncio.to_thread(self.queue.claim, self.worker_id, db_ids)
+        if job is None:
+            return False
+        log_debug(f"Processing ingestion job {job.id}, attempt {job.attempts} of {job.max_attempts}")
+        await self.process_job(job)
+        return True
+
+    async def _work(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                if await self.run_once():
+                    continue
+            except Exception as e:
+                log_error(f"Ingestion worker error: {e}")
+            await asyncio.sleep(self.poll_interval)
+
+    async def arun(self) -> None:
+        """Run the workers until stop() is called."""
+        await asyncio.gather(*[self._work() for _ in range(self.num_workers)])
+
+    def run(self) -> None:
+        """Run the workers in the current thread until stop() is called."""
+        asyncio.run(self.arun())
+
+    def start(self) -> None:
+        """Run the workers in a background thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self.run, name="agno-ingestion", daemon=True)
+        self._thread.start()
+        log_debug(f"Started {self.num_workers} ingestion workers")
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the workers once the jobs they are processing are done."""
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
@@ -41,6 +41,7 @@ from agno.os.schema import (
 )
 from agno.os.settings import AgnoAPISettings
 from agno.os.utils import (
+    coalesce_content_events,
     get_agent_by_id,
     get_db,
     get_team_by_id,
@@ -284,6 +285,7 @@ async def agent_response_streamer(
     audio: Optional[List[Audio]] = None,
     videos: Optional[List[Video]] = None,
     files: Optional[List[FileMedia]] = None,
+    flush_interval: Optional[float] = None,
     **kwargs: Any,
 ) -> AsyncGenerator:
     try:
@@ -299,7 +301,7 @@ async def agent_response_streamer(
             stream_events=True,
             **kwargs,
         )
-        async for run_response_chunk in run_response:
+        async for run_response_chunk in coalesce_content_events(run_response, flush_interval):
             yield format_sse_event(run_response_chunk)  # type: ignore
     except (InputCheckError, OutputCheckError) as e:
         error_response = RunErrorEvent(
@@ -325,6 +327,7 @@ async def agent_continue_response_streamer(
     updated_tools: Optional[List] = None,
     session_id: Optional[str] = None,
     user_id: Optional[str] = None,
+    flush_interval: Optional[float] = None,
 ) -> AsyncGenerator:
     try:
         continue_response = agent.acontinue_run(
@@ -335,7 +338,7 @@ async def agent_continue_response_streamer(
             stream=True,
             stream_events=True,
         )
-        async for run_response_chunk in continue_response:
+        async for run_response_chunk in coalesce_content_events(continue_response, flush_interval):
             yield format_sse_event(run_response_chunk)  # type: ignore
     except (InputCheckError, OutputCheckError) as e:
         error_response = RunErrorEvent(
@@ -368,6 +371,7 @@ async def team_response_streamer(
     audio: Optional[List[Audio]] = None,
     videos: Optional[List[Video]] = None,
     files: Optional[List[FileMedia]] = None,
+    flush_interval: Optional[float] = None,
     **kwargs: Any,
 ) -> AsyncGenerator:
     """Run the given team asynchronously and yield its response"""
@@ -384,7 +388,7 @@ async def team_response_streamer(
             stream_events=True,
             **kwargs,
         )
-        async for run_response_chunk in run_response:
+        async for run_response_chunk in coalesce_content_events(run_response, flush_interval):
             yield format_sse_event(run_response_chunk)  # type: ignore
     except (InputCheckError, OutputCheckError) as e:
         error_response = TeamRunErrorEvent(
@@ -478,6 +482,7 @@ async def workflow_response_streamer(
     input: Optional[Union[str, Dict[str, Any], List[Any], BaseModel]] = None,
     session_id: Optional[str] = None,
     user_id: Optional[str] = None,
+    flush_interval: Optional[float] = None,
     **kwargs: Any,
 ) -> AsyncGenerator:
     try:
@@ -490,7 +495,7 @@ async def workflow_response_streamer(
             **kwargs,
         )
 
-        async for run_response_chunk in run_response:
+        async for run_response_chunk in coalesce_content_events(run_response, flush_interval):
             yield format_sse_event(run_response_chunk)  # type: ignore
 
     except (InputCheckError, OutputCheckError) as e:
@@ -935,6 +940,7 @@ def get_base_router(
                     audio=base64_audios if base64_audios else None,
                     videos=base64_videos if base64_videos else None,
                     files=input_files if input_files else None,
+                    flush_interval=settings.stream_flush_interval,
                     **kwargs,
                 ),
                 media_type="text/event-stream",
@@ -1063,6 +1069,7 @@ def get_base_router(
                     updated_tools=updated_tools,
                     session_id=session_id,
                     user_id=user_id,
+                    flush_interval=settings.stream_flush_interval,
                 ),
                 media_type="text/event-stream",
             )
@@ -1322,6 +1329,7 @@ def get_base_router(
                     audio=base64_audios if base64_audios else None,
                     videos=base64_videos if base64_videos else None,
                     files=document_files if document_files else None,
+                    flush_interval=settings.stream_flush_interval,
                     **kwargs,
                 ),
                 media_type="text/event-stream",
@@ -1718,6 +1726,7 @@ def get_base_router(
                         input=message,
                         session_id=session_id,
                         user_id=user_id,
+                        flush_interval=settings.stream_flush_interval,
                         **kwargs,
                     ),
                     media_type="text/event-stream",
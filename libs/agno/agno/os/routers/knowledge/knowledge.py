@@ -1,7 +1,7 @@
 import json
 import logging
 import math
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, Path, Query, UploadFile
 
@@ -38,11 +38,16 @@ from agno.os.utils import get_knowledge_instance_by_db_id
 from agno.utils.log import log_debug, log_info
 from agno.utils.string import generate_id
 
+if TYPE_CHECKING:
+    from agno.os.ingestion import IngestionQueue
+
 logger = logging.getLogger(__name__)
 
 
 def get_knowledge_router(
-    knowledge_instances: List[Knowledge], settings: AgnoAPISettings = AgnoAPISettings()
+    knowledge_instances: List[Knowledge],
+    settings: AgnoAPISettings = AgnoAPISettings(),
+    ingestion_queue: Optional["IngestionQueue"] = None,
 ) -> APIRouter:
     """Create knowledge router with comprehensive OpenAPI documentation for content management endpoints."""
     router = APIRouter(
@@ -56,10 +61,12 @@ def get_knowledge_router(
             500: {"description": "Internal Server Error", "model": InternalServerErrorResponse},
         },
     )
-    return attach_routes(router=router, knowledge_instances=knowledge_instances)
+    return attach_routes(router=router, knowledge_instances=knowledge_instances, ingestion_queue=ingestion_queue)
 
 
-def attach_routes(router: APIRouter, knowledge_instances: List[Knowledge]) -> APIRouter:
+def attach_routes(
+    router: APIRouter, knowledge_instances: List[Knowledge], ingestion_queue: Optional["IngestionQueue"] = None
+) -> APIRouter:
     @router.post(
         "/knowledge/content",
         response_model=ContentResponseSchema,
@@ -68,7 +75,8 @@ def attach_routes(router: APIRouter, knowledge_instances: List[Knowledge]) -> AP
         summary="Upload Content",
         description=(
             "Upload content to the knowledge base. Supports file uploads, text content, or URLs. "
-            "Content is processed asynchronously in the background. Supports custom readers and chunking strategies."
+            "Content is processed asynchronously in the background. Supports custom readers and chunking strategies. "
+            "With an ingestion queue, uploads are spooled to disk and processed by the ingestion workers."
         ),
         responses={
             202: {
@@ -108,6 +116,8 @@ def attach_routes(router: APIRouter, knowledge_instances: List[Knowledge]) -> AP
     ):
         knowledge = get_knowledge_instance_by_db_id(knowledge_instances, db_id)
         log_info(f"Adding content: {name}, {description}, {url}, {metadata}")
+        # Queued files are streamed to the spool directory instead of being read into memory
+        queue = ingestion_queue if knowledge.contents_db is not None else None
 
         parsed_metadata = None
         if metadata:
@@ -117,7 +127,7 @@ def attach_routes(router: APIRouter, knowledge_instances: List[Knowledge]) -> AP
                 # If it's not valid JSON, treat as a simple key-value pair
                 parsed_metadata = {"value": metadata} if metadata != "string" else None
         if file:
-            content_bytes = await file.read()
+            content_bytes = await file.read() if queue is None else None
         elif text_content:
             content_bytes = text_content.encode("utf-8")
         else:
@@ -174,7 +184,15 @@ def attach_routes(router: APIRouter, knowledge_instances: List[Knowledge]) -> AP
         content.content_hash = content_hash
         content.id = generate_id(content_hash)
 
-        background_tasks.add_task(process_content, knowledge, content, reader_id, chunker, chunk_size, chunk_overlap)
+        if queue is not None:
+            if file:
+                await file.seek(0)
+            source = file.file if file else content_bytes
+            await queue.aenqueue(knowledge, content, source, reader_id, chunker, chunk_size, chunk_overlap)
+        else:
+            background_tasks.add_task(
+                process_content, knowledge, content, reader_id, chunker, chunk_size, chunk_overlap
+            )
 
         response = ContentResponseSchema(
             id=content.id,
@@ -959,28 +977,7 @@ async def process_content(
     """Background task to process the content"""
 
     try:
-        if reader_id:
-            reader = None
-            if knowledge.readers and reader_id in knowledge.readers:
-                reader = knowledge.readers[reader_id]
-            else:
-                key = reader_id.lower().strip().replace("-", "_").replace(" ", "_")
-                candidates = [key] + ([key[:-6]] if key.endswith("reader") else [])
-                for cand in candidates:
-                    try:
-                        reader = ReaderFactory.create_reader(cand)
-                        log_debug(f"Resolved reader: {reader.__class__.__name__}")
-                        break
-                    except Exception:
-                        continue
-            if reader:
-                content.reader = reader
-        if chunker and content.reader:
-            # Set the chunker name on the reader - let the reader handle it internally
-            content.reader.set_chunking_strategy_from_string(chunker, chunk_size=chunk_size, overlap=chunk_overlap)
-            log_debug(f"Set chunking strategy: {chunker}")
-
-        log_debug(f"Using reader: {content.reader.__class__.__name__}")
+        resolve_content_reader(knowledge, content, reader_id, chunker, chunk_size, chunk_overlap)
         await knowledge._load_content(content, upsert=False, skip_if_exists=True)
         log_info(f"Content {content.id} processed successfully")
     except Exception as e:
@@ -995,3 +992,36 @@ async def process_content(
         except Exception:
             # Swallow any secondary errors to avoid crashing the background task
             pass
+
+
+def resolve_content_reader(
+    knowledge: Knowledge,
+    content: Content,
+    reader_id: Optional[str] = None,
+    chunker: Optional[str] = None,
+    chunk_size: Optional[int] = None,
+    chunk_overlap: Optional[int] = None,
+) -> None:
+    """Set the reader and chunking strategy requested for the content"""
+    if reader_id:
+        reader = None
+        if knowledge.readers and reader_id in knowledge.readers:
+            reader = knowledge.readers[reader_id]
+        else:
+            key = reader_id.lower().strip().replace("-", "_").replace(" ", "_")
+            candidates = [key] + ([key[:-6]] if key.endswith("reader") else [])
+            for cand in candidates:
+                try:
+                    reader = ReaderFactory.create_reader(cand)
+                    log_debug(f"Resolved reader: {reader.__class__.__name__}")
+                    break
+                except Exception:
+                    continue
+        if reader:
+            content.reader = reader
+    if chunker and content.reader:
+        # Set the chunker name on the reader - let the reader handle it internally
+        content.reader.set_chunking_strategy_from_string(chunker, chunk_size=chunk_size, overlap=chunk_overlap)
+        log_debug(f"Set chunking strategy: {chunker}")
+
+    log_debug(f"Using reader: {content.reader.__class__.__name__}")
@@ -20,6 +20,12 @@ class AgnoAPISettings(BaseSettings):
     # Authentication settings
     os_security_key: Optional[str] = Field(default=None, description="Bearer token for API authentication")
 
+    # Seconds during which consecutive content deltas of a streamed run are merged into a single event.
+    # Reduces the number of events serialized and sent for fast token streams. Disabled when not set.
+    stream_flush_interval: Optional[float] = Field(
+        default=None, description="Maximum seconds a streamed content delta is held to be merged with the next ones"
+    )
+
     # Cors origin list to allow requests from.
     # This list is set using the set_cors_origin_list validator
     cors_origin_list: Optional[List[str]] = Field(default=None, validate_default=True)
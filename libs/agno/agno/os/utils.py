@@ -1,4 +1,6 @@
-from typing import Any, Callable, Dict, List, Optional, Set, Union
+import asyncio
+from dataclasses import fields, replace
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Tuple, Union
 
 from fastapi import FastAPI, HTTPException, UploadFile
 from fastapi.routing import APIRoute, APIRouter
@@ -12,6 +14,8 @@ from agno.media import Audio, Image, Video
 from agno.media import File as FileMedia
 from agno.models.message import Message
 from agno.os.config import AgentOSConfig
+from agno.run.agent import RunContentEvent
+from agno.run.team import RunContentEvent as TeamRunContentEvent
 from agno.team.team import Team
 from agno.tools import Toolkit
 from agno.tools.function import Function
@@ -628,3 +632,126 @@ def stringify_input_content(input_content: Union[str, Dict[str, Any], List[Any],
         return str(input_content)
     else:
         return str(input_content)
+
+
+# Content event fields that carry more than a text delta. Events setting any of them are never merged.
+_CONTENT_EVENT_EXTRA_FIELDS = frozenset(
+    [
+        "reasoning_content",
+        "model_provider_data",
+        "citations",
+        "response_audio",
+        "image",
+        "references",
+        "additional_input",
+        "reasoning_steps",
+        "reasoning_messages",
+    ]
+)
+_CONTENT_EVENT_IGNORED_FIELDS = _CONTENT_EVENT_EXTRA_FIELDS | {"content", "created_at"}
+
+
+def _get_coalescing_key(event: Any) -> Optional[Tuple[Any, ...]]:
+    """Return the key of a content delta that can be merged with the deltas sharing its key, or None."""
+    if type(event) not in (RunContentEvent, TeamRunContentEvent) or not isinstance(event.content, str):
+        return None
+    if any(getattr(event, name) is not None for name in _CONTENT_EVENT_EXTRA_FIELDS):
+        return None
+    return (type(event),) + tuple(
+        getattr(event, f.name) for f in fields(event) if f.name not in _CONTENT_EVENT_IGNORED_FIELDS
+    )
+
+
+def _merge_content_events(events: List[Any]) -> Any:
+    if len(events) == 1:
+        return events[0]
+    return replace(events[0], content="".join(event.content for event in events))
+
+
+async def coalesce_content_events(events: AsyncIterator[Any], flush_interval: Optional[float]) -> AsyncIterator[Any]:
+    """Merge consecutive content deltas of the same run into a single event.
+
+    The run is consumed by a background task, and all deltas already received are merged into one event.
+    A delta is held for at most flush_interval seconds, and any other event flushes the pending deltas first,
+    so the event order is kept.
+
+    Args:
+        events: The stream of run events.
+        flush_interval: Maximum number of seconds a delta is held. None or 0 disables coalescing.
+    """
+    if not flush_interval or flush_interval <= 0:
+        async for event in events:
+            yield event
+        return
+
+    end_of_stream = object()
+    queue: "asyncio.Queue[Any]" = asyncio.Queue()
+
+    async def consume_events() -> None:
+        try:
+            async for event in events:
+                queue.put_nowait(event)
+        except BaseException as e:
+            queue.put_nowait(_StreamError(e))
+            if isinstance(e, asyncio.CancelledError):
+                raise
+        finally:
+            queue.put_nowait(end_of_stream)
+
+    loop = asyncio.get_running_loop()
+    consumer = asyncio.ensure_future(consume_events())
+    pending: List[Any] = []
+    pending_key: Optional[Tuple[Any, ...]] = None
+    flush_at = 0.0
+    try:
+        while True:
+            try:
+                item = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                if not pending:
+                    item = await queue.get()
+                else:
+                    try:
+                        item = await asyncio.wait_for(queue.get(), timeout=max(flush_at - loop.time(), 0))
+                    except asyncio.TimeoutError:
+                        yield _merge_content_events(pending)
+                        pending = []
+                        continue
+
+            if item is end_of_stream:
+                break
+            if isinstance(item, _StreamError):
+                if pending:
+                    yield _merge_content_events(pending)
+                    pending = []
+                raise item.error
+
+            key = _get_coalescing_key(item)
+            if pending and key is not None and key == pending_key:
+                pending.append(item)
+                if loop.time() >= flush_at:
+                    yield _merge_content_events(pending)
+                    pending = []
+                continue
+
+            if pending:
+                yield _merge_content_events(pending)
+                pending = []
+            if key is not None:
+                pending, pending_key = [item], key
+                flush_at = loop.time() + flush_interval
+            else:
+                yield item
+
+        if pending:
+            yield _merge_content_events(pending)
+    finally:
+        if not consumer.done():
+            consumer.cancel()
+
+
+class _StreamError:
+    """Wraps an exception raised by the stream being coalesced"""
+
+    def __init__(self, error: BaseException):
+        self.error = error
@@ -1,6 +1,6 @@
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields, is_dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Union
 
 from pydantic import BaseModel
 
@@ -24,33 +24,70 @@ class RunContext:
     session_state: Optional[Dict[str, Any]] = None
 
 
+# Event fields that BaseRunOutputEvent.to_dict serializes separately (or drops)
+EVENT_EXCLUDED_FIELDS: FrozenSet[str] = frozenset(
+    [
+        "tools",
+        "tool",
+        "metadata",
+        "image",
+        "images",
+        "videos",
+        "audio",
+        "response_audio",
+        "citations",
+        "member_responses",
+        "reasoning_messages",
+        "reasoning_steps",
+        "references",
+        "additional_input",
+        "session_summary",
+        "metrics",
+    ]
+)
+
+# Names of the fields copied by _fields_to_dict, per event class and excluded fields
+_field_plans: Dict[Tuple[type, FrozenSet[str]], Tuple[str, ...]] = {}
+
+_PRIMITIVE_TYPES = (str, int, float, bool)
+
+
+def _to_serializable(value: Any) -> Any:
+    """Convert nested dataclasses and containers like dataclasses.asdict does, without deep-copying other objects."""
+    if value is None or type(value) in _PRIMITIVE_TYPES:
+        return value
+    if is_dataclass(value) and not isinstance(value, type):
+        return {f.name: _to_serializable(getattr(value, f.name)) for f in fields(value)}
+    if isinstance(value, (list, tuple)):
+        return [_to_serializable(v) for v in value]
+    if isinstance(value, dict):
+        return {_to_serializable(k): _to_serializable(v) for k, v in value.items()}
+    return value
+
+
 @dataclass
 class BaseRunOutputEvent:
+    def _fields_to_dict(self, exclude: FrozenSet[str] = frozenset()) -> Dict[str, Any]:
+        """Convert the fields that are not None and not excluded to a dict.
+
+        Events are serialized once per streamed token, so the names of the fields to copy are computed once
+        per class, and only the values that need it are converted.
+        """
+        plan_key = (type(self), exclude)
+        field_names = _field_plans.get(plan_key)
+        if field_names is None:
+            field_names = tuple(f.name for f in fields(self) if f.name not in exclude)
+            _field_plans[plan_key] = field_names
+
+        _dict: Dict[str, Any] = {}
+        for name in field_names:
+            value = getattr(self, name)
+            if value is not None:
+                _dict[name] = value if type(value) in _PRIMITIVE_TYPES else _to_serializable(value)
+        return _dict
+
     def to_dict(self) -> Dict[str, Any]:
-        _dict = {
-            k: v
-            for k, v in asdict(self).items()
-            if v is not None
-            and k
-            not in [
-                "tools",
-                "tool",
-                "metadata",
-                "image",
-                "images",
-                "videos",
-                "audio",
-                "response_audio",
-                "citations",
-                "member_responses",
-                "reasoning_messages",
-                "reasoning_steps",
-                "references",
-                "additional_input",
-                "session_summary",
-                "metrics",
-            ]
-        }
+        _dict = self._fields_to_dict(exclude=EVENT_EXCLUDED_FIELDS)
 
         if hasattr(self, "metadata") and self.metadata is not None:
             _dict["metadata"] = self.metadata
@@ -138,7 +175,7 @@ class BaseRunOutputEvent:
     def to_json(self, separators=(", ", ": "), indent: Optional[int] = 2) -> str:
         import json
 
-        from agno.utils.serialize import json_serializer
+        from agno.utils.serialize import dumps_compact, json_serializer
 
         try:
             _dict = self.to_dict()
@@ -146,7 +183,9 @@ class BaseRunOutputEvent:
             log_error("Failed to convert response event to json", exc_info=True)
             raise
 
-        if indent is None:
+        if indent is None and tuple(separators) == (",", ":"):
+            return dumps_compact(_dict)
+        elif indent is None:
             return json.dumps(_dict, separators=separators, default=json_serializer, ensure_ascii=False)
         else:
             return json.dumps(_dict, indent=indent, separators=separators, default=json_serializer, ensure_ascii=False)
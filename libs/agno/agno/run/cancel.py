@@ -1,14 +1,55 @@
 """Run cancellation management."""
 
 import threading
+import time
+from abc import ABC, abstractmethod
 from typing import Dict
 
 from agno.exceptions import RunCancelledException
 from agno.utils.log import logger
 
 
-class RunCancellationManager:
-    """Manages cancellation state for agent runs."""
+class BaseRunCancellationManager(ABC):
+    """Interface for the backends keeping track of which runs are cancelled."""
+
+    @abstractmethod
+    def register_run(self, run_id: str) -> None:
+        """Register a new run as not cancelled."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def cancel_run(self, run_id: str) -> bool:
+        """Cancel a run by marking it as cancelled.
+
+        Returns:
+            bool: True if run was found and cancelled, False if run not found.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def is_cancelled(self, run_id: str) -> bool:
+        """Check if a run is cancelled."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def cleanup_run(self, run_id: str) -> None:
+        """Remove a run from tracking (called when run completes)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_active_runs(self) -> Dict[str, bool]:
+        """Get all currently tracked runs and their cancellation status."""
+        raise NotImplementedError
+
+    def raise_if_cancelled(self, run_id: str) -> None:
+        """Check if a run should be cancelled and raise exception if so."""
+        if self.is_cancelled(run_id):
+            logger.info(f"Cancelling run {run_id}")
+            raise RunCancelledException(f"Run {run_id} was cancelled")
+
+
+class RunCancellationManager(BaseRunCancellationManager):
+    """Manages cancellation state for agent runs in the memory of the current process."""
 
     def __init__(self):
         self._cancelled_runs: Dict[str, bool] = {}
@@ -36,8 +77,8 @@ class RunCancellationManager:
 
     def is_cancelled(self, run_id: str) -> bool:
         """Check if a run is cancelled."""
-        with self._lock:
-            return self._cancelled_runs.get(run_id, False)
+        # Single dict reads are atomic, so the hot path doesn't need the lock
+        return self._cancelled_runs.get(run_id, False)
 
     def cleanup_run(self, run_id: str) -> None:
         """Remove a run from tracking (called when run completes)."""
@@ -45,20 +86,69 @@ class RunCancellationManager:
             if run_id in self._cancelled_runs:
                 del self._cancelled_runs[run_id]
 
-    def raise_if_cancelled(self, run_id: str) -> None:
-        """Check if a run should be cancelled and raise exception if so."""
-        if self.is_cancelled(run_id):
-            logger.info(f"Cancelling run {run_id}")
-            raise RunCancelledException(f"Run {run_id} was cancelled")
-
     def get_active_runs(self) -> Dict[str, bool]:
         """Get all currently tracked runs and their cancellation status."""
         with self._lock:
             return self._cancelled_runs.copy()
 
 
+class PollingRunCancellationManager(BaseRunCancellationManager):
+    """Base class for cancellation backends shared between processes.
+
+    Runs are checked many times while they execute, so the shared state is read at most once every
+    `poll_interval` seconds per run. Once a run is seen as cancelled, it stays cancelled locally.
+    """
+
+    def __init__(self, poll_interval: float = 0.5):
+        self.poll_interval = poll_interval
+        self._cancelled_locally: Dict[str, bool] = {}
+        self._last_polled: Dict[str, float] = {}
+
+    @abstractmethod
+    def _read_cancelled(self, run_id: str) -> bool:
+        """Read the cancellation status of a run from the shared state."""
+        raise NotImplementedError
+
+    def is_cancelled(self, run_id: str) -> bool:
+        """Check if a run is cancelled, reading the shared state if it was not read in the last poll_interval."""
+        if self._cancelled_locally.get(run_id, False):
+            return True
+
+        now = time.monotonic()
+        if now - self._last_polled.get(run_id, 0.0) < self.poll_interval:
+            return False
+        self._last_polled[run_id] = now
+
+        if self._read_cancelled(run_id):
+            self._cancelled_locally[run_id] = True
+            return True
+        return False
+
+    def _mark_cancelled_locally(self, run_id: str) -> None:
+        self._cancelled_locally[run_id] = True
+
+    def _forget(self, run_id: str) -> None:
+        self._cancelled_locally.pop(run_id, None)
+        self._last_polled.pop(run_id, None)
+
+
 # Global cancellation manager instance
-_cancellation_manager = RunCancellationManager()
+_cancellation_manager: BaseRunCancellationManager = RunCancellationManager()
+
+
+def set_cancellation_manager(manager: BaseRunCancellationManager) -> None:
+    """Set the cancellation manager used by all agents, teams and workflows.
+
+    Use a manager shared between processes, like SqlRunCancellationManager or RedisRunCancellationManager,
+    when cancel requests can reach a different process than the one executing the run.
+    """
+    global _cancellation_manager
+    _cancellation_manager = manager
+
+
+def get_cancellation_manager() -> BaseRunCancellationManager:
+    """Get the cancellation manager used by all agents, teams and workflows."""
+    return _cancellation_manager
 
 
 def register_run(run_id: str) -> None:
@@ -0,0 +1,89 @@
+"""Run cancellation backend storing the cancellation state in Redis."""
+
+from typing import Any, Dict, Optional
+
+from agno.db.base import BaseDb
+from agno.run.cancel import PollingRunCancellationManager
+from agno.utils.log import log_debug, logger
+
+
+class RedisRunCancellationManager(PollingRunCancellationManager):
+    """Keeps track of cancelled runs in Redis, so runs can be cancelled from any process.
+
+    Each run is stored as one key, expiring after `expire` seconds so runs of crashed processes don't pile up.
+
+    Example:
+        >>> from agno.run.cancel import set_cancellation_manager
+        >>> set_cancellation_manager(RedisRunCancellationManager(db=RedisDb(db_url=db_url)))
+    """
+
+    def __init__(
+        self,
+        db: Optional[BaseDb] = None,
+        redis_client: Optional[Any] = None,
+        key_prefix: str = "agno:run_cancellations",
+        expire: Optional[int] = 24 * 60 * 60,
+        poll_interval: float = 0.5,
+    ):
+        """
+        Args:
+            db (Optional[BaseDb]): The RedisDb to store the cancellation state in.
+            redis_client (Optional[Any]): The Redis client to use, if no db is given.
+            key_prefix (str): Prefix of the Redis keys.
+            expire (Optional[int]): Seconds after which the state of a run is removed. None keeps it until cleanup.
+            poll_interval (float): Minimum seconds between two reads of the state of the same run.
+
+        Raises:
+            ValueError: If neither a db with a Redis client nor a redis_client is provided.
+        """
+        super().__init__(poll_interval=poll_interval)
+
+        client = redis_client or getattr(db, "redis_client", None)
+        if client is None:
+            raise ValueError("RedisRunCancellationManager requires a RedisDb or a redis_client")
+        self.redis_client = client
+        self.key_prefix = key_prefix
+        self.expire = expire
+
+    def _key(self, run_id: str) -> str:
+        return f"{self.key_prefix}:{run_id}"
+
+    def register_run(self, run_id: str) -> None:
+        """Register a new run as not cancelled."""
+        self._forget(run_id)
+        self.redis_client.set(self._key(run_id), "0", ex=self.expire)
+
+    def cancel_run(self, run_id: str) -> bool:
+        """Cancel a run by marking it as cancelled.
+
+        Returns:
+            bool: True if run was found and cancelled, False if run not found.
+        """
+        # Only set the key if the run is registered, keeping its expiry
+        if not self.redis_client.set(self._key(run_id), "1", xx=True, keepttl=True):
+            logger.warning(f"Attempted to cancel unknown run {run_id}")
+            return False
+
+        self._mark_cancelled_locally(run_id)
+        logger.info(f"Run {run_id} marked for cancellation")
+        return True
+
+    def _read_cancelled(self, run_id: str) -> bool:
+        value = self.redis_client.get(self._key(run_id))
+        return value in ("1", b"1")
+
+    def cleanup_run(self, run_id: str) -> None:
+        """Remove a run from tracking (called when run completes)."""
+        self._forget(run_id)
+        self.redis_client.delete(self._key(run_id))
+        log_debug(f"Removed cancellation state of run {run_id}")
+
+    def get_active_runs(self) -> Dict[str, bool]:
+        """Get all currently tracked runs and their cancellation status."""
+        active_runs: Dict[str, bool] = {}
+        for key in self.redis_client.scan_iter(match=f"{self.key_prefix}:*"):
+            key = key.decode("utf-8") if isinstance(key, bytes) else key
+            value = self.redis_client.get(key)
+            if value is not None:
+                active_runs[key[len(self.key_prefix) + 1 :]] = value in ("1", b"1")
+        return active_runs
@@ -0,0 +1,120 @@
+"""Run cancellation backend storing the cancellation state in a SQL database."""
+
+import time
+from typing import Any, Dict, Optional
+
+from agno.db.base import BaseDb
+from agno.run.cancel import PollingRunCancellationManager
+from agno.utils.log import log_debug, logger
+
+try:
+    from sqlalchemy import BigInteger, Boolean, Column, MetaData, String, Table, select, update
+    from sqlalchemy.engine import Engine
+    from sqlalchemy.exc import IntegrityError
+    from sqlalchemy.schema import CreateSchema
+except ImportError:
+    raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
+
+
+class SqlRunCancellationManager(PollingRunCancellationManager):
+    """Keeps track of cancelled runs in a table of a SQL database, so runs can be cancelled from any process.
+
+    Works with the databases built on a SQLAlchemy engine: PostgresDb, SqliteDb, MySQLDb and SingleStoreDb.
+
+    Example:
+        >>> from agno.run.cancel import set_cancellation_manager
+        >>> set_cancellation_manager(SqlRunCancellationManager(db=PostgresDb(db_url=db_url)))
+    """
+
+    def __init__(
+        self,
+        db: Optional[BaseDb] = None,
+        db_engine: Optional[Engine] = None,
+        db_schema: Optional[str] = None,
+        table_name: str = "agno_run_cancellations",
+        poll_interval: float = 0.5,
+    ):
+        """
+        Args:
+            db (Optional[BaseDb]): The database to store the cancellation state in.
+            db_engine (Optional[Engine]): The SQLAlchemy engine to use, if no db is given.
+            db_schema (Optional[str]): The database schema to use. Defaults to the schema of the db.
+            table_name (str): Name of the table to store the cancellation state in.
+            poll_interval (float): Minimum seconds between two reads of the state of the same run.
+
+        Raises:
+            ValueError: If neither a db with a SQLAlchemy engine nor a db_engine is provided.
+        """
+        super().__init__(poll_interval=poll_interval)
+
+        engine = db_engine or getattr(db, "db_engine", None)
+        if not isinstance(engine, Engine):
+            raise ValueError("SqlRunCancellationManager requires a db with a sync SQLAlchemy engine, or a db_engine")
+        self.db_engine: Engine = engine
+
+        if db_schema is None and engine.dialect.name != "sqlite":
+            db_schema = getattr(db, "db_schema", None)
+        self.table = Table(
+            table_name,
+            MetaData(schema=db_schema),
+            Column("run_id", String(255), primary_key=True),
+            Column("cancelled", Boolean, nullable=False, default=False),
+            Column("created_at", BigInteger, nullable=False),
+            Column("updated_at", BigInteger, nullable=True),
+        )
+        if db_schema is not None and engine.dialect.name == "postgresql":
+            with self.db_engine.begin() as conn:
+                conn.execute(CreateSchema(db_schema, if_not_exists=True))
+        self.table.create(self.db_engine, checkfirst=True)
+
+    def register_run(self, run_id: str) -> None:
+        """Register a new run as not cancelled."""
+        self._forget(run_id)
+        now = int(time.time())
+        with self.db_engine.begin() as conn:
+            try:
+                with conn.begin_nested():
+                    conn.execute(self.table.insert().values(run_id=run_id, cancelled=False, created_at=now))
+            except IntegrityError:
+                conn.execute(
+                    update(self.table).where(self.table.c.run_id == run_id).values(cancelled=False, updated_at=now)
+                )
+
+    def cancel_run(self, run_id: str) -> bool:
+        """Cancel a run by marking it as cancelled.
+
+        Returns:
+            bool: True if run was found and cancelled, False if run not found.
+        """
+        with self.db_engine.begin() as conn:
+            result: Any = conn.execute(
+                update(self.table)
+                .where(self.table.c.run_id == run_id)
+                .values(cancelled=True, updated_at=int(time.time()))
+            )
+
+        if result.rowcount == 0:
+            logger.warning(f"Attempted to cancel unknown run {run_id}")
+            return False
+
+        self._mark_cancelled_locally(run_id)
+        logger.info(f"Run {run_id} marked for cancellation")
+        return True
+
+    def _read_cancelled(self, run_id: str) -> bool:
+        with self.db_engine.connect() as conn:
+            cancelled = conn.execute(select(self.table.c.cancelled).where(self.table.c.run_id == run_id)).scalar()
+        return bool(cancelled)
+
+    def cleanup_run(self, run_id: str) -> None:
+        """Remove a run from tracking (called when run completes)."""
+        self._forget(run_id)
+        with self.db_engine.begin() as conn:
+            conn.execute(self.table.delete().where(self.table.c.run_id == run_id))
+        log_debug(f"Removed cancellation state of run {run_id}")
+
+    def get_active_runs(self) -> Dict[str, bool]:
+        """Get all currently tracked runs and their cancellation status."""
+        with self.db_engine.connect() as conn:
+            rows = conn.execute(select(self.table.c.run_id, self.table.c.cancelled)).fetchall()
+        return {str(run_id): bool(cancelled) for run_id, cancelled in rows}
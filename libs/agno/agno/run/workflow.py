@@ -60,6 +60,10 @@ class WorkflowRunEvent(str, Enum):
     custom_event = "CustomEvent"
 
 
+# Workflow event fields that BaseWorkflowRunOutputEvent.to_dict serializes separately
+_WORKFLOW_EVENT_EXCLUDED_FIELDS = frozenset(["step_results", "step_response", "iteration_results", "all_results"])
+
+
 @dataclass
 class BaseWorkflowRunOutputEvent(BaseRunOutputEvent):
     """Base class for all workflow run response events"""
@@ -76,7 +80,7 @@ class BaseWorkflowRunOutputEvent(BaseRunOutputEvent):
     parent_step_id: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        _dict = {k: v for k, v in asdict(self).items() if v is not None}
+        _dict = self._fields_to_dict(exclude=_WORKFLOW_EVENT_EXCLUDED_FIELDS)
 
         if hasattr(self, "content") and self.content and isinstance(self.content, BaseModel):
             _dict["content"] = self.content.model_dump(exclude_none=True)
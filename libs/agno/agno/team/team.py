@@ -1,11 +1,15 @@
 import asyncio
 import contextlib
 import json
+import threading
 import warnings
 from collections import ChainMap, deque
-from copy import copy
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextvars import copy_context
+from copy import copy, deepcopy
 from dataclasses import dataclass
 from os import getenv
+from queue import Queue
 from textwrap import dedent
 from typing import (
     Any,
@@ -197,6 +201,9 @@ class Team:
     respond_directly: bool = False
     # If True, the team leader will delegate the task to all members, instead of deciding for a subset
     delegate_to_all_members: bool = False
+    # Maximum number of members run at the same time when delegating to all members in sync runs.
+    # None runs all members at once, 1 runs them one after another.
+    max_concurrent_members: Optional[int] = None
     # Set to false if you want to send the run input directly to the member agents
     determine_input_for_members: bool = True
 
@@ -331,6 +338,9 @@ class Team:
     tool_choice: Optional[Union[str, Dict[str, Any]]] = None
     # Maximum number of tool calls allowed.
     tool_call_limit: Optional[int] = None
+    # Maximum number of tool calls of one model response executed in parallel in sync runs.
+    # None or 1 executes them one after another. Async runs always execute them concurrently.
+    max_parallel_tool_calls: Optional[int] = None
     # A list of hooks to be called before and after the tool call
     tool_hooks: Optional[List[Callable]] = None
 
@@ -448,6 +458,7 @@ class Team:
         determine_input_for_members: bool = True,
         delegate_task_to_all_members: bool = False,
         delegate_to_all_members: bool = False,
+        max_concurrent_members: Optional[int] = None,
         user_id: Optional[str] = None,
         session_id: Optional[str] = None,
         session_state: Optional[Dict[str, Any]] = None,
@@ -496,6 +507,7 @@ class Team:
         max_tool_calls_from_history: Optional[int] = None,
         tools: Optional[List[Union[Toolkit, Callable, Function, Dict]]] = None,
         tool_call_limit: Optional[int] = None,
+        max_parallel_tool_calls: Optional[int] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_hooks: Optional[List[Callable]] = None,
         pre_hooks: Optional[List[Union[Callable[..., Any], BaseGuardrail]]] = None,
@@ -555,6 +567,7 @@ class Team:
         self.respond_directly = respond_directly
         self.determine_input_for_members = determine_input_for_members
         self.delegate_to_all_members = delegate_to_all_members or delegate_task_to_all_members
+        self.max_concurrent_members = max_concurrent_members
 
         self.user_id = user_id
         self.session_id = session_id
@@ -621,6 +634,7 @@ class Team:
         self.tools = tools
         self.tool_choice = tool_choice
         self.tool_call_limit = tool_call_limit
+        self.max_parallel_tool_calls = max_parallel_tool_calls
         self.tool_hooks = tool_hooks
 
         # Initialize hooks with backward compatibility
@@ -1373,6 +1387,7 @@ class Team:
                 tools=_tools,
                 tool_choice=self.tool_choice,
                 tool_call_limit=self.tool_call_limit,
+                max_parallel_tool_calls=self.max_parallel_tool_calls,
                 send_media_to_model=self.send_media_to_model,
             )
 
@@ -2991,6 +3006,7 @@ class Team:
             tools=tools,
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
+            max_parallel_tool_calls=self.max_parallel_tool_calls,
             stream_model_response=stream_model_response,
             send_media_to_model=self.send_media_to_model,
         ):
@@ -5147,7 +5163,7 @@ class Team:
                     if name in _function_names:
                         continue
                     _function_names.append(name)
-                    _func = _func.model_copy(deep=True)
+                    _func = _func.model_copy()
 
                     _func._team = self
                     _func.process_entrypoint(strict=strict)
@@ -5168,7 +5184,7 @@ class Team:
                 if tool.name in _function_names:
                     continue
                 _function_names.append(tool.name)
-                tool = tool.model_copy(deep=True)
+                tool = tool.model_copy()
                 tool._team = self
                 tool.process_entrypoint(strict=strict)
                 if strict and tool.strict is None:
@@ -5188,7 +5204,6 @@ class Team:
                 # We add the tools, which are callable functions
                 try:
                     _func = Function.from_callable(tool, strict=strict)
-                    _func = _func.model_copy(deep=True)
                     if _func.name in _function_names:
                         continue
                     _function_names.append(_func.name)
@@ -5208,7 +5223,7 @@ class Team:
 
             # Check if any functions need media before collecting
             needs_media = any(
-                any(param in signature(func.entrypoint).parameters for param in ["images", "videos", "audios", "files"])
+                not {"images", "videos", "audios", "files"}.isdisjoint(signature(func.entrypoint).parameters)
                 for func in _functions
                 if isinstance(func, Function) and func.entrypoint is not None
             )
@@ -7409,6 +7424,156 @@ class Team:
                 member_session_state_copy,  # type: ignore
             )
 
+        def _get_member_response_str(
+            member_name: Optional[str], member_agent_run_response: Union[TeamRunOutput, RunOutput]
+        ) -> str:
+            """Format the response of a member for the result of delegate_task_to_members."""
+            try:
+                if member_agent_run_response.content is None and (
+                    member_agent_run_response.tools is None or len(member_agent_run_response.tools) == 0
+                ):
+                    return f"Agent {member_name}: No response from the member agent."
+                elif isinstance(member_agent_run_response.content, str):
+                    if len(member_agent_run_response.content.strip()) > 0:
+                        return f"Agent {member_name}: {member_agent_run_response.content}"
+                    elif member_agent_run_response.tools is not None and len(member_agent_run_response.tools) > 0:
+                        return f"Agent {member_name}: {','.join([str(tool.result) for tool in member_agent_run_response.tools])}"
+                elif issubclass(type(member_agent_run_response.content), BaseModel):
+                    return f"Agent {member_name}: {member_agent_run_response.content.model_dump_json(indent=2)}"  # type: ignore
+                else:
+                    return f"Agent {member_name}: {json.dumps(member_agent_run_response.content, indent=2)}"
+            except Exception as e:
+                return f"Agent {member_name}: Error - {str(e)}"
+            return f"Agent {member_name}: No Response"
+
+        def _delegate_task_to_members_concurrently(
+            task: str, max_workers: int
+        ) -> Iterator[Union[RunOutputEvent, TeamRunOutputEvent, str]]:
+            """Run all members in a thread pool.
+
+            Each member gets its own deep copy of the session state. Member events are yielded as they arrive,
+            while the member outputs, session state updates and metrics are merged in member order once all members are done.
+            """
+            member_runs: List[Tuple[Union[Agent, "Team"], Any, Any, Dict[str, Any]]] = []
+            for member_agent in self.members:
+                member_agent_task, history = _setup_delegate_task_to_member(
+                    member_agent=member_agent, task_description=task
+                )
+                member_runs.append((member_agent, member_agent_task, history, deepcopy(run_context.session_state)))  # type: ignore
+
+            def run_member(
+                member_agent: Union[Agent, "Team"],
+                member_agent_task: Any,
+                history: Any,
+                member_session_state_copy: Dict[str, Any],
+                stream_member: bool,
+            ) -> Any:
+                return member_agent.run(  # type: ignore
+                    input=member_agent_task if not history else history,
+                    user_id=user_id,
+                    # All members have the same session_id
+                    session_id=session.session_id,
+                    session_state=member_session_state_copy,  # Send a copy to the agent
+                    images=images,
+                    videos=videos,
+                    audio=audio,
+                    files=files,
+                    stream=stream_member,
+                    stream_events=stream_events if stream_member else None,
+                    knowledge_filters=run_context.knowledge_filters
+                    if not member_agent.knowledge_filters and member_agent.knowledge
+                    else None,
+                    debug_mode=debug_mode,
+                    dependencies=run_context.dependencies,
+                    add_dependencies_to_context=add_dependencies_to_context,
+                    add_session_state_to_context=add_session_state_to_context,
+                    metadata=run_context.metadata,
+                    yield_run_output=True if stream_member else None,
+                )
+
+            member_responses: List[Optional[Union[TeamRunOutput, RunOutput]]] = [None] * len(member_runs)
+            executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="agno-team-member")
+            finished = False
+            try:
+                if stream:
+                    # Members push their events to a queue, so they are yielded as they arrive
+                    events: "Queue[Tuple[int, Any, bool]]" = Queue()
+                    stop_streaming = threading.Event()
+
+                    def stream_member(index: int) -> None:
+                        member_agent, member_agent_task, history, member_session_state_copy = member_runs[index]
+                        try:
+                            for chunk in run_member(
+                                member_agent, member_agent_task, history, member_session_state_copy, True
+                            ):
+                                if isinstance(chunk, (TeamRunOutput, RunOutput)):
+                                    member_responses[index] = chunk
+                                elif not stop_streaming.is_set():
+                                    events.put((index, chunk, False))
+                            events.put((index, None, True))
+                        except BaseException as e:
+                            events.put((index, e, True))
+
+                    for index in range(len(member_runs)):
+                        executor.submit(copy_context().run, stream_member, index)
+
+                    completed = 0
+                    try:
+                        while completed < len(member_runs):
+                            _, item, done = events.get()
+                            if done:
+                                completed += 1
+                                if isinstance(item, BaseException):
+                                    raise item
+                                continue
+
+                            # Check if the run is cancelled
+                            check_if_run_cancelled(item)
+
+                            # Yield the member event directly
+                            item.parent_run_id = item.parent_run_id or run_response.run_id
+                            yield item
+                    finally:
+                        stop_streaming.set()
+                else:
+                    futures = [
+                        executor.submit(
+                            copy_context().run,
+                            run_member,
+                            member_agent,
+                            member_agent_task,
+                            history,
+                            member_session_state_copy,
+                            False,
+                        )
+                        for member_agent, member_agent_task, history, member_session_state_copy in member_runs
+                    ]
+                    next_index = 0
+                    # Errors are raised as soon as a member fails, outputs are yielded in member order
+                    for future in as_completed(futures):
+                        check_if_run_cancelled(future.result())
+                        while next_index < len(futures) and futures[next_index].done():
+                            member_agent_run_response = futures[next_index].result()
+                            check_if_run_cancelled(member_agent_run_response)
+                            member_responses[next_index] = member_agent_run_response
+                            yield _get_member_response_str(member_runs[next_index][0].name, member_agent_run_response)
+                            next_index += 1
+                finished = True
+            finally:
+                # On errors and early exits, don't wait for the members still running and cancel those not started
+                executor.shutdown(wait=finished, cancel_futures=not finished)
+
+            # Merge the member runs in member order, so the result doesn't depend on which member finished first
+            for (member_agent, member_agent_task, _, member_session_state_copy), member_agent_run_response in zip(
+                member_runs, member_responses
+            ):
+                _process_delegate_task_to_member(
+                    member_agent_run_response,
+                    member_agent,
+                    member_agent_task,
+                    member_session_state_copy,
+                )
+
         # When the task should be delegated to all members
         def delegate_task_to_members(task: str) -> Iterator[Union[RunOutputEvent, TeamRunOutputEvent, str]]:
             """
@@ -7421,6 +7586,13 @@ class Team:
                 str: The result of the delegated task.
             """
 
+            max_workers = min(self.max_concurrent_members or len(self.members), len(self.members))
+            if max_workers > 1:
+                yield from _delegate_task_to_members_concurrently(task, max_workers=max_workers)
+                # After all the member runs, switch back to the team logger
+                use_team_logger()
+                return
+
             # Run all the members sequentially
             for _, member_agent in enumerate(self.members):
                 member_agent_task, history = _setup_delegate_task_to_member(
@@ -7490,27 +7662,7 @@ class Team:
                     )
 
                     check_if_run_cancelled(member_agent_run_response)  # type: ignore
-
-                    try:
-                        if member_agent_run_response.content is None and (  # type: ignore
-                            member_agent_run_response.tools is None or len(member_agent_run_response.tools) == 0  # type: ignore
-                        ):
-                            yield f"Agent {member_agent.name}: No response from the member agent."
-                        elif isinstance(member_agent_run_response.content, str):  # type: ignore
-                            if len(member_agent_run_response.content.strip()) > 0:  # type: ignore
-                                yield f"Agent {member_agent.name}: {member_agent_run_response.content}"  # type: ignore
-                            elif (
-                                member_agent_run_response.tools is not None and len(member_agent_run_response.tools) > 0  # type: ignore
-                            ):
-                                yield f"Agent {member_agent.name}: {','.join([tool.result for tool in member_agent_run_response.tools])}"  # type: ignore
-                        elif issubclass(type(member_agent_run_response.content), BaseModel):  # type: ignore
-                            yield f"Agent {member_agent.name}: {member_agent_run_response.content.model_dump_json(indent=2)}"  # type: ignore
-                        else:
-                            import json
-
-                            yield f"Agent {member_agent.name}: {json.dumps(member_agent_run_response.content, indent=2)}"  # type: ignore
-                    except Exception as e:
-                        yield f"Agent {member_agent.name}: Error - {str(e)}"
+                    yield _get_member_response_str(member_agent.name, member_agent_run_response)  # type: ignore
 
                 _process_delegate_task_to_member(
                     member_agent_run_response,
@@ -7655,29 +7807,7 @@ class Team:
                         )
 
                         member_name = member_agent.name if member_agent.name else f"agent_{member_agent_index}"
-                        try:
-                            if member_agent_run_response.content is None and (
-                                member_agent_run_response.tools is None or len(member_agent_run_response.tools) == 0
-                            ):
-                                return f"Agent {member_name}: No response from the member agent."
-                            elif isinstance(member_agent_run_response.content, str):
-                                if len(member_agent_run_response.content.strip()) > 0:
-                                    return f"Agent {member_name}: {member_agent_run_response.content}"
-                                elif (
-                                    member_agent_run_response.tools is not None
-                                    and len(member_agent_run_response.tools) > 0
-                                ):
-                                    return f"Agent {member_name}: {','.join([tool.result for tool in member_agent_run_response.tools])}"
-                            elif issubclass(type(member_agent_run_response.content), BaseModel):
-                                return f"Agent {member_name}: {member_agent_run_response.content.model_dump_json(indent=2)}"  # type: ignore
-                            else:
-                                import json
-
-                                return f"Agent {member_name}: {json.dumps(member_agent_run_response.content, indent=2)}"
-                        except Exception as e:
-                            return f"Agent {member_name}: Error - {str(e)}"
-
-                        return f"Agent {member_name}: No Response"
+                        return _get_member_response_str(member_name, member_agent_run_response)
 
                     tasks.append(run_member_agent)  # type: ignore
 
@@ -66,6 +66,7 @@ def tool(
     add_instructions: bool = True,
     show_result: Optional[bool] = None,
     stop_after_tool_call: Optional[bool] = None,
+    parallel_safe: bool = True,
     requires_confirmation: Optional[bool] = None,
     requires_user_input: Optional[bool] = None,
     user_input_fields: Optional[List[str]] = None,
@@ -94,6 +95,7 @@ def tool(*args, **kwargs) -> Union[Function, Callable[[F], Function]]:
         add_instructions: bool - If True, add instructions to the system message
         show_result: Optional[bool] - If True, shows the result after function call
         stop_after_tool_call: Optional[bool] - If True, the agent will stop after the function call.
+        parallel_safe: bool - If False, the function is never executed in parallel with other tool calls
         requires_confirmation: Optional[bool] - If True, the function will require user confirmation before execution
         requires_user_input: Optional[bool] - If True, the function will require user input before execution
         user_input_fields: Optional[List[str]] - List of fields that will be provided to the function as user input
@@ -131,6 +133,7 @@ def tool(*args, **kwargs) -> Union[Function, Callable[[F], Function]]:
             "add_instructions",
             "show_result",
             "stop_after_tool_call",
+            "parallel_safe",
             "requires_confirmation",
             "requires_user_input",
             "user_input_fields",
@@ -1,7 +1,23 @@
+import threading
+from collections import OrderedDict
+from copy import deepcopy
 from dataclasses import dataclass
 from functools import partial
 from importlib.metadata import version
-from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Type, TypeVar, get_type_hints
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    get_type_hints,
+)
 
 from docstring_parser import parse
 from packaging.version import Version
@@ -62,6 +78,112 @@ class UserInputField:
         )
 
 
+@dataclass
+class ToolSchemaCacheStats:
+    """Counters of the process-wide cache of compiled tool schemas"""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "hit_rate": self.hit_rate}
+
+
+def _copy_user_input_schema(schema: Optional[List[UserInputField]]) -> Optional[List[UserInputField]]:
+    # Values are filled in per run, so every Function gets its own fields
+    if schema is None:
+        return None
+    return [UserInputField(f.name, f.field_type, f.description, f.value) for f in schema]
+
+
+class _CompiledFunction:
+    """The result of processing an entrypoint: its JSON schema, description and validating wrapper"""
+
+    __slots__ = ("source", "source_parameters", "name", "parameters", "description", "entrypoint", "user_input_schema")
+
+    def __init__(
+        self,
+        source: Callable,
+        source_parameters: Optional[Dict[str, Any]],
+        name: str,
+        parameters: Dict[str, Any],
+        description: Optional[str],
+        entrypoint: Optional[Callable],
+        user_input_schema: Optional[List[UserInputField]],
+    ):
+        self.source = source
+        self.source_parameters = source_parameters
+        self.name = name
+        self.parameters = parameters
+        self.description = description
+        self.entrypoint = entrypoint
+        self.user_input_schema = user_input_schema
+
+    def copy_user_input_schema(self) -> Optional[List[UserInputField]]:
+        return _copy_user_input_schema(self.user_input_schema)
+
+
+class _ToolSchemaCache:
+    """Compiled functions keyed by the identity of their entrypoint and the options that shape their schema.
+
+    Entries hold a reference to their entrypoint, so an id is never reused while its entry exists.
+    The least recently used entries are evicted beyond `max_size`.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self.stats = ToolSchemaCacheStats()
+
+        self._entries: "OrderedDict[Tuple[Hashable, ...], _CompiledFunction]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self, key: Tuple[Hashable, ...], source: Callable, source_parameters: Optional[Dict[str, Any]] = None
+    ) -> Optional[_CompiledFunction]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.source is not source or entry.source_parameters != source_parameters:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry
+
+    def put(self, key: Tuple[Hashable, ...], entry: _CompiledFunction) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.stats = ToolSchemaCacheStats()
+
+
+_tool_schema_cache = _ToolSchemaCache()
+
+
+def get_tool_schema_cache_stats() -> ToolSchemaCacheStats:
+    """Return the counters of the process-wide cache of compiled tool schemas."""
+    return _tool_schema_cache.stats
+
+
+def clear_tool_schema_cache() -> None:
+    """Drop all compiled tool schemas and reset the counters, e.g. after redefining functions at runtime."""
+    _tool_schema_cache.clear()
+
+
 class Function(BaseModel):
     """Model for storing functions that can be called by an agent."""
 
@@ -90,6 +212,8 @@ class Function(BaseModel):
     show_result: bool = False
     # If True, the agent will stop after the function call.
     stop_after_tool_call: bool = False
+    # If False, the function is never executed in parallel with other tool calls (e.g. when it is not thread-safe).
+    parallel_safe: bool = True
     # Hook that runs before the function is executed.
     # If defined, can accept the FunctionCall instance as a parameter.
     pre_hook: Optional[Callable] = None
@@ -146,6 +270,7 @@ class Function(BaseModel):
         """
         Override model_copy to handle callable fields that can't be deep copied (pickled).
         Callables should always be shallow copied (referenced), not deep copied.
+        Shallow copies share the parameters, which are replaced rather than updated in place when processed.
         """
         # For deep copy, we need to handle callable fields specially
         if deep:
@@ -184,11 +309,27 @@ class Function(BaseModel):
 
     @classmethod
     def from_callable(cls, c: Callable, name: Optional[str] = None, strict: bool = False) -> "Function":
+        function_name = name or c.__name__
+        # The schema of a callable is compiled once per process, and shared by the Functions created from it
+        cache_key = ("callable", id(c), function_name, strict)
+        compiled = _tool_schema_cache.get(cache_key, c)
+        if compiled is None:
+            compiled = cls._compile_callable(c, function_name=function_name, strict=strict)
+            _tool_schema_cache.put(cache_key, compiled)
+
+        return cls(
+            name=compiled.name,
+            description=compiled.description,
+            parameters=compiled.parameters,
+            entrypoint=compiled.entrypoint,
+        )
+
+    @classmethod
+    def _compile_callable(cls, c: Callable, function_name: str, strict: bool = False) -> _CompiledFunction:
         from inspect import getdoc, signature
 
         from agno.utils.json_schema import get_json_schema
 
-        function_name = name or c.__name__
         parameters = {"type": "object", "properties": {}, "required": []}
         try:
             sig = signature(c)
@@ -304,11 +445,14 @@ class Function(BaseModel):
 
         entrypoint = cls._wrap_callable(c)
 
-        return cls(
+        return _CompiledFunction(
+            source=c,
+            source_parameters=None,
             name=function_name,
-            description=get_entrypoint_docstring(entrypoint=c),
             parameters=parameters,
+            description=get_entrypoint_docstring(entrypoint=c),
             entrypoint=entrypoint,
+            user_input_schema=None,
         )
 
     def process_entrypoint(self, strict: bool = False):
@@ -325,12 +469,34 @@ class Function(BaseModel):
         if self.entrypoint is None:
             return
 
+        # Entrypoints are compiled once per process for each set of options that shapes their schema
+        source = self.entrypoint
+        cache_key = (
+            "entrypoint",
+            id(source),
+            strict,
+            self.description,
+            bool(self.requires_user_input),
+            tuple(self.user_input_fields) if self.user_input_fields is not None else None,
+        )
+        compiled = _tool_schema_cache.get(cache_key, source, self.parameters)
+        if compiled is not None:
+            self.parameters = compiled.parameters
+            self.description = compiled.description
+            self.entrypoint = compiled.entrypoint
+            if self.requires_user_input:
+                self.user_input_schema = compiled.copy_user_input_schema()
+            return
+        source_parameters = deepcopy(self.parameters)
+
         parameters = {"type": "object", "properties": {}, "required": []}
 
         params_set_by_user = False
         # If the user set the parameters (i.e. they are different from the default), we should keep them
         if self.parameters != parameters:
             params_set_by_user = True
+            # Copies of this Function may share the parameters, so they are updated on a copy
+            self.parameters = deepcopy(self.parameters)
 
         if self.requires_user_input:
             self.user_input_schema = self.user_input_schema or []
@@ -459,6 +625,19 @@ class Function(BaseModel):
         except Exception as e:
             log_warning(f"Failed to add validate decorator to entrypoint: {e}")
 
+        _tool_schema_cache.put(
+            cache_key,
+            _CompiledFunction(
+                source=source,
+                source_parameters=source_parameters,
+                name=self.name,
+                parameters=self.parameters,
+                description=self.description,
+                entrypoint=self.entrypoint,
+                user_input_schema=_copy_user_input_schema(self.user_input_schema) if self.requires_user_input else None,
+            ),
+        )
+
     @staticmethod
     def _wrap_callable(func: Callable) -> Callable:
         """Wrap a callable with Pydantic's validate_call decorator, if relevant"""
@@ -1,10 +1,14 @@
 from agno.tools.mcp.mcp import MCPTools
 from agno.tools.mcp.multi_mcp import MultiMCPTools
 from agno.tools.mcp.params import SSEClientParams, StreamableHTTPClientParams
+from agno.tools.mcp.pool import MCPConnection, MCPPoolStats, MCPSessionPool
 
 __all__ = [
     "MCPTools",
     "MultiMCPTools",
+    "MCPConnection",
+    "MCPPoolStats",
+    "MCPSessionPool",
     "StreamableHTTPClientParams",
     "SSEClientParams",
 ]
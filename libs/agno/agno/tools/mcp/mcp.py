@@ -1,7 +1,7 @@
 import weakref
 from dataclasses import asdict
 from datetime import timedelta
-from typing import Any, Literal, Optional, Union
+from typing import TYPE_CHECKING, Any, Literal, Optional, Union
 
 from agno.tools import Toolkit
 from agno.tools.function import Function
@@ -17,6 +17,9 @@ try:
 except (ImportError, ModuleNotFoundError):
     raise ImportError("`mcp` not installed. Please install using `pip install mcp`")
 
+if TYPE_CHECKING:
+    from agno.tools.mcp.pool import MCPConnection, MCPSessionPool
+
 
 class MCPTools(Toolkit):
     """
@@ -44,6 +47,7 @@ class MCPTools(Toolkit):
         exclude_tools: Optional[list[str]] = None,
         refresh_connection: bool = False,
         tool_name_prefix: Optional[str] = "",
+        pool: Optional["MCPSessionPool"] = None,
         **kwargs,
     ):
         """
@@ -61,6 +65,8 @@ class MCPTools(Toolkit):
             exclude_tools: Optional list of tool names to exclude (if None, excludes none)
             transport: The transport protocol to use, either "stdio" or "sse" or "streamable-http"
             refresh_connection: If True, the connection and tools will be refreshed on each run
+            pool: A MCPSessionPool keeping the connection alive across runs. Closing the toolkit then releases the
+                connection to the pool, and the next connect reuses it with its cached tool listing.
         """
         super().__init__(name="MCPTools", **kwargs)
 
@@ -73,6 +79,7 @@ class MCPTools(Toolkit):
         self.exclude_tools = exclude_tools
         self.refresh_connection = refresh_connection
         self.tool_name_prefix = tool_name_prefix
+        self.pool = pool
 
         if session is None and server_params is None:
             if transport == "sse" and url is None:
@@ -128,6 +135,8 @@ class MCPTools(Toolkit):
             self.server_params = StdioServerParameters(command=cmd, args=arguments, env=env)
 
         self._client = client
+        # The pooled connection used when the toolkit has a pool
+        self._connection: Optional["MCPConnection"] = None
 
         self._initialized = False
         self._connection_task = None
@@ -148,6 +157,12 @@ class MCPTools(Toolkit):
         return self._initialized
 
     async def is_alive(self) -> bool:
+        if self._connection is not None:
+            try:
+                await self._connection.send_ping()
+                return True
+            except (RuntimeError, BaseException):
+                return False
         if self.session is None:
             return False
         try:
@@ -167,6 +182,7 @@ class MCPTools(Toolkit):
             self._initialized = False
             self._connection_task = None
             self._active_contexts = []
+            self._connection = None
 
         if self._initialized:
             return
@@ -186,6 +202,14 @@ class MCPTools(Toolkit):
             await self.initialize()
             return
 
+        # Reuse the connection kept alive by the pool
+        if self.pool is not None:
+            self._connection = await self.pool.acquire(self._get_server_params())
+            self.session = self._connection.session
+            await self.build_tools()
+            self._initialized = True
+            return
+
         # Create a new studio session
         if self.transport == "sse":
             sse_params = asdict(self.server_params) if self.server_params is not None else {}  # type: ignore
@@ -222,11 +246,30 @@ class MCPTools(Toolkit):
         # Initialize with the new session
         await self.initialize()
 
+    def _get_server_params(self) -> Union[StdioServerParameters, SSEClientParams, StreamableHTTPClientParams]:
+        if self.server_params is not None:
+            return self.server_params
+        if self.transport == "sse":
+            return SSEClientParams(url=self.url)  # type: ignore
+        if self.transport == "streamable-http":
+            return StreamableHTTPClientParams(url=self.url)  # type: ignore
+        raise ValueError("server_params must be provided when using stdio transport.")
+
+    def _release_connection(self) -> None:
+        """Release the pooled connection, which stays open for the next run"""
+        self._connection = None
+        self.session = None
+        self._initialized = False
+
     async def close(self) -> None:
         """Close the MCP connection and clean up resources"""
         if not self._initialized:
             return
 
+        if self._connection is not None:
+            self._release_connection()
+            return
+
         try:
             if self._session_context is not None:
                 await self._session_context.__aexit__(None, None, None)
@@ -247,6 +290,10 @@ class MCPTools(Toolkit):
 
     async def __aexit__(self, _exc_type, _exc_val, _exc_tb):
         """Exit the async context manager."""
+        if self._connection is not None:
+            self._release_connection()
+            return
+
         if self._session_context is not None:
             await self._session_context.__aexit__(_exc_type, _exc_val, _exc_tb)
             self.session = None
@@ -260,12 +307,15 @@ class MCPTools(Toolkit):
 
     async def build_tools(self) -> None:
         """Build the tools for the MCP toolkit"""
-        if self.session is None:
+        if self.session is None and self._connection is None:
             raise ValueError("Session is not initialized")
 
+        # Pooled connections cache the tool listing, and keep working for the registered tools after a reconnect
+        session = self._connection if self._connection is not None else self.session
+
         try:
             # Get the list of tools from the MCP server
-            available_tools = await self.session.list_tools()  # type: ignore
+            available_tools = await session.list_tools()  # type: ignore
 
             self._check_tools_filters(
                 available_tools=[tool.name for tool in available_tools.tools],
@@ -290,7 +340,7 @@ class MCPTools(Toolkit):
             for tool in filtered_tools:
                 try:
                     # Get an entrypoint for the tool
-                    entrypoint = get_entrypoint_for_tool(tool, self.session)  # type: ignore
+                    entrypoint = get_entrypoint_for_tool(tool, session)  # type: ignore
                     # Create a Function for the tool
                     f = Function(
                         name=tool_name_prefix + tool.name,
@@ -1,21 +1,17 @@
 import weakref
-from contextlib import AsyncExitStack
-from dataclasses import asdict
-from datetime import timedelta
 from types import TracebackType
 from typing import List, Literal, Optional, Union
 
 from agno.tools import Toolkit
 from agno.tools.function import Function
 from agno.tools.mcp.params import SSEClientParams, StreamableHTTPClientParams
+from agno.tools.mcp.pool import MCPConnection, MCPSessionPool
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.mcp import get_entrypoint_for_tool, prepare_command
 
 try:
     from mcp import ClientSession, StdioServerParameters
-    from mcp.client.sse import sse_client
-    from mcp.client.stdio import get_default_environment, stdio_client
-    from mcp.client.streamable_http import streamablehttp_client
+    from mcp.client.stdio import get_default_environment
 except (ImportError, ModuleNotFoundError):
     raise ImportError("`mcp` not installed. Please install using `pip install mcp`")
 
@@ -47,6 +43,7 @@ class MultiMCPTools(Toolkit):
         exclude_tools: Optional[list[str]] = None,
         refresh_connection: bool = False,
         allow_partial_failure: bool = False,
+        pool: Optional[MCPSessionPool] = None,
         **kwargs,
     ):
         """
@@ -64,6 +61,9 @@ class MultiMCPTools(Toolkit):
             exclude_tools: Optional list of tool names to exclude (if None, excludes none).
             allow_partial_failure: If True, allows toolkit to initialize even if some MCP servers fail to connect. If False, any failure will raise an exception.
             refresh_connection: If True, the connection and tools will be refreshed on each run
+            pool: A MCPSessionPool keeping the connections alive across runs. Closing the toolkit then releases the
+                connections to the pool, and the next connect reuses them with their cached tool listings.
+                Without a pool, the toolkit opens its own connections and closes them when it is closed.
         """
         super().__init__(name="MultiMCPTools", **kwargs)
 
@@ -122,14 +122,16 @@ class MultiMCPTools(Toolkit):
                 for url in urls:
                     self.server_params_list.append(StreamableHTTPClientParams(url=url))
 
-        self._async_exit_stack = AsyncExitStack()
+        self.pool = pool
+        # The pool of the connections opened by the toolkit itself, when no pool is given
+        self._own_pool: Optional[MCPSessionPool] = None
 
         self._client = client
 
         self._initialized = False
         self._connection_task = None
         self._successful_connections = 0
-        self._sessions: list[ClientSession] = []
+        self._sessions: list[Union[ClientSession, MCPConnection]] = []
 
         self.allow_partial_failure = allow_partial_failure
 
@@ -214,46 +216,25 @@ class MultiMCPTools(Toolkit):
 
         server_connection_errors = []
 
-        for server_params in self.server_params_list:
-            try:
-                # Handle stdio connections
-                if isinstance(server_params, StdioServerParameters):
-                    stdio_transport = await self._async_exit_stack.enter_async_context(stdio_client(server_params))
-                    read, write = stdio_transport
-                    session = await self._async_exit_stack.enter_async_context(
-                        ClientSession(read, write, read_timeout_seconds=timedelta(seconds=self.timeout_seconds))
-                    )
-                    await self.initialize(session)
-                    self._successful_connections += 1
-
-                # Handle SSE connections
-                elif isinstance(server_params, SSEClientParams):
-                    client_connection = await self._async_exit_stack.enter_async_context(
-                        sse_client(**asdict(server_params))
-                    )
-                    read, write = client_connection
-                    session = await self._async_exit_stack.enter_async_context(ClientSession(read, write))
-                    await self.initialize(session)
-                    self._successful_connections += 1
-
-                # Handle Streamable HTTP connections
-                elif isinstance(server_params, StreamableHTTPClientParams):
-                    client_connection = await self._async_exit_stack.enter_async_context(
-                        streamablehttp_client(**asdict(server_params))
-                    )
-                    read, write = client_connection[0:2]
-                    session = await self._async_exit_stack.enter_async_context(ClientSession(read, write))
-                    await self.initialize(session)
-                    self._successful_connections += 1
+        pool = self.pool
+        if pool is None:
+            pool = self._own_pool = self._own_pool or MCPSessionPool(timeout_seconds=self.timeout_seconds)
 
-            except Exception as e:
+        # Each connection is opened by its own task, so the servers are connected concurrently
+        connections = await pool.acquire_many(self.server_params_list)
+        for server_params, connection in zip(self.server_params_list, connections):
+            if isinstance(connection, BaseException):
                 if not self.allow_partial_failure:
-                    raise ValueError(f"MCP connection failed: {e}")
+                    await self._release_connections()
+                    raise ValueError(f"MCP connection failed: {connection}")
 
-                log_error(f"Failed to initialize MCP server with params {server_params}: {e}")
-                server_connection_errors.append(str(e))
+                log_error(f"Failed to initialize MCP server with params {server_params}: {connection}")
+                server_connection_errors.append(str(connection))
                 continue
 
+            self._sessions.append(connection)
+            self._successful_connections += 1
+
         if self._successful_connections > 0:
             await self.build_tools()
 
@@ -263,16 +244,23 @@ class MultiMCPTools(Toolkit):
         if not self._initialized and self._successful_connections > 0:
             self._initialized = True
 
+    async def _release_connections(self) -> None:
+        """Release the connections to the pool, closing the connections opened by the toolkit itself"""
+        self._sessions = []
+        self._successful_connections = 0
+        self._initialized = False
+
+        own_pool, self._own_pool = self._own_pool, None
+        if own_pool is not None:
+            await own_pool.close()
+
     async def close(self) -> None:
         """Close the MCP connections and clean up resources"""
         if not self._initialized:
             return
 
         try:
-            await self._async_exit_stack.aclose()
-            self._sessions = []
-            self._successful_connections = 0
-
+            await self._release_connections()
         except (RuntimeError, BaseException) as e:
             log_error(f"Failed to close MCP connections: {e}")
 
@@ -293,11 +281,10 @@ class MultiMCPTools(Toolkit):
         exc_tb: Union[TracebackType, None],
     ):
         """Exit the async context manager."""
-        await self._async_exit_stack.aclose()
-        self._initialized = False
-        self._successful_connections = 0
+        await self._release_connections()
 
     async def build_tools(self) -> None:
+        # Pooled connections cache their tool listing
         for session in self._sessions:
             # Get the list of tools from the MCP server
             available_tools = await session.list_tools()
@@ -0,0 +1,328 @@
+import asyncio
+import json
+import time
+from contextlib import AsyncExitStack
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from agno.tools.mcp.params import SSEClientParams, StreamableHTTPClientParams
+from agno.utils.log import log_debug, log_warning
+
+try:
+    from mcp import ClientSession, StdioServerParameters
+    from mcp.client.sse import sse_client
+    from mcp.client.stdio import stdio_client
+    from mcp.client.streamable_http import streamablehttp_client
+    from mcp.types import CallToolResult, ListToolsResult, ServerNotification, ToolListChangedNotification
+except (ImportError, ModuleNotFoundError):
+    raise ImportError("`mcp` not installed. Please install using `pip install mcp`")
+
+
+ServerParams = Union[StdioServerParameters, SSEClientParams, StreamableHTTPClientParams]
+
+
+@dataclass
+class MCPPoolStats:
+    """Counters of an MCP session pool"""
+
+    connections: int = 0
+    reconnections: int = 0
+    failed_health_checks: int = 0
+    tool_list_hits: int = 0
+    tool_list_misses: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            "connections": self.connections,
+            "reconnections": self.reconnections,
+            "failed_health_checks": self.failed_health_checks,
+            "tool_list_hits": self.tool_list_hits,
+            "tool_list_misses": self.tool_list_misses,
+        }
+
+
+def _get_server_key(server_params: ServerParams) -> Tuple[str, str]:
+    if isinstance(server_params, StdioServerParameters):
+        return "stdio", server_params.model_dump_json()
+    return type(server_params).__name__, json.dumps(asdict(server_params), sort_keys=True, default=str)
+
+
+class MCPConnection:
+    """A connection to one MCP server, shared by the toolkits using the server.
+
+    The transport and session are opened and closed by a background task, so the connection outlives the
+    runs using it and can be closed from any task of the event loop. It can be used wherever the toolkits
+    expect a `ClientSession`: tool calls go through the current session, even after a reconnect.
+
+    Args:
+        server_params: Parameters of the server.
+        timeout_seconds: Read timeout of the session, and timeout of health checks.
+        max_concurrent_calls: Maximum number of tool calls in flight on the server.
+        tools_ttl: Seconds the tool listing is cached for. Defaults to caching it until the server reports a change.
+        health_check_interval: Seconds during which a successful health check is trusted.
+        stats: Counters shared with the pool.
+    """
+
+    def __init__(
+        self,
+        server_params: ServerParams,
+        timeout_seconds: int = 10,
+        max_concurrent_calls: int = 8,
+        tools_ttl: Optional[float] = None,
+        health_check_interval: float = 30.0,
+        stats: Optional[MCPPoolStats] = None,
+    ):
+        self.server_params = server_params
+        self.timeout_seconds = timeout_seconds
+        self.tools_ttl = tools_ttl
+        self.health_check_interval = health_check_interval
+        self.stats = stats or MCPPoolStats()
+
+        self.session: Optional[ClientSession] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closing: Optional[asyncio.Event] = None
+        self._lock = asyncio.Lock()
+        self._calls = asyncio.Semaphore(max_concurrent_calls)
+
+        self._healthy = False
+        self._checked_at = 0.0
+        self._tools: Optional[ListToolsResult] = None
+        self._tools_listed_at = 0.0
+        self._tools_version = 0
+
+    def __repr__(self) -> str:
+        if isinstance(self.server_params, StdioServerParameters):
+            return f"MCPConnection({' '.join([self.server_params.command, *self.server_params.args])})"
+        return f"MCPConnection({self.server_params.url})"
+
+    @property
+    def connected(self) -> bool:
+        return self.session is not None and self._task is not None and not self._task.done()
+
+    def _open_transport(self) -> Any:
+        if isinstance(self.server_params, SSEClientParams):
+            return sse_client(**asdict(self.server_params))
+        if isinstance(self.server_params, StreamableHTTPClientParams):
+            return streamablehttp_client(**asdict(self.server_params))
+        return stdio_client(self.server_params)
+
+    async def _serve(self, ready: "asyncio.Future[None]", closing: asyncio.Event) -> None:
+        """Open the connection, then keep it open until it is closed"""
+        try:
+            async with AsyncExitStack() as stack:
+                streams = await stack.enter_async_context(self._open_transport())
+                session = await stack.enter_async_context(
+                    ClientSession(
+                        streams[0],
+                        streams[1],
+                        read_timeout_seconds=timedelta(seconds=self.timeout_seconds),
+                        message_handler=self._handle_message,
+                    )
+                )
+                await session.initialize()
+                self.session = session
+                ready.set_result(None)
+                await closing.wait()
+        except asyncio.CancelledError:
+            if not ready.done():
+                ready.cancel()
+            raise
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                log_warning(f"{self} closed with an error: {e}")
+        finally:
+            self.session = None
+
+    async def _handle_message(self, message: Any) -> None:
+        if isinstance(message, ServerNotification) and isinstance(message.root, ToolListChangedNotification):
+            log_debug(f"Tool listing of {self} changed")
+            self.invalidate_tools()
+
+    async def connect(self) -> None:
+        """Open the connection to the server"""
+        closing = asyncio.Event()
+        ready: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        self._closing = closing
+        self._task = asyncio.create_task(self._serve(ready, closing))
+        try:
+            await ready
+        except BaseException:
+            # Also tear the connection down when the caller is cancelled while it is being opened
+            await self.close()
+            raise
+
+        self.stats.connections += 1
+        self._healthy = True
+        self._checked_at = time.monotonic()
+        log_debug(f"Connected {self}")
+
+    async def close(self) -> None:
+        """Close the connection to the server"""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        if self._closing is not None:
+            self._closing.set()
+        try:
+            await task
+        except Exception as e:
+            log_warning(f"Failed to close {self}: {e}")
+        finally:
+            self.session = None
+            self._healthy = False
+
+    async def send_ping(self) -> None:
+        """Ping the server, raising an error if it doesn't answer within the timeout"""
+        session = self.session
+        try:
+            if session is None:
+                raise RuntimeError(f"{self} is not connected")
+            await asyncio.wait_for(session.send_ping(), timeout=self.timeout_seconds)
+        except Exception:
+            self._healthy = False
+            raise
+        self._healthy = True
+        self._checked_at = time.monotonic()
+
+    async def ensure_alive(self) -> None:
+        """Connect to the server, or reconnect if it stopped answering health checks"""
+        async with self._lock:
+            if self._task is None:
+                await self.connect()
+                return
+            if self.connected and self._healthy and time.monotonic() - self._checked_at < self.health_check_interval:
+                return
+            if self.connected:
+                try:
+                    await self.send_ping()
+                    return
+                except Exception as e:
+                    log_warning(f"Health check of {self} failed: {e}")
+
+            self.stats.failed_health_checks += 1
+            await self.close()
+            # The server may come back with other tools
+            self.invalidate_tools()
+            await self.connect()
+            self.stats.reconnections += 1
+
+    async def list_tools(self) -> ListToolsResult:
+        """List the tools of the server, from the cache if the listing is still valid"""
+        if self._tools is not None and (
+            self.tools_ttl is None or time.monotonic() - self._tools_listed_at < self.tools_ttl
+        ):
+            self.stats.tool_list_hits += 1
+            return self._tools
+
+        self.stats.tool_list_misses += 1
+        if self.session is None:
+            raise RuntimeError(f"{self} is not connected")
+        version = self._tools_version
+        tools = await self.session.list_tools()
+        # Listings that were invalidated while they were requested are not cached
+        if version == self._tools_version:
+            self._tools = tools
+            self._tools_listed_at = time.monotonic()
+        return tools
+
+    def invalidate_tools(self) -> None:
+        self._tools = None
+        self._tools_version += 1
+
+    async def call_tool(self, name: str, arguments: Optional[Dict[str, Any]] = None, **kwargs) -> CallToolResult:
+        """Call a tool of the server, waiting while the maximum number of calls are in flight"""
+        async with self._calls:
+            if self.session is None:
+                raise RuntimeError(f"{self} is not connected")
+            return await self.session.call_tool(name, arguments, **kwargs)
+
+
+class MCPSessionPool:
+    """Keeps connections to MCP servers alive across runs, for the MCPTools and MultiMCPTools sharing the pool.
+
+    Toolkits using a pool acquire their connections when they connect, and release them when they close:
+    the next run reuses the open connection and its cached tool listing instead of spawning the server or
+    repeating the handshake. Connections are health checked when acquired, and reconnected if the server
+    stopped answering.
+
+    Connections belong to the event loop they were opened in. Close the pool when the application shuts down.
+
+    Args:
+        timeout_seconds: Read timeout of the sessions, and timeout of health checks.
+        max_concurrent_calls: Maximum number of tool calls in flight per server.
+        tools_ttl: Seconds tool listings are cached for. Defaults to caching them until the server reports a change.
+        health_check_interval: Seconds during which a successful health check is trusted.
+    """
+
+    def __init__(
+        self,
+        timeout_seconds: int = 10,
+        max_concurrent_calls: int = 8,
+        tools_ttl: Optional[float] = None,
+        health_check_interval: float = 30.0,
+    ):
+        self.timeout_seconds = timeout_seconds
+        self.max_concurrent_calls = max_concurrent_calls
+        self.tools_ttl = tools_ttl
+        self.health_check_interval = health_check_interval
+        self.stats = MCPPoolStats()
+
+        self._connections: Dict[Tuple[str, str], MCPConnection] = {}
+
+    def _get_connection(self, server_params: ServerParams) -> MCPConnection:
+        key = _get_server_key(server_params)
+        connection = self._connections.get(key)
+        if connection is None:
+            connection = MCPConnection(
+                server_params,
+                timeout_seconds=self.timeout_seconds,
+                max_concurrent_calls=self.max_concurrent_calls,
+                tools_ttl=self.tools_ttl,
+                health_check_interval=self.health_check_interval,
+                stats=self.stats,
+            )
+            self._connections[key] = connection
+        return connection
+
+    async def acquire(self, server_params: ServerParams) -> MCPConnection:
+        """Return a live connection to the server, connecting or reconnecting to it if needed"""
+        connection = self._get_connection(server_params)
+        await connection.ensure_alive()
+        return connection
+
+    async def acquire_many(
+        self, server_params_list: Sequence[ServerParams]
+    ) -> List[Union[MCPConnection, BaseException]]:
+        """Acquire connections to several servers concurrently.
+
+        Returns:
+            List[Union[MCPConnection, BaseException]]: The connection to each server, or the error connecting to it.
+        """
+        return await asyncio.gather(
+            *[self.acquire(server_params) for server_params in server_params_list], return_exceptions=True
+        )
+
+    def invalidate_tools(self, server_params: Optional[ServerParams] = None) -> None:
+        """Drop the cached tool listing of a server, or of all servers"""
+        if server_params is not None:
+            connection = self._connections.get(_get_server_key(server_params))
+            if connection is not None:
+                connection.invalidate_tools()
+            return
+        for connection in self._connections.values():
+            connection.invalidate_tools()
+
+    async def close(self) -> None:
+        """Close all connections"""
+        connections = list(self._connections.values())
+        self._connections.clear()
+        await asyncio.gather(*[connection.close() for connection in connections])
+
+    async def __aenter__(self) -> "MCPSessionPool":
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        await self.close()
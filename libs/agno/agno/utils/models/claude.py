@@ -364,3 +364,56 @@ def format_tools_for_model(tools: Optional[List[Dict[str, Any]]] = None) -> Opti
 
         parsed_tools.append(tool)
     return parsed_tools
+
+
+def _add_cache_control(content: Any, cache_control: Dict[str, Any]) -> Optional[List[Any]]:
+    """Return a copy of the message content with a cache breakpoint on its last cacheable block."""
+    if isinstance(content, str):
+        content = [{"type": "text", "text": content}] if content else []
+
+    for index in range(len(content) - 1, -1, -1):
+        block = content[index]
+        block = block.model_dump(exclude_none=True) if hasattr(block, "model_dump") else dict(block)
+        # Thinking blocks and empty text blocks can't be cached
+        if block.get("type") in ("thinking", "redacted_thinking") or (
+            block.get("type") == "text" and not block.get("text")
+        ):
+            continue
+        block["cache_control"] = cache_control
+        return [*content[:index], block, *content[index + 1 :]]
+    return None
+
+
+def add_cache_breakpoints(
+    chat_messages: List[Dict[str, Any]], cache_control: Dict[str, Any], max_breakpoints: int = 2
+) -> List[Dict[str, Any]]:
+    """
+    Place prompt cache breakpoints on the conversation history.
+
+    The last message is marked so the next request can read the whole conversation from the cache, and the previous
+    user turn, where the last request placed its breakpoint, is marked so this request reads what the last one wrote.
+    Messages are copied instead of updated, so the history stays unchanged.
+
+    Args:
+        chat_messages (List[Dict[str, Any]]): The messages formatted for the Anthropic API.
+        cache_control (Dict[str, Any]): The cache control to place on the breakpoints.
+        max_breakpoints (int): Maximum number of breakpoints to place.
+
+    Returns:
+        List[Dict[str, Any]]: The messages with the cache breakpoints.
+    """
+    cached_messages = list(chat_messages)
+    breakpoints = 0
+    for index in range(len(cached_messages) - 1, -1, -1):
+        if breakpoints >= max_breakpoints:
+            break
+        message = cached_messages[index]
+        # Requests end with a user turn, so the breakpoints of earlier requests are on user turns
+        if message["role"] != "user":
+            continue
+        content = _add_cache_control(message["content"], cache_control)
+        if content is None:
+            continue
+        cached_messages[index] = {**message, "content": content}
+        breakpoints += 1
+    return cached_messages
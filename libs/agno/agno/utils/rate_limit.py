@@ -0,0 +1,339 @@
+"""Client-side admission control for model and embedder requests."""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Deque, Dict, Iterator, Optional, Tuple
+
+from agno.utils.log import log_debug
+
+
+def estimate_tokens(text: Optional[str]) -> int:
+    """Rough token count of a text, using ~4 characters per token."""
+    if not text:
+        return 0
+    return len(text) // 4 + 1
+
+
+@dataclass
+class RateLimiterStats:
+    """Counters for a RateLimiter"""
+
+    requests: int = 0
+    # Requests that had to wait for a concurrency slot or for room in the rate limits
+    throttled_requests: int = 0
+    wait_time: float = 0.0
+    estimated_tokens: int = 0
+    used_tokens: int = 0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "requests": self.requests,
+            "throttled_requests": self.throttled_requests,
+            "wait_time": self.wait_time,
+            "estimated_tokens": self.estimated_tokens,
+            "used_tokens": self.used_tokens,
+        }
+
+
+class _Reservation:
+    """An amount admitted by a _SlidingWindow, corrected once the actual amount is known."""
+
+    __slots__ = ("admitted_at", "amount")
+
+    def __init__(self, admitted_at: float, amount: float):
+        self.admitted_at = admitted_at
+        self.amount = amount
+
+
+class _SlidingWindow:
+    """Amounts admitted over the last 60 seconds, so that no 60 second window admits more than `per_minute`.
+
+    A reservation is admitted as soon as it fits in the window, borrowing against the whole minute, and is
+    corrected with the actual amount once known. Reservations are admitted in the order they were made, and
+    an amount larger than the limit is admitted once the window is empty.
+    """
+
+    window = 60.0
+
+    def __init__(self, per_minute: float):
+        self.per_minute = per_minute
+        self.total = 0.0
+        self._reservations: Deque[_Reservation] = deque()
+
+    def reserve(self, amount: float, now: float) -> Tuple[_Reservation, float]:
+        """Admit `amount` and return the reservation with the seconds to wait before using it."""
+        while self._reservations and self._reservations[0].admitted_at <= now - self.window:
+            self.total -= self._reservations.popleft().amount
+
+        admitted_at = max(now, self._reservations[-1].admitted_at) if self._reservations else now
+        needed = min(amount, self.per_minute)
+        total = self.total
+        # Earliest time the amount fits, once enough earlier reservations have left the window
+        for reservation in self._reservations:
+            if total + needed <= self.per_minute:
+                break
+            total -= reservation.amount
+            admitted_at = max(admitted_at, reservation.admitted_at + self.window)
+
+        reservation = _Reservation(admitted_at, amount)
+        self._reservations.append(reservation)
+        self.total += amount
+        return reservation, admitted_at - now
+
+    def adjust(self, reservation: _Reservation, amount: float) -> None:
+        """Replace the amount of a reservation, e.g. the estimated tokens of a request with the used ones."""
+        self.total += amount - reservation.amount
+        reservation.amount = amount
+
+
+class _Waiter:
+    """A thread or a task waiting for a concurrency slot."""
+
+    __slots__ = ("event", "loop", "future", "granted")
+
+    def __init__(
+        self,
+        event: Optional[threading.Event] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        future: Optional["asyncio.Future[None]"] = None,
+    ):
+        self.event = event
+        self.loop = loop
+        self.future = future
+        self.granted = False
+
+    def wake(self) -> None:
+        if self.event is not None:
+            self.event.set()
+        elif self.loop is not None and self.future is not None:
+            self.loop.call_soon_threadsafe(_resolve_future, self.future)
+
+
+def _resolve_future(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class RateLimitLease:
+    """Admission granted by a RateLimiter for one request.
+
+    Call `set_usage` with the tokens the request actually used, so the tokens reserved for it are corrected
+    when the lease is released.
+    """
+
+    def __init__(self, limiter: "RateLimiter", estimated_tokens: int, reservation: Optional[_Reservation] = None):
+        self.limiter = limiter
+        self.estimated_tokens = estimated_tokens
+        self.used_tokens: Optional[int] = None
+        self._reservation = reservation
+
+    def set_usage(self, tokens: Optional[int]) -> None:
+        if tokens:
+            self.used_tokens = tokens
+
+
+class RateLimiter:
+    """Paces requests to a provider to stay under its rate limits, instead of reacting to 429 errors.
+
+    Requests and tokens are tracked over a sliding 60 second window, so no minute goes over the limits while
+    a request can use the whole budget of the minute. The tokens of a request are estimated before it is sent
+    (counting its maximum output) and corrected with the actual usage once it completes, so the unused part
+    of the estimate is available to the next requests right away. An optional cap on concurrent requests
+    queues callers in FIFO order, across threads and event loops.
+
+    Share one instance between all models or embedders that use the same API key, e.g. with
+    `get_rate_limiter`.
+
+    Args:
+        requests_per_minute: Maximum requests started per minute.
+        tokens_per_minute: Maximum tokens used per minute.
+        max_concurrent_requests: Maximum requests in flight at the same time.
+
+    Example:
+        >>> limiter = RateLimiter(requests_per_minute=500, tokens_per_minute=200_000)
+        >>> agent = Agent(model=OpenAIChat(id="gpt-4o", rate_limiter=limiter))
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_concurrent_requests: Optional[int] = None,
+    ):
+        if requests_per_minute is not None and requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        if tokens_per_minute is not None and tokens_per_minute <= 0:
+            raise ValueError("tokens_per_minute must be positive")
+        if max_concurrent_requests is not None and max_concurrent_requests <= 0:
+            raise ValueError("max_concurrent_requests must be positive")
+
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_concurrent_requests = max_concurrent_requests
+        self.stats = RateLimiterStats()
+
+        self._lock = threading.Lock()
+        self._request_window = _SlidingWindow(requests_per_minute) if requests_per_minute else None
+        self._token_window = _SlidingWindow(tokens_per_minute) if tokens_per_minute else None
+        self._active = 0
+        self._waiters: Deque[_Waiter] = deque()
+
+    # --- Concurrency slots ---
+
+    def _try_take_slot(self) -> bool:
+        """Take a slot if one is free and nobody is queued. Must be called with the lock held."""
+        if self.max_concurrent_requests is None:
+            return True
+        if self._active < self.max_concurrent_requests and not self._waiters:
+            self._active += 1
+            return True
+        return False
+
+    def _release_slot(self) -> None:
+        if self.max_concurrent_requests is None:
+            return
+        with self._lock:
+            # Hand the slot over to the first waiter instead of freeing it, to keep the queue FIFO
+            if self._waiters:
+                waiter = self._waiters.popleft()
+                waiter.granted = True
+                waiter.wake()
+            else:
+                self._active -= 1
+
+    def _acquire_slot(self) -> bool:
+        """Block until a slot is free. Returns True if the caller had to wait."""
+        with self._lock:
+            if self._try_take_slot():
+                return False
+            waiter = _Waiter(event=threading.Event())
+            self._waiters.append(waiter)
+        waiter.event.wait()  # type: ignore[union-attr]
+        return True
+
+    async def _aacquire_slot(self) -> bool:
+        """Wait until a slot is free. Returns True if the caller had to wait."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._try_take_slot():
+                return False
+            future: "asyncio.Future[None]" = loop.create_future()
+            waiter = _Waiter(loop=loop, future=future)
+            self._waiters.append(waiter)
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                granted = waiter.granted
+                if not granted:
+                    self._waiters.remove(waiter)
+            if granted:
+                self._release_slot()
+            raise
+        return True
+
+    # --- Sliding windows ---
+
+    def _reserve(self, tokens: int) -> Tuple[RateLimitLease, float]:
+        """Reserve one request and `tokens` tokens, returning the lease and the seconds to wait before sending it."""
+        now = time.monotonic()
+        delay = 0.0
+        reservation = None
+        with self._lock:
+            if self._request_window is not None:
+                delay = max(delay, self._request_window.reserve(1, now)[1])
+            if self._token_window is not None and tokens > 0:
+                reservation, token_delay = self._token_window.reserve(tokens, now)
+                delay = max(delay, token_delay)
+            self.stats.requests += 1
+            self.stats.estimated_tokens += tokens
+        return RateLimitLease(self, tokens, reservation), delay
+
+    def _settle(self, lease: RateLimitLease) -> None:
+        with self._lock:
+            if lease.used_tokens is not None:
+                self.stats.used_tokens += lease.used_tokens
+                if self._token_window is not None and lease._reservation is not None:
+                    self._token_window.adjust(lease._reservation, lease.used_tokens)
+
+    def _record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.stats.throttled_requests += 1
+            self.stats.wait_time += seconds
+
+    # --- Public API ---
+
+    @contextmanager
+    def limit(self, tokens: int = 0) -> Iterator[RateLimitLease]:
+        """Wait for admission of a request estimated to use `tokens` tokens, blocking the thread.
+
+        Example:
+            >>> with limiter.limit(tokens=estimate) as lease:
+            ...     response = client.create(...)
+            ...     lease.set_usage(response.usage.total_tokens)
+        """
+        started_at = time.monotonic()
+        waited = self._acquire_slot()
+        try:
+            lease, delay = self._reserve(tokens)
+            if delay > 0:
+                log_debug(f"Rate limiter: waiting {delay:.2f}s before sending the request")
+                time.sleep(delay)
+            if waited or delay > 0:
+                self._record_wait(time.monotonic() - started_at)
+            try:
+                yield lease
+            finally:
+                self._settle(lease)
+        finally:
+            self._release_slot()
+
+    @asynccontextmanager
+    async def alimit(self, tokens: int = 0) -> AsyncIterator[RateLimitLease]:
+        """Wait for admission of a request estimated to use `tokens` tokens, without blocking the event loop."""
+        started_at = time.monotonic()
+        waited = await self._aacquire_slot()
+        try:
+            lease, delay = self._reserve(tokens)
+            if delay > 0:
+                log_debug(f"Rate limiter: waiting {delay:.2f}s before sending the request")
+                await asyncio.sleep(delay)
+            if waited or delay > 0:
+                self._record_wait(time.monotonic() - started_at)
+            try:
+                yield lease
+            finally:
+                self._settle(lease)
+        finally:
+            self._release_slot()
+
+
+_rate_limiters: Dict[str, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    key: str,
+    requests_per_minute: Optional[float] = None,
+    tokens_per_minute: Optional[float] = None,
+    max_concurrent_requests: Optional[int] = None,
+) -> RateLimiter:
+    """Get the process-wide RateLimiter registered under `key`, creating it with the given limits if needed.
+
+    Use one key per provider and API key (or per model, for per-model quotas), e.g. "openai:gpt-4o".
+    The limits are only used when the rate limiter is created.
+    """
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(key)
+        if limiter is None:
+            limiter = RateLimiter(
+                requests_per_minute=requests_per_minute,
+                tokens_per_minute=tokens_per_minute,
+                max_concurrent_requests=max_concurrent_requests,
+            )
+            _rate_limiters[key] = limiter
+        return limiter
@@ -4,6 +4,11 @@ from datetime import date, datetime, time
 from enum import Enum
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 
 def json_serializer(obj: Any) -> Any:
     """Custom JSON serializer for objects not serializable by default json module.
@@ -30,3 +35,25 @@ def json_serializer(obj: Any) -> Any:
 
     # Fallback to string
     return str(obj)
+
+
+def dumps_compact(obj: Any) -> str:
+    """Serialize an object to compact JSON (no whitespace), as used for streamed events.
+
+    Uses `orjson` when it is installed, falling back to the standard json module.
+    Objects the encoders don't handle natively are serialized with json_serializer in both cases.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj,
+                default=json_serializer,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS,
+            ).decode("utf-8")
+        except TypeError:
+            # e.g. integers larger than 64 bits, which only the json module supports
+            pass
+
+    import json
+
+    return json.dumps(obj, separators=(",", ":"), default=json_serializer, ensure_ascii=False)
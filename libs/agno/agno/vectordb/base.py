@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 
 from agno.knowledge.document import Document
+from agno.utils.log import logger
 from agno.utils.string import generate_id
 
 
@@ -24,6 +25,40 @@ class VectorDb(ABC):
         # Last resort fallback to generate id from name if ID not specified
         self.id = id if id else generate_id(name)
 
+    def _embed_documents(self, documents: List[Document]) -> None:
+        """
+        Embed documents with the embedder of the vector db, in one batch call when batching is enabled and supported.
+
+        Args:
+            documents: List of documents to embed
+        """
+        embedder = getattr(self, "embedder", None)
+        if embedder is None or not documents:
+            return
+
+        if embedder.enable_batch and hasattr(embedder, "get_embeddings_batch_and_usage"):
+            try:
+                embeddings, usages = embedder.get_embeddings_batch_and_usage([doc.content for doc in documents])
+                for j, doc in enumerate(documents):
+                    if j < len(embeddings):
+                        doc.embedding = embeddings[j]
+                        doc.usage = usages[j] if j < len(usages) else None
+                return
+            except Exception as e:
+                # Check if this is a rate limit error - don't fall back as it would make things worse
+                error_str = str(e).lower()
+                is_rate_limit = any(
+                    phrase in error_str
+                    for phrase in ["rate limit", "too many requests", "429", "trial key", "api calls / minute"]
+                )
+                if is_rate_limit:
+                    logger.error(f"Rate limit detected during batch embedding. {e}")
+                    raise e
+                logger.warning(f"Batch embedding failed, falling back to individual embeddings: {e}")
+
+        for doc in documents:
+            doc.embed(embedder=embedder)
+
     @abstractmethod
     def create(self) -> None:
         raise NotImplementedError
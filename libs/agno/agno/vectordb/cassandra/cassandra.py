@@ -96,9 +96,9 @@ class Cassandra(VectorDb):
 
     def insert(self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         log_info(f"Cassandra VectorDB : Inserting Documents to the table {self.table_name}")
+        self._embed_documents(documents)
         futures = []
         for doc in documents:
-            doc.embed(embedder=self.embedder)
             metadata = {key: str(value) for key, value in doc.meta_data.items()}
             metadata.update(filters or {})
             metadata["content_id"] = doc.content_id or ""
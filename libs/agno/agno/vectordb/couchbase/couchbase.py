@@ -310,10 +310,8 @@ class CouchbaseSearch(VectorDb):
         log_debug(f"Inserting {len(documents)} documents")
 
         docs_to_insert: Dict[str, Any] = {}
+        self._embed_documents([document for document in documents if document.embedding is None])
         for document in documents:
-            if document.embedding is None:
-                document.embed(embedder=self.embedder)
-
             if document.embedding is None:
                 raise ValueError(f"Failed to generate embedding for document: {document.name}")
             try:
@@ -402,11 +400,9 @@ class CouchbaseSearch(VectorDb):
         logger.info(f"Upserting {len(documents)} documents")
 
         docs_to_upsert: Dict[str, Any] = {}
+        self._embed_documents([document for document in documents if document.embedding is None])
         for document in documents:
             try:
-                if document.embedding is None:
-                    document.embed(embedder=self.embedder)
-
                 if document.embedding is None:
                     raise ValueError(f"Failed to generate embedding for document: {document.name}")
 
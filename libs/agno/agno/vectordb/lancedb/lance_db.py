@@ -306,19 +306,22 @@ class LanceDb(VectorDb):
             return
 
         log_debug(f"Inserting {len(documents)} documents")
-        data = []
+        documents = [document for document in documents if not self.doc_exists(document)]
+        self._embed_documents(documents)
+        self._insert_embedded(content_hash, documents, filters)
 
+    def _insert_embedded(
+        self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Insert documents that are already embedded."""
+        data = []
         for document in documents:
-            if self.doc_exists(document):
-                continue
-
             # Add filters to document metadata if provided
             if filters:
                 meta_data = document.meta_data.copy() if document.meta_data else {}
                 meta_data.update(filters)
                 document.meta_data = meta_data
 
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = str(md5(cleaned_content.encode()).hexdigest())
             payload = {
@@ -371,6 +374,7 @@ class LanceDb(VectorDb):
             return
 
         log_debug(f"Inserting {len(documents)} documents")
+        documents = [document for document in documents if not self.doc_exists(document)]
 
         # Still do async embedding for performance
         if self.embedder.enable_batch and hasattr(self.embedder, "async_get_embeddings_batch_and_usage"):
@@ -400,7 +404,7 @@ class LanceDb(VectorDb):
             await asyncio.gather(*embed_tasks, return_exceptions=True)
 
         # Use sync insert to avoid sync/async table synchronization issues
-        self.insert(content_hash, documents, filters)
+        self._insert_embedded(content_hash, documents, filters)
 
     def upsert_available(self) -> bool:
         """Check if upsert is available in LanceDB."""
@@ -452,7 +456,10 @@ class LanceDb(VectorDb):
                 await asyncio.gather(*embed_tasks, return_exceptions=True)
 
         # Use sync upsert for reliability
-        self.upsert(content_hash=content_hash, documents=documents, filters=filters)
+        if self.content_hash_exists(content_hash):
+            self._delete_by_content_hash(content_hash)
+        documents = [document for document in documents if not self.doc_exists(document)]
+        self._insert_embedded(content_hash, documents, filters)
 
     def search(
         self, query: str, limit: int = 5, filters: Optional[Union[Dict[str, Any], List[FilterExpr]]] = None
@@ -0,0 +1,734 @@
+import asyncio
+import json
+import os
+import threading
+from hashlib import md5
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("`numpy` not installed. Please install using `pip install numpy`")
+
+from agno.filters import AND, EQ, GT, IN, LT, NOT, OR, FilterExpr
+from agno.knowledge.document import Document
+from agno.knowledge.embedder import Embedder
+from agno.knowledge.reranker.base import Reranker
+from agno.utils.log import log_debug, log_info, log_warning, logger
+from agno.vectordb.base import VectorDb
+from agno.vectordb.distance import Distance
+from agno.vectordb.search import SearchType
+
+
+class LocalDb(VectorDb):
+    """
+    In-process vector database backed by a memory-mapped float32 matrix.
+
+    Embeddings are stored row-wise in `<path>/<collection>.f32` and the document records
+    (content, name, metadata, content hash) are stored in a JSON sidecar `<path>/<collection>.json`.
+    Writes append their changes to `<path>/<collection>.log`, which is folded back into the sidecar once it
+    grows larger than the collection. Opening an existing collection only memory-maps the matrix and replays
+    the log, so nothing is re-embedded on cold start. Deleted rows are tombstoned and reclaimed by `optimize()`.
+
+    Args:
+        collection: Name of the collection. Used as the file prefix.
+        path: Directory where the collection files are stored.
+        name: Name of the vector database.
+        description: Description of the vector database.
+        id: Custom ID for the vector database.
+        embedder: The embedder to use when embedding the document contents.
+        distance: The distance metric to use when searching for documents.
+        reranker: The reranker to use when reranking documents.
+        initial_capacity: Number of rows to allocate when the matrix file is first created.
+    """
+
+    def __init__(
+        self,
+        collection: str,
+        path: str = "tmp/localdb",
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        id: Optional[str] = None,
+        embedder: Optional[Embedder] = None,
+        distance: Distance = Distance.cosine,
+        reranker: Optional[Reranker] = None,
+        initial_capacity: int = 1024,
+    ):
+        if not collection:
+            raise ValueError("Collection name must be provided.")
+
+        # Dynamic ID generation based on unique identifiers
+        if id is None:
+            from agno.utils.string import generate_id
+
+            seed = f"{path}#{collection}"
+            id = generate_id(seed)
+
+        super().__init__(id=id, name=name, description=description)
+
+        self.collection_name: str = collection
+        self.path: Path = Path(path)
+
+        # Embedder for embedding the document contents
+        if embedder is None:
+            from agno.knowledge.embedder.openai import OpenAIEmbedder
+
+            embedder = OpenAIEmbedder()
+            log_info("Embedder not provided, using OpenAIEmbedder as default.")
+        self.embedder: Embedder = embedder
+        self.dimensions: Optional[int] = self.embedder.dimensions
+
+        self.distance: Distance = distance
+        self.reranker: Optional[Reranker] = reranker
+        self.initial_capacity: int = max(1, initial_capacity)
+
+        # Embedding matrix and the records aligned to its rows. A `None` record marks a deleted row.
+        self._matrix: Optional[np.memmap] = None
+        self._records: List[Optional[Dict[str, Any]]] = []
+        self._count: int = 0
+        # Lookup indexes over the live rows
+        self._id_index: Dict[str, int] = {}
+        self._content_hash_index: Dict[str, List[int]] = {}
+        # Cached row norms, only valid for the first `_count` rows
+        self._norms: Optional[np.ndarray] = None
+        # Snapshot generation the change log belongs to, and the number of entries appended since the snapshot
+        self._generation: int = 0
+        self._log_entries: int = 0
+        self._loaded: bool = False
+        self._lock = threading.RLock()
+
+    @property
+    def matrix_path(self) -> Path:
+        return self.path / f"{self.collection_name}.f32"
+
+    @property
+    def metadata_path(self) -> Path:
+        return self.path / f"{self.collection_name}.json"
+
+    @property
+    def log_path(self) -> Path:
+        return self.path / f"{self.collection_name}.log"
+
+    # -*- Storage helpers
+
+    def _ensure_loaded(self) -> None:
+        """Load the collection from disk on first access."""
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            if self.metadata_path.exists():
+                self._load()
+            self._loaded = True
+
+    def _load(self) -> None:
+        with open(self.metadata_path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+
+        stored_distance = state.get("distance")
+        if stored_distance is not None and stored_distance != self.distance.value:
+            log_warning(
+                f"Collection '{self.collection_name}' was created with distance '{stored_distance}', "
+                f"searching with '{self.distance.value}'"
+            )
+
+        self.dimensions = state.get("dimensions") or self.dimensions
+        self._records = state.get("records", [])
+        self._generation = state.get("generation", 0)
+        truncated = self._replay_log()
+        self._count = len(self._records)
+
+        # The matrix may have grown after the snapshot was written, so size it from the file itself
+        if self.dimensions and self.matrix_path.exists():
+            capacity = self.matrix_path.stat().st_size // (self.dimensions * np.dtype(np.float32).itemsize)
+            if capacity > 0:
+                self._matrix = np.memmap(
+                    self.matrix_path, dtype=np.float32, mode="r+", shape=(capacity, self.dimensions)
+                )
+        self._rebuild_indexes()
+        self._norms = None
+        if truncated:
+            # Later appends would land after the partial line, so fold what was read into a fresh snapshot
+            self._persist()
+        log_debug(f"Loaded {self._count} rows from {self.matrix_path}")
+
+    def _replay_log(self) -> bool:
+        """Apply the changes appended since the snapshot was written. Returns whether the log ended in a partial entry."""
+        self._log_entries = 0
+        if not self.log_path.exists():
+            return False
+        with open(self.log_path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f):
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A write interrupted mid-line; everything after it is incomplete too
+                    log_warning(f"Ignoring truncated entry in {self.log_path}")
+                    return True
+                if line_number == 0:
+                    # The log was left over from an older snapshot, which already contains its changes
+                    if entry.get("generation") != self._generation:
+                        return False
+                    continue
+                row = entry["row"]
+                while len(self._records) <= row:
+                    self._records.append(None)
+                self._records[row] = entry.get("record")
+                self._log_entries += 1
+        return False
+
+    def _rebuild_indexes(self) -> None:
+        self._id_index = {}
+        self._content_hash_index = {}
+        for row, record in enumerate(self._records):
+            if record is not None:
+                self._index_record(row, record)
+
+    def _index_record(self, row: int, record: Dict[str, Any]) -> None:
+        self._id_index[record["id"]] = row
+        self._content_hash_index.setdefault(record["content_hash"], []).append(row)
+
+    def _unindex_record(self, row: int, record: Dict[str, Any]) -> None:
+        self._id_index.pop(record["id"], None)
+        rows = self._content_hash_index.get(record["content_hash"])
+        if rows is not None:
+            if row in rows:
+                rows.remove(row)
+            if not rows:
+                del self._content_hash_index[record["content_hash"]]
+
+    def _capacity(self) -> int:
+        return 0 if self._matrix is None else self._matrix.shape[0]
+
+    def _reserve(self, rows: int) -> None:
+        """Grow the matrix file so it can hold at least `rows` rows."""
+        if self.dimensions is None:
+            raise ValueError("Embedder.dimensions must be set or inferable from the first embedding.")
+        capacity = self._capacity()
+        if rows <= capacity:
+            return
+
+        new_capacity = max(capacity * 2, self.initial_capacity, rows)
+        if self._matrix is not None:
+            self._matrix.flush()
+            self._matrix = None
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        with open(self.matrix_path, "ab") as f:
+            f.truncate(new_capacity * self.dimensions * np.dtype(np.float32).itemsize)
+        self._matrix = np.memmap(self.matrix_path, dtype=np.float32, mode="r+", shape=(new_capacity, self.dimensions))
+        log_debug(f"Resized {self.matrix_path} to {new_capacity} rows")
+
+    def _persist(self) -> None:
+        """Flush the matrix, atomically rewrite the sidecar and discard the change log it now contains."""
+        if self._matrix is not None:
+            self._matrix.flush()
+        self.path.mkdir(parents=True, exist_ok=True)
+        state = {
+            "dimensions": self.dimensions,
+            "distance": self.distance.value,
+            "capacity": self._capacity(),
+            "generation": self._generation + 1,
+            "records": self._records[: self._count],
+        }
+        tmp_path = self.metadata_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        # A log left behind by a crash after this point is ignored on load, as it belongs to the older generation
+        os.replace(tmp_path, self.metadata_path)
+        self._generation += 1
+        self._log_entries = 0
+        if self.log_path.exists():
+            self.log_path.unlink()
+
+    def _persist_rows(self, rows: List[int]) -> None:
+        """Flush the matrix and append the records of the changed rows to the change log.
+
+        Falls back to rewriting the sidecar once the log holds more entries than the collection has rows,
+        so the cost of the snapshots stays proportional to the number of writes.
+        """
+        if not self.metadata_path.exists() or self._log_entries + len(rows) > max(self._count, 1024):
+            self._persist()
+            return
+        if self._matrix is not None:
+            self._matrix.flush()
+        lines = []
+        if not self.log_path.exists():
+            lines.append(json.dumps({"generation": self._generation}))
+        lines.extend(json.dumps({"row": row, "record": self._records[row]}) for row in rows)
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        self._log_entries += len(rows)
+
+    def _clean_content(self, content: str) -> str:
+        return content.replace("\x00", "\ufffd")
+
+    def _get_document_record(
+        self, document: Document, filters: Optional[Dict[str, Any]], content_hash: str
+    ) -> Dict[str, Any]:
+        cleaned_content = self._clean_content(document.content)
+        meta_data = document.meta_data or {}
+        if filters:
+            meta_data.update(filters)
+        return {
+            "id": document.id or md5(cleaned_content.encode()).hexdigest(),
+            "name": document.name,
+            "content": cleaned_content,
+            "meta_data": meta_data,
+            "content_id": document.content_id,
+            "content_hash": content_hash,
+        }
+
+    def _write_documents(self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]]) -> None:
+        """Write already-embedded documents. Documents with an existing ID overwrite their row in place."""
+        pending = []
+        for document in documents:
+            if document.embedding is None:
+                logger.error(f"Document '{document.name}' has no embedding, skipping")
+                continue
+            pending.append((self._get_document_record(document, filters, content_hash), document.embedding))
+        if not pending:
+            return
+
+        with self._lock:
+            # The sidecar records the dimensions, so the write that settles them has to rewrite it
+            rewrite_sidecar = self.dimensions is None
+            if self.dimensions is None:
+                self.dimensions = len(pending[0][1])
+
+            new_rows = sum(1 for record, _ in pending if record["id"] not in self._id_index)
+            self._reserve(self._count + new_rows)
+            assert self._matrix is not None
+
+            written = []
+            for record, embedding in pending:
+                if len(embedding) != self.dimensions:
+                    logger.error(
+                        f"Embedding for '{record['name']}' has {len(embedding)} dimensions, expected {self.dimensions}"
+                    )
+                    continue
+                row = self._id_index.get(record["id"])
+                if row is None:
+                    row = self._count
+                    self._records.append(record)
+                    self._count += 1
+                else:
+                    self._unindex_record(row, self._records[row])  # type: ignore
+                    self._records[row] = record
+                self._matrix[row] = np.asarray(embedding, dtype=np.float32)
+                self._index_record(row, record)
+                written.append(row)
+
+            self._norms = None
+            if rewrite_sidecar:
+                self._persist()
+            else:
+                self._persist_rows(written)
+        log_debug(f"Committed {len(pending)} documents")
+
+    def _delete_rows(self, rows: List[int]) -> int:
+        with self._lock:
+            deleted = []
+            for row in rows:
+                record = self._records[row]
+                if record is None:
+                    continue
+                self._unindex_record(row, record)
+                self._records[row] = None
+                deleted.append(row)
+            if deleted:
+                self._persist_rows(deleted)
+            return len(deleted)
+
+    def _find_rows(self, predicate) -> List[int]:
+        self._ensure_loaded()
+        return [row for row, record in enumerate(self._records) if record is not None and predicate(record)]
+
+    # -*- Filtering
+
+    def _record_value(self, record: Dict[str, Any], key: str) -> Any:
+        meta_data = record.get("meta_data") or {}
+        if key in meta_data:
+            return meta_data[key]
+        if key in ("name", "content_id", "content_hash"):
+            return record.get(key)
+        return None
+
+    def _matches_dict(self, record: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+        for key, value in filters.items():
+            record_value = self._record_value(record, key)
+            if isinstance(value, (list, tuple)):
+                if record_value not in value:
+                    return False
+            elif record_value != value:
+                return False
+        return True
+
+    def _matches_expr(self, record: Dict[str, Any], expr: FilterExpr) -> bool:
+        if isinstance(expr, EQ):
+            return self._record_value(record, expr.key) == expr.value
+        if isinstance(expr, IN):
+            return self._record_value(record, expr.key) in expr.values
+        if isinstance(expr, (GT, LT)):
+            record_value = self._record_value(record, expr.key)
+            if record_value is None:
+                return False
+            try:
+                return record_value > expr.value if isinstance(expr, GT) else record_value < expr.value
+            except TypeError:
+                return False
+        if isinstance(expr, AND):
+            return all(self._matches_expr(record, e) for e in expr.expressions)
+        if isinstance(expr, OR):
+            return any(self._matches_expr(record, e) for e in expr.expressions)
+        if isinstance(expr, NOT):
+            return not self._matches_expr(record, expr.expression)
+        raise ValueError(f"Unsupported filter expression: {expr}")
+
+    def _candidate_mask(self, filters: Optional[Union[Dict[str, Any], List[FilterExpr]]]) -> np.ndarray:
+        """Boolean mask over the used rows: live rows that pass the filters."""
+        records = self._records[: self._count]
+        if not filters:
+            return np.fromiter((r is not None for r in records), dtype=bool, count=self._count)
+        if isinstance(filters, dict):
+            return np.fromiter(
+                (r is not None and self._matches_dict(r, filters) for r in records), dtype=bool, count=self._count
+            )
+        return np.fromiter(
+            (r is not None and all(self._matches_expr(r, f) for f in filters) for r in records),
+            dtype=bool,
+            count=self._count,
+        )
+
+    # -*- Scoring
+
+    def _row_norms(self) -> np.ndarray:
+        if self._norms is None or len(self._norms) != self._count:
+            assert self._matrix is not None
+            self._norms = np.linalg.norm(self._matrix[: self._count], axis=1)
+        return self._norms
+
+    def _scores(self, query_embedding: np.ndarray) -> np.ndarray:
+        """Score every used row against the query. Lower scores are better for all metrics."""
+        assert self._matrix is not None
+        matrix = self._matrix[: self._count]
+        dot = matrix @ query_embedding
+        if self.distance == Distance.max_inner_product:
+            return -dot
+        norms = self._row_norms()
+        if self.distance == Distance.l2:
+            return np.sqrt(np.maximum(norms**2 - 2 * dot + float(query_embedding @ query_embedding), 0.0))
+        # Cosine distance
+        denominator = norms * np.linalg.norm(query_embedding)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            similarity = np.where(denominator > 0, dot / denominator, 0.0)
+        return 1.0 - similarity
+
+    def _vector_search(
+        self,
+        query_embedding: List[float],
+        limit: int,
+        filters: Optional[Union[Dict[str, Any], List[FilterExpr]]],
+    ) -> List[Document]:
+        self._ensure_loaded()
+        with self._lock:
+            if self._matrix is None or self._count == 0 or limit <= 0:
+                return []
+            if len(query_embedding) != self.dimensions:
+                logger.error(f"Query embedding has {len(query_embedding)} dimensions, expected {self.dimensions}")
+                return []
+
+            mask = self._candidate_mask(filters)
+            candidates = np.flatnonzero(mask)
+            if len(candidates) == 0:
+                return []
+
+            scores = self._scores(np.asarray(query_embedding, dtype=np.float32))[candidates]
+            k = min(limit, len(candidates))
+            if k < len(candidates):
+                top = np.argpartition(scores, k - 1)[:k]
+            else:
+                top = np.arange(len(candidates))
+            top = top[np.argsort(scores[top], kind="stable")]
+
+            search_results: List[Document] = []
+            for i in top:
+                row = int(candidates[i])
+                record = self._records[row]
+                assert record is not None
+                search_results.append(
+                    Document(
+                        id=record["id"],
+                        name=record.get("name"),
+                        meta_data=dict(record.get("meta_data") or {}),
+                        content=record["content"],
+                        embedding=self._matrix[row].tolist(),
+                        content_id=record.get("content_id"),
+                    )
+                )
+            return search_results
+
+    # -*- VectorDb interface
+
+    def create(self) -> None:
+        """Create the collection directory, or open the existing collection."""
+        with self._lock:
+            self._ensure_loaded()
+            if not self.metadata_path.exists():
+                log_debug(f"Creating collection: {self.collection_name}")
+                if self.dimensions is not None:
+                    self._reserve(self.initial_capacity)
+                self._persist()
+
+    async def async_create(self) -> None:
+        self.create()
+
+    def exists(self) -> bool:
+        return self.metadata_path.exists()
+
+    async def async_exists(self) -> bool:
+        return self.exists()
+
+    def name_exists(self, name: str) -> bool:
+        """Check if a document with the given name exists in the collection."""
+        self._ensure_loaded()
+        return any(record is not None and record.get("name") == name for record in self._records)
+
+    async def async_name_exists(self, name: str) -> bool:
+        return self.name_exists(name)
+
+    def id_exists(self, id: str) -> bool:
+        self._ensure_loaded()
+        return id in self._id_index
+
+    def content_hash_exists(self, content_hash: str) -> bool:
+        self._ensure_loaded()
+        return content_hash in self._content_hash_index
+
+    def insert(self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Embed and insert documents into the collection.
+
+        Args:
+            content_hash (str): The content hash of the documents.
+            documents (List[Document]): List of documents to insert.
+            filters (Optional[Dict[str, Any]]): Filters to merge with the document metadata.
+        """
+        log_info(f"Inserting {len(documents)} documents")
+        self._ensure_loaded()
+        self._embed_documents(documents)
+        self._write_documents(content_hash, documents, filters)
+
+    async def _async_embed_documents(self, documents: List[Document]) -> None:
+        """
+        Embed documents using either batch embedding or individual embedding.
+
+        Args:
+            documents: List of documents to embed
+        """
+        if self.embedder.enable_batch and hasattr(self.embedder, "async_get_embeddings_batch_and_usage"):
+            try:
+                embeddings, usages = await self.embedder.async_get_embeddings_batch_and_usage(
+                    [doc.content for doc in documents]
+                )
+                for j, doc in enumerate(documents):
+                    if j < len(embeddings):
+                        doc.embedding = embeddings[j]
+                        doc.usage = usages[j] if j < len(usages) else None
+            except Exception as e:
+                # Check if this is a rate limit error - don't fall back as it would make things worse
+                error_str = str(e).lower()
+                is_rate_limit = any(
+                    phrase in error_str
+                    for phrase in ["rate limit", "too many requests", "429", "trial key", "api calls / minute"]
+                )
+                if is_rate_limit:
+                    logger.error(f"Rate limit detected during batch embedding. {e}")
+                    raise e
+                logger.warning(f"Async batch embedding failed, falling back to individual embeddings: {e}")
+                await asyncio.gather(
+                    *[doc.async_embed(embedder=self.embedder) for doc in documents], return_exceptions=True
+                )
+        else:
+            await asyncio.gather(
+                *[doc.async_embed(embedder=self.embedder) for doc in documents], return_exceptions=True
+            )
+
+    async def async_insert(
+        self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Embed documents concurrently and insert them into the collection."""
+        log_info(f"Async Inserting {len(documents)} documents")
+        self._ensure_loaded()
+        await self._async_embed_documents(documents)
+        self._write_documents(content_hash, documents, filters)
+
+    def upsert_available(self) -> bool:
+        return True
+
+    def upsert(self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Replace all documents with the given content hash."""
+        if self.content_hash_exists(content_hash):
+            self._delete_by_content_hash(content_hash)
+        self.insert(content_hash, documents, filters)
+
+    async def async_upsert(
+        self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None
+    ) -> None:
+        if self.content_hash_exists(content_hash):
+            self._delete_by_content_hash(content_hash)
+        await self.async_insert(content_hash, documents, filters)
+
+    def search(
+        self, query: str, limit: int = 5, filters: Optional[Union[Dict[str, Any], List[FilterExpr]]] = None
+    ) -> List[Document]:
+        """Search the collection for the documents closest to the query.
+
+        Args:
+            query (str): Query to search for.
+            limit (int): Number of results to return.
+            filters (Optional[Union[Dict[str, Any], List[FilterExpr]]]): Metadata filters. Dict values that are
+                lists match any of the listed values.
+
+        Returns:
+            List[Document]: List of search results, closest first.
+        """
+        query_embedding = self.embedder.get_embedding(query)
+        if query_embedding is None:
+            logger.error(f"Error getting embedding for Query: {query}")
+            return []
+
+        search_results = self._vector_search(query_embedding, limit, filters)
+        if self.reranker and search_results:
+            search_results = self.reranker.rerank(query=query, documents=search_results)
+
+        log_info(f"Found {len(search_results)} documents")
+        return search_results
+
+    async def async_search(
+        self, query: str, limit: int = 5, filters: Optional[Union[Dict[str, Any], List[FilterExpr]]] = None
+    ) -> List[Document]:
+        query_embedding = await self.embedder.async_get_embedding(query)
+        if query_embedding is None:
+            logger.error(f"Error getting embedding for Query: {query}")
+            return []
+
+        search_results = self._vector_search(query_embedding, limit, filters)
+        if self.reranker and search_results:
+            search_results = self.reranker.rerank(query=query, documents=search_results)
+
+        log_info(f"Found {len(search_results)} documents")
+        return search_results
+
+    def drop(self) -> None:
+        """Delete the collection files."""
+        with self._lock:
+            self._matrix = None
+            self._records = []
+            self._count = 0
+            self._norms = None
+            self._rebuild_indexes()
+            self._generation = 0
+            self._log_entries = 0
+            for file_path in (self.matrix_path, self.metadata_path, self.log_path):
+                if file_path.exists():
+                    log_debug(f"Deleting {file_path}")
+                    file_path.unlink()
+
+    async def async_drop(self) -> None:
+        self.drop()
+
+    def get_count(self) -> int:
+        """Get the number of live documents in the collection."""
+        self._ensure_loaded()
+        return len(self._id_index)
+
+    def optimize(self) -> None:
+        """Compact the matrix by removing deleted rows."""
+        self._ensure_loaded()
+        with self._lock:
+            live_rows = [row for row, record in enumerate(self._records) if record is not None]
+            if len(live_rows) == self._count:
+                return
+            if self._matrix is not None:
+                self._matrix[: len(live_rows)] = self._matrix[live_rows]
+            self._records = [self._records[row] for row in live_rows]
+            self._count = len(self._records)
+            self._norms = None
+            self._rebuild_indexes()
+            self._persist()
+            log_debug(f"Compacted collection {self.collection_name} to {self._count} rows")
+
+    def delete(self) -> bool:
+        """Delete all documents in the collection."""
+        try:
+            with self._lock:
+                self._ensure_loaded()
+                self._records = []
+                self._count = 0
+                self._norms = None
+                self._rebuild_indexes()
+                self._persist()
+            return True
+        except Exception as e:
+            logger.error(f"Error clearing collection: {e}")
+            return False
+
+    def delete_by_id(self, id: str) -> bool:
+        self._ensure_loaded()
+        row = self._id_index.get(id)
+        if row is None:
+            log_info(f"Document with ID '{id}' not found")
+            return False
+        self._delete_rows([row])
+        log_info(f"Deleted document with ID '{id}'")
+        return True
+
+    def delete_by_name(self, name: str) -> bool:
+        deleted = self._delete_rows(self._find_rows(lambda record: record.get("name") == name))
+        log_info(f"Deleted {deleted} documents with name '{name}'")
+        return deleted > 0
+
+    def delete_by_metadata(self, metadata: Dict[str, Any]) -> bool:
+        deleted = self._delete_rows(
+            self._find_rows(
+                lambda record: all((record.get("meta_data") or {}).get(k) == v for k, v in metadata.items())
+            )
+        )
+        log_info(f"Deleted {deleted} documents with metadata '{metadata}'")
+        return deleted > 0
+
+    def delete_by_content_id(self, content_id: str) -> bool:
+        deleted = self._delete_rows(self._find_rows(lambda record: record.get("content_id") == content_id))
+        log_info(f"Deleted {deleted} documents with content_id '{content_id}'")
+        return deleted > 0
+
+    def _delete_by_content_hash(self, content_hash: str) -> bool:
+        self._ensure_loaded()
+        deleted = self._delete_rows(list(self._content_hash_index.get(content_hash, [])))
+        log_info(f"Deleted {deleted} documents with content_hash '{content_hash}'")
+        return deleted > 0
+
+    def update_metadata(self, content_id: str, metadata: Dict[str, Any]) -> None:
+        """
+        Update the metadata for documents with the given content_id.
+
+        Args:
+            content_id (str): The content ID to update
+            metadata (Dict[str, Any]): The metadata to update
+        """
+        rows = self._find_rows(lambda record: record.get("content_id") == content_id)
+        if not rows:
+            log_debug(f"No documents found with content_id: {content_id}")
+            return
+        with self._lock:
+            for row in rows:
+                record = self._records[row]
+                assert record is not None
+                record["meta_data"] = {**(record.get("meta_data") or {}), **metadata}
+            self._persist_rows(rows)
+        log_debug(f"Updated metadata for {len(rows)} documents with content_id: {content_id}")
+
+    def get_supported_search_types(self) -> List[str]:
+        return [SearchType.vector]
@@ -416,7 +416,6 @@ class Milvus(VectorDb):
     def _insert_hybrid_document(self, content_hash: str, document: Document) -> None:
         """Insert a document with both dense and sparse vectors."""
         data = self._prepare_document_data(content_hash=content_hash, document=document, include_vectors=True)
-        document.embed(embedder=self.embedder)
         self.client.insert(
             collection_name=self.collection,
             data=data,
@@ -436,13 +435,13 @@ class Milvus(VectorDb):
     def insert(self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """Insert documents based on search type."""
         log_debug(f"Inserting {len(documents)} documents")
+        self._embed_documents(documents)
 
         if self.search_type == SearchType.hybrid:
             for document in documents:
                 self._insert_hybrid_document(content_hash=content_hash, document=document)
         else:
             for document in documents:
-                document.embed(embedder=self.embedder)
                 if not document.embedding:
                     log_debug(f"Skipping document without embedding: {document.name} ({document.meta_data})")
                     continue
@@ -523,7 +522,6 @@ class Milvus(VectorDb):
         else:
 
             async def process_document(document):
-                document.embed(embedder=self.embedder)
                 if not document.embedding:
                     log_debug(f"Skipping document without embedding: {document.name} ({document.meta_data})")
                     return None
@@ -573,8 +571,8 @@ class Milvus(VectorDb):
             filters (Optional[Dict[str, Any]]): Filters to apply while upserting
         """
         log_debug(f"Upserting {len(documents)} documents")
+        self._embed_documents(documents)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
 
@@ -539,10 +539,10 @@ class MongoDb(VectorDb):
         log_debug(f"Inserting {len(documents)} documents")
         collection = self._get_collection()
 
+        self._embed_documents(documents)
         prepared_docs = []
         for document in documents:
             try:
-                document.embed(embedder=self.embedder)
                 if document.embedding is None:
                     raise ValueError(f"Failed to generate embedding for document: {document.id}")
                 doc_data = self.prepare_doc(content_hash, document, filters)
@@ -566,9 +566,9 @@ class MongoDb(VectorDb):
         log_info(f"Upserting {len(documents)} documents")
         collection = self._get_collection()
 
+        self._embed_documents(documents)
         for document in documents:
             try:
-                document.embed(embedder=self.embedder)
                 if document.embedding is None:
                     raise ValueError(f"Failed to generate embedding for document: {document.id}")
                 doc_data = self.prepare_doc(content_hash, document, filters)
@@ -284,9 +284,9 @@ class PineconeDb(VectorDb):
 
         """
 
+        self._embed_documents(documents)
         vectors = []
         for document in documents:
-            document.embed(embedder=self.embedder)
             document.meta_data["text"] = document.content
             # Include name and content_id in metadata
             metadata = document.meta_data.copy()
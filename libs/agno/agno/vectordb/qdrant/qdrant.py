@@ -344,6 +344,8 @@ class Qdrant(VectorDb):
             batch_size (int): Batch size for inserting documents
         """
         log_debug(f"Inserting {len(documents)} documents")
+        if self.search_type in [SearchType.vector, SearchType.hybrid]:
+            self._embed_documents(documents)
         points = []
         for document in documents:
             cleaned_content = document.content.replace("\x00", "\ufffd")
@@ -357,13 +359,11 @@ class Qdrant(VectorDb):
 
             if self.search_type == SearchType.vector:
                 # For vector search, maintain backward compatibility with unnamed vectors
-                document.embed(embedder=self.embedder)
                 vector = document.embedding  # type: ignore
             else:
                 # For other search types, use named vectors
                 vector = {}
                 if self.search_type in [SearchType.hybrid]:
-                    document.embed(embedder=self.embedder)
                     vector[self.dense_vector_name] = document.embedding
 
                 if self.search_type in [SearchType.keyword, SearchType.hybrid]:
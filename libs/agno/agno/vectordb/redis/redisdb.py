@@ -305,6 +305,7 @@ class RedisDB(VectorDb):
     ) -> None:
         """Insert documents into the Redis index."""
         try:
+            self._embed_documents([doc for doc in documents if not doc.embedding])
             # Store content hash for tracking
             parsed_documents = []
             for doc in documents:
@@ -327,6 +328,7 @@ class RedisDB(VectorDb):
         """Async version of insert method."""
         try:
             async_index = await self._get_async_index()
+            self._embed_documents([doc for doc in documents if not doc.embedding])
             parsed_documents = []
             for doc in documents:
                 parsed_doc = self._parse_redis_hash(doc)
@@ -180,10 +180,10 @@ class SingleStore(VectorDb):
             filters (Optional[Dict[str, Any]]): Optional filters for the insert.
             batch_size (int): Number of documents to insert in each batch.
         """
+        self._embed_documents(documents)
         with self.Session.begin() as sess:
             counter = 0
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 record_id = md5(cleaned_content.encode()).hexdigest()
                 _id = document.id or record_id
@@ -241,10 +241,10 @@ class SingleStore(VectorDb):
             filters (Optional[Dict[str, Any]]): Optional filters for the upsert.
             batch_size (int): Number of documents to upsert in each batch.
         """
+        self._embed_documents(documents)
         with self.Session.begin() as sess:
             counter = 0
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 record_id = md5(cleaned_content.encode()).hexdigest()
                 _id = document.id or record_id
@@ -291,8 +291,8 @@ class SurrealDb(VectorDb):
             filters: A dictionary of filters to apply to the query.
 
         """
+        self._embed_documents(documents)
         for doc in documents:
-            doc.embed(embedder=self.embedder)
             meta_data: Dict[str, Any] = doc.meta_data if isinstance(doc.meta_data, dict) else {}
             meta_data["content_hash"] = content_hash
             data: Dict[str, Any] = {"content": doc.content, "embedding": doc.embedding, "meta_data": meta_data}
@@ -309,8 +309,8 @@ class SurrealDb(VectorDb):
             filters: A dictionary of filters to apply to the query.
 
         """
+        self._embed_documents(documents)
         for doc in documents:
-            doc.embed(embedder=self.embedder)
             meta_data: Dict[str, Any] = doc.meta_data if isinstance(doc.meta_data, dict) else {}
             meta_data["content_hash"] = content_hash
             data: Dict[str, Any] = {"content": doc.content, "embedding": doc.embedding, "meta_data": meta_data}
@@ -530,8 +530,8 @@ class SurrealDb(VectorDb):
             filters: A dictionary of filters to apply to the query.
 
         """
+        self._embed_documents(documents)
         for doc in documents:
-            doc.embed(embedder=self.embedder)
             meta_data: Dict[str, Any] = doc.meta_data if isinstance(doc.meta_data, dict) else {}
             meta_data["content_hash"] = content_hash
             data: Dict[str, Any] = {"content": doc.content, "embedding": doc.embedding, "meta_data": meta_data}
@@ -551,8 +551,8 @@ class SurrealDb(VectorDb):
             filters: A dictionary of filters to apply to the query.
 
         """
+        self._embed_documents(documents)
         for doc in documents:
-            doc.embed(embedder=self.embedder)
             meta_data: Dict[str, Any] = doc.meta_data if isinstance(doc.meta_data, dict) else {}
             meta_data["content_hash"] = content_hash
             data: Dict[str, Any] = {"content": doc.content, "embedding": doc.embedding, "meta_data": meta_data}
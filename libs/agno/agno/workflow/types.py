@@ -16,7 +16,7 @@ from agno.utils.media import (
     reconstruct_images,
     reconstruct_videos,
 )
-from agno.utils.serialize import json_serializer
+from agno.utils.serialize import dumps_compact, json_serializer
 from agno.utils.timer import Timer
 
 
@@ -484,7 +484,12 @@ class WebSocketHandler:
             else:
                 data = {"type": "message", "content": str(event)}
 
-            await self.websocket.send_text(self.format_sse_event(json.dumps(data, default=json_serializer)))
+            # The event type is known here, so the JSON doesn't need to be parsed again by format_sse_event
+            event_type = data.get("event") if isinstance(data, dict) else None
+            if isinstance(event_type, str) and event_type:
+                await self.websocket.send_text(f"event: {event_type}\ndata: {dumps_compact(data)}\n\n")
+            else:
+                await self.websocket.send_text(self.format_sse_event(json.dumps(data, default=json_serializer)))
 
         except Exception as e:
             log_warning(f"Failed to handle WebSocket event: {e}")
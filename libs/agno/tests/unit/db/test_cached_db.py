@@ -0,0 +1,200 @@
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+from agno.db.base import AsyncBaseDb, SessionType
+from agno.db.cached import AsyncCachedDb, CachedDb
+from agno.db.in_memory import InMemoryDb
+from agno.session import AgentSession, TeamSession
+
+
+def _agent_session(session_id: str, user_id: str = "user-1", **kwargs) -> AgentSession:
+    return AgentSession(session_id=session_id, agent_id="agent-1", user_id=user_id, **kwargs)
+
+
+def test_reads_are_served_from_the_cache_after_a_write():
+    db = InMemoryDb()
+    cached_db = CachedDb(db)
+
+    with patch.object(db, "get_session", wraps=db.get_session) as get_session:
+        written = cached_db.upsert_session(_agent_session("s1", session_data={"session_state": {"turn": 1}}))
+        first = cached_db.get_session("s1", SessionType.AGENT)
+        second = cached_db.get_session("s1", SessionType.AGENT)
+
+        assert get_session.call_count == 0
+    assert first is second is written
+    assert cached_db.stats.hits == 2
+    # Writes go through to the database
+    assert db.get_session("s1", SessionType.AGENT).session_data == {"session_state": {"turn": 1}}  # type: ignore[union-attr]
+    # Sessions of other types, users, or as dicts are read from the database
+    assert cached_db.get_session("s1", SessionType.AGENT, user_id="user-2") is None
+    assert cached_db.get_session("s1", SessionType.AGENT, deserialize=False)["session_id"] == "s1"  # type: ignore[index]
+
+
+def test_misses_read_through_and_are_evicted_lru():
+    db = InMemoryDb()
+    for session_id in ("s1", "s2", "s3"):
+        db.upsert_session(_agent_session(session_id))
+    cached_db = CachedDb(db, max_sessions=2)
+
+    with patch.object(db, "get_session", wraps=db.get_session) as get_session:
+        cached_db.get_session("s1", SessionType.AGENT)
+        cached_db.get_session("s2", SessionType.AGENT)
+        cached_db.get_session("s1", SessionType.AGENT)
+        cached_db.get_session("s3", SessionType.AGENT)  # Evicts s2
+        cached_db.get_session("s1", SessionType.AGENT)
+        cached_db.get_session("s2", SessionType.AGENT)
+
+        assert [call.kwargs["session_id"] for call in get_session.call_args_list] == ["s1", "s2", "s3", "s2"]
+    assert cached_db.stats.misses == 4
+    assert cached_db.stats.evictions == 2
+
+
+def test_invalidation():
+    db = InMemoryDb()
+    db.upsert_session(_agent_session("s1"))
+    db.upsert_session(TeamSession(session_id="t1", team_id="team-1"))
+    cached_db = CachedDb(db, ttl=0.05)
+
+    cached = cached_db.get_session("s1", SessionType.AGENT)
+    assert cached_db.get_session("s1", SessionType.AGENT) is cached
+    time.sleep(0.06)
+    assert cached_db.get_session("s1", SessionType.AGENT) is not cached
+
+    cached_db.get_session("t1", SessionType.TEAM)
+    cached_db.delete_session("t1")
+    assert cached_db.get_session("t1", SessionType.TEAM) is None
+
+    renamed = cached_db.rename_session("s1", SessionType.AGENT, "Renamed")
+    assert cached_db.get_session("s1", SessionType.AGENT) is renamed
+
+
+def test_other_methods_are_delegated_explicitly(tmp_path):
+    from agno.db.base import BaseDb
+    from agno.db.schemas import UserMemory
+    from agno.db.sqlite import SqliteDb
+
+    # Every method of the base class is defined on the cache itself, none is patched in
+    for base, cache in ((BaseDb, CachedDb), (AsyncBaseDb, AsyncCachedDb)):
+        assert not cache.__abstractmethods__
+        for name, value in vars(base).items():
+            if callable(value) and not name.startswith("__"):
+                assert name in vars(cache), name
+
+    db = CachedDb(SqliteDb(db_file=str(tmp_path / "agno.db")))
+    db.upsert_user_memory(UserMemory(memory_id="m1", memory="Likes tea", user_id="u1", topics=["drinks"]))
+    # Databases whose memory methods take no user_id are called without it
+    assert db.get_user_memory_stats()[1] == 1
+    assert db.get_user_memory("m1").memory == "Likes tea"  # type: ignore[union-attr]
+    db.delete_user_memory("m1")
+    assert db.get_user_memories() == []
+
+
+def test_sessions_written_by_another_worker_are_refetched(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+
+    from agno.db.sqlite import SqliteDb
+
+    now = [1_000]
+    # updated_at has a resolution of one second
+    monkeypatch.setattr("agno.db.sqlite.sqlite.time", SimpleNamespace(time=lambda: now[0]))
+    db_file = str(tmp_path / "agno.db")
+    worker_a = CachedDb(SqliteDb(db_file=db_file))
+    worker_b = CachedDb(SqliteDb(db_file=db_file))
+
+    worker_a.upsert_session(_agent_session("s1", created_at=now[0], session_data={"session_state": {"turn": 1}}))
+    assert worker_b.get_session("s1", SessionType.AGENT).session_data == {"session_state": {"turn": 1}}  # type: ignore[union-attr]
+    cached = worker_a.get_session("s1", SessionType.AGENT)
+    assert worker_a.get_session("s1", SessionType.AGENT) is cached
+
+    now[0] += 1
+    worker_b.upsert_session(_agent_session("s1", created_at=now[0], session_data={"session_state": {"turn": 2}}))
+    session = worker_a.get_session("s1", SessionType.AGENT)
+    assert session is not cached
+    assert session.session_data == {"session_state": {"turn": 2}}  # type: ignore[union-attr]
+    assert worker_a.get_session("s1", SessionType.AGENT) is session
+
+    worker_b.delete_session("s1")
+    assert worker_a.get_session("s1", SessionType.AGENT) is None
+
+
+def test_session_lock_serializes_turns():
+    cached_db = CachedDb(InMemoryDb())
+    cached_db.upsert_session(_agent_session("s1", session_data={"session_state": {"turns": 0}}))
+
+    def turn():
+        with cached_db.session_lock("s1"):
+            session = cached_db.get_session("s1", SessionType.AGENT)
+            turns = session.session_data["session_state"]["turns"]  # type: ignore[union-attr]
+            time.sleep(0.01)
+            cached_db.upsert_session(_agent_session("s1", session_data={"session_state": {"turns": turns + 1}}))
+
+    threads = [threading.Thread(target=turn) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    session = cached_db.db.get_session("s1", SessionType.AGENT)
+    assert session.session_data["session_state"]["turns"] == 5  # type: ignore[union-attr]
+    assert not cached_db._locks._locks
+
+
+class _AsyncInMemoryDb(AsyncBaseDb):
+    def __init__(self):
+        super().__init__()
+        self.db = InMemoryDb()
+        self.reads = 0
+
+    async def get_session(self, session_id, session_type, user_id=None, deserialize=True):
+        self.reads += 1
+        return self.db.get_session(session_id, session_type, user_id=user_id, deserialize=deserialize)
+
+    async def get_session_updated_at(self, session_id, session_type):
+        return self.db.get_session_updated_at(session_id, session_type)
+
+    async def upsert_session(self, session, deserialize=True):
+        await asyncio.sleep(0.01)
+        return self.db.upsert_session(session, deserialize=deserialize)
+
+
+_AsyncInMemoryDb.__abstractmethods__ = frozenset()
+
+
+async def test_async_cached_db_serializes_turns():
+    db = _AsyncInMemoryDb()
+    cached_db = AsyncCachedDb(db)
+    assert isinstance(cached_db, AsyncBaseDb)
+    await cached_db.upsert_session(_agent_session("s1", session_data={"session_state": {"turns": 0}}))
+
+    async def turn():
+        async with cached_db.session_lock("s1"):
+            session = await cached_db.get_session("s1", SessionType.AGENT)
+            turns = session.session_data["session_state"]["turns"]  # type: ignore[union-attr]
+            await cached_db.upsert_session(_agent_session("s1", session_data={"session_state": {"turns": turns + 1}}))
+
+    await asyncio.gather(*[turn() for _ in range(5)])
+
+    session = await cached_db.get_session("s1", SessionType.AGENT)
+    assert session.session_data["session_state"]["turns"] == 5  # type: ignore[union-attr]
+    assert db.reads == 0
+    assert not cached_db._locks._locks
+
+
+def test_agent_turns_read_the_session_from_the_cache(monkeypatch):
+    from agno.agent import Agent
+    from agno.models.openai.chat import OpenAIChat
+    from agno.models.response import ModelResponse
+
+    monkeypatch.setattr(OpenAIChat, "invoke", lambda self, **kwargs: ModelResponse(role="assistant", content="Hi"))
+    db = InMemoryDb()
+    agent = Agent(model=OpenAIChat(id="gpt-4o", api_key="test-key"), db=CachedDb(db), add_history_to_context=True)
+
+    with patch.object(db, "get_session", wraps=db.get_session) as get_session:
+        agent.run("Hello", session_id="s1")
+        agent.run("Hello again", session_id="s1")
+
+        # Only the first turn misses
+        assert get_session.call_count == 1
+    assert len(db.get_session("s1", SessionType.AGENT).runs) == 2  # type: ignore[union-attr, arg-type]
@@ -0,0 +1,152 @@
+from agno.db.base import SessionType
+from agno.db.in_memory import InMemoryDb
+from agno.db.schemas.evals import EvalRunRecord, EvalType
+from agno.db.schemas.knowledge import KnowledgeRow
+from agno.db.schemas.memory import UserMemory
+from agno.session import AgentSession, TeamSession
+
+
+def _agent_session(session_id: str, agent_id: str = "agent-1", user_id: str = "user-1", **kwargs) -> AgentSession:
+    return AgentSession(session_id=session_id, agent_id=agent_id, user_id=user_id, **kwargs)
+
+
+def test_session_lookups_use_indexes():
+    db = InMemoryDb()
+    db.upsert_session(_agent_session("s1", session_data={"session_name": "First"}))
+    db.upsert_session(_agent_session("s2", agent_id="agent-2", user_id="user-2"))
+    db.upsert_session(TeamSession(session_id="s3", team_id="team-1", user_id="user-1"))
+
+    session = db.get_session("s1", SessionType.AGENT)
+    assert isinstance(session, AgentSession) and session.session_id == "s1"
+    assert db.get_session("s1", SessionType.AGENT, user_id="user-2") is None
+
+    assert [s.session_id for s in db.get_sessions(SessionType.AGENT, user_id="user-1")] == ["s1"]
+    assert [s.session_id for s in db.get_sessions(SessionType.AGENT, component_id="agent-2")] == ["s2"]
+    assert [s.session_id for s in db.get_sessions(SessionType.TEAM, user_id="user-1")] == ["s3"]
+
+    sessions, total = db.get_sessions(SessionType.AGENT, limit=1, page=2, deserialize=False)
+    assert total == 2
+    assert [s["session_id"] for s in sessions] == ["s2"]
+
+
+def test_session_updates_and_deletes_keep_indexes_consistent():
+    db = InMemoryDb()
+    db.upsert_session(_agent_session("s1"))
+    db.upsert_session(_agent_session("s1", user_id="user-2"))
+
+    assert db.get_sessions(SessionType.AGENT, user_id="user-1") == []
+    assert [s.session_id for s in db.get_sessions(SessionType.AGENT, user_id="user-2")] == ["s1"]
+
+    renamed = db.rename_session("s1", SessionType.AGENT, "Renamed")
+    assert renamed.session_data["session_name"] == "Renamed"
+
+    assert db.delete_session("s1") is True
+    assert db.delete_session("s1") is False
+    assert db.get_sessions(SessionType.AGENT, user_id="user-2") == []
+    assert db._session_keys_by_user == {}
+
+
+def test_reads_do_not_leak_references_to_stored_records():
+    db = InMemoryDb()
+    db.upsert_session(_agent_session("s1", session_data={"session_name": "Original"}))
+
+    session = db.get_session("s1", SessionType.AGENT)
+    session.session_data["session_name"] = "Changed by caller"
+    raw, _ = db.get_sessions(SessionType.AGENT, deserialize=False)
+    raw[0]["session_data"]["session_name"] = "Changed again"
+
+    assert db.get_session("s1", SessionType.AGENT).session_data["session_name"] == "Original"
+
+
+def test_mutated_reads_do_not_leak_into_the_store():
+    from agno.models.message import Message
+    from agno.models.metrics import Metrics
+    from agno.run.agent import RunOutput
+
+    db = InMemoryDb()
+    run = RunOutput(
+        run_id="r1",
+        agent_id="agent-1",
+        content="A long answer",
+        messages=[Message(role="user", content="Hi")],
+        metrics=Metrics(input_tokens=10),
+    )
+    db.upsert_session(_agent_session("s1", session_data={"session_state": {"items": ["a"]}}, runs=[run]))
+    db.upsert_user_memory(UserMemory(memory_id="m1", memory="likes tea", user_id="user-1", topics=["drinks"]))
+
+    # from_dict pops keys from the run dicts it is given, callers modify the session state and runs
+    session = db.get_session("s1", SessionType.AGENT)
+    session.session_data["session_state"]["items"].append("b")
+    session.runs[0].messages.append(Message(role="assistant", content="Hello"))
+    raw, _ = db.get_sessions(SessionType.AGENT, deserialize=False)
+    raw[0]["runs"][0]["messages"][0]["content"] = "Changed"
+    raw[0]["runs"][0].pop("content")
+    memory = db.get_user_memory("m1")
+    memory.topics.append("food")
+    db.get_user_memories(deserialize=False)[0][0]["topics"].append("fruit")
+
+    session = db.get_session("s1", SessionType.AGENT)
+    assert session.session_data == {"session_state": {"items": ["a"]}}
+    assert session.runs[0].content == "A long answer"
+    assert [message.content for message in session.runs[0].messages] == ["Hi"]
+    assert db.get_user_memory("m1").topics == ["drinks"]
+
+    # Values nobody modifies in place are shared with the store rather than copied
+    first, _ = db.get_sessions(SessionType.AGENT, deserialize=False)
+    second, _ = db.get_sessions(SessionType.AGENT, deserialize=False)
+    assert first[0]["runs"][0] is not second[0]["runs"][0]
+    assert first[0]["runs"][0]["metrics"] is second[0]["runs"][0]["metrics"]
+
+
+def test_list_reads_copy_only_the_returned_records():
+    db = InMemoryDb()
+    for i in range(3):
+        db.create_eval_run(EvalRunRecord(run_id=f"e{i}", eval_type=EvalType.ACCURACY, eval_data={"score": i}))
+    db.upsert_knowledge_content(KnowledgeRow(id="k1", name="first", description="", metadata={"tags": ["a"]}))
+
+    runs, total = db.get_eval_runs(limit=1, page=1, sort_by="run_id", sort_order="asc", deserialize=False)
+    assert total == 3
+    runs[0]["eval_data"]["score"] = 100
+    [record] = db.get_eval_runs(limit=1, page=1, sort_by="run_id", sort_order="asc")
+    record.eval_data["score"] = 200
+    assert db.get_eval_run("e0").eval_data == {"score": 0}
+
+    rows, _ = db.get_knowledge_contents()
+    rows[0].metadata["tags"] = ["changed"]
+    assert db.get_knowledge_content("k1").metadata == {"tags": ["a"]}
+
+    db.upsert_session(_agent_session("s1", session_data={"session_metrics": {"input_tokens": 3}}))
+    sessions = db._get_all_sessions_for_metrics_calculation()
+    assert sessions[0]["session_data"] is db._sessions[next(iter(db._sessions))]["session_data"]
+
+
+def test_memory_lookups_use_indexes():
+    db = InMemoryDb()
+    db.upsert_user_memory(UserMemory(memory_id="m1", memory="likes tea", user_id="user-1", topics=["drinks"]))
+    db.upsert_user_memory(UserMemory(memory_id="m2", memory="likes coffee", user_id="user-2"))
+
+    assert db.get_user_memory("m1").memory == "likes tea"
+    assert db.get_user_memory("m1", user_id="user-2") is None
+    assert [m.memory_id for m in db.get_user_memories(user_id="user-2")] == ["m2"]
+    assert [m.memory_id for m in db.get_user_memories(topics=["drinks"])] == ["m1"]
+
+    stats, total = db.get_user_memory_stats()
+    assert total == 2
+    assert {s["user_id"]: s["total_memories"] for s in stats} == {"user-1": 1, "user-2": 1}
+
+    db.delete_user_memory("m1", user_id="user-2")
+    assert db.get_user_memory("m1") is not None
+    db.delete_user_memories(["m1", "m2"])
+    assert db.get_user_memories() == []
+
+
+def test_knowledge_rows_are_keyed_by_id():
+    db = InMemoryDb()
+    db.upsert_knowledge_content(KnowledgeRow(id="k1", name="first", description=""))
+    db.upsert_knowledge_content(KnowledgeRow(id="k1", name="updated", description=""))
+
+    rows, total = db.get_knowledge_contents()
+    assert total == 1
+    assert db.get_knowledge_content("k1").name == "updated"
+    db.delete_knowledge_content("k1")
+    assert db.get_knowledge_content("k1") is None
@@ -0,0 +1,121 @@
+from agno.db.base import BaseDb, SessionType
+from agno.db.in_memory import InMemoryDb
+from agno.db.log import LogDb
+from agno.db.schemas.evals import EvalRunRecord, EvalType
+from agno.db.schemas.knowledge import KnowledgeRow
+from agno.db.schemas.memory import UserMemory
+from agno.session import AgentSession
+
+
+def _agent_session(session_id: str, **kwargs) -> AgentSession:
+    return AgentSession(session_id=session_id, agent_id="agent-1", user_id="user-1", **kwargs)
+
+
+def _line_count(path) -> int:
+    return len(path.read_text().splitlines())
+
+
+def test_records_survive_reopening(tmp_path):
+    db = LogDb(db_path=str(tmp_path))
+    db.upsert_session(_agent_session("s1", session_data={"session_name": "First"}))
+    db.upsert_session(_agent_session("s2"))
+    db.delete_session("s2")
+    db.upsert_user_memory(UserMemory(memory_id="m1", memory="likes tea", user_id="user-1"))
+    db.upsert_knowledge_content(KnowledgeRow(id="k1", name="doc", description=""))
+    db.create_eval_run(
+        EvalRunRecord(run_id="e1", eval_type=EvalType.ACCURACY, eval_data={"score": 1}, agent_id="agent-1")
+    )
+    db.rename_eval_run("e1", "Renamed")
+    db.close()
+
+    # One line per write, nothing is rewritten
+    assert _line_count(tmp_path / "agno_sessions.jsonl") == 3
+
+    reopened = LogDb(db_path=str(tmp_path))
+    assert reopened.get_session("s1", SessionType.AGENT).session_data["session_name"] == "First"
+    assert reopened.get_session("s2", SessionType.AGENT) is None
+    assert reopened.get_user_memory("m1").memory == "likes tea"
+    assert reopened.get_knowledge_content("k1").name == "doc"
+    assert reopened.get_eval_run("e1").name == "Renamed"
+    assert [m.memory_id for m in reopened.get_user_memories(user_id="user-1")] == ["m1"]
+
+
+def test_cleared_records_stay_cleared_after_reopening(tmp_path):
+    db = LogDb(db_path=str(tmp_path))
+    db.upsert_user_memory(UserMemory(memory_id="m1", memory="likes tea", user_id="user-1"))
+    db.upsert_user_memory(UserMemory(memory_id="m2", memory="likes jazz", user_id="user-2"))
+    db.clear_memories()
+    db.close()
+
+    reopened = LogDb(db_path=str(tmp_path))
+    assert reopened.get_user_memories() == []
+    assert reopened.get_user_memory("m1") is None
+
+
+def test_instances_sharing_a_path_see_each_others_writes(tmp_path):
+    first = LogDb(db_path=str(tmp_path))
+    second = LogDb(db_path=str(tmp_path))
+
+    first.upsert_session(_agent_session("s1"))
+    assert second.get_session("s1", SessionType.AGENT) is not None
+
+    second.upsert_user_memory(UserMemory(memory_id="m1", memory="likes tea", user_id="user-1"))
+    second.delete_session("s1")
+    assert first.get_session("s1", SessionType.AGENT) is None
+    assert first.get_user_memory("m1").memory == "likes tea"
+
+
+def test_logs_are_compacted(tmp_path):
+    db = LogDb(db_path=str(tmp_path), compact_min_records=10)
+    for i in range(25):
+        db.upsert_user_memory(UserMemory(memory_id="m1", memory=f"version {i}", user_id="user-1"))
+
+    assert _line_count(tmp_path / "agno_memories.jsonl") < 10
+    other = LogDb(db_path=str(tmp_path))
+    assert other.get_user_memory("m1").memory == "version 24"
+
+    # A compaction by one instance is picked up by the other
+    db.upsert_user_memory(UserMemory(memory_id="m2", memory="another", user_id="user-1"))
+    db.compact()
+    assert _line_count(tmp_path / "agno_memories.jsonl") == 2
+    assert other.get_user_memory("m2").memory == "another"
+    other.upsert_user_memory(UserMemory(memory_id="m3", memory="third", user_id="user-1"))
+    assert len(db.get_user_memories()) == 3
+
+
+def test_incomplete_record_left_by_a_crash_is_dropped(tmp_path):
+    db = LogDb(db_path=str(tmp_path))
+    db.upsert_session(_agent_session("s1"))
+    db.close()
+
+    log_file = tmp_path / "agno_sessions.jsonl"
+    with open(log_file, "a") as f:
+        f.write('{"op": "put", "key": ["s2", "agent", "agent-1"], "value": {"sess')
+
+    reopened = LogDb(db_path=str(tmp_path))
+    assert [s.session_id for s in reopened.get_sessions(SessionType.AGENT)] == ["s1"]
+    reopened.upsert_session(_agent_session("s3"))
+
+    assert _line_count(log_file) == 2
+    assert [s.session_id for s in LogDb(db_path=str(tmp_path)).get_sessions(SessionType.AGENT)] == ["s1", "s3"]
+
+
+def test_in_memory_methods_are_delegated_explicitly(tmp_path, monkeypatch):
+    init_calls = []
+    base_init = BaseDb.__init__
+
+    def counting_init(self, *args, **kwargs):
+        init_calls.append(kwargs)
+        base_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(BaseDb, "__init__", counting_init)
+    db = LogDb(db_path=str(tmp_path), session_table="my_sessions", id="log-db")
+
+    assert len(init_calls) == 1
+    assert (db.id, db.session_table_name) == ("log-db", "my_sessions")
+    assert LogDb.__abstractmethods__ == frozenset()
+    in_memory_methods = {
+        name for name in vars(InMemoryDb) if not name.startswith("_") and callable(vars(InMemoryDb)[name])
+    }
+    not_delegated = in_memory_methods - set(vars(LogDb)) - {"get_latest_schema_version", "upsert_schema_version"}
+    assert not_delegated == set()
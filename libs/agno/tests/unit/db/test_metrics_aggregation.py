@@ -0,0 +1,152 @@
+import json
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import Column, MetaData, Table, text
+from sqlalchemy.dialects import postgresql
+
+from agno.db.base import SessionType
+from agno.db.sqlite import SqliteDb
+from agno.db.sqlite.utils import calculate_date_metrics
+from agno.db.utils import get_day_ranges
+from agno.run.agent import RunOutput
+from agno.run.team import TeamRunOutput
+from agno.session import AgentSession, TeamSession
+
+TODAY = datetime.now(timezone.utc).date()
+
+
+def _timestamp(day: date, hour: int = 12) -> int:
+    return int(datetime(day.year, day.month, day.day, hour, tzinfo=timezone.utc).timestamp())
+
+
+def _session(session_id: str, day: date, user_id, runs, input_tokens: int = 10) -> AgentSession:
+    return AgentSession(
+        session_id=session_id,
+        agent_id="agent-1",
+        user_id=user_id,
+        created_at=_timestamp(day),
+        session_data={"session_metrics": {"input_tokens": input_tokens, "total_tokens": input_tokens * 2}},
+        runs=runs,
+    )
+
+
+def _run(run_id: str, session_id: str, model: str = "gpt-4o", provider: str = "OpenAI") -> RunOutput:
+    return RunOutput(run_id=run_id, session_id=session_id, agent_id="agent-1", model=model, model_provider=provider)
+
+
+def _populate(db: SqliteDb) -> None:
+    two_days_ago = TODAY - timedelta(days=2)
+    db.upsert_session(
+        _session("s1", two_days_ago, "user-1", [_run("r1", "s1"), _run("r2", "s1", "claude", "Anthropic")])
+    )
+    db.upsert_session(_session("s2", two_days_ago, "user-1", [_run("r3", "s2")], input_tokens=5))
+    db.upsert_session(_session("s3", two_days_ago, "user-2", []))
+    db.upsert_session(_session("s4", TODAY, None, [_run("r4", "s4")]))
+    db.upsert_session(
+        TeamSession(
+            session_id="t1",
+            team_id="team-1",
+            user_id="user-3",
+            created_at=_timestamp(TODAY),
+            runs=[TeamRunOutput(run_id="r5", session_id="t1", team_id="team-1", model="gpt-4o")],
+        )
+    )
+
+
+def _python_metrics(db: SqliteDb, day: date) -> dict:
+    """Metrics of the given day, calculated in Python from the loaded sessions"""
+    start, end = get_day_ranges([day])[0]
+    sessions_data: dict = {"agent": [], "team": [], "workflow": []}
+    for session in db._get_all_sessions_for_metrics_calculation(start_timestamp=start, end_timestamp=end - 1):
+        session = dict(session)
+        for field in ("session_data", "runs"):
+            if isinstance(session[field], str):
+                session[field] = json.loads(session[field])
+        session["runs"] = session["runs"] or []
+        session["session_data"] = session["session_data"] or {}
+        sessions_data[session["session_type"]].append(session)
+    return calculate_date_metrics(day, sessions_data)
+
+
+def _comparable(record: dict) -> dict:
+    record = {key: value for key, value in record.items() if key not in ("id", "created_at", "updated_at")}
+    record["model_metrics"] = sorted(
+        record["model_metrics"], key=lambda model: (model["model_id"], model["model_provider"])
+    )
+    return record
+
+
+@pytest.mark.parametrize("store_runs_separately", [False, True])
+def test_aggregated_metrics_match_the_python_calculation(store_runs_separately):
+    db = SqliteDb(db_url="sqlite://", store_runs_separately=store_runs_separately)
+    _populate(db)
+
+    results = db.calculate_metrics()
+
+    assert [result["date"] for result in results] == [TODAY - timedelta(days=2), TODAY]
+    for result in results:
+        assert _comparable(result) == _comparable(_python_metrics(db, result["date"]))
+
+    first_day = results[0]
+    assert first_day["agent_sessions_count"] == 3
+    assert first_day["agent_runs_count"] == 3
+    assert first_day["users_count"] == 2
+    assert first_day["token_metrics"]["input_tokens"] == 25
+    assert first_day["model_metrics"] == [
+        {"model_id": "claude", "model_provider": "Anthropic", "count": 1},
+        {"model_id": "gpt-4o", "model_provider": "OpenAI", "count": 2},
+    ]
+    assert results[1]["team_runs_count"] == 1
+    assert results[1]["users_count"] == 1
+
+
+def test_only_updated_days_are_recalculated():
+    db = SqliteDb(db_url="sqlite://")
+    _populate(db)
+    db.calculate_metrics()
+
+    # Move the watermark to the past, as if time went by since the calculation
+    with db.Session() as sess, sess.begin():
+        sess.execute(text("UPDATE agno_metrics SET updated_at = updated_at - 100"))
+        sess.execute(text("UPDATE agno_sessions SET updated_at = updated_at - 200"))
+
+    # Only today is recalculated when no past session was updated
+    assert [result["date"] for result in db.calculate_metrics()] == [TODAY]
+
+    with db.Session() as sess, sess.begin():
+        sess.execute(text("UPDATE agno_metrics SET updated_at = updated_at - 100"))
+        sess.execute(text("UPDATE agno_sessions SET updated_at = updated_at - 300"))
+
+    session = db.get_session("s3", SessionType.AGENT)
+    session.runs = [_run("r6", "s3", "mistral-large", "Mistral")]
+    db.upsert_session(session)
+
+    results = db.calculate_metrics()
+    assert [result["date"] for result in results] == [TODAY - timedelta(days=2), TODAY]
+    assert results[0]["agent_runs_count"] == 4
+    assert {"model_id": "mistral-large", "model_provider": "Mistral", "count": 1} in results[0]["model_metrics"]
+
+    metrics, _ = db.get_metrics(starting_date=TODAY - timedelta(days=2), ending_date=TODAY - timedelta(days=2))
+    assert len(metrics) == 1
+    assert metrics[0]["agent_runs_count"] == 4
+
+
+def test_postgres_statements_compile():
+    from agno.db.postgres.schemas import get_table_schema_definition
+    from agno.db.postgres.utils import get_metrics_aggregation_statements
+
+    def table(name: str, table_type: str) -> Table:
+        schema = get_table_schema_definition(table_type)
+        columns = [Column(column, config["type"]()) for column, config in schema.items() if not column.startswith("_")]
+        return Table(name, MetaData(), *columns)
+
+    statements = get_metrics_aggregation_statements(
+        table("agno_sessions", "sessions"), table("agno_runs", "runs"), [TODAY - timedelta(days=1), TODAY]
+    )
+
+    runs = str(statements["runs"][0].compile(dialect=postgresql.dialect()))
+    assert "jsonb_array_elements" in runs
+    assert "runs" not in str(statements["sessions"][0].compile(dialect=postgresql.dialect()))
+    # Runs stored in the sessions and in the runs table
+    assert len(statements["runs"]) == 2
@@ -0,0 +1,98 @@
+import time
+
+from sqlalchemy import text
+
+from agno.db.base import SessionType
+from agno.db.migrations.versions import v2_5_0
+from agno.db.sqlite import SqliteDb
+from agno.run.agent import RunOutput
+from agno.session import AgentSession
+
+
+def _run(run_id: str, content: str = "") -> RunOutput:
+    return RunOutput(run_id=run_id, agent_id="agent-1", session_id="s1", content=content or run_id)
+
+
+def _session(runs) -> AgentSession:
+    return AgentSession(
+        session_id="s1", agent_id="agent-1", user_id="user-1", created_at=int(time.time()), runs=list(runs)
+    )
+
+
+def _stored_runs(db: SqliteDb):
+    with db.Session() as sess:
+        return sess.execute(text("SELECT run_id, position FROM agno_session_runs ORDER BY position")).fetchall()
+
+
+def test_runs_are_stored_as_separate_rows(tmp_path):
+    db = SqliteDb(db_file=str(tmp_path / "agno.db"), store_runs_separately=True)
+    stored = db.upsert_session(_session([_run("r0"), _run("r1"), _run("r2")]))
+    assert [run.run_id for run in stored.runs] == ["r0", "r1", "r2"]
+    assert db.get_session_runs("s1", num_runs=1)[0]["run_id"] == "r2"
+
+    with db.Session() as sess:
+        assert sess.execute(text("SELECT runs FROM agno_sessions")).scalar() in (None, "null")
+    assert _stored_runs(db) == [("r0", 0), ("r1", 1), ("r2", 2)]
+
+    # Load only the latest runs, append one and update one: older runs are kept
+    session = db.get_session("s1", SessionType.AGENT, num_runs=1)
+    assert [run.run_id for run in session.runs] == ["r2"]
+    session.runs[0].content = "updated"
+    session.runs.append(_run("r3"))
+    db.upsert_session(session)
+
+    session = db.get_session("s1", SessionType.AGENT)
+    assert [run.run_id for run in session.runs] == ["r0", "r1", "r2", "r3"]
+    assert session.runs[2].content == "updated"
+    assert db.get_session("s1", SessionType.AGENT, num_runs=0).runs == []
+    assert len(db.get_sessions(SessionType.AGENT)[0].runs) == 4
+
+    db.delete_session("s1")
+    assert _stored_runs(db) == []
+
+
+def test_session_runs_limit():
+    db = SqliteDb(db_url="sqlite://", store_runs_separately=True, session_runs_limit=2)
+    db.upsert_session(_session([_run(f"r{i}") for i in range(5)]))
+
+    assert [run.run_id for run in db.get_session("s1", SessionType.AGENT).runs] == ["r3", "r4"]
+    assert len(db.get_session("s1", SessionType.AGENT, num_runs=10).runs) == 5
+
+
+def test_migration_moves_runs_out_of_sessions_table(tmp_path):
+    db_file = str(tmp_path / "agno.db")
+    SqliteDb(db_file=db_file).upsert_session(_session([_run("r0"), _run("r1")]))
+
+    db = SqliteDb(db_file=db_file, store_runs_separately=True)
+    assert [run.run_id for run in db.get_session("s1", SessionType.AGENT).runs] == ["r0", "r1"]
+
+    assert v2_5_0.up(db, "sessions", db.session_table_name) is True
+    assert _stored_runs(db) == [("r0", 0), ("r1", 1)]
+    assert [run.run_id for run in db.get_session("s1", SessionType.AGENT).runs] == ["r0", "r1"]
+
+    assert v2_5_0.down(db, "sessions", db.session_table_name) is True
+    plain_db = SqliteDb(db_file=db_file)
+    assert [run.run_id for run in plain_db.get_session("s1", SessionType.AGENT).runs] == ["r0", "r1"]
+
+
+def test_limited_reads_of_runs_in_the_sessions_table_are_upserted_whole(tmp_path):
+    db_file = str(tmp_path / "agno.db")
+    SqliteDb(db_file=db_file).upsert_session(_session([_run(f"r{i}") for i in range(4)]))
+
+    # Runs in the sessions table are not limited, whether runs are stored separately or not
+    for db in (
+        SqliteDb(db_file=db_file, session_runs_limit=1),
+        SqliteDb(db_file=db_file, store_runs_separately=True, session_runs_limit=1),
+    ):
+        session = db.get_session("s1", SessionType.AGENT, num_runs=0)
+        db.upsert_session(session)
+        assert len(db.get_session("s1", SessionType.AGENT, num_runs=10).runs) == 4
+        assert [run["run_id"] for run in db.get_session_runs("s1", num_runs=1)] == ["r3"]
+
+    # After the upsert the runs are in the runs table, and reads are limited
+    db = SqliteDb(db_file=db_file, store_runs_separately=True, session_runs_limit=1)
+    assert _stored_runs(db) == [(f"r{i}", i) for i in range(4)]
+    session = db.get_session("s1", SessionType.AGENT)
+    assert [run.run_id for run in session.runs] == ["r3"]
+    db.upsert_session(session)
+    assert len(db.get_session("s1", SessionType.AGENT, num_runs=10).runs) == 4
@@ -0,0 +1,44 @@
+import re
+
+import pytest
+
+from agno.knowledge.chunking.fixed import FixedSizeChunking
+from agno.knowledge.chunking.normalization import NormalizationProfile, normalize_text
+
+TEXT = "# Title  \r\n\r\n\r\nSome\ttext,   with  spaces.\n  - indented item\n\n\f\vEnd \n"
+
+
+def legacy_clean_text(text: str) -> str:
+    cleaned_text = re.sub(r"\n+", "\n", text)
+    cleaned_text = re.sub(r"\s+", " ", cleaned_text)
+    cleaned_text = re.sub(r"\t+", "\t", cleaned_text)
+    cleaned_text = re.sub(r"\r+", "\r", cleaned_text)
+    cleaned_text = re.sub(r"\f+", "\f", cleaned_text)
+    return re.sub(r"\v+", "\v", cleaned_text)
+
+
+def test_plain_profile_matches_the_previous_clean_text():
+    assert FixedSizeChunking().clean_text(TEXT) == legacy_clean_text(TEXT)
+    assert normalize_text(TEXT, track_offsets=True).text == legacy_clean_text(TEXT)
+
+
+def test_markdown_profile_keeps_line_and_paragraph_breaks():
+    normalized = normalize_text(TEXT, NormalizationProfile.MARKDOWN)
+
+    assert normalized.text == "# Title\n\nSome text, with spaces.\n  - indented item\n\nEnd\n"
+    assert normalize_text(TEXT, "none").text == TEXT
+
+
+@pytest.mark.parametrize("profile", ["plain", "markdown"])
+def test_offsets_map_back_to_the_original_text(profile):
+    normalized = normalize_text(TEXT, profile, track_offsets=True)
+
+    assert normalized.text == normalize_text(TEXT, profile).text
+    for offset, char in enumerate(normalized.text):
+        original = normalized.to_original(offset)
+        if char.isspace():
+            assert TEXT[original].isspace()
+        else:
+            # Every other character maps to itself, in order
+            assert TEXT[original] == char
+    assert normalized.to_original(len(normalized.text)) == len(TEXT)
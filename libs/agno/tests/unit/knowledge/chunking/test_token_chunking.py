@@ -0,0 +1,77 @@
+import pytest
+
+from agno.knowledge.chunking.strategy import ChunkingStrategyFactory, ChunkingStrategyType
+from agno.knowledge.chunking.tokens import RegexTokenizer, TokenChunking
+from agno.knowledge.document.base import Document
+
+TEXT = " ".join(f"Sentence number {i} talks about chunking." for i in range(200))
+
+
+def test_chunks_respect_the_token_budget_and_end_at_sentences():
+    tokenizer = RegexTokenizer()
+    chunker = TokenChunking(chunk_size=50, tokenizer=tokenizer)
+
+    chunks = chunker.chunk(Document(id="doc", content=TEXT))
+
+    assert len(chunks) > 1
+    for chunk in chunks:
+        assert tokenizer.count_tokens(chunk.content) <= 50
+        assert chunk.meta_data["chunk_tokens"] <= 50
+        # Offsets map each chunk back to the original content
+        assert TEXT[chunk.meta_data["start_char"] : chunk.meta_data["end_char"]] == chunk.content
+    assert all(chunk.content.endswith(".") for chunk in chunks)
+    assert [chunk.id for chunk in chunks[:2]] == ["doc_1", "doc_2"]
+    # Nothing is lost between the chunks
+    assert " ".join(chunk.content for chunk in chunks) == TEXT
+
+
+def test_chunks_end_at_paragraphs_and_map_to_the_original_text():
+    paragraphs = [" ".join(f"word{i}{j}" for j in range(30)) for i in range(6)]
+    text = "\n\n\n".join(f"  {paragraph}  " for paragraph in paragraphs)
+    chunker = TokenChunking(chunk_size=100, tokenizer=RegexTokenizer())
+
+    chunks = chunker.chunk(Document(content=text))
+
+    # Paragraphs of 60 tokens: a boundary in the second half of each budget
+    assert [chunk.content for chunk in chunks] == paragraphs
+    for chunk in chunks:
+        assert text[chunk.meta_data["start_char"] : chunk.meta_data["end_char"]] == chunk.content
+
+
+def test_overlap_repeats_tokens_of_the_previous_chunk():
+    chunker = TokenChunking(chunk_size=40, overlap=10, tokenizer=RegexTokenizer())
+
+    chunks = chunker.chunk(Document(content=TEXT))
+
+    for previous, chunk in zip(chunks, chunks[1:]):
+        assert chunk.meta_data["start_char"] < previous.meta_data["end_char"]
+
+
+def test_long_words_are_split_inside_the_word():
+    chunker = TokenChunking(chunk_size=10, tokenizer=RegexTokenizer())
+
+    chunks = chunker.chunk(Document(content="x" * 100))
+
+    assert [chunk.meta_data["chunk_tokens"] for chunk in chunks] == [10, 10, 5]
+
+
+def test_fast_path_matches_the_regular_path():
+    text = TEXT * 5
+    regular = TokenChunking(chunk_size=64, tokenizer=RegexTokenizer())
+    fast = TokenChunking(chunk_size=64, tokenizer=RegexTokenizer(), fast_path_threshold=1000)
+    fast.segment_size = 2000
+
+    assert [c.content for c in fast.chunk(Document(content=text))] == [
+        c.content for c in regular.chunk(Document(content=text))
+    ]
+
+
+def test_factory_creates_token_chunking():
+    chunker = ChunkingStrategyFactory.create_strategy(
+        ChunkingStrategyType.from_string("TokenChunker"), chunk_size=100, overlap=10, tokenizer=RegexTokenizer()
+    )
+
+    assert isinstance(chunker, TokenChunking)
+    assert chunker.chunk_size == 100
+    with pytest.raises(ValueError):
+        TokenChunking(chunk_size=10, overlap=10, tokenizer=RegexTokenizer())
@@ -0,0 +1,45 @@
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+
+from agno.db.in_memory import InMemoryDb
+from agno.knowledge.knowledge import Knowledge
+from agno.knowledge.reader.csv_reader import CSVReader
+from agno.vectordb.local import LocalDb
+
+
+@pytest.fixture
+def embedder():
+    def _embed(text: str) -> List[float]:
+        return [float(len(text)), 1.0]
+
+    async def async_get_embedding_and_usage(text):
+        return _embed(text), None
+
+    mock = MagicMock()
+    mock.dimensions = 2
+    mock.enable_batch = False
+    mock.get_embedding.side_effect = _embed
+    mock.get_embedding_and_usage.side_effect = lambda text: (_embed(text), None)
+    mock.async_get_embedding_and_usage.side_effect = async_get_embedding_and_usage
+    return mock
+
+
+def test_large_files_are_loaded_in_batches(tmp_path, embedder):
+    csv_file = tmp_path / "export.csv"
+    csv_file.write_text("\n".join(f"row {i},value {i}" for i in range(25)))
+
+    vector_db = LocalDb(collection="rows", path=str(tmp_path / "vectors"), embedder=embedder)
+    knowledge = Knowledge(
+        vector_db=vector_db, contents_db=InMemoryDb(), stream_threshold_bytes=10, stream_batch_size=10
+    )
+    reader = CSVReader()
+    reader.read = MagicMock(side_effect=AssertionError("large files must not be read at once"))  # type: ignore[method-assign]
+
+    knowledge.add_content(path=str(csv_file), reader=reader)
+
+    results = vector_db.search("row 7, value 7", limit=30)
+    assert len(results) == 25
+    content = knowledge.get_content()[0][0]
+    assert content.status == "completed"
@@ -0,0 +1,119 @@
+import asyncio
+import os
+import threading
+from pathlib import Path
+from typing import Any, List, Optional
+from unittest.mock import MagicMock
+
+from agno.db.in_memory import InMemoryDb
+from agno.knowledge.content import ContentStatus
+from agno.knowledge.document import Document
+from agno.knowledge.knowledge import Knowledge
+from agno.knowledge.reader.base import Reader
+
+
+class RecordingReader(Reader):
+    """Reads a text file into one document, recording the thread it ran on."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.threads: List[str] = []
+
+    def read(self, obj: Any, name: Optional[str] = None, password: Optional[str] = None) -> List[Document]:
+        self.threads.append(threading.current_thread().name)
+        text = Path(obj).read_text()
+        if text == "broken":
+            raise ValueError("Could not parse file")
+        return [Document(name=name, content=text)]
+
+
+def _vector_db():
+    vector_db = MagicMock()
+    vector_db.upsert_available.return_value = False
+    vector_db.content_hash_exists.return_value = False
+    state = {"in_flight": 0, "max_in_flight": 0, "inserted": []}
+
+    async def async_insert(content_hash, documents, filters=None):
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        await asyncio.sleep(0.01)
+        state["inserted"].extend(doc.content for doc in documents)
+        state["in_flight"] -= 1
+
+    vector_db.async_insert.side_effect = async_insert
+    return vector_db, state
+
+
+def test_directory_load_is_concurrent_and_bounded(tmp_path):
+    docs = tmp_path / "docs"
+    (docs / "nested" / "deeper").mkdir(parents=True)
+    for i in range(6):
+        (docs / f"file_{i}.txt").write_text(f"top {i}")
+    (docs / "nested" / "inner.txt").write_text("inner")
+    (docs / "nested" / "deeper" / "deepest.txt").write_text("deepest")
+    (docs / "nested" / "skipped.md").write_text("skipped")
+
+    vector_db, state = _vector_db()
+    knowledge = Knowledge(
+        vector_db=vector_db, contents_db=InMemoryDb(), max_concurrent_files=4, max_concurrent_inserts=2
+    )
+    reader = RecordingReader()
+    knowledge.add_content(path=str(docs), reader=reader, exclude=["*.md"])
+
+    assert sorted(state["inserted"]) == sorted([f"top {i}" for i in range(6)] + ["inner", "deepest"])
+    assert 1 < state["max_in_flight"] <= 2
+    assert all(thread.startswith("agno-knowledge-reader") for thread in reader.threads)
+
+    contents, total = knowledge.contents_db.get_knowledge_contents()
+    assert total == 8
+    assert all(row.status == ContentStatus.COMPLETED for row in contents)
+
+
+def test_directory_load_continues_after_failed_file(tmp_path):
+    (tmp_path / "good.txt").write_text("good")
+    (tmp_path / "bad.txt").write_text("broken")
+
+    vector_db, state = _vector_db()
+    knowledge = Knowledge(vector_db=vector_db, contents_db=InMemoryDb())
+    knowledge.add_content(path=str(tmp_path), reader=RecordingReader())
+
+    assert state["inserted"] == ["good"]
+    contents, _ = knowledge.contents_db.get_knowledge_contents()
+    statuses = sorted((row.status, row.status_message) for row in contents)
+    assert statuses == [(ContentStatus.COMPLETED, ""), (ContentStatus.FAILED, "Could not parse file")]
+
+
+class ProcessRecordingReader(Reader):
+    """Reads a text file into one document, recording the process it ran in."""
+
+    def read(self, obj: Any, name: Optional[str] = None, password: Optional[str] = None) -> List[Document]:
+        return [Document(name=name, content=Path(obj).read_text(), meta_data={"pid": os.getpid()})]
+
+
+def test_files_are_parsed_in_reader_processes(tmp_path):
+    for i in range(4):
+        (tmp_path / f"file_{i}.txt").write_text(f"file {i}")
+
+    vector_db = MagicMock()
+    vector_db.upsert_available.return_value = False
+    vector_db.content_hash_exists.return_value = False
+    pids = []
+
+    async def async_insert(content_hash, documents, filters=None):
+        pids.extend(doc.meta_data.get("pid") for doc in documents)
+
+    vector_db.async_insert.side_effect = async_insert
+    knowledge = Knowledge(vector_db=vector_db, contents_db=InMemoryDb(), reader_processes=2)
+    try:
+        knowledge.add_content(path=str(tmp_path), reader=ProcessRecordingReader())
+        assert len(pids) == 4
+        assert os.getpid() not in pids
+
+        # Readers that can't be pickled are run on the reader threads
+        reader = RecordingReader()
+        reader.lock = threading.Lock()  # type: ignore[attr-defined]
+        knowledge.add_content(path=str(tmp_path / "file_0.txt"), reader=reader, skip_if_exists=False)
+        assert reader.threads and reader.threads[0].startswith("agno-knowledge-reader")
+    finally:
+        knowledge.close()
+    assert knowledge._reader_executor is None and knowledge._reader_process_pool is None
@@ -0,0 +1,118 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from agno.knowledge.embedder.base import Embedder
+from agno.knowledge.document import Document
+from agno.knowledge.embedder.batcher import BatchingEmbedder
+from agno.vectordb.local import LocalDb
+
+
+@dataclass
+class RecordingEmbedder(Embedder):
+    id: str = "recording-embedder"
+    dimensions: Optional[int] = 2
+    batch_size: int = 100
+    batches: List[List[str]] = field(default_factory=list)
+    fail: bool = False
+
+    def get_embedding(self, text: str) -> List[float]:
+        return [float(len(text)), 1.0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        self.batches.append([text])
+        return self.get_embedding(text), None
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        self.batches.append(list(texts))
+        return [self.get_embedding(text) for text in texts], [{"total_tokens": len(texts)}] * len(texts)
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        if self.fail:
+            raise RuntimeError("provider unavailable")
+        self.batches.append(list(texts))
+        return [[float(len(text)), 1.0] for text in texts], [{"total_tokens": len(texts)}] * len(texts)
+
+
+async def test_concurrent_requests_are_coalesced():
+    inner = RecordingEmbedder()
+    embedder = BatchingEmbedder(embedder=inner, max_latency=0.05)
+
+    results = await asyncio.gather(
+        embedder.async_get_embedding("one"),
+        embedder.async_get_embeddings_batch_and_usage(["three", "four"]),
+        embedder.async_get_embedding_and_usage("seventeen"),
+    )
+
+    assert inner.batches == [["one", "three", "four", "seventeen"]]
+    assert results[0] == [3.0, 1.0]
+    assert results[1][0] == [[5.0, 1.0], [4.0, 1.0]]
+    assert results[2] == ([9.0, 1.0], {"total_tokens": 4})
+    assert embedder.stats.batches == 1
+    assert embedder.stats.requests == 3
+    assert embedder.enable_batch is True
+
+
+async def test_batches_respect_batch_size_and_token_limits():
+    inner = RecordingEmbedder(batch_size=3)
+    embedder = BatchingEmbedder(embedder=inner, max_latency=0.05)
+    await embedder.async_get_embeddings_batch_and_usage([f"text {i}" for i in range(7)])
+    assert [len(batch) for batch in inner.batches] == [3, 3, 1]
+
+    inner = RecordingEmbedder()
+    # Each 40 character text is estimated at 11 tokens
+    embedder = BatchingEmbedder(embedder=inner, max_batch_tokens=25)
+    await embedder.async_get_embeddings_batch_and_usage(["x" * 40] * 5)
+    assert [len(batch) for batch in inner.batches] == [2, 2, 1]
+
+
+async def test_batch_errors_reach_every_caller():
+    embedder = BatchingEmbedder(embedder=RecordingEmbedder(fail=True))
+    results = await asyncio.gather(
+        embedder.async_get_embedding("a"), embedder.async_get_embedding("b"), return_exceptions=True
+    )
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_works_across_event_loops():
+    inner = RecordingEmbedder()
+    embedder = BatchingEmbedder(embedder=inner)
+    assert asyncio.run(embedder.async_get_embedding("first")) == [5.0, 1.0]
+    assert asyncio.run(embedder.async_get_embedding("second")) == [6.0, 1.0]
+    assert embedder.get_embedding("sync") == [4.0, 1.0]
+    assert inner.batches == [["first"], ["second"]]
+
+
+def test_requires_embedder():
+    with pytest.raises(ValueError):
+        BatchingEmbedder()
+
+
+def test_sync_inserts_are_batched(tmp_path):
+    inner = RecordingEmbedder(batch_size=3)
+    embedder = BatchingEmbedder(embedder=inner)
+    vector_db = LocalDb(collection="docs", path=str(tmp_path), embedder=embedder)
+    vector_db.create()
+
+    vector_db.insert("hash", [Document(content=f"document {i}") for i in range(7)])
+
+    assert [len(batch) for batch in inner.batches] == [3, 3, 1]
+    assert vector_db.get_count() == 7
+    assert embedder.stats.to_dict() == {"requests": 1, "texts": 7, "batches": 3, "texts_per_batch": 7 / 3}
+    [result] = vector_db.search("document 4", limit=1)
+    assert result.embedding == [10.0, 1.0]
+
+
+def test_sync_batches_fall_back_to_single_texts():
+    @dataclass
+    class SingleTextEmbedder(Embedder):
+        def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+            return [float(len(text))], None
+
+    embedder = BatchingEmbedder(embedder=SingleTextEmbedder(), max_batch_tokens=2)
+    assert embedder.get_embeddings_batch_and_usage(["a", "bb", "ccc"]) == ([[1.0], [2.0], [3.0]], [None] * 3)
+    assert embedder.stats.batches == 2
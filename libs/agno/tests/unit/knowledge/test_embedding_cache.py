@@ -0,0 +1,140 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from agno.knowledge.embedder.base import Embedder
+from agno.knowledge.embedder.cache import CachedEmbedder, EmbeddingCache
+
+
+@dataclass
+class CountingEmbedder(Embedder):
+    id: str = "counting-embedder"
+    dimensions: Optional[int] = 3
+    calls: List[str] = field(default_factory=list)
+    batches: List[List[str]] = field(default_factory=list)
+
+    def _embed(self, text: str) -> List[float]:
+        return [float(len(text)), float(text.count("a")), 1.0]
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding_and_usage(text)[0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        self.calls.append(text)
+        return self._embed(text), {"total_tokens": len(text)}
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        self.batches.append(texts)
+        results = [self.get_embedding_and_usage(text) for text in texts]
+        return [r[0] for r in results], [r[1] for r in results]
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding(text)
+
+    async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding_and_usage(text)
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        results = [self.get_embedding_and_usage(text) for text in texts]
+        return [r[0] for r in results], [r[1] for r in results]
+
+
+def test_memory_cache_hits():
+    inner = CountingEmbedder()
+    embedder = CachedEmbedder(embedder=inner)
+
+    first, usage = embedder.get_embedding_and_usage("banana")
+    second, cached_usage = embedder.get_embedding_and_usage("banana")
+
+    assert first == second == [6.0, 3.0, 1.0]
+    assert usage == {"total_tokens": 6}
+    assert cached_usage is None
+    assert inner.calls == ["banana"]
+    assert embedder.cache.stats.hits == 1
+    assert embedder.cache.stats.misses == 1
+    assert embedder.dimensions == 3
+
+
+def test_key_includes_embedder_identity():
+    cache = EmbeddingCache()
+    small = CachedEmbedder(embedder=CountingEmbedder(id="small"), cache=cache)
+    large = CachedEmbedder(embedder=CountingEmbedder(id="large"), cache=cache)
+
+    small.get_embedding("apple")
+    large.get_embedding("apple")
+
+    assert cache.stats.misses == 2
+    assert cache.stats.hits == 0
+
+
+def test_memory_lru_eviction():
+    embedder = CachedEmbedder(embedder=CountingEmbedder(), cache=EmbeddingCache(max_memory_entries=2))
+
+    embedder.get_embedding("a")
+    embedder.get_embedding("b")
+    embedder.get_embedding("a")
+    embedder.get_embedding("c")  # evicts "b"
+    embedder.get_embedding("b")
+
+    assert embedder.embedder.calls == ["a", "b", "c", "b"]
+    assert embedder.cache.stats.memory_evictions == 2
+
+
+def test_disk_cache_survives_restart(tmp_path):
+    db_file = str(tmp_path / "embeddings.db")
+    first = CachedEmbedder(embedder=CountingEmbedder(), cache=EmbeddingCache(db_file=db_file))
+    expected = first.get_embedding("persisted text")
+    first.cache.close()
+
+    inner = CountingEmbedder()
+    second = CachedEmbedder(embedder=inner, cache=EmbeddingCache(db_file=db_file))
+    assert second.get_embedding("persisted text") == expected
+    assert inner.calls == []
+    assert second.cache.stats.disk_hits == 1
+
+
+def test_disk_cache_size_eviction(tmp_path):
+    # Each 3-dimensional embedding takes 24 bytes on disk
+    cache = EmbeddingCache(max_memory_entries=0, db_file=str(tmp_path / "embeddings.db"), max_disk_bytes=60)
+    embedder = CachedEmbedder(embedder=CountingEmbedder(), cache=cache)
+
+    for text in ["one", "two", "three"]:
+        embedder.get_embedding(text)
+
+    assert cache.stats.disk_evictions >= 1
+    embedder.get_embedding("three")
+    assert cache.stats.disk_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_only_embeds_misses():
+    inner = CountingEmbedder()
+    embedder = CachedEmbedder(embedder=inner)
+    embedder.get_embedding("cached")
+
+    embeddings, usages = await embedder.async_get_embeddings_batch_and_usage(["cached", "new", "new"])
+
+    assert inner.calls == ["cached", "new"]
+    assert embeddings[0] == [6.0, 1.0, 1.0]
+    assert embeddings[1] == embeddings[2] == [3.0, 0.0, 1.0]
+    assert usages == [None, {"total_tokens": 3}, None]
+
+
+def test_sync_batch_embeds_misses_in_one_call():
+    inner = CountingEmbedder()
+    embedder = CachedEmbedder(embedder=inner)
+    embedder.get_embedding("cached")
+
+    embeddings, usages = embedder.get_embeddings_batch_and_usage(["cached", "new", "other", "new"])
+
+    assert inner.batches == [["new", "other"]]
+    assert embeddings[0] == [6.0, 1.0, 1.0]
+    assert embeddings[1] == embeddings[3] == [3.0, 0.0, 1.0]
+    assert usages == [None, {"total_tokens": 3}, {"total_tokens": 5}, None]
+
+    # Served from the cache once embedded
+    assert embedder.get_embeddings_batch_and_usage(["new", "other"])[1] == [None, None]
+    assert inner.batches == [["new", "other"]]
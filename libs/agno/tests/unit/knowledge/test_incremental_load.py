@@ -0,0 +1,86 @@
+from pathlib import Path
+from typing import Any, List, Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+from agno.db.in_memory import InMemoryDb
+from agno.knowledge.document import Document
+from agno.knowledge.knowledge import Knowledge
+from agno.knowledge.reader.base import Reader
+from agno.vectordb.local import LocalDb
+
+
+class ParagraphReader(Reader):
+    """Reads a text file into one document per paragraph."""
+
+    def read(self, obj: Any, name: Optional[str] = None, password: Optional[str] = None) -> List[Document]:
+        text = Path(obj).read_text() if isinstance(obj, Path) else obj.read().decode("utf-8")
+        return [Document(name=name, content=paragraph) for paragraph in text.split("\n\n") if paragraph]
+
+
+@pytest.fixture
+def embedder():
+    embedded: List[str] = []
+
+    def _embed(text: str) -> List[float]:
+        embedded.append(text)
+        return [float(len(text)), float(text.count("e")), 1.0]
+
+    async def async_get_embedding_and_usage(text):
+        return _embed(text), None
+
+    mock = MagicMock()
+    mock.dimensions = 3
+    mock.enable_batch = False
+    mock.embedded = embedded
+    mock.get_embedding.side_effect = _embed
+    mock.get_embedding_and_usage.side_effect = lambda text: (_embed(text), None)
+    mock.async_get_embedding_and_usage.side_effect = async_get_embedding_and_usage
+    return mock
+
+
+@pytest.fixture
+def knowledge(tmp_path, embedder):
+    vector_db = LocalDb(collection="docs", path=str(tmp_path / "vectors"), embedder=embedder)
+    return Knowledge(vector_db=vector_db, contents_db=InMemoryDb())
+
+
+def test_incremental_load_skips_unchanged_and_replaces_changed_chunks(tmp_path, knowledge, embedder):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "a.txt").write_text("alpha one\n\nalpha two\n\nalpha three")
+    (docs / "b.txt").write_text("beta one")
+
+    knowledge.add_content(path=str(docs), reader=ParagraphReader(), incremental=True)
+    assert knowledge.vector_db.get_count() == 4
+    assert len(embedder.embedded) == 4
+
+    # A second load with no changes does not read or embed anything
+    embedder.embedded.clear()
+    knowledge.add_content(path=str(docs), reader=ParagraphReader(), incremental=True)
+    assert embedder.embedded == []
+    assert knowledge.vector_db.get_count() == 4
+
+    # Only the edited paragraph is embedded, and the removed one is deleted
+    (docs / "a.txt").write_text("alpha one\n\nalpha two edited")
+    knowledge.add_content(path=str(docs), reader=ParagraphReader(), incremental=True)
+    assert embedder.embedded == ["alpha two edited"]
+    assert knowledge.vector_db.get_count() == 3
+
+    contents, _ = knowledge.contents_db.get_knowledge_contents()
+    assert all(row.content_digest for row in contents)
+    assert sorted(len(row.chunk_digests) for row in contents) == [1, 2]
+
+
+def test_incremental_load_replaces_content_loaded_without_digests(tmp_path, knowledge, embedder):
+    file_path = tmp_path / "notes.txt"
+    file_path.write_text("first\n\nsecond")
+
+    knowledge.add_content(path=str(file_path), reader=ParagraphReader())
+    assert knowledge.vector_db.get_count() == 2
+
+    file_path.write_text("first\n\nsecond\n\nthird")
+    knowledge.add_content(path=str(file_path), reader=ParagraphReader(), incremental=True)
+    assert knowledge.vector_db.get_count() == 3
+    assert sorted(doc.content for doc in knowledge.vector_db.search("first", limit=10)) == ["first", "second", "third"]
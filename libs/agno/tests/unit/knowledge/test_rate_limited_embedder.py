@@ -0,0 +1,101 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from agno.knowledge.embedder.base import Embedder
+from agno.knowledge.embedder.rate_limit import RateLimitedEmbedder
+from agno.utils.rate_limit import RateLimiter
+
+
+@dataclass
+class UsageEmbedder(Embedder):
+    """Embedder reporting one token per character, with the usage of a batch repeated on every text."""
+
+    id: str = "usage-embedder"
+    dimensions: Optional[int] = 2
+    batch_size: int = 2
+    batches: List[List[str]] = field(default_factory=list)
+
+    def get_embedding(self, text: str) -> List[float]:
+        return [float(len(text)), 1.0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        self.batches.append([text])
+        return self.get_embedding(text), {"total_tokens": len(text)}
+
+    async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding_and_usage(text)
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        self.batches.append(list(texts))
+        usage = {"total_tokens": sum(len(text) for text in texts)}
+        return [self.get_embedding(text) for text in texts], [usage] * len(texts)
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        return self.get_embeddings_batch_and_usage(texts)
+
+
+def make_embedder() -> RateLimitedEmbedder:
+    limiter = RateLimiter(requests_per_minute=600, tokens_per_minute=60_000)
+    return RateLimitedEmbedder(embedder=UsageEmbedder(), rate_limiter=limiter)
+
+
+TEXTS = ["one", "three", "four", "seventeen", "x"]
+
+
+def test_requires_an_embedder_and_a_rate_limiter():
+    with pytest.raises(ValueError):
+        RateLimitedEmbedder(rate_limiter=RateLimiter(requests_per_minute=1))
+    with pytest.raises(ValueError):
+        RateLimitedEmbedder(embedder=UsageEmbedder())
+
+
+def test_sync_requests_are_admitted_and_usage_recorded():
+    embedder = make_embedder()
+
+    assert embedder.get_embedding_and_usage("three") == ([5.0, 1.0], {"total_tokens": 5})
+    assert embedder.get_embedding("one") == [3.0, 1.0]
+    assert embedder.rate_limiter.stats.requests == 2  # type: ignore[union-attr]
+    assert embedder.rate_limiter.stats.used_tokens == 8  # type: ignore[union-attr]
+
+
+def test_sync_batches_are_admitted_once_each():
+    embedder = make_embedder()
+
+    embeddings, usages = embedder.get_embeddings_batch_and_usage(TEXTS)
+
+    assert embeddings == [[float(len(text)), 1.0] for text in TEXTS]
+    assert len(usages) == len(TEXTS)
+    assert embedder.embedder.batches == [["one", "three"], ["four", "seventeen"], ["x"]]  # type: ignore[union-attr]
+    stats = embedder.rate_limiter.stats  # type: ignore[union-attr]
+    assert stats.requests == 3
+    # The usage repeated on every text of a batch is counted once
+    assert stats.used_tokens == sum(len(text) for text in TEXTS)
+
+
+async def test_async_requests_are_admitted_and_usage_recorded():
+    embedder = make_embedder()
+
+    results = await asyncio.gather(*[embedder.async_get_embedding_and_usage(text) for text in TEXTS[:3]])
+
+    assert [embedding for embedding, _ in results] == [[3.0, 1.0], [5.0, 1.0], [4.0, 1.0]]
+    assert await embedder.async_get_embedding("x") == [1.0, 1.0]
+    assert embedder.rate_limiter.stats.requests == 4  # type: ignore[union-attr]
+    assert embedder.rate_limiter.stats.used_tokens == 13  # type: ignore[union-attr]
+
+
+async def test_async_batches_are_admitted_once_each():
+    embedder = make_embedder()
+
+    embeddings, usages = await embedder.async_get_embeddings_batch_and_usage(TEXTS)
+
+    assert embeddings == [[float(len(text)), 1.0] for text in TEXTS]
+    assert len(usages) == len(TEXTS)
+    assert embedder.embedder.batches == [["one", "three"], ["four", "seventeen"], ["x"]]  # type: ignore[union-attr]
+    stats = embedder.rate_limiter.stats  # type: ignore[union-attr]
+    assert stats.requests == 3
+    assert stats.used_tokens == sum(len(text) for text in TEXTS)
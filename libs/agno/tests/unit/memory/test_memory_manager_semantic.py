@@ -0,0 +1,90 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from agno.db.in_memory import InMemoryDb
+from agno.knowledge.embedder.base import Embedder
+from agno.memory import MemoryManager, UserMemory
+
+VOCABULARY = ["pizza", "food", "hiking", "mountains", "python", "code"]
+
+
+@dataclass
+class KeywordEmbedder(Embedder):
+    """Embeds a text as the counts of the vocabulary words it contains"""
+
+    dimensions: int = len(VOCABULARY)
+    texts: List[str] = field(default_factory=list)
+    batches: List[List[str]] = field(default_factory=list)
+
+    def get_embedding(self, text: str) -> List[float]:
+        self.texts.append(text)
+        words = text.lower().split()
+        return [float(words.count(word)) for word in VOCABULARY]
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        self.batches.append(list(texts))
+        return [self.get_embedding(text) for text in texts], [None] * len(texts)
+
+
+@pytest.fixture
+def memory_manager():
+    manager = MemoryManager(db=InMemoryDb(), embedder=KeywordEmbedder())
+    manager.add_user_memory(UserMemory(memory_id="m1", memory="likes pizza food"), user_id="u1")
+    manager.add_user_memory(UserMemory(memory_id="m2", memory="goes hiking in the mountains"), user_id="u1")
+    manager.add_user_memory(UserMemory(memory_id="m3", memory="writes python code"), user_id="u1")
+    return manager
+
+
+def test_semantic_search_ranks_by_similarity(memory_manager):
+    embedder = memory_manager.embedder
+    assert len(embedder.texts) == 3
+
+    results = memory_manager.search_user_memories(query="mountains", retrieval_method="semantic", user_id="u1", limit=2)
+    assert [memory.memory_id for memory in results][0] == "m2"
+    assert len(results) == 2
+    # Only the query was embedded
+    assert len(embedder.texts) == 4
+
+    assert memory_manager.search_user_memories(query="food", retrieval_method="semantic", user_id="other") == []
+    with pytest.raises(ValueError):
+        memory_manager.search_user_memories(retrieval_method="semantic", user_id="u1")
+
+
+def test_semantic_search_follows_memory_changes(memory_manager):
+    memory_manager.replace_user_memory("m3", UserMemory(memory="eats pizza every day"), user_id="u1")
+    memory_manager.delete_user_memory("m1", user_id="u1")
+    # Written straight to the db, so indexed on the next search
+    memory_manager.db.upsert_user_memory(UserMemory(memory_id="m4", memory="pizza food food", user_id="u1"))
+
+    results = memory_manager.search_user_memories(query="pizza food", retrieval_method="semantic", user_id="u1")
+    assert [memory.memory_id for memory in results][:2] == ["m4", "m3"]
+    assert "m1" not in [memory.memory_id for memory in results]
+
+
+def test_embeddings_are_persisted_and_missing_ones_batched(tmp_path):
+    db = InMemoryDb()
+    db_file = str(tmp_path / "memory_embeddings.db")
+    manager = MemoryManager(db=db, embedder=KeywordEmbedder(), embeddings_db_file=db_file)
+    manager.add_user_memory(UserMemory(memory_id="m1", memory="likes pizza food"), user_id="u1")
+    manager.add_user_memory(UserMemory(memory_id="m2", memory="goes hiking in the mountains"), user_id="u1")
+    manager.get_memory_index().close()
+
+    # Written while the index was not running
+    db.upsert_user_memory(UserMemory(memory_id="m3", memory="writes python code", user_id="u1"))
+    db.upsert_user_memory(UserMemory(memory_id="m4", memory="reads code reviews", user_id="u1"))
+    db.delete_user_memory("m1")
+
+    # After a restart, stored embeddings are reused and the missing ones are embedded in one batch
+    embedder = KeywordEmbedder()
+    restarted = MemoryManager(db=db, embedder=embedder, embeddings_db_file=db_file)
+    results = restarted.search_user_memories(query="mountains", retrieval_method="semantic", user_id="u1")
+    assert results[0].memory_id == "m2"
+    assert embedder.batches == [["writes python code", "reads code reviews"]]
+    assert embedder.texts == ["writes python code", "reads code reviews", "mountains"]
+
+    # Embeddings of another embedder are not used
+    other = MemoryManager(db=db, embedder=KeywordEmbedder(dimensions=5), embeddings_db_file=db_file)
+    other.search_user_memories(query="code", retrieval_method="semantic", user_id="u1")
+    assert len(other.embedder.batches[0]) == 3
@@ -0,0 +1,128 @@
+import json
+from typing import List
+
+import pytest
+from anthropic.types import Message as AnthropicMessage
+from anthropic.types import TextBlock, Usage
+
+from agno.models.anthropic import Claude
+from agno.models.message import Message
+
+TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": f"tool_{index}",
+            "description": f"Tool {index}",
+            "parameters": {"type": "object", "properties": {"query": {"type": "string"}}, "required": ["query"]},
+        },
+    }
+    for index in range(3)
+]
+
+
+def conversation(turns: int) -> List[Message]:
+    messages = [Message(role="system", content="You are a helpful assistant.")]
+    for turn in range(turns):
+        messages.append(Message(role="user", content=f"Question {turn}"))
+        messages.append(
+            Message(
+                role="assistant",
+                tool_calls=[
+                    {
+                        "id": f"call_{turn}",
+                        "type": "function",
+                        "function": {"name": "tool_0", "arguments": json.dumps({"query": f"q{turn}"})},
+                    }
+                ],
+            )
+        )
+        messages.append(Message(role="tool", tool_call_id=f"call_{turn}", content=f"Result {turn}"))
+    return messages
+
+
+def breakpoints(chat_messages) -> List[int]:
+    return [
+        index
+        for index, message in enumerate(chat_messages)
+        for block in message["content"]
+        if isinstance(block, dict) and "cache_control" in block
+    ]
+
+
+def without_cache_control(chat_messages) -> str:
+    def strip(block):
+        if hasattr(block, "model_dump"):
+            block = block.model_dump(exclude_none=True)
+        return {key: value for key, value in block.items() if key != "cache_control"}
+
+    return json.dumps(
+        [
+            {"role": message["role"], "content": [strip(block) for block in message["content"]]}
+            for message in chat_messages
+        ]
+    )
+
+
+def test_breakpoints_on_tools_and_system_prompt():
+    model = Claude(id="claude-sonnet-4-5-20250929", auto_cache=True)
+    request_kwargs = model._prepare_request_kwargs("You are a helpful assistant.", tools=TOOLS)
+
+    assert request_kwargs["system"][0]["cache_control"] == {"type": "ephemeral"}
+    assert request_kwargs["tools"][-1]["cache_control"] == {"type": "ephemeral"}
+    assert all("cache_control" not in tool for tool in request_kwargs["tools"][:-1])
+
+    # No breakpoints without auto_cache
+    request_kwargs = Claude(id="claude-sonnet-4-5-20250929")._prepare_request_kwargs("System", tools=TOOLS)
+    assert "cache_control" not in request_kwargs["system"][0]
+    assert all("cache_control" not in tool for tool in request_kwargs["tools"])
+
+
+def test_breakpoints_on_the_history_prefix():
+    model = Claude(id="claude-sonnet-4-5-20250929", auto_cache=True, extended_cache_time=True)
+    messages = conversation(turns=3)
+
+    chat_messages, _ = model._format_messages(messages)
+    # The last message, and the last message of the previous request: the question before the tool call
+    assert breakpoints(chat_messages) == [len(chat_messages) - 3, len(chat_messages) - 1]
+    assert chat_messages[-1]["content"][-1]["cache_control"] == {"type": "ephemeral", "ttl": "1h"}
+    # The messages of the agent are not updated
+    assert breakpoints(model._format_messages(messages[:1])[0]) == []
+    assert messages[-1].content == "Result 2"
+
+    # The next request only appends to the prefix of the previous one
+    next_messages, _ = model._format_messages(conversation(turns=4))
+    previous = without_cache_control(chat_messages)
+    assert without_cache_control(next_messages).startswith(previous[:-1])
+
+
+def test_history_breakpoints_skip_empty_blocks():
+    model = Claude(id="claude-sonnet-4-5-20250929", auto_cache=True)
+    chat_messages, _ = model._format_messages([Message(role="user", content="")])
+    assert breakpoints(chat_messages) == []
+
+
+@pytest.mark.parametrize("streamed", [False, True])
+def test_cache_tokens_are_reported_in_metrics(streamed):
+    model = Claude(id="claude-sonnet-4-5-20250929", auto_cache=True)
+    response = AnthropicMessage(
+        id="msg_1",
+        type="message",
+        role="assistant",
+        model=model.id,
+        content=[TextBlock(type="text", text="Hi")],
+        stop_reason="end_turn",
+        usage=Usage(input_tokens=12, output_tokens=5, cache_read_input_tokens=2048, cache_creation_input_tokens=256),
+    )
+
+    if streamed:
+        from anthropic.types import MessageStopEvent
+
+        event = MessageStopEvent(type="message_stop")
+        event.message = response  # type: ignore[attr-defined]
+        model_response = model._parse_provider_response_delta(event)  # type: ignore[arg-type]
+    else:
+        model_response = model._parse_provider_response(response)
+
+    assert model_response.response_usage.cache_read_tokens == 2048
+    assert model_response.response_usage.cache_write_tokens == 256
@@ -0,0 +1,106 @@
+import time
+
+import pytest
+
+from agno.models.cache import ModelResponseCache, SqliteModelResponseCacheBackend
+from agno.models.message import Message
+from agno.models.metrics import Metrics
+from agno.models.openai.chat import OpenAIChat
+from agno.models.response import ModelResponse
+
+
+def test_memory_tier_returns_fresh_copies_and_respects_ttl():
+    cache = ModelResponseCache(max_memory_entries=2)
+    cache.set("a", {"result": {"content": "hello"}})
+
+    first = cache.get("a")
+    first["result"]["content"] = "changed"  # type: ignore[index]
+    assert cache.get("a") == {"result": {"content": "hello"}}
+    assert cache.stats.memory_hits == 2
+
+    cache._memory["a"] = (cache._memory["a"][0], time.time() - 10)
+    assert cache.get("a", ttl=5) is None
+    assert cache.stats.misses == 1
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = ModelResponseCache(max_memory_entries=2)
+    cache.set("a", {"v": 1})
+    cache.set("b", {"v": 2})
+    cache.get("a")
+    cache.set("c", {"v": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"v": 1}
+    assert cache.stats.memory_evictions == 1
+
+
+def test_sqlite_backend_is_shared_and_bounded(tmp_path):
+    db_file = str(tmp_path / "responses.db")
+    writer = ModelResponseCache(backend=SqliteModelResponseCacheBackend(db_file=db_file, max_bytes=100))
+    writer.set("old", {"content": "x" * 40})
+    writer.set("new", {"content": "y" * 40})
+
+    # A second process only sees the backend
+    reader = ModelResponseCache(backend=SqliteModelResponseCacheBackend(db_file=db_file, max_bytes=100))
+    assert reader.get("new") == {"content": "y" * 40}
+    assert reader.stats.backend_hits == 1
+    assert reader.get("old") is None
+
+
+def test_sqlite_backend_is_bounded_across_processes(tmp_path):
+    db_file = str(tmp_path / "responses.db")
+    first = SqliteModelResponseCacheBackend(db_file=db_file, max_bytes=100)
+    second = SqliteModelResponseCacheBackend(db_file=db_file, max_bytes=100)
+
+    # Each process writes less than the budget, together they write more
+    assert first.get("a") is None
+    second.set("b", "y" * 40)
+    first.set("a", "x" * 40)
+    first.set("c", "z" * 40)
+
+    # The least recently used entry, written by the other process, is evicted
+    assert second.get("b") is None
+    assert first.get("a") is not None
+    assert second.get("c") is not None
+
+
+def test_model_cache_hit_is_reported_on_metrics(monkeypatch):
+    calls = []
+
+    def invoke(self, **kwargs):
+        calls.append(kwargs)
+        return ModelResponse(role="assistant", content="Paris", response_usage=Metrics(total_tokens=10))
+
+    monkeypatch.setattr(OpenAIChat, "invoke", invoke)
+    model = OpenAIChat(id="gpt-4o", api_key="test-key", cache_response=True, response_cache=ModelResponseCache())
+
+    first_messages = [Message(role="user", content="Capital of France?")]
+    first = model.response(messages=first_messages)
+    second_messages = [Message(role="user", content="Capital of France?")]
+    second = model.response(messages=second_messages)
+
+    assert len(calls) == 1
+    assert first.content == second.content == "Paris"
+    assert first_messages[-1].metrics.response_cache_misses == 1
+    assert first_messages[-1].metrics.total_tokens == 10
+    # The cached answer is added to the messages, so it shows up in the run metrics and history
+    assert second_messages[-1].role == "assistant"
+    assert second_messages[-1].content == "Paris"
+    assert second_messages[-1].metrics.response_cache_hits == 1
+    assert model.response_cache.stats.hits == 1  # type: ignore[union-attr]
+
+
+def test_sql_backend(tmp_path):
+    pytest.importorskip("sqlalchemy")
+    from sqlalchemy import create_engine
+
+    from agno.models.cache_sql import SqlModelResponseCacheBackend
+
+    backend = SqlModelResponseCacheBackend(db_engine=create_engine(f"sqlite:///{tmp_path / 'agno.db'}"))
+    cache = ModelResponseCache(max_memory_entries=0, backend=backend)
+    cache.set("key", {"content": "cached"})
+    cache.set("key", {"content": "updated"})
+
+    assert cache.get("key") == {"content": "updated"}
+    assert cache.get("key", ttl=0) is None
@@ -0,0 +1,134 @@
+import threading
+import time
+
+import pytest
+
+from agno.models.message import Message
+from agno.models.openai.chat import OpenAIChat
+from agno.models.response import ModelResponse, ModelResponseEvent
+from agno.tools.function import Function, FunctionCall
+
+
+@pytest.fixture
+def model():
+    return OpenAIChat(id="gpt-4o", api_key="test-key")
+
+
+def _function_call(name: str, entrypoint, **kwargs) -> FunctionCall:
+    function = Function(name=name, entrypoint=entrypoint, **kwargs)
+    function.process_entrypoint()
+    return FunctionCall(function=function, arguments={}, call_id=f"call_{name}")
+
+
+def _run(model, function_calls, **kwargs):
+    results = []
+    events = list(model.run_function_calls(function_calls=function_calls, function_call_results=results, **kwargs))
+    return results, events
+
+
+def _sleeping_tool(seconds: float, value: str):
+    def entrypoint() -> str:
+        time.sleep(seconds)
+        return value
+
+    return entrypoint
+
+
+def test_parallel_tool_calls_return_results_in_call_order(model):
+    function_calls = [
+        _function_call("slow", _sleeping_tool(0.3, "slow")),
+        _function_call("medium", _sleeping_tool(0.2, "medium")),
+        _function_call("fast", _sleeping_tool(0.1, "fast")),
+    ]
+
+    start = time.perf_counter()
+    results, events = _run(model, function_calls, max_parallel_tool_calls=3)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.5
+    assert [result.content for result in results] == ["slow", "medium", "fast"]
+    completed = [
+        event.tool_executions[0].tool_name
+        for event in events
+        if isinstance(event, ModelResponse) and event.event == ModelResponseEvent.tool_call_completed.value
+    ]
+    assert completed == ["slow", "medium", "fast"]
+
+
+def test_tool_calls_are_sequential_by_default(model):
+    thread_ids = []
+
+    def record_thread() -> str:
+        thread_ids.append(threading.get_ident())
+        return "ok"
+
+    results, _ = _run(model, [_function_call("a", record_thread), _function_call("b", record_thread)])
+    assert [result.content for result in results] == ["ok", "ok"]
+    assert thread_ids == [threading.get_ident()] * 2
+
+
+def test_functions_not_parallel_safe_run_on_calling_thread(model):
+    thread_ids = {}
+
+    def record_thread(name: str):
+        def entrypoint() -> str:
+            thread_ids[name] = threading.get_ident()
+            return name
+
+        return entrypoint
+
+    function_calls = [
+        _function_call("a", record_thread("a")),
+        _function_call("unsafe", record_thread("unsafe"), parallel_safe=False),
+        _function_call("b", record_thread("b")),
+    ]
+    results, _ = _run(model, function_calls, max_parallel_tool_calls=4)
+
+    assert [result.content for result in results] == ["a", "unsafe", "b"]
+    assert thread_ids["unsafe"] == threading.get_ident()
+    assert thread_ids["a"] != threading.get_ident()
+
+
+def test_parallel_tool_calls_keep_pause_and_limit_semantics(model):
+    function_calls = [
+        _function_call("a", _sleeping_tool(0, "a")),
+        _function_call("confirm", _sleeping_tool(0, "confirm"), requires_confirmation=True),
+        _function_call("b", _sleeping_tool(0, "b")),
+        _function_call("c", _sleeping_tool(0, "c")),
+    ]
+    results, events = _run(model, function_calls, max_parallel_tool_calls=4, function_call_limit=3)
+
+    paused = [event for event in events if event.event == ModelResponseEvent.tool_call_paused.value]
+    assert [event.tool_executions[0].tool_name for event in paused] == ["confirm"]
+    assert [result.tool_name for result in results] == ["a", "b", "c"]
+    assert results[2].tool_call_error is True
+    assert all(isinstance(result, Message) for result in results)
+
+
+def test_functions_not_parallel_safe_do_not_overlap_other_calls(model):
+    intervals = {}
+
+    def timed_tool(name: str, seconds: float):
+        def entrypoint() -> str:
+            start = time.perf_counter()
+            time.sleep(seconds)
+            intervals[name] = (start, time.perf_counter())
+            return name
+
+        return entrypoint
+
+    function_calls = [
+        _function_call("slow_before", timed_tool("slow_before", 0.2)),
+        _function_call("other_before", timed_tool("other_before", 0.05)),
+        _function_call("unsafe", timed_tool("unsafe", 0.05), parallel_safe=False),
+        _function_call("slow_after", timed_tool("slow_after", 0.2)),
+        _function_call("other_after", timed_tool("other_after", 0.05)),
+    ]
+    results, _ = _run(model, function_calls, max_parallel_tool_calls=4)
+
+    assert [result.content for result in results] == [fc.function.name for fc in function_calls]
+    unsafe_start, unsafe_end = intervals["unsafe"]
+    assert all(intervals[name][1] <= unsafe_start for name in ("slow_before", "other_before"))
+    assert all(intervals[name][0] >= unsafe_end for name in ("slow_after", "other_after"))
+    # The calls within a segment still run in parallel
+    assert intervals["other_after"][0] < intervals["slow_after"][1]
@@ -0,0 +1,61 @@
+import asyncio
+
+from agno.os.utils import coalesce_content_events
+from agno.run.agent import RunContentEvent, RunStartedEvent, ToolCallStartedEvent
+
+
+async def _stream(events, delay: float = 0):
+    for event in events:
+        if delay:
+            await asyncio.sleep(delay)
+        yield event
+
+
+async def _collect(stream):
+    return [event async for event in stream]
+
+
+async def test_coalescing_disabled_keeps_every_event():
+    events = [RunContentEvent(run_id="r", content=c) for c in "abc"]
+    assert await _collect(coalesce_content_events(_stream(events), None)) == events
+
+
+async def test_consecutive_deltas_are_merged_in_order():
+    events = [
+        RunStartedEvent(run_id="r"),
+        RunContentEvent(run_id="r", content="Hel"),
+        RunContentEvent(run_id="r", content="lo"),
+        ToolCallStartedEvent(run_id="r"),
+        RunContentEvent(run_id="r", content=" wor"),
+        RunContentEvent(run_id="r", content="ld", reasoning_content="thinking"),
+        RunContentEvent(run_id="other", content="!"),
+    ]
+    result = await _collect(coalesce_content_events(_stream(events), flush_interval=10))
+
+    assert [type(event).__name__ for event in result] == [
+        "RunStartedEvent",
+        "RunContentEvent",
+        "ToolCallStartedEvent",
+        "RunContentEvent",
+        "RunContentEvent",
+        "RunContentEvent",
+    ]
+    assert [event.content for event in result if isinstance(event, RunContentEvent)] == ["Hello", " wor", "ld", "!"]
+    # The original events are not modified
+    assert events[1].content == "Hel"
+
+
+async def test_pending_deltas_are_flushed_after_the_interval():
+    async def slow_stream():
+        yield RunContentEvent(run_id="r", content="a")
+        yield RunContentEvent(run_id="r", content="b")
+        await asyncio.sleep(0.2)
+        yield RunContentEvent(run_id="r", content="c")
+
+    received = []
+    async for event in coalesce_content_events(slow_stream(), flush_interval=0.05):
+        received.append((event.content, asyncio.get_running_loop().time()))
+
+    assert [content for content, _ in received] == ["ab", "c"]
+    # "ab" was sent before "c" was produced
+    assert received[1][1] - received[0][1] > 0.1
@@ -0,0 +1,212 @@
+import asyncio
+import threading
+import time
+from typing import Any, List, Optional
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+
+from agno.db.sqlite import SqliteDb
+from agno.knowledge.document import Document
+from agno.knowledge.knowledge import Knowledge
+from agno.knowledge.reader.base import Reader
+from agno.os.ingestion import IngestionJobLostError, IngestionJobStatus, IngestionQueue, IngestionWorkerPool
+from agno.os.routers.knowledge import get_knowledge_router
+from agno.vectordb.local import LocalDb
+
+
+class ParagraphReader(Reader):
+    """Reads a text file into one document per paragraph."""
+
+    def read(self, obj: Any, name: Optional[str] = None, password: Optional[str] = None) -> List[Document]:
+        return [Document(name=name, content=paragraph) for paragraph in obj.read().decode().split("\n\n")]
+
+
+class FailingReader(Reader):
+    def read(self, obj: Any, name: Optional[str] = None, password: Optional[str] = None) -> List[Document]:
+        raise RuntimeError("reader crashed")
+
+
+@pytest.fixture
+def embedder():
+    mock = MagicMock()
+    mock.dimensions = 3
+    mock.enable_batch = False
+    mock.get_embedding_and_usage.side_effect = lambda text: ([float(len(text)), 1.0, 0.0], None)
+
+    async def async_get_embedding_and_usage(text):
+        return [float(len(text)), 1.0, 0.0], None
+
+    mock.async_get_embedding_and_usage.side_effect = async_get_embedding_and_usage
+    return mock
+
+
+@pytest.fixture
+def db(tmp_path):
+    return SqliteDb(db_file=str(tmp_path / "agno.db"))
+
+
+@pytest.fixture
+def knowledge(tmp_path, db, embedder):
+    return Knowledge(
+        vector_db=LocalDb(collection="docs", path=str(tmp_path / "vectors"), embedder=embedder),
+        contents_db=db,
+        readers={"paragraph": ParagraphReader(), "failing": FailingReader()},
+    )
+
+
+@pytest.fixture
+def queue(tmp_path, db):
+    return IngestionQueue(db=db, spool_dir=tmp_path / "spool", max_attempts=2, retry_delay=0)
+
+
+def upload(client: TestClient, reader_id: str = "paragraph") -> str:
+    response = client.post(
+        "/knowledge/content",
+        files={"file": ("notes.txt", b"first paragraph\n\nsecond paragraph", "text/plain")},
+        data={"reader_id": reader_id},
+    )
+    assert response.status_code == 202
+    return response.json()["id"]
+
+
+def status(client: TestClient, content_id: str) -> dict:
+    return client.get(f"/knowledge/content/{content_id}/status").json()
+
+
+def make_client(knowledge: Knowledge, queue: IngestionQueue) -> TestClient:
+    app = FastAPI()
+    app.include_router(get_knowledge_router(knowledge_instances=[knowledge], ingestion_queue=queue))
+    return TestClient(app)
+
+
+def test_uploads_are_spooled_and_processed_by_workers(tmp_path, knowledge, queue):
+    client = make_client(knowledge, queue)
+    content_id = upload(client)
+
+    # The upload is spooled and queued, not processed by the request worker
+    assert status(client, content_id) == {"status": "processing", "status_message": "Queued for ingestion"}
+    [job] = queue.get_jobs(IngestionJobStatus.PENDING)
+    assert job.content_id == content_id
+    assert open(job.payload["spool_path"], "rb").read() == b"first paragraph\n\nsecond paragraph"
+    assert knowledge.vector_db.get_count() == 0
+
+    pool = IngestionWorkerPool(queue=queue, knowledge=[knowledge])
+    assert asyncio.run(pool.run_once()) is True
+    assert asyncio.run(pool.run_once()) is False
+
+    assert status(client, content_id) == {"status": "completed", "status_message": ""}
+    assert knowledge.vector_db.get_count() == 2
+    assert queue.get_jobs() == []
+    assert list((tmp_path / "spool").iterdir()) == []
+
+
+def test_failed_jobs_are_retried_then_marked_as_failed(knowledge, queue):
+    client = make_client(knowledge, queue)
+    content_id = upload(client, reader_id="failing")
+    pool = IngestionWorkerPool(queue=queue, knowledge=[knowledge])
+
+    asyncio.run(pool.run_once())
+    first = status(client, content_id)
+    assert first["status"] == "processing"
+    assert first["status_message"].startswith("Attempt 1 of 2 failed")
+    assert queue.get_jobs(IngestionJobStatus.PENDING)[0].attempts == 1
+
+    asyncio.run(pool.run_once())
+    assert status(client, content_id)["status"] == "failed"
+    [job] = queue.get_jobs(IngestionJobStatus.FAILED)
+    assert job.attempts == 2
+    assert "reader crashed" in job.error
+
+
+def test_jobs_of_stopped_workers_are_resumed(knowledge, queue):
+    client = make_client(knowledge, queue)
+    content_id = upload(client)
+
+    # A worker claims the job, then stops without renewing its lease
+    job = queue.claim("stopped-worker")
+    assert job is not None and job.status == IngestionJobStatus.RUNNING
+    pool = IngestionWorkerPool(queue=queue, knowledge=[knowledge])
+    assert asyncio.run(pool.run_once()) is False
+
+    with queue.db_engine.begin() as conn:
+        conn.execute(update(queue.table).values(lease_expires_at=0))
+    assert asyncio.run(pool.run_once()) is True
+    assert status(client, content_id)["status"] == "completed"
+    assert knowledge.vector_db.get_count() == 2
+
+
+def test_jobs_are_only_completed_or_failed_by_the_worker_holding_them(knowledge, queue):
+    client = make_client(knowledge, queue)
+    upload(client)
+    job = queue.claim("slow-worker")
+    assert job is not None
+
+    # The lease of the slow worker expires and another worker claims the job
+    with queue.db_engine.begin() as conn:
+        conn.execute(update(queue.table).values(lease_expires_at=0))
+    assert queue.claim("other-worker") is not None
+
+    with pytest.raises(IngestionJobLostError):
+        queue.complete(job.id, "slow-worker")
+    with pytest.raises(IngestionJobLostError):
+        queue.fail(job, "too slow", "slow-worker")
+    assert queue.heartbeat(job.id, "slow-worker") is False
+    [running] = queue.get_jobs(IngestionJobStatus.RUNNING)
+    assert running.claimed_by == "other-worker" and running.error is None
+
+
+def test_attempts_are_abandoned_when_the_lease_is_lost(tmp_path, db, knowledge):
+    queue = IngestionQueue(db=db, spool_dir=tmp_path / "spool", lease_seconds=0)
+    client = make_client(knowledge, queue)
+    content_id = upload(client)
+    pool = IngestionWorkerPool(queue=queue, knowledge=[knowledge])
+    stopped = []
+
+    async def load_content(knowledge, content, job):
+        # Another worker claims the job while this one is still loading it
+        with queue.db_engine.begin() as conn:
+            conn.execute(update(queue.table).values(claimed_by="other-worker"))
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            stopped.append(job.id)
+            raise
+
+    pool._load_content = load_content  # type: ignore[method-assign]
+    assert asyncio.run(asyncio.wait_for(pool.run_once(), timeout=10)) is True
+
+    assert len(stopped) == 1
+    [job] = queue.get_jobs(IngestionJobStatus.RUNNING)
+    assert job.claimed_by == "other-worker"
+    # The content and the spooled file are left to the other worker
+    assert status(client, content_id)["status"] == "processing"
+    assert len(list((tmp_path / "spool").iterdir())) == 1
+
+
+def test_worker_pool_runs_in_a_background_thread(knowledge, queue):
+    client = make_client(knowledge, queue)
+    pool = IngestionWorkerPool(queue=queue, knowledge=[knowledge], num_workers=2, poll_interval=0.05)
+    processed = threading.Event()
+    process_job = pool.process_job
+
+    async def process_and_notify(job):
+        await process_job(job)
+        processed.set()
+
+    pool.process_job = process_and_notify  # type: ignore[method-assign]
+    pool.start()
+    try:
+        content_id = upload(client)
+        # Status reads of the API and updates of the workers run concurrently on the same db
+        deadline = time.monotonic() + 30
+        while not processed.wait(timeout=0.01) and time.monotonic() < deadline:
+            assert status(client, content_id)["status"] in ("processing", "completed")
+        assert processed.is_set()
+    finally:
+        pool.stop(timeout=5)
+    assert status(client, content_id)["status"] == "completed"
+    assert queue.get_jobs() == []
@@ -216,3 +216,29 @@ async def test_async_read_empty_file(csv_reader, temp_dir):
 
     documents = await csv_reader.async_read(empty_path)
     assert documents == []
+
+
+def test_iter_read_matches_read_with_row_chunking(csv_reader, csv_file):
+    documents = csv_reader.read(csv_file)
+    batches = list(csv_reader.iter_read(csv_file, batch_size=3))
+
+    assert [len(batch) for batch in batches] == [3, 1]
+    streamed = [document for batch in batches for document in batch]
+    assert [document.content for document in streamed] == [document.content for document in documents]
+    assert [document.meta_data["row_number"] for document in streamed] == [1, 2, 3, 4]
+
+
+def test_iter_read_bytesio_skips_header_across_batches():
+    from agno.knowledge.chunking.row import RowChunking
+
+    reader = CSVReader(chunking_strategy=RowChunking(skip_header=True))
+    file = io.BytesIO(SAMPLE_CSV.encode("utf-8"))
+    file.name = "people.csv"
+
+    streamed = [document for batch in reader.iter_read(file, batch_size=2) for document in batch]
+
+    assert [document.meta_data["row_number"] for document in streamed] == [2, 3, 4]
+    assert streamed[0].content == "John, 30, New York"
+    assert streamed[0].name == "people"
+    # The caller's file object is left open
+    assert not file.closed
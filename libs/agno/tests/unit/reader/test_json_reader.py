@@ -1,4 +1,5 @@
 import json
+import io
 from io import BytesIO
 from pathlib import Path
 
@@ -265,3 +266,39 @@ async def test_async_large_json():
 
     assert len(documents) == 1000
     assert all(doc.name == "large" for doc in documents)
+
+
+def test_iter_read_yields_batches_of_array_items(tmp_path):
+    items = [{"id": i, "text": "x" * i} for i in range(5)]
+    file_path = tmp_path / "items.json"
+    file_path.write_text(json.dumps(items))
+
+    reader = JSONReader(chunk=False)
+    batches = list(reader.iter_read(file_path, batch_size=2))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    documents = [document for batch in batches for document in batch]
+    assert [json.loads(document.content) for document in documents] == items
+    assert [document.meta_data["page"] for document in documents] == [1, 2, 3, 4, 5]
+    assert documents[0].name == "items"
+
+
+def test_iter_json_items_reads_incrementally():
+    from agno.knowledge.reader.json_reader import _iter_json_items
+
+    items = [{"n": 12345, "s": "a, b ] c"}, [1, 2], 3.5, "text", None, True]
+    stream = io.StringIO(json.dumps(items))
+    assert list(_iter_json_items(stream, read_size=3)) == items
+    assert list(_iter_json_items(io.StringIO('{"single": 1}'))) == [{"single": 1}]
+    with pytest.raises(ValueError):
+        list(_iter_json_items(io.StringIO("[1, 2"), read_size=2))
+
+
+def test_iter_json_items_reads_numbers_split_across_blocks():
+    from agno.knowledge.reader.json_reader import _iter_json_items
+
+    text = "[1, 12.5, -3.25e-10, 4E+2, 6]"
+    items = json.loads(text)
+    # Split the numbers at every position, e.g. "12." | "5" and "-3.25e" | "-10"
+    for read_size in range(1, len(text) + 1):
+        assert list(_iter_json_items(io.StringIO(text), read_size=read_size)) == items
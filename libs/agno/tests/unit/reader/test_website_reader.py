@@ -1,3 +1,6 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import patch
 
 import pytest
@@ -35,14 +38,6 @@ def mock_html_content_with_article():
     """
 
 
-def test_delay():
-    reader = WebsiteReader()
-
-    with patch("time.sleep", return_value=None) as mock_sleep:
-        reader.delay(1, 2)
-        mock_sleep.assert_called_once()
-
-
 def test_crawl_basic(mock_html_content):
     reader = WebsiteReader(max_depth=1, max_links=1)
 
@@ -171,16 +166,6 @@ def test_crawl_max_depth(mock_html_content, mock_html_content_with_article):
         assert "https://example.com/page1" in result
 
 
-@pytest.mark.asyncio
-async def test_async_delay():
-    reader = WebsiteReader()
-
-    # Simple patch for asyncio.sleep
-    with patch("asyncio.sleep", return_value=None) as mock_sleep:
-        await reader.async_delay(1, 2)
-        mock_sleep.assert_called_once()
-
-
 @pytest.mark.asyncio
 async def test_async_crawl_basic(mock_html_content):
     reader = WebsiteReader(max_depth=1, max_links=1)
@@ -273,3 +258,119 @@ async def test_async_crawl_max_depth(mock_html_content, mock_html_content_with_a
         assert len(result) == 2
         assert "https://example.com" in result
         assert "https://example.com/page1" in result
+
+
+@pytest.fixture
+def local_site():
+    """Serve a small website from a local HTTP server, recording the requests it receives."""
+    pages = {
+        "/": '<main>Home</main><a href="/a">A</a><a href="/b#section">B</a><a href="/private">P</a>',
+        "/a": '<main>Page A</main><a href="/">Home</a><a href="/b">B</a>',
+        "/b": '<main>Page B</main><a href="/A/../a">A</a>',
+        "/private": "<main>Private</main>",
+    }
+    site = {"requests": [], "not_modified": 0, "active": 0, "max_active": 0}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            with lock:
+                site["requests"].append(self.path)
+                site["active"] += 1
+                site["max_active"] = max(site["max_active"], site["active"])
+            try:
+                if self.path == "/robots.txt":
+                    body = b"User-agent: *\nDisallow: /private\n"
+                elif self.path in pages:
+                    if self.headers.get("If-None-Match") == f'"{self.path}"':
+                        with lock:
+                            site["not_modified"] += 1
+                        self.send_response(304)
+                        self.end_headers()
+                        return
+                    body = pages[self.path].encode()
+                else:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                time.sleep(0.05)
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html")
+                self.send_header("ETag", f'"{self.path}"')
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            finally:
+                with lock:
+                    site["active"] -= 1
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    site["url"] = f"http://127.0.0.1:{server.server_address[1]}/"
+    yield site
+    server.shutdown()
+    server.server_close()
+
+
+def test_crawl_local_site_dedups_and_respects_robots(local_site):
+    reader = WebsiteReader(max_depth=3, max_links=10, politeness_delay=0)
+
+    result = reader.crawl(local_site["url"])
+
+    assert sorted(result.values()) == ["Home", "Page A", "Page B"]
+    # Every page is fetched once, whatever the form of its links, and the disallowed page is never fetched
+    assert sorted(path for path in local_site["requests"] if path != "/robots.txt") == ["/", "/a", "/b"]
+    assert local_site["requests"].count("/robots.txt") == 1
+    assert reader.crawl_stats.disallowed == 1
+
+
+async def test_async_crawl_limits_concurrency_per_host(local_site):
+    reader = WebsiteReader(max_depth=3, max_links=10, politeness_delay=0, max_concurrency_per_host=1)
+
+    await reader.async_crawl(local_site["url"])
+
+    assert local_site["max_active"] == 1
+
+
+async def test_async_crawl_politeness_delay(local_site):
+    reader = WebsiteReader(max_depth=2, max_links=10, politeness_delay=0.2)
+
+    started_at = time.monotonic()
+    await reader.async_crawl(local_site["url"])
+
+    # "/", then "/a" and "/b" are spaced by the delay
+    assert time.monotonic() - started_at >= 0.4
+
+
+async def test_async_recrawl_revalidates_unchanged_pages(local_site):
+    reader = WebsiteReader(max_depth=3, max_links=10, politeness_delay=0)
+
+    first = await reader.async_crawl(local_site["url"])
+    second = await reader.async_crawl(local_site["url"])
+
+    assert sorted(first.values()) == ["Home", "Page A", "Page B"]
+    # Unchanged pages are left out, so they are not embedded again, but their links are still followed
+    assert second == {}
+    assert local_site["not_modified"] == 3
+    assert reader.crawl_stats.fetched == 0
+    assert reader.crawl_stats.unchanged == 3
+
+
+def test_page_validators_are_persisted_and_capped(tmp_path, local_site):
+    page_cache_file = str(tmp_path / "pages.db")
+    WebsiteReader(max_depth=3, max_links=10, politeness_delay=0, page_cache_file=page_cache_file).crawl(
+        local_site["url"]
+    )
+
+    # A new reader, e.g. after a restart, revalidates the pages crawled by the previous one
+    reader = WebsiteReader(max_depth=3, max_links=10, politeness_delay=0, page_cache_file=page_cache_file)
+    assert reader.read(local_site["url"]) == []
+    assert reader.crawl_stats.unchanged == 3
+
+    capped = WebsiteReader(max_depth=3, max_links=10, politeness_delay=0, max_cached_pages=2)
+    capped.crawl(local_site["url"])
+    assert len(capped._page_cache) == 2
@@ -0,0 +1,74 @@
+import pytest
+
+from agno.exceptions import RunCancelledException
+from agno.run import cancel
+from agno.run.cancel import RunCancellationManager, get_cancellation_manager, set_cancellation_manager
+from agno.run.cancel_sql import SqlRunCancellationManager
+from agno.db.sqlite import SqliteDb
+
+
+@pytest.fixture
+def restore_manager():
+    manager = get_cancellation_manager()
+    yield
+    set_cancellation_manager(manager)
+
+
+def test_in_memory_manager():
+    manager = RunCancellationManager()
+    manager.register_run("run-1")
+    assert manager.is_cancelled("run-1") is False
+    assert manager.cancel_run("run-1") is True
+    assert manager.cancel_run("unknown") is False
+    with pytest.raises(RunCancelledException):
+        manager.raise_if_cancelled("run-1")
+    manager.cleanup_run("run-1")
+    assert manager.get_active_runs() == {}
+
+
+def test_set_cancellation_manager(restore_manager):
+    manager = RunCancellationManager()
+    set_cancellation_manager(manager)
+
+    cancel.register_run("run-1")
+    assert cancel.cancel_run("run-1") is True
+    assert manager.is_cancelled("run-1") is True
+    cancel.cleanup_run("run-1")
+    assert manager.get_active_runs() == {}
+
+
+def test_sql_manager_shared_between_processes(tmp_path):
+    db_file = str(tmp_path / "agno.db")
+    worker = SqlRunCancellationManager(db=SqliteDb(db_file=db_file), poll_interval=0)
+    other_worker = SqlRunCancellationManager(db=SqliteDb(db_file=db_file), poll_interval=0)
+
+    worker.register_run("run-1")
+    assert worker.is_cancelled("run-1") is False
+    assert other_worker.cancel_run("unknown") is False
+    assert other_worker.cancel_run("run-1") is True
+
+    with pytest.raises(RunCancelledException):
+        worker.raise_if_cancelled("run-1")
+    assert other_worker.get_active_runs() == {"run-1": True}
+
+    # Registering the same run again resets its state
+    worker.register_run("run-1")
+    assert worker.is_cancelled("run-1") is False
+
+    worker.cleanup_run("run-1")
+    assert other_worker.get_active_runs() == {}
+
+
+def test_sql_manager_polls_at_most_once_per_interval(tmp_path):
+    db_file = str(tmp_path / "agno.db")
+    worker = SqlRunCancellationManager(db=SqliteDb(db_file=db_file), poll_interval=60)
+    other_worker = SqlRunCancellationManager(db=SqliteDb(db_file=db_file), poll_interval=60)
+
+    worker.register_run("run-1")
+    assert worker.is_cancelled("run-1") is False
+    other_worker.cancel_run("run-1")
+
+    # The state was read less than poll_interval ago, so the cancellation is seen on the next poll
+    assert worker.is_cancelled("run-1") is False
+    worker._last_polled["run-1"] = 0.0
+    assert worker.is_cancelled("run-1") is True
@@ -212,3 +212,38 @@ def test_api_schema_session_state():
     team_api_response = team_schema.model_dump(exclude_none=True)
     assert "session_state" in team_api_response
     assert team_api_response["session_state"] == {"team_api_data": "value"}
+
+
+def test_content_event_compact_json():
+    from agno.models.response import ToolExecution
+    from agno.run.agent import RunContentEvent, ToolCallCompletedEvent
+
+    event = RunContentEvent(
+        run_id="run_1", content="Hello", model_provider_data={"ids": ("a", "b")}, reasoning_content=None
+    )
+    data = json.loads(event.to_json(separators=(",", ":"), indent=None))
+    assert data["content"] == "Hello"
+    assert data["model_provider_data"] == {"ids": ["a", "b"]}
+    assert "reasoning_content" not in data
+    assert " " not in event.to_json(separators=(",", ":"), indent=None).replace("Hello", "")
+
+    tool_event = ToolCallCompletedEvent(tool=ToolExecution(tool_name="search", tool_args={"query": "agno"}))
+    assert json.loads(tool_event.to_json(indent=None))["tool"]["tool_args"] == {"query": "agno"}
+
+
+def test_event_to_dict_converts_nested_dataclasses():
+    @dataclass
+    class Location:
+        city: RunEnum
+        tags: list
+
+    @dataclass
+    class NestedRunEvent(BaseRunOutputEvent):
+        location: Location = field(default_factory=lambda: Location(city=RunEnum.SF, tags=["a"]))
+        missing: str = None  # type: ignore
+
+    event = NestedRunEvent()
+    assert event.to_dict() == {"location": {"city": RunEnum.SF, "tags": ["a"]}}
+    assert json.loads(event.to_json(separators=(",", ":"), indent=None)) == {
+        "location": {"city": "San Francisco", "tags": ["a"]}
+    }
@@ -0,0 +1,121 @@
+import threading
+import time
+
+import pytest
+
+from agno.agent import Agent
+from agno.models.openai import OpenAIChat
+from agno.run import RunContext
+from agno.run.agent import RunContentEvent, RunOutput
+from agno.run.team import TeamRunOutput
+from agno.session.team import TeamSession
+from agno.team.team import Team
+
+
+def _member(name: str, delay: float, state_key: str) -> Agent:
+    member = Agent(name=name, model=OpenAIChat(id="gpt-4o", api_key="test-key"))
+
+    def run(input, session_state=None, stream=False, **kwargs):
+        # Each member gets its own copy of the nested session state
+        session_state["shared"][state_key] = name
+        run_output = RunOutput(run_id=f"run-{name}", agent_id=member.id, content=f"{name} done")
+
+        def events():
+            time.sleep(delay)
+            yield RunContentEvent(agent_name=name, content=name)
+            yield run_output
+
+        if stream:
+            return events()
+        time.sleep(delay)
+        return run_output
+
+    member.run = run  # type: ignore
+    return member
+
+
+@pytest.fixture
+def team():
+    members = [_member("slow", 0.3, "a"), _member("medium", 0.2, "b"), _member("fast", 0.1, "c")]
+    return Team(name="Broadcast Team", model=OpenAIChat(id="gpt-4o", api_key="test-key"), members=members)
+
+
+def _delegate_function(team: Team, run_context: RunContext, run_response: TeamRunOutput, stream: bool = False):
+    team.delegate_to_all_members = True
+    return team._get_delegate_task_function(
+        session=TeamSession(session_id="test-session"),
+        run_response=run_response,
+        run_context=run_context,
+        team_run_context={},
+        stream=stream,
+    )
+
+
+def test_members_run_concurrently_and_merge_in_member_order(team):
+    run_context = RunContext(session_state={"shared": {}}, run_id="test-run", session_id="test-session")
+    run_response = TeamRunOutput(run_id="test-run", content="")
+    function = _delegate_function(team, run_context, run_response)
+
+    start = time.perf_counter()
+    results = list(function.entrypoint(task="Do the task"))
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.5
+    assert results == ["Agent slow: slow done", "Agent medium: medium done", "Agent fast: fast done"]
+    assert [member_run.run_id for member_run in run_response.member_responses] == ["run-slow", "run-medium", "run-fast"]
+    assert run_context.session_state == {"shared": {"a": "slow", "b": "medium", "c": "fast"}}
+
+
+def test_members_stream_events_as_they_arrive(team):
+    run_context = RunContext(session_state={"shared": {}}, run_id="test-run", session_id="test-session")
+    run_response = TeamRunOutput(run_id="test-run", content="")
+    function = _delegate_function(team, run_context, run_response, stream=True)
+
+    events = list(function.entrypoint(task="Do the task"))
+
+    assert [event.content for event in events] == ["fast", "medium", "slow"]
+    assert all(event.parent_run_id == "test-run" for event in events)
+    assert [member_run.run_id for member_run in run_response.member_responses] == ["run-slow", "run-medium", "run-fast"]
+
+
+def test_max_concurrent_members_of_one_runs_sequentially(team):
+    team.max_concurrent_members = 1
+    thread_ids = set()
+    for member in team.members:
+        run = member.run
+
+        def record_thread(*args, _run=run, **kwargs):
+            thread_ids.add(threading.get_ident())
+            return _run(*args, **kwargs)
+
+        member.run = record_thread  # type: ignore
+
+    run_context = RunContext(session_state={"shared": {}}, run_id="test-run", session_id="test-session")
+    function = _delegate_function(team, run_context, TeamRunOutput(run_id="test-run", content=""))
+    results = list(function.entrypoint(task="Do the task"))
+    assert thread_ids == {threading.get_ident()}
+    # Formatted like the concurrent results
+    assert results == ["Agent slow: slow done", "Agent medium: medium done", "Agent fast: fast done"]
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_member_errors_are_raised_without_waiting_for_the_other_members(stream):
+    def broken_run(*args, **kwargs):
+        raise RuntimeError("member crashed")
+
+    broken = Agent(name="broken", model=OpenAIChat(id="gpt-4o", api_key="test-key"))
+    broken.run = broken_run  # type: ignore
+    team = Team(
+        name="Broadcast Team",
+        model=OpenAIChat(id="gpt-4o", api_key="test-key"),
+        members=[_member("sleepy", 2.0, "a"), broken],
+    )
+    run_context = RunContext(session_state={"shared": {}}, run_id="test-run", session_id="test-session")
+    function = _delegate_function(team, run_context, TeamRunOutput(run_id="test-run", content=""), stream=stream)
+
+    start = time.perf_counter()
+    with pytest.raises(RuntimeError, match="member crashed"):
+        list(function.entrypoint(task="Do the task"))
+
+    # The sleepy member is left running in the background
+    assert time.perf_counter() - start < 1.0
@@ -0,0 +1,182 @@
+import asyncio
+import os
+import signal
+import sys
+import textwrap
+import time
+
+import pytest
+
+from agno.tools.mcp import MCPConnection, MCPSessionPool, MCPTools, MultiMCPTools
+
+pytest.importorskip("mcp.server.fastmcp")
+
+from mcp import StdioServerParameters  # noqa: E402
+
+SERVER = textwrap.dedent(
+    """
+    import asyncio
+    import os
+    import sys
+    import time
+
+    from mcp.server.fastmcp import Context, FastMCP
+
+    time.sleep(float(sys.argv[2]) if len(sys.argv) > 2 else 0)
+    server = FastMCP(sys.argv[1] if len(sys.argv) > 1 else "test")
+
+
+    @server.tool()
+    def echo(text: str) -> str:
+        \"\"\"Echo the text.\"\"\"
+        return text
+
+
+    @server.tool()
+    def pid() -> int:
+        \"\"\"Return the id of the server process.\"\"\"
+        return os.getpid()
+
+
+    @server.tool()
+    async def wait(seconds: float) -> str:
+        \"\"\"Wait for some seconds.\"\"\"
+        await asyncio.sleep(seconds)
+        return "done"
+
+
+    @server.tool()
+    async def add_shout(ctx: Context) -> str:
+        \"\"\"Add the shout tool.\"\"\"
+        server.add_tool(lambda text: text.upper(), name="shout", description="Shout the text.")
+        await ctx.session.send_tool_list_changed()
+        return "added"
+
+
+    server.run()
+    """
+)
+
+
+@pytest.fixture
+def server_script(tmp_path):
+    path = tmp_path / "server.py"
+    path.write_text(SERVER)
+    return str(path)
+
+
+def server_params(script: str, name: str = "test", startup_delay: float = 0) -> StdioServerParameters:
+    return StdioServerParameters(command=sys.executable, args=[script, name, str(startup_delay)])
+
+
+async def call(tools, name: str, **kwargs) -> str:
+    result = await tools.functions[name].entrypoint(**kwargs)
+    return result.content
+
+
+async def test_pooled_connection_is_reused_across_runs(server_script):
+    async with MCPSessionPool() as pool:
+        tools = MCPTools(server_params=server_params(server_script), pool=pool, tool_name_prefix=None)
+
+        # Two runs, each connecting and closing the toolkit
+        await tools.connect()
+        first_pid = await call(tools, "pid")
+        await tools.close()
+        await tools.connect()
+        assert await call(tools, "echo", text="hello") == "hello"
+        assert await call(tools, "pid") == first_pid
+        await tools.close()
+
+        assert pool.stats.connections == 1
+        assert pool.stats.tool_list_misses == 1
+        assert pool.stats.tool_list_hits == 1
+
+
+async def test_dead_server_is_reconnected(server_script):
+    async with MCPSessionPool(timeout_seconds=2, health_check_interval=0) as pool:
+        tools = MCPTools(server_params=server_params(server_script), pool=pool, tool_name_prefix=None)
+        await tools.connect()
+        first_pid = await call(tools, "pid")
+        await tools.close()
+
+        os.kill(int(first_pid), signal.SIGKILL)
+        await asyncio.sleep(0.2)
+        assert not await tools.is_alive()
+
+        await tools.connect()
+        assert tools.initialized
+        assert await call(tools, "pid") != first_pid
+        assert pool.stats.reconnections == 1
+        assert pool.stats.failed_health_checks == 1
+
+
+async def test_close_does_not_swallow_cancellation(server_script):
+    connection = MCPConnection(server_params(server_script))
+    # A connection task that is slow to shut down
+    connection._task = asyncio.create_task(asyncio.sleep(60))
+    closer = asyncio.create_task(connection.close())
+    await asyncio.sleep(0.1)
+
+    closer.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await closer
+    assert connection.session is None
+    assert not connection.connected
+
+
+async def test_tool_listing_is_invalidated(server_script):
+    async with MCPSessionPool() as pool:
+        params = server_params(server_script)
+        connection = await pool.acquire(params)
+        assert "shout" not in [tool.name for tool in (await connection.list_tools()).tools]
+
+        # The server notifies its clients that its tools changed
+        await connection.call_tool("add_shout")
+        for _ in range(50):
+            if connection._tools is None:
+                break
+            await asyncio.sleep(0.05)
+        assert "shout" in [tool.name for tool in (await connection.list_tools()).tools]
+
+        await connection.list_tools()
+        pool.invalidate_tools(params)
+        await connection.list_tools()
+        assert pool.stats.tool_list_misses == 3
+        assert pool.stats.tool_list_hits == 1
+
+
+async def test_calls_in_flight_are_capped_per_server(server_script):
+    async with MCPSessionPool(max_concurrent_calls=2) as pool:
+        connection = await pool.acquire(server_params(server_script))
+
+        start = time.perf_counter()
+        await asyncio.gather(*[connection.call_tool("wait", {"seconds": 0.5}) for _ in range(4)])
+        elapsed = time.perf_counter() - start
+
+        # Four calls, two at a time
+        assert 1.0 <= elapsed < 1.9
+
+
+async def test_multi_mcp_connects_concurrently(server_script, monkeypatch):
+    from agno.tools.mcp.pool import MCPConnection
+
+    # The connect interval of each server, from the start of the connection until it is ready
+    intervals = {}
+    ensure_alive = MCPConnection.ensure_alive
+
+    async def timed_ensure_alive(self):
+        start = time.perf_counter()
+        await ensure_alive(self)
+        intervals[self.server_params.args[1]] = (start, time.perf_counter())
+
+    monkeypatch.setattr(MCPConnection, "ensure_alive", timed_ensure_alive)
+    servers = [server_params(server_script, name=f"server_{i}", startup_delay=0.2) for i in range(3)]
+
+    async with MultiMCPTools(server_params_list=servers) as tools:
+        assert tools.initialized
+        assert await call(tools, "echo", text="hello") == "hello"
+
+    # Every server started connecting before any of them was ready
+    assert sorted(intervals) == ["server_0", "server_1", "server_2"]
+    assert max(start for start, _ in intervals.values()) < min(end for _, end in intervals.values())
+    assert not tools.initialized
@@ -0,0 +1,117 @@
+import pytest
+
+from agno.tools.function import Function, clear_tool_schema_cache, get_tool_schema_cache_stats
+from agno.tools.toolkit import Toolkit
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_tool_schema_cache()
+    yield
+    clear_tool_schema_cache()
+
+
+def add(a: int, b: int = 1) -> int:
+    """Add two numbers.
+
+    Args:
+        a: The first number.
+        b: The second number.
+    """
+    return a + b
+
+
+class MathTools(Toolkit):
+    def __init__(self, **kwargs):
+        super().__init__(name="math_tools", tools=[self.multiply], **kwargs)
+
+    def multiply(self, a: int, b: int) -> int:
+        """Multiply two numbers."""
+        return a * b
+
+
+def test_from_callable_compiles_once():
+    first = Function.from_callable(add)
+    second = Function.from_callable(add)
+
+    assert first is not second
+    assert first.entrypoint is second.entrypoint
+    assert first.parameters == second.parameters
+    assert first.parameters["required"] == ["a"]
+    assert get_tool_schema_cache_stats().to_dict()["hits"] == 1
+    assert get_tool_schema_cache_stats().misses == 1
+
+    strict = Function.from_callable(add, strict=True)
+    assert strict.parameters["required"] == ["a", "b"]
+    assert get_tool_schema_cache_stats().misses == 2
+
+
+def test_process_entrypoint_reuses_the_compiled_schema():
+    source = MathTools().functions["multiply"]
+
+    first = source.model_copy()
+    first.process_entrypoint()
+    second = source.model_copy()
+    second.process_entrypoint()
+
+    assert get_tool_schema_cache_stats().hits == 1
+    assert second.parameters == first.parameters
+    assert second.entrypoint is first.entrypoint
+    assert second.description == "Multiply two numbers."
+    # The entrypoint is wrapped with argument validation
+    assert second.entrypoint(a="2", b=3) == 6  # type: ignore[misc]
+    # The toolkit keeps its unprocessed Function
+    assert source.parameters == {"type": "object", "properties": {}, "required": []}
+
+    strict = source.model_copy()
+    strict.process_entrypoint(strict=True)
+    assert strict.parameters["additionalProperties"] is False
+    assert "additionalProperties" not in first.parameters
+
+
+def test_user_parameters_are_part_of_the_key():
+    parameters = {"type": "object", "properties": {"a": {"type": "integer"}}, "required": []}
+    source = Function(name="add", entrypoint=add, parameters=parameters)
+
+    first = source.model_copy()
+    first.process_entrypoint()
+    assert first.parameters["additionalProperties"] is False
+    # The parameters given by the user are not updated in place
+    assert "additionalProperties" not in parameters
+
+    parameters["properties"]["b"] = {"type": "integer"}
+    second = Function(name="add", entrypoint=add, parameters=parameters)
+    second.process_entrypoint()
+
+    assert get_tool_schema_cache_stats().hits == 0
+    assert "b" in second.parameters["properties"]
+
+
+def test_user_input_fields_are_copied_per_function():
+    source = Function(name="add", entrypoint=add, requires_user_input=True, user_input_fields=["b"])
+
+    first = source.model_copy()
+    first.process_entrypoint()
+    first.user_input_schema[1].value = 2  # type: ignore[index]
+    second = source.model_copy()
+    second.process_entrypoint()
+
+    assert get_tool_schema_cache_stats().hits == 1
+    assert [field.name for field in second.user_input_schema] == ["a", "b"]  # type: ignore[union-attr]
+    assert second.user_input_schema[1].value is None  # type: ignore[index]
+
+
+def test_agent_runs_hit_the_cache(monkeypatch):
+    from agno.agent import Agent
+    from agno.models.openai.chat import OpenAIChat
+    from agno.models.response import ModelResponse
+
+    monkeypatch.setattr(OpenAIChat, "invoke", lambda self, **kwargs: ModelResponse(role="assistant", content="Hi"))
+    agent = Agent(model=OpenAIChat(id="gpt-4o", api_key="test-key"), tools=[MathTools(), add])
+
+    agent.run("Hello")
+    misses = get_tool_schema_cache_stats().misses
+    agent.run("Hello again")
+
+    assert get_tool_schema_cache_stats().misses == misses
+    assert get_tool_schema_cache_stats().hits >= 2
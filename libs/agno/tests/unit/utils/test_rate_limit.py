@@ -0,0 +1,157 @@
+import asyncio
+import threading
+import time
+
+
+from agno.utils.rate_limit import RateLimiter, _SlidingWindow, get_rate_limiter
+
+
+def test_requests_per_minute_paces_requests(monkeypatch):
+    # A shorter window, so the test doesn't wait for a minute
+    monkeypatch.setattr(_SlidingWindow, "window", 0.2)
+    limiter = RateLimiter(requests_per_minute=2)
+
+    started_at = time.monotonic()
+    for _ in range(3):
+        with limiter.limit():
+            pass
+    elapsed = time.monotonic() - started_at
+
+    # The third request waits for the first one to leave the window
+    assert elapsed >= 0.18
+    assert limiter.stats.requests == 3
+    assert limiter.stats.throttled_requests == 1
+
+
+def test_usage_corrects_the_reserved_tokens():
+    limiter = RateLimiter(tokens_per_minute=6000)
+
+    with limiter.limit(tokens=500) as lease:
+        assert limiter._token_window.total == 500  # type: ignore[union-attr]
+        lease.set_usage(100)
+
+    assert limiter._token_window.total == 100  # type: ignore[union-attr]
+    assert limiter.stats.estimated_tokens == 500
+    assert limiter.stats.used_tokens == 100
+
+
+def _admission_times(window: _SlidingWindow, amounts: list) -> list:
+    """Send requests back to back, starting each one as soon as the window admits it."""
+    now = 0.0
+    times = []
+    for amount in amounts:
+        now += window.reserve(amount, now)[1]
+        times.append(now)
+    return times
+
+
+def test_no_minute_admits_more_than_the_limit():
+    times = _admission_times(_SlidingWindow(per_minute=100), [1] * 300)
+
+    # The budget of a minute can be used at once, then requests wait for earlier ones to leave the window
+    assert times[99] == 0.0
+    assert times[100] == 60.0
+    windows = [sum(1 for t in times if start <= t < start + 60) for start in times]
+    assert max(windows) == 100
+
+
+def test_amounts_larger_than_the_limit_are_admitted_once_the_window_is_empty():
+    window = _SlidingWindow(per_minute=100)
+    assert _admission_times(window, [30, 250, 10]) == [0.0, 60.0, 120.0]
+
+
+def test_small_requests_are_not_paced_by_their_maximum_output():
+    # Requests reserve their maximum output, e.g. 8192 tokens, but use a few hundred
+    limiter = RateLimiter(tokens_per_minute=40_000)
+    estimate = 8193
+
+    started_at = time.monotonic()
+    for _ in range(20):
+        with limiter.limit(tokens=estimate) as lease:
+            lease.set_usage(300)
+    elapsed = time.monotonic() - started_at
+
+    # Reserving the estimate without refunds would take 20 * 8193 / (40000 / 60) seconds, over 4 minutes
+    assert elapsed < 1.0
+    assert limiter.stats.throttled_requests == 0
+    assert limiter._token_window.total == 20 * 300  # type: ignore[union-attr]
+
+
+def test_max_concurrent_requests_across_threads():
+    limiter = RateLimiter(max_concurrent_requests=2)
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def request():
+        nonlocal active, max_active
+        with limiter.limit():
+            with lock:
+                active += 1
+                max_active = max(max_active, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+
+    threads = [threading.Thread(target=request) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max_active == 2
+    assert limiter._active == 0
+
+
+async def test_max_concurrent_requests_async_and_cancellation():
+    limiter = RateLimiter(max_concurrent_requests=1)
+    order = []
+
+    async def request(i: int):
+        async with limiter.alimit():
+            order.append(i)
+            await asyncio.sleep(0.01)
+
+    holder = asyncio.ensure_future(request(0))
+    await asyncio.sleep(0)
+    cancelled = asyncio.ensure_future(request(1))
+    waiting = [asyncio.ensure_future(request(i)) for i in range(2, 4)]
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    await asyncio.gather(holder, *waiting)
+
+    # Waiters are admitted in FIFO order and the cancelled one gives its place away
+    assert order == [0, 2, 3]
+    assert limiter._active == 0
+    assert not limiter._waiters
+
+
+def test_get_rate_limiter_is_shared_by_key():
+    limiter = get_rate_limiter("test:shared", requests_per_minute=10)
+    assert get_rate_limiter("test:shared") is limiter
+    assert get_rate_limiter("test:other") is not limiter
+
+
+def test_model_response_goes_through_the_rate_limiter(monkeypatch):
+    from copy import deepcopy
+
+    from agno.models.message import Message
+    from agno.models.metrics import Metrics
+    from agno.models.openai.chat import OpenAIChat
+    from agno.models.response import ModelResponse
+
+    limiter = RateLimiter(tokens_per_minute=100_000)
+    model = OpenAIChat(id="gpt-4o", api_key="test-key", rate_limiter=limiter)
+    monkeypatch.setattr(
+        OpenAIChat,
+        "invoke",
+        lambda self, **kwargs: ModelResponse(role="assistant", content="hi", response_usage=Metrics(total_tokens=42)),
+    )
+
+    model.response(messages=[Message(role="user", content="Hello there")])
+
+    assert limiter.stats.requests == 1
+    assert limiter.stats.used_tokens == 42
+    # Copies of the model share the budget of the API key
+    assert deepcopy(model).rate_limiter is limiter
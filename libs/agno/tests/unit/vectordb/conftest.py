@@ -11,6 +11,7 @@ def mock_embedder():
 
     # Mock dimensions property
     mock.dimensions = 1024
+    mock.enable_batch = False
 
     # Create a fixed embedding vector of the correct size
     mock_embedding: List[float] = [0.1] * 1024
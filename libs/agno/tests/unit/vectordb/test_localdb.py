@@ -0,0 +1,225 @@
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+
+from agno.filters import AND, EQ, GT, IN, NOT
+from agno.knowledge.document import Document
+from agno.vectordb.distance import Distance
+from agno.vectordb.local import LocalDb
+
+TEST_COLLECTION = "test_collection"
+
+VOCABULARY = ["coconut", "noodle", "curry", "soup", "spicy", "rice", "chicken", "milk"]
+
+
+def _embed(text: str) -> List[float]:
+    """Bag-of-words embedding over a tiny vocabulary, so similar texts get close vectors."""
+    words = text.lower()
+    return [float(words.count(word)) + 0.01 for word in VOCABULARY]
+
+
+@pytest.fixture
+def embedder():
+    mock = MagicMock()
+    mock.dimensions = len(VOCABULARY)
+    mock.enable_batch = False
+    mock.get_embedding.side_effect = _embed
+    mock.get_embedding_and_usage.side_effect = lambda text: (_embed(text), None)
+
+    async def async_get_embedding(text):
+        return _embed(text)
+
+    async def async_get_embedding_and_usage(text):
+        return _embed(text), None
+
+    mock.async_get_embedding.side_effect = async_get_embedding
+    mock.async_get_embedding_and_usage.side_effect = async_get_embedding_and_usage
+    return mock
+
+
+@pytest.fixture
+def local_db(tmp_path, embedder):
+    db = LocalDb(collection=TEST_COLLECTION, path=str(tmp_path), embedder=embedder, initial_capacity=2)
+    db.create()
+    yield db
+    db.drop()
+
+
+@pytest.fixture
+def sample_documents() -> List[Document]:
+    return [
+        Document(
+            content="Tom Kha Gai is a Thai coconut soup with chicken and coconut milk",
+            meta_data={"cuisine": "Thai", "type": "soup", "rating": 5},
+            name="tom_kha",
+        ),
+        Document(
+            content="Pad Thai is a stir-fried rice noodle dish",
+            meta_data={"cuisine": "Thai", "type": "noodles", "rating": 4},
+            name="pad_thai",
+        ),
+        Document(
+            content="Green curry is a spicy Thai curry with coconut milk",
+            meta_data={"cuisine": "Thai", "type": "curry", "rating": 3},
+            name="green_curry",
+        ),
+    ]
+
+
+def test_create_collection(local_db):
+    assert local_db.exists() is True
+    assert local_db.get_count() == 0
+
+
+def test_insert_and_search(local_db, sample_documents):
+    local_db.insert(content_hash="test_hash", documents=sample_documents)
+    assert local_db.get_count() == 3
+    assert local_db.content_hash_exists("test_hash")
+    assert local_db.name_exists("pad_thai")
+
+    results = local_db.search("noodle rice", limit=1)
+    assert [doc.name for doc in results] == ["pad_thai"]
+    assert len(results[0].embedding) == len(VOCABULARY)
+
+
+@pytest.mark.parametrize("distance", [Distance.cosine, Distance.l2, Distance.max_inner_product])
+def test_search_distances(tmp_path, embedder, sample_documents, distance):
+    db = LocalDb(collection=TEST_COLLECTION, path=str(tmp_path), embedder=embedder, distance=distance)
+    db.create()
+    db.insert(content_hash="test_hash", documents=sample_documents)
+
+    results = db.search("spicy curry curry", limit=2)
+    assert len(results) == 2
+    assert results[0].name == "green_curry"
+
+
+def test_search_with_filters(local_db, sample_documents):
+    local_db.insert(content_hash="test_hash", documents=sample_documents)
+
+    results = local_db.search("coconut", limit=5, filters={"type": "curry"})
+    assert [doc.name for doc in results] == ["green_curry"]
+
+    results = local_db.search("coconut", limit=5, filters={"type": ["soup", "noodles"]})
+    assert {doc.name for doc in results} == {"tom_kha", "pad_thai"}
+
+    results = local_db.search("coconut", limit=5, filters=[AND(EQ("cuisine", "Thai"), GT("rating", 3))])
+    assert {doc.name for doc in results} == {"tom_kha", "pad_thai"}
+
+    results = local_db.search("coconut", limit=5, filters=[NOT(IN("type", ["soup", "curry"]))])
+    assert [doc.name for doc in results] == ["pad_thai"]
+
+
+def test_reopen_without_reembedding(tmp_path, embedder, sample_documents):
+    db = LocalDb(collection=TEST_COLLECTION, path=str(tmp_path), embedder=embedder, initial_capacity=1)
+    db.create()
+    db.insert(content_hash="test_hash", documents=sample_documents)
+    embed_calls = embedder.get_embedding_and_usage.call_count
+
+    reopened = LocalDb(collection=TEST_COLLECTION, path=str(tmp_path), embedder=embedder)
+    assert reopened.get_count() == 3
+    results = reopened.search("noodle", limit=1)
+    assert results[0].name == "pad_thai"
+    assert embedder.get_embedding_and_usage.call_count == embed_calls
+
+
+def test_writes_append_to_the_log_until_it_is_compacted(tmp_path, embedder, sample_documents):
+    db = LocalDb(collection=TEST_COLLECTION, path=str(tmp_path), embedder=embedder, initial_capacity=1)
+    db.create()
+    snapshot = db.metadata_path.read_text()
+
+    sample_documents[0].content_id = "content-1"
+    for doc in sample_documents:
+        db.insert(content_hash=doc.name, documents=[doc])
+    db.delete_by_name("pad_thai")
+    db.update_metadata("content-1", {"reviewed": True})
+    # Individual writes only append to the log, the sidecar is left as it was
+    assert db.metadata_path.read_text() == snapshot
+    assert db.log_path.exists()
+    stale_log = db.log_path.read_text()
+
+    # An interrupted append leaves a partial line, which is ignored on load
+    with open(db.log_path, "a", encoding="utf-8") as f:
+        f.write('{"row": 7, "rec')
+
+    reopened = LocalDb(collection=TEST_COLLECTION, path=str(tmp_path), embedder=embedder)
+    assert reopened.get_count() == 2
+    assert not reopened.name_exists("pad_thai")
+    assert [doc.name for doc in reopened.search("coconut", limit=5, filters={"reviewed": True})] == ["tom_kha"]
+    # The partial entry is dropped, so appends made after reopening are read back
+    reopened.delete_by_name("green_curry")
+    assert LocalDb(collection=TEST_COLLECTION, path=str(tmp_path), embedder=embedder).get_count() == 1
+
+    # Compaction folds the log into the sidecar, and a stale log from an older snapshot is not replayed
+    reopened.optimize()
+    assert not reopened.log_path.exists()
+    reopened.log_path.write_text(stale_log)
+    reopened = LocalDb(collection=TEST_COLLECTION, path=str(tmp_path), embedder=embedder)
+    assert [doc.name for doc in reopened.search("coconut", limit=5)] == ["tom_kha"]
+
+
+def test_insert_embeds_documents_in_one_batch(local_db, embedder, sample_documents):
+    embedder.enable_batch = True
+    embedder.get_embeddings_batch_and_usage.side_effect = lambda texts: (
+        [_embed(text) for text in texts],
+        [{"total_tokens": 1}] * len(texts),
+    )
+
+    local_db.insert(content_hash="hash1", documents=sample_documents)
+
+    embedder.get_embeddings_batch_and_usage.assert_called_once()
+    embedder.get_embedding_and_usage.assert_not_called()
+    assert all(document.usage == {"total_tokens": 1} for document in sample_documents)
+    assert local_db.search("coconut soup", limit=1)[0].name == "tom_kha"
+
+
+def test_failed_batches_fall_back_to_single_embeddings_except_on_rate_limits(local_db, embedder, sample_documents):
+    embedder.enable_batch = True
+    embedder.get_embeddings_batch_and_usage.side_effect = RuntimeError("batch endpoint unavailable")
+    local_db.insert(content_hash="hash1", documents=sample_documents)
+    assert embedder.get_embedding_and_usage.call_count == len(sample_documents)
+    assert local_db.get_count() == len(sample_documents)
+
+    embedder.get_embeddings_batch_and_usage.side_effect = RuntimeError("429 Too Many Requests")
+    with pytest.raises(RuntimeError, match="429"):
+        local_db.upsert(content_hash="hash2", documents=[Document(content="Mango sticky rice", name="mango")])
+    assert embedder.get_embedding_and_usage.call_count == len(sample_documents)
+
+
+def test_upsert_replaces_content_hash(local_db, sample_documents):
+    local_db.insert(content_hash="test_hash", documents=sample_documents)
+    local_db.upsert(content_hash="test_hash", documents=[Document(content="Massaman curry", name="massaman")])
+
+    assert local_db.get_count() == 1
+    assert local_db.search("curry", limit=5)[0].name == "massaman"
+
+
+def test_delete_and_optimize(local_db, sample_documents):
+    for doc in sample_documents:
+        doc.content_id = doc.name
+    local_db.insert(content_hash="test_hash", documents=sample_documents)
+
+    assert local_db.delete_by_name("tom_kha") is True
+    assert local_db.delete_by_content_id("pad_thai") is True
+    assert local_db.delete_by_metadata({"type": "missing"}) is False
+    assert local_db.get_count() == 1
+
+    local_db.optimize()
+    results = local_db.search("coconut", limit=5)
+    assert [doc.name for doc in results] == ["green_curry"]
+    assert local_db.id_exists(results[0].id)
+
+
+def test_update_metadata(local_db, sample_documents):
+    sample_documents[0].content_id = "content-1"
+    local_db.insert(content_hash="test_hash", documents=sample_documents)
+
+    local_db.update_metadata("content-1", {"reviewed": True})
+    results = local_db.search("coconut", limit=5, filters={"reviewed": True})
+    assert [doc.name for doc in results] == ["tom_kha"]
+
+
+async def test_async_insert_and_search(local_db, sample_documents):
+    await local_db.async_insert(content_hash="test_hash", documents=sample_documents)
+    results = await local_db.async_search("noodle", limit=1)
+    assert results[0].name == "pad_thai"